@@ -0,0 +1,58 @@
+"""Benchmark grounding mapping of a large corpus of Statements.
+
+The corpus is loaded from a pickle or JSON file of Statements, e.g., a
+dump of 1M REACH Statements, and mapped with the default GroundingMapper
+without memoization, with memoization, and with memoization using a pool
+of processes. Run as
+
+    python -m indra.benchmarks.benchmark_grounding_mapper corpus.pkl \
+        [--n-procs 4] [--limit 1000000]
+"""
+import time
+import pickle
+import argparse
+from indra.statements import stmts_from_json_file
+from indra.preassembler.grounding_mapper import GroundingMapper, \
+    default_grounding_map, default_agent_map, default_ignores, \
+    default_misgrounding_map
+
+
+def load_corpus(fname, limit=None):
+    """Return Statements loaded from a pickle or JSON file."""
+    if fname.endswith('.pkl'):
+        with open(fname, 'rb') as fh:
+            stmts = pickle.load(fh)
+    else:
+        stmts = stmts_from_json_file(fname)
+    return stmts[:limit] if limit else stmts
+
+
+def time_mapping(stmts, memo_size, n_procs):
+    """Return the time it takes to map the given Statements."""
+    mapper = GroundingMapper(default_grounding_map,
+                             agent_map=default_agent_map,
+                             ignores=default_ignores,
+                             misgrounding_map=default_misgrounding_map,
+                             use_adeft=False, memo_size=memo_size)
+    start = time.perf_counter()
+    mapped_stmts = mapper.map_stmts(stmts, n_procs=n_procs)
+    return time.perf_counter() - start, len(mapped_stmts)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Benchmark the GroundingMapper on a corpus.')
+    parser.add_argument('corpus')
+    parser.add_argument('--n-procs', type=int, default=4)
+    parser.add_argument('--limit', type=int)
+    args = parser.parse_args()
+
+    stmts = load_corpus(args.corpus, args.limit)
+    print('Loaded %d statements' % len(stmts))
+    for label, memo_size, n_procs in [('no memoization', 0, 1),
+                                      ('memoization', 100000, 1),
+                                      ('memoization, %d processes'
+                                       % args.n_procs, 100000, args.n_procs)]:
+        ts, num_mapped = time_mapping(stmts, memo_size, n_procs)
+        print('%s: %.1fs (%.0f statements/s), %d statements mapped'
+              % (label, ts, len(stmts) / ts, num_mapped))
@@ -0,0 +1,99 @@
+"""Benchmark the time it takes to import commonly used INDRA modules.
+
+Each module is imported in a fresh interpreter so that the numbers
+reflect a cold import, including reading any resource files at import
+time. Run as
+
+    python -m indra.benchmarks.benchmark_import_time [-n 5] [--importtime]
+
+With --importtime, the slowest imports reported by `python -X importtime`
+are also printed for each module.
+"""
+import sys
+import time
+import argparse
+import subprocess
+
+
+DEFAULT_MODULES = ['indra.statements', 'indra.tools.assemble_corpus',
+                   'indra.databases.hgnc_client',
+                   'indra.databases.mesh_client',
+                   'indra.databases.chebi_client']
+
+
+def time_import(module, num_runs=5):
+    """Return the wall clock times of importing a module in new processes.
+
+    Parameters
+    ----------
+    module : str
+        The name of the module to import.
+    num_runs : Optional[int]
+        The number of times the import is repeated. Default: 5
+
+    Returns
+    -------
+    list[float]
+        The time in seconds each import took, including interpreter
+        startup.
+    """
+    times = []
+    for _ in range(num_runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-c', 'import %s' % module],
+                       check=True, stdout=subprocess.DEVNULL,
+                       stderr=subprocess.DEVNULL)
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def get_slowest_imports(module, top_n=10):
+    """Return the slowest imports triggered by importing a module.
+
+    Parameters
+    ----------
+    module : str
+        The name of the module to import.
+    top_n : Optional[int]
+        The number of imports to return. Default: 10
+
+    Returns
+    -------
+    list[tuple]
+        Tuples of cumulative time in microseconds and the name of the
+        imported module, sorted by decreasing time.
+    """
+    res = subprocess.run([sys.executable, '-X', 'importtime', '-c',
+                          'import %s' % module], check=True,
+                         stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                         universal_newlines=True)
+    entries = []
+    for line in res.stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        parts = [p.strip() for p in line[len('import time:'):].split('|')]
+        if not parts[1].isdigit():
+            continue
+        entries.append((int(parts[1]), parts[2]))
+    return sorted(entries, reverse=True)[:top_n]
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Benchmark the import time of INDRA modules.')
+    parser.add_argument('modules', nargs='*', default=DEFAULT_MODULES)
+    parser.add_argument('-n', '--num-runs', type=int, default=5)
+    parser.add_argument('--importtime', action='store_true')
+    args = parser.parse_args()
+
+    for module in args.modules:
+        try:
+            times = time_import(module, args.num_runs)
+        except subprocess.CalledProcessError:
+            print('%s: import failed' % module)
+            continue
+        print('%s: min %.3fs, mean %.3fs over %d runs'
+              % (module, min(times), sum(times) / len(times), len(times)))
+        if args.importtime:
+            for us, name in get_slowest_imports(module):
+                print('    %8.3fs %s' % (us / 1e6, name))
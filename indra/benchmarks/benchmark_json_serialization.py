@@ -0,0 +1,74 @@
+"""Benchmark the JSON serialization and deserialization of Statements.
+
+The corpus is loaded from a pickle or JSON file of Statements and written
+into a JSON file and read back, both with stmts_to_json_file and
+stmts_from_json_file and with the equivalent plain json calls, reporting
+the number of Statements encoded and decoded per second. Run as
+
+    python -m indra.benchmarks.benchmark_json_serialization corpus.pkl \
+        [--limit 100000]
+"""
+import os
+import json
+import time
+import argparse
+import tempfile
+from indra.statements import stmts_from_json, stmts_from_json_file, \
+    stmts_to_json, stmts_to_json_file
+from indra.tools.assemble_corpus import load_statements
+
+
+def load_corpus(fname, limit=None):
+    """Return Statements loaded from a pickle or JSON file."""
+    if fname.endswith('.json'):
+        stmts = stmts_from_json_file(fname)
+    else:
+        stmts = load_statements(fname)
+    return stmts[:limit] if limit else stmts
+
+
+def encode_plain(stmts, fname):
+    with open(fname, 'w') as fh:
+        json.dump(stmts_to_json(stmts), fh, indent=1)
+
+
+def decode_plain(fname):
+    with open(fname, 'r') as fh:
+        return stmts_from_json(json.load(fh))
+
+
+def time_call(func, *args):
+    """Return the time a function call takes and its return value."""
+    start = time.perf_counter()
+    res = func(*args)
+    return time.perf_counter() - start, res
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Benchmark the JSON serialization of Statements.')
+    parser.add_argument('corpus')
+    parser.add_argument('--limit', type=int)
+    args = parser.parse_args()
+
+    stmts = load_corpus(args.corpus, args.limit)
+    print('Loaded %d statements' % len(stmts))
+    tmp_dir = tempfile.mkdtemp()
+    plain_fname = os.path.join(tmp_dir, 'plain.json')
+    fname = os.path.join(tmp_dir, 'stmts.json')
+    for label, func, func_args in [
+            ('encode, json.dump', encode_plain, (stmts, plain_fname)),
+            ('encode, stmts_to_json_file', stmts_to_json_file,
+             (stmts, fname)),
+            ('decode, json.load', decode_plain, (plain_fname,)),
+            ('decode, stmts_from_json_file', stmts_from_json_file,
+             (fname,))]:
+        ts, res = time_call(func, *func_args)
+        del res
+        print('%s: %.1fs (%.0f statements/s)'
+              % (label, ts, len(stmts) / ts))
+    with open(plain_fname, 'r') as fh1, open(fname, 'r') as fh2:
+        print('Identical JSON: %s' % (fh1.read() == fh2.read()))
+    os.remove(plain_fname)
+    os.remove(fname)
+    os.rmdir(tmp_dir)
@@ -4,6 +4,8 @@ import requests
 from lxml import etree
 from functools import lru_cache, cmp_to_key
 from indra.util import read_unicode_csv
+from indra.resources import get_resource_path, LazyResource, \
+    make_module_getattr
 from indra.databases.obo_client import OboClient
 
 _obo_client = OboClient(prefix='chebi')
@@ -36,7 +38,7 @@ def get_pubchem_id(chebi_id):
         PubChem ID corresponding to the given ChEBI ID. If the lookup fails,
         None is returned.
     """
-    pubchem_id = chebi_pubchem.get(_add_prefix(chebi_id))
+    pubchem_id = _pubchem_maps.chebi_pubchem.get(_add_prefix(chebi_id))
     return pubchem_id
 
 
@@ -54,7 +56,7 @@ def get_chebi_id_from_pubchem(pubchem_id):
         ChEBI ID corresponding to the given Pubchem ID. If the lookup fails,
         None is returned.
     """
-    chebi_id = pubchem_chebi.get(pubchem_id)
+    chebi_id = _pubchem_maps.pubchem_chebi.get(pubchem_id)
     return chebi_id
 
 
@@ -72,7 +74,7 @@ def get_chembl_id(chebi_id):
         ChEMBL ID corresponding to the given ChEBI ID. If the lookup fails,
         None is returned.
     """
-    return chebi_chembl.get(_add_prefix(chebi_id))
+    return _chembl_maps.chebi_chembl.get(_add_prefix(chebi_id))
 
 
 def get_chebi_id_from_chembl(chembl_id):
@@ -89,7 +91,7 @@ def get_chebi_id_from_chembl(chembl_id):
         ChEBI ID corresponding to the given ChEBML ID. If the lookup fails,
         None is returned.
     """
-    return chembl_chebi.get(chembl_id)
+    return _chembl_maps.chembl_chebi.get(chembl_id)
 
 
 def get_chebi_id_from_cas(cas_id):
@@ -106,7 +108,7 @@ def get_chebi_id_from_cas(cas_id):
         The ChEBI ID corresponding to the given CAS ID. If the lookup
         fails, None is returned.
     """
-    return cas_chebi.get(cas_id)
+    return _cas_map.cas_chebi.get(cas_id)
 
 
 def get_chebi_name_from_id(chebi_id, offline=True):
@@ -297,7 +299,7 @@ def get_chebi_id_from_hmdb(hmdb_id):
         The ChEBI ID that the given HMDB ID maps to or None if no mapping
         was found.
     """
-    return hmdb_chebi.get(hmdb_id)
+    return _hmdb_map.hmdb_chebi.get(hmdb_id)
 
 
 # Read resource files into module-level variables
@@ -372,7 +374,15 @@ def _read_resource_csv(fname):
     return csv_reader
 
 
-chebi_pubchem, pubchem_chebi = _read_chebi_to_pubchem()
-chebi_chembl, chembl_chebi = _read_chebi_to_chembl()
-cas_chebi = _read_cas_to_chebi()
-hmdb_chebi = _read_hmdb_to_chebi()
+_pubchem_maps = LazyResource(
+    _read_chebi_to_pubchem, ['chebi_pubchem', 'pubchem_chebi'], globals(),
+    sources=[get_resource_path('chebi_to_pubchem.tsv')])
+_chembl_maps = LazyResource(
+    _read_chebi_to_chembl, ['chebi_chembl', 'chembl_chebi'], globals(),
+    sources=[get_resource_path('chebi_to_chembl.tsv')])
+_cas_map = LazyResource(_read_cas_to_chebi, ['cas_chebi'], globals(),
+                        sources=[get_resource_path('cas_to_chebi.tsv')])
+_hmdb_map = LazyResource(_read_hmdb_to_chebi, ['hmdb_chebi'], globals(),
+                         sources=[get_resource_path('hmdb_to_chebi.tsv')])
+__getattr__ = make_module_getattr(__name__, _pubchem_maps, _chembl_maps,
+                                  _cas_map, _hmdb_map)
@@ -6,6 +6,7 @@ from indra.databases import chebi_client, uniprot_client
 from indra.statements import Inhibition, Agent, Evidence
 from collections import defaultdict
 from indra.util import read_unicode_csv
+from indra.resources import LazyResource, make_module_getattr
 
 logger = logging.getLogger(__name__)
 
@@ -365,7 +366,7 @@ def get_chembl_name(chembl_id):
     str or None
         The corresponding ChEBML name or None if not available.
     """
-    return chembl_names.get(chembl_id)
+    return _chembl.chembl_names.get(chembl_id)
 
 
 resource_file = os.path.join(os.path.dirname(os.path.abspath(__file__)),
@@ -382,4 +383,6 @@ def _load_resource():
     return chembl_names
 
 
-chembl_names = _load_resource()
+_chembl = LazyResource(_load_resource, ['chembl_names'], globals(),
+                       sources=[resource_file])
+__getattr__ = make_module_getattr(__name__, _chembl)
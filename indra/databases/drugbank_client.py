@@ -1,6 +1,7 @@
 """Client for interacting with DrugBank entries."""
 import os
 from indra.util import read_unicode_csv
+from indra.resources import LazyResource, make_module_getattr
 
 
 def get_db_mapping(drugbank_id, db_ns):
@@ -18,7 +19,7 @@ def get_db_mapping(drugbank_id, db_ns):
     str or None
         The ID mapped to the given name space or None if not available.
     """
-    return drugbank_to_db.get((drugbank_id, db_ns))
+    return _mappings.drugbank_to_db.get((drugbank_id, db_ns))
 
 
 def get_drugbank_id_from_db_id(db_ns, db_id):
@@ -36,7 +37,7 @@ def get_drugbank_id_from_db_id(db_ns, db_id):
     str or None
         The mapped DrugBank ID or None if not available.
     """
-    return db_to_drugbank.get((db_ns, db_id))
+    return _mappings.db_to_drugbank.get((db_ns, db_id))
 
 
 def get_chebi_id(drugbank_id):
@@ -117,7 +118,7 @@ def get_drugbank_name(drugbank_id):
         The name corresponding to the given DrugBank ID or None if not
         available.
     """
-    return drugbank_names.get(drugbank_id)
+    return _mappings.drugbank_names.get(drugbank_id)
 
 
 mappings_file = os.path.join(os.path.dirname(os.path.abspath(__file__)),
@@ -156,4 +157,7 @@ def _load_mappings():
     return drugbank_to_db, db_to_drugbank, drugbank_names
 
 
-drugbank_to_db, db_to_drugbank, drugbank_names = _load_mappings()
+_mappings = LazyResource(_load_mappings, ['drugbank_to_db', 'db_to_drugbank',
+                                         'drugbank_names'], globals(),
+                         sources=[mappings_file])
+__getattr__ = make_module_getattr(__name__, _mappings)
@@ -9,7 +9,8 @@ import xml.etree.ElementTree as ET
 from functools import lru_cache
 
 from indra.util import read_unicode_csv, UnicodeXMLTreeBuilder as UTB
-from indra.resources import get_resource_path
+from indra.resources import get_resource_path, LazyResource, \
+    make_module_getattr
 
 logger = logging.getLogger(__name__)
 
@@ -31,7 +32,7 @@ def get_uniprot_id(hgnc_id):
     uniprot_id : str
         The UniProt ID corresponding to the given HGNC ID.
     """
-    uniprot_id = uniprot_ids.get(hgnc_id)
+    uniprot_id = _hgnc.uniprot_ids.get(hgnc_id)
     # The lookup can yield an empty string. Instead return None.
     if not uniprot_id:
         return None
@@ -52,7 +53,7 @@ def get_entrez_id(hgnc_id):
     entrez_id : str
         The Entrez ID corresponding to the given HGNC ID.
     """
-    entrez_id = entrez_ids.get(hgnc_id)
+    entrez_id = _hgnc.entrez_ids.get(hgnc_id)
     # The lookup can yield an empty string. Instead return None.
     if not entrez_id:
         return None
@@ -72,7 +73,7 @@ def get_hgnc_from_entrez(entrez_id):
     hgnc_id : str
         The HGNC ID corresponding to the given Entrez ID.
     """
-    hgnc_id = entrez_ids_reverse.get(entrez_id)
+    hgnc_id = _hgnc.entrez_ids_reverse.get(entrez_id)
     return hgnc_id
 
 
@@ -90,7 +91,7 @@ def get_ensembl_id(hgnc_id):
     ensembl_id : str
         The Ensembl ID corresponding to the given HGNC ID.
     """
-    return ensembl_ids.get(hgnc_id)
+    return _hgnc.ensembl_ids.get(hgnc_id)
 
 
 def get_hgnc_from_ensembl(ensembl_id):
@@ -106,7 +107,7 @@ def get_hgnc_from_ensembl(ensembl_id):
     hgnc_id : str
         The HGNC ID corresponding to the given Ensembl ID.
     """
-    return ensembl_ids_reverse.get(ensembl_id)
+    return _hgnc.ensembl_ids_reverse.get(ensembl_id)
 
 
 def get_hgnc_name(hgnc_id):
@@ -123,7 +124,7 @@ def get_hgnc_name(hgnc_id):
         The HGNC symbol corresponding to the given HGNC ID.
     """
     try:
-        hgnc_name = hgnc_names[hgnc_id]
+        hgnc_name = _hgnc.hgnc_names[hgnc_id]
     except KeyError:
         xml_tree = get_hgnc_entry(hgnc_id)
         if xml_tree is None:
@@ -149,7 +150,7 @@ def get_hgnc_id(hgnc_name):
     hgnc_id : str
         The HGNC ID corresponding to the given HGNC symbol.
     """
-    return hgnc_ids.get(hgnc_name)
+    return _hgnc.hgnc_ids.get(hgnc_name)
 
 
 def get_current_hgnc_id(hgnc_name):
@@ -172,7 +173,7 @@ def get_current_hgnc_id(hgnc_name):
     hgnc_id = get_hgnc_id(hgnc_name)
     if hgnc_id:
         return hgnc_id
-    hgnc_id = prev_sym_map.get(hgnc_name)
+    hgnc_id = _hgnc.prev_sym_map.get(hgnc_name)
     return hgnc_id
 
 
@@ -191,7 +192,7 @@ def get_hgnc_from_mouse(mgi_id):
     """
     if mgi_id and mgi_id.startswith('MGI:'):
         mgi_id = mgi_id[4:]
-    return mouse_map.get(mgi_id)
+    return _hgnc.mouse_map.get(mgi_id)
 
 
 def get_hgnc_from_rat(rgd_id):
@@ -209,7 +210,7 @@ def get_hgnc_from_rat(rgd_id):
     """
     if rgd_id and rgd_id.startswith('RGD:'):
         rgd_id = rgd_id[4:]
-    return rat_map.get(rgd_id)
+    return _hgnc.rat_map.get(rgd_id)
 
 
 def get_rat_id(hgnc_id):
@@ -225,7 +226,7 @@ def get_rat_id(hgnc_id):
     rgd_id : str
         The RGD ID corresponding to the given HGNC ID.
     """
-    for k, v in rat_map.items():
+    for k, v in _hgnc.rat_map.items():
         if v == hgnc_id:
             return k
 
@@ -243,7 +244,7 @@ def get_mouse_id(hgnc_id):
     mgi_id : str
         The MGI ID corresponding to the given HGNC ID.
     """
-    for k, v in mouse_map.items():
+    for k, v in _hgnc.mouse_map.items():
         if v == hgnc_id:
             return k
 
@@ -288,7 +289,7 @@ def get_gene_type(hgnc_id: str) -> Union[str, None]:
     :
         The locus type of the given gene.
     """
-    return gene_type.get(hgnc_id)
+    return _hgnc.gene_type.get(hgnc_id)
 
 
 def is_kinase(gene_name):
@@ -304,7 +305,7 @@ def is_kinase(gene_name):
     bool
         True if the given gene name corresponds to a kinase, False otherwise.
     """
-    return gene_name in kinases
+    return gene_name in _gene_lists.kinases
 
 
 def is_transcription_factor(gene_name):
@@ -321,7 +322,7 @@ def is_transcription_factor(gene_name):
         True if the given gene name corresponds to a transcription factor,
         False otherwise.
     """
-    return gene_name in tfs
+    return gene_name in _gene_lists.tfs
 
 
 def is_phosphatase(gene_name):
@@ -338,7 +339,7 @@ def is_phosphatase(gene_name):
         True if the given gene name corresponds to a phosphatase,
         False otherwise.
     """
-    return gene_name in phosphatases
+    return gene_name in _gene_lists.phosphatases
 
 
 def get_enzymes(hgnc_id: str) -> Set[str]:
@@ -354,7 +355,7 @@ def get_enzymes(hgnc_id: str) -> Set[str]:
     :
         A set of EC codes
     """
-    return hgnc_to_enzymes.get(hgnc_id, set())
+    return _hgnc.hgnc_to_enzymes.get(hgnc_id, set())
 
 
 def get_hgncs_from_enzyme(ec_code: str) -> Set[str]:
@@ -370,7 +371,7 @@ def get_hgncs_from_enzyme(ec_code: str) -> Set[str]:
     :
         A set of HGNC identifiers
     """
-    return enzyme_to_hgncs.get(ec_code, set())
+    return _hgnc.enzyme_to_hgncs.get(ec_code, set())
 
 
 def get_hgnc_id_from_mgi_name(mgi_name: str) -> Union[str, None]:
@@ -534,12 +535,13 @@ def _read_hgnc_maps():
     )
 
 
-(
-    hgnc_names, hgnc_ids, hgnc_withdrawn, uniprot_ids, entrez_ids,
-    entrez_ids_reverse, mouse_map, rat_map, prev_sym_map, ensembl_ids,
-    ensembl_ids_reverse, gene_type,
-    hgnc_to_enzymes, enzyme_to_hgncs, uniprot_ids_preferred
-) = _read_hgnc_maps()
+_hgnc = LazyResource(_read_hgnc_maps, [
+    'hgnc_names', 'hgnc_ids', 'hgnc_withdrawn', 'uniprot_ids', 'entrez_ids',
+    'entrez_ids_reverse', 'mouse_map', 'rat_map', 'prev_sym_map',
+    'ensembl_ids', 'ensembl_ids_reverse', 'gene_type',
+    'hgnc_to_enzymes', 'enzyme_to_hgncs', 'uniprot_ids_preferred'
+], globals(), sources=[get_resource_path('hgnc_entries.tsv'),
+                       get_resource_path('hgnc_uniprot_preferred.csv')])
 
 
 def _read_kinases():
@@ -568,4 +570,7 @@ def _read_tfs():
     return gene_names
 
 
-kinases, phosphatases, tfs = _read_kinases(), _read_phosphatases(), _read_tfs()
+_gene_lists = LazyResource(
+    lambda: (_read_kinases(), _read_phosphatases(), _read_tfs()),
+    ['kinases', 'phosphatases', 'tfs'], globals())
+__getattr__ = make_module_getattr(__name__, _hgnc, _gene_lists)
@@ -4,9 +4,12 @@ import json
 import requests
 import itertools
 from typing import List
-from functools import lru_cache
+from functools import lru_cache, wraps
 from os.path import abspath, dirname, join, pardir
+from indra.config import get_config
 from indra.util import read_unicode_csv
+from indra.util.response_cache import ResponseCache
+from indra.resources import LazyResource, make_module_getattr
 
 MESH_URL = 'https://id.nlm.nih.gov/mesh/'
 HERE = dirname(abspath(__file__))
@@ -17,46 +20,46 @@ DB_MAPPINGS = join(RESOURCES, 'mesh_mappings.tsv')
 CAS_MAPPINGS = join(RESOURCES, 'mesh_cas_mappings.tsv')
 
 
-mesh_id_to_name = {}
-mesh_name_to_id = {}
-mesh_name_to_id_name = {}
-mesh_id_to_tree_numbers = {}
-mesh_supp_to_primary = {}
-mesh_to_ncbitaxon = {}
-ncbitaxon_to_mesh = {}
-
-
-def _load_mesh_file(path, supplementary):
-    it = read_unicode_csv(path, delimiter='\t')
-    for terms in it:
-        if supplementary:
-            mesh_id, mesh_label, mesh_terms_str, mapped_to_str = terms
-            mesh_supp_to_primary[mesh_id] = mapped_to_str.split(',')
-        else:
-            mesh_id, mesh_label, mesh_terms_str, \
-                tree_number_str, taxon_ids = terms
-            if taxon_ids:
-                taxon_ids = taxon_ids.split('|')
-                for taxon_id in taxon_ids:
-                    # Note that these seem to be one-to-one so
-                    # we don't need to worry about overwriting
-                    ncbitaxon_to_mesh[taxon_id] = mesh_id
-                mesh_to_ncbitaxon[mesh_id] = taxon_ids
-            # This is a rare corner case where an entry is outside the
-            # tree structure, e.g., D005260, D008297
-            if not tree_number_str:
-                continue
-            mesh_id_to_tree_numbers[mesh_id] = tree_number_str.split('|')
-        mesh_terms = mesh_terms_str.split('|') if mesh_terms_str else []
-        mesh_id_to_name[mesh_id] = mesh_label
-        mesh_name_to_id[mesh_label] = mesh_id
-        for term in mesh_terms:
-            mesh_name_to_id_name[term] = [mesh_id, mesh_label]
-
-
-_load_mesh_file(MESH_FILE, supplementary=False)
-if os.path.exists(MESH_SUPP_FILE):
-    _load_mesh_file(MESH_SUPP_FILE, supplementary=True)
+def _load_mesh_files():
+    mesh_id_to_name = {}
+    mesh_name_to_id = {}
+    mesh_name_to_id_name = {}
+    mesh_id_to_tree_numbers = {}
+    mesh_supp_to_primary = {}
+    mesh_to_ncbitaxon = {}
+    ncbitaxon_to_mesh = {}
+    paths = [(MESH_FILE, False)]
+    if os.path.exists(MESH_SUPP_FILE):
+        paths.append((MESH_SUPP_FILE, True))
+    for path, supplementary in paths:
+        for terms in read_unicode_csv(path, delimiter='\t'):
+            if supplementary:
+                mesh_id, mesh_label, mesh_terms_str, mapped_to_str = terms
+                mesh_supp_to_primary[mesh_id] = mapped_to_str.split(',')
+            else:
+                mesh_id, mesh_label, mesh_terms_str, \
+                    tree_number_str, taxon_ids = terms
+                if taxon_ids:
+                    taxon_ids = taxon_ids.split('|')
+                    for taxon_id in taxon_ids:
+                        # Note that these seem to be one-to-one so
+                        # we don't need to worry about overwriting
+                        ncbitaxon_to_mesh[taxon_id] = mesh_id
+                    mesh_to_ncbitaxon[mesh_id] = taxon_ids
+                # This is a rare corner case where an entry is outside the
+                # tree structure, e.g., D005260, D008297
+                if not tree_number_str:
+                    continue
+                mesh_id_to_tree_numbers[mesh_id] = \
+                    tree_number_str.split('|')
+            mesh_terms = mesh_terms_str.split('|') if mesh_terms_str else []
+            mesh_id_to_name[mesh_id] = mesh_label
+            mesh_name_to_id[mesh_label] = mesh_id
+            for term in mesh_terms:
+                mesh_name_to_id_name[term] = [mesh_id, mesh_label]
+    return mesh_id_to_name, mesh_name_to_id, mesh_name_to_id_name, \
+        mesh_id_to_tree_numbers, mesh_supp_to_primary, mesh_to_ncbitaxon, \
+        ncbitaxon_to_mesh
 
 
 def _load_db_mappings(db_mappings_path, cas_mappings_path):
@@ -90,10 +93,166 @@ def _load_db_mappings(db_mappings_path, cas_mappings_path):
     return mesh_to_db, db_to_mesh
 
 
-mesh_to_db, db_to_mesh = _load_db_mappings(DB_MAPPINGS, CAS_MAPPINGS)
+_mesh = LazyResource(_load_mesh_files, [
+    'mesh_id_to_name', 'mesh_name_to_id', 'mesh_name_to_id_name',
+    'mesh_id_to_tree_numbers', 'mesh_supp_to_primary', 'mesh_to_ncbitaxon',
+    'ncbitaxon_to_mesh'], globals(), sources=[MESH_FILE, MESH_SUPP_FILE])
+_db_mappings = LazyResource(
+    lambda: _load_db_mappings(DB_MAPPINGS, CAS_MAPPINGS),
+    ['mesh_to_db', 'db_to_mesh'], globals(),
+    sources=[DB_MAPPINGS, CAS_MAPPINGS])
+
+
+class MeshTreeIndex(object):
+    """An index of the MeSH hierarchy for fast category and ancestor checks.
+
+    For each MeSH ID, the index holds the set of tree numbers that are
+    prefixes of the ID's tree numbers at a level of the hierarchy (e.g.,
+    D12, D12.776 and D12.776.157 for D12.776.157) along with the letters
+    of the trees it appears in, and a bitset of the commonly checked
+    categories in :data:`CATEGORY_PREFIXES` it belongs to. The entries of
+    primary terms are computed when the index is built, and the ones of
+    supplementary concepts, via the primary terms they are mapped to, when
+    they are first needed. IDs that are in neither table have no entry of
+    their own, so the index stays the same size however many IDs are
+    looked up.
+
+    Parameters
+    ----------
+    mesh_id_to_tree_numbers : dict[str, list[str]]
+        The tree numbers of each primary MeSH ID.
+    mesh_supp_to_primary : Optional[dict[str, list[str]]]
+        The primary MeSH IDs each supplementary concept is mapped to.
+    """
+    #: The tree number prefixes whose membership is stored as a bitset
+    CATEGORY_PREFIXES = ['A', 'B', 'C', 'D', 'D08', 'D12']
+
+    def __init__(self, mesh_id_to_tree_numbers, mesh_supp_to_primary=None):
+        self._supp_to_primary = mesh_supp_to_primary or {}
+        self._category_bits = {prefix: 1 << idx for idx, prefix
+                               in enumerate(self.CATEGORY_PREFIXES)}
+        self.tree_number_to_id = {}
+        self._entries = {}
+        for mesh_id, tree_numbers in mesh_id_to_tree_numbers.items():
+            tree_numbers = list(tree_numbers)
+            for tree_number in tree_numbers:
+                self.tree_number_to_id[tree_number] = mesh_id
+            self._entries[mesh_id] = self._make_entry(tree_numbers)
+        self._empty_entry = self._make_entry([])
+
+    def _make_entry(self, tree_numbers):
+        prefixes = set()
+        for tree_number in tree_numbers:
+            prefixes.add(tree_number[:1])
+            parts = tree_number.split('.')
+            for idx in range(1, len(parts) + 1):
+                prefixes.add('.'.join(parts[:idx]))
+        mask = 0
+        for prefix, bit in self._category_bits.items():
+            if prefix in prefixes:
+                mask |= bit
+        return tuple(tree_numbers), frozenset(prefixes), mask
+
+    def _get_entry(self, mesh_id):
+        entry = self._entries.get(mesh_id)
+        if entry is None:
+            # Supplementary concepts get the tree numbers of the primary
+            # terms they are mapped to, other IDs have no tree numbers.
+            primary_ids = self._supp_to_primary.get(mesh_id) \
+                if mesh_id and mesh_id.startswith('C') else None
+            if not primary_ids:
+                # Entries are only stored for the IDs in the tables so
+                # that the index doesn't grow with every ID queried.
+                return self._empty_entry
+            tree_numbers = set()
+            for primary_id in primary_ids:
+                primary_entry = self._entries.get(primary_id)
+                if primary_entry:
+                    tree_numbers |= set(primary_entry[0])
+            entry = self._make_entry(sorted(tree_numbers))
+            self._entries[mesh_id] = entry
+        return entry
+
+    def get_tree_numbers(self, mesh_id):
+        """Return the tree numbers of a MeSH ID."""
+        return list(self._get_entry(mesh_id)[0])
+
+    def has_tree_prefix(self, mesh_id, tree_prefix):
+        """Return True if the MeSH ID has a tree number with the prefix."""
+        bit = self._category_bits.get(tree_prefix)
+        if bit is not None:
+            return bool(self._get_entry(mesh_id)[2] & bit)
+        tree_numbers, prefixes, _ = self._get_entry(mesh_id)
+        # Tree numbers consist of three character parts separated by dots,
+        # so prefixes that end at a level of the hierarchy can be looked up
+        # directly, other prefixes are matched against each tree number.
+        if len(tree_prefix) == 1 or \
+                all(len(part) == 3 for part in tree_prefix.split('.')):
+            return tree_prefix in prefixes
+        return any(tn.startswith(tree_prefix) for tn in tree_numbers)
+
+    def isa(self, mesh_id1, mesh_id2):
+        """Return True if the first MeSH ID is the same as or below the
+        second one in the hierarchy."""
+        prefixes = self._get_entry(mesh_id1)[1]
+        return any(tn in prefixes for tn in self._get_entry(mesh_id2)[0])
+
+    def get_ancestors(self, mesh_id):
+        """Return the MeSH IDs above a MeSH ID in the hierarchy."""
+        ancestors = {self.tree_number_to_id[prefix] for prefix
+                     in self._get_entry(mesh_id)[1]
+                     if prefix in self.tree_number_to_id}
+        ancestors.discard(mesh_id)
+        return ancestors
+
+
+_tree_index = LazyResource(
+    lambda: MeshTreeIndex(_mesh.mesh_id_to_tree_numbers,
+                          _mesh.mesh_supp_to_primary),
+    ['mesh_tree_index'], globals())
+__getattr__ = make_module_getattr(__name__, _mesh, _db_mappings,
+                                  _tree_index)
+
+
+_web_cache = None
+
+
+def _get_web_cache():
+    global _web_cache
+    cache_dir = get_config('INDRA_MESH_WEB_CACHE_DIR', failure_ok=True)
+    if not cache_dir:
+        return None
+    if _web_cache is None or \
+            _web_cache.cache_dir != os.path.expanduser(cache_dir):
+        _web_cache = ResponseCache(cache_dir)
+    return _web_cache
+
+
+def _web_cached(func):
+    """Cache the results of a function calling a web service on disk.
+
+    If the INDRA_MESH_WEB_CACHE_DIR configuration option is set, the
+    (JSON-serializable) results of the function are stored in that folder,
+    keyed by the function's name and arguments. Missing results (None) are
+    not cached.
+    """
+    @wraps(func)
+    def wrapper(*args):
+        cache = _get_web_cache()
+        if cache is None:
+            return func(*args)
+        key = cache.get_key(func.__name__, *args)
+        res = cache.get(key)
+        if res is None:
+            res = func(*args)
+            if res is not None:
+                cache.put(key, res)
+        return res
+    return wrapper
 
 
 @lru_cache(maxsize=1000)
+@_web_cached
 def get_mesh_name_from_web(mesh_id):
     """Get the MESH label for the given MESH ID using the NLM REST API.
 
@@ -141,7 +300,7 @@ def get_mesh_name(mesh_id, offline=False):
         Label for the MESH ID, or None if the query failed or no label was
         found.
     """
-    indra_mesh_mapping = mesh_id_to_name.get(mesh_id)
+    indra_mesh_mapping = _mesh.mesh_id_to_name.get(mesh_id)
     if offline or indra_mesh_mapping is not None:
         return indra_mesh_mapping
     # Look up the MESH mapping from NLM if we don't have it locally
@@ -175,12 +334,12 @@ def get_mesh_id_name(mesh_term, offline=False):
     if not mesh_term:
         return None, None
 
-    indra_mesh_id = mesh_name_to_id.get(mesh_term)
+    indra_mesh_id = _mesh.mesh_name_to_id.get(mesh_term)
     if indra_mesh_id is not None:
         return indra_mesh_id, mesh_term
 
     indra_mesh_id, new_term = \
-        mesh_name_to_id_name.get(mesh_term, (None, None))
+        _mesh.mesh_name_to_id_name.get(mesh_term, (None, None))
     if indra_mesh_id is not None:
         return indra_mesh_id, new_term
 
@@ -192,6 +351,7 @@ def get_mesh_id_name(mesh_term, offline=False):
 
 
 @lru_cache(maxsize=1000)
+@_web_cached
 def submit_sparql_query(query_body):
     url = MESH_URL + 'sparql'
     query = '%s\n%s' % (mesh_rdf_prefixes, query_body)
@@ -254,13 +414,36 @@ def get_mesh_id_name_from_web(mesh_term):
     return id, name
 
 
+def get_mesh_tree_index():
+    """Return the index of the MeSH hierarchy built from the resource files.
+
+    Returns
+    -------
+    MeshTreeIndex
+        The index of the MeSH hierarchy.
+    """
+    return _tree_index.mesh_tree_index
+
+
 def mesh_isa(mesh_id1, mesh_id2):
-    tns1 = get_mesh_tree_numbers(mesh_id1)
-    tns2 = get_mesh_tree_numbers(mesh_id2)
-    for t1, t2 in itertools.product(tns1, tns2):
-        if t1.startswith(t2):
-            return True
-    return False
+    return get_mesh_tree_index().isa(mesh_id1, mesh_id2)
+
+
+def get_mesh_ancestors(mesh_id):
+    """Return the MeSH IDs above a given MeSH ID in the hierarchy.
+
+    Parameters
+    ----------
+    mesh_id : str
+        A MeSH ID, which can also be a supplementary concept.
+
+    Returns
+    -------
+    set[str]
+        The MeSH IDs of the ancestors of the given MeSH ID, i.e., the terms
+        whose tree numbers are prefixes of its tree numbers.
+    """
+    return get_mesh_tree_index().get_ancestors(mesh_id)
 
 
 def mesh_isa_web(mesh_id1, mesh_id2):
@@ -310,11 +493,12 @@ def get_mesh_tree_numbers(mesh_id):
         primary_ids = get_primary_mappings(mesh_id)
         all_tree_ids = set()
         for primary_id in primary_ids:
-            all_tree_ids |= set(mesh_id_to_tree_numbers.get(primary_id, []))
+            all_tree_ids |= \
+                set(_mesh.mesh_id_to_tree_numbers.get(primary_id, []))
         return list(all_tree_ids)
     # Handle primary terms
     else:
-        return mesh_id_to_tree_numbers.get(mesh_id, [])
+        return _mesh.mesh_id_to_tree_numbers.get(mesh_id, [])
 
 
 def get_mesh_tree_numbers_from_web(mesh_id):
@@ -355,8 +539,7 @@ def get_mesh_tree_numbers_from_web(mesh_id):
 
 def has_tree_prefix(mesh_id, tree_prefix):
     """Return True if the given MeSH ID has the given tree prefix."""
-    tree_numbers = get_mesh_tree_numbers(mesh_id)
-    return any(tn.startswith(tree_prefix) for tn in tree_numbers)
+    return get_mesh_tree_index().has_tree_prefix(mesh_id, tree_prefix)
 
 
 def is_disease(mesh_id):
@@ -429,7 +612,7 @@ def get_db_mapping(mesh_id):
         A tuple consisting of a DB namespace and ID for the mapping or None
         if not available.
     """
-    return mesh_to_db.get(mesh_id)
+    return _db_mappings.mesh_to_db.get(mesh_id)
 
 
 def get_mesh_id_from_db_id(db_ns, db_id):
@@ -448,7 +631,7 @@ def get_mesh_id_from_db_id(db_ns, db_id):
         The MeSH ID corresponding to the given namespace and ID if available,
         otherwise None.
     """
-    return db_to_mesh.get((db_ns, db_id))
+    return _db_mappings.db_to_mesh.get((db_ns, db_id))
 
 
 def get_primary_mappings(db_id: str) -> List[str]:
@@ -467,7 +650,7 @@ def get_primary_mappings(db_id: str) -> List[str]:
         The list of primary MeSH terms that the supplementary concept
         is heading-mapped to.
     """
-    return mesh_supp_to_primary.get(db_id, [])
+    return _mesh.mesh_supp_to_primary.get(db_id, [])
 
 
 mesh_rdf_prefixes = """
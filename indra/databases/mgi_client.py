@@ -4,7 +4,8 @@ from collections import defaultdict
 from typing import List, Union
 
 from indra.util import read_unicode_csv
-from indra.resources import get_resource_path
+from indra.resources import get_resource_path, LazyResource, \
+    make_module_getattr
 
 
 def get_id_from_name(name: str) -> Union[str, None]:
@@ -20,7 +21,7 @@ def get_id_from_name(name: str) -> Union[str, None]:
     :
         The MGI ID (without prefix) or None if not available.
     """
-    return mgi_name_to_id.get(name)
+    return _mgi.mgi_name_to_id.get(name)
 
 
 def get_name_from_id(mgi_id: str) -> Union[str, None]:
@@ -38,7 +39,7 @@ def get_name_from_id(mgi_id: str) -> Union[str, None]:
     """
     if mgi_id and mgi_id.startswith('MGI:'):
         mgi_id = mgi_id[4:]
-    return mgi_id_to_name.get(mgi_id)
+    return _mgi.mgi_id_to_name.get(mgi_id)
 
 
 def get_synonyms(mgi_id: str) -> List[str]:
@@ -57,7 +58,7 @@ def get_synonyms(mgi_id: str) -> List[str]:
     """
     if mgi_id and mgi_id.startswith('MGI:'):
         mgi_id = mgi_id[4:]
-    return mgi_synonyms.get(mgi_id, [])
+    return _mgi.mgi_synonyms.get(mgi_id, [])
 
 
 def get_id_from_name_synonym(name_synonym: str) -> Union[None, str, List[str]]:
@@ -81,10 +82,10 @@ def get_id_from_name_synonym(name_synonym: str) -> Union[None, str, List[str]]:
         The MGI ID (without prefix) of a single gene, a list of MGI IDs,
         or None.
     """
-    mgi_id = mgi_name_to_id.get(name_synonym)
+    mgi_id = _mgi.mgi_name_to_id.get(name_synonym)
     if mgi_id:
         return mgi_id
-    mgi_ids = mgi_synonyms_reverse.get(name_synonym)
+    mgi_ids = _mgi.mgi_synonyms_reverse.get(name_synonym)
     if mgi_ids:
         if len(mgi_ids) == 1:
             return mgi_ids[0]
@@ -108,7 +109,7 @@ def get_ensembl_id(mgi_id: str) -> Union[str, None]:
     """
     if mgi_id and mgi_id.startswith('MGI:'):
         mgi_id = mgi_id[4:]
-    return mgi_id_to_ensembl.get(mgi_id)
+    return _mgi.mgi_id_to_ensembl.get(mgi_id)
 
 
 def _read_mgi():
@@ -134,5 +135,8 @@ def _read_mgi():
         dict(mgi_synonyms_reverse), mgi_id_to_ensembl
 
 
-mgi_id_to_name, mgi_name_to_id, mgi_synonyms, mgi_synonyms_reverse, \
-   mgi_id_to_ensembl = _read_mgi()
+_mgi = LazyResource(_read_mgi, ['mgi_id_to_name', 'mgi_name_to_id',
+                                 'mgi_synonyms', 'mgi_synonyms_reverse',
+                                 'mgi_id_to_ensembl'], globals(),
+                    sources=[get_resource_path('mgi_entries.tsv')])
+__getattr__ = make_module_getattr(__name__, _mgi)
@@ -35,11 +35,26 @@ class OntologyClient:
     """A base client class for OBO and OWL ontologies."""
 
     def __init__(self, prefix: str):
-        """Read the OBO file export at the given path."""
+        """Prepare a client for the OBO file export of the given prefix.
+
+        The export is only read once the client is first used.
+        """
         self.prefix = prefix.lower()
+        self._resource_prefix = prefix
+
+    def __getattr__(self, name):
+        # This is only called for attributes that are not set yet, so the
+        # first access to the lookup tables triggers loading them.
+        if name in {'entries', 'alt_to_id', 'name_to_id', 'synonym_to_id'}:
+            self._load()
+            return self.__dict__[name]
+        raise AttributeError(name)
+
+    def _load(self):
+        """Read the OBO file export and build the lookup tables."""
         self.entries = {
             entry['id']: entry for entry
-            in load_resource_json(f'{prefix}.json')
+            in load_resource_json(f'{self._resource_prefix}.json')
         }
         self.alt_to_id = {}
         self.name_to_id = {}
@@ -2,7 +2,8 @@ import logging
 import requests
 from typing import List, Union
 from functools import lru_cache
-from indra.resources import get_resource_path
+from indra.resources import get_resource_path, LazyResource, \
+    make_module_getattr
 from indra.util import read_unicode_csv
 
 
@@ -122,7 +123,7 @@ def get_mesh_id(pubchem_cid: str) -> Union[str, None]:
         The MeSH ID corresponding to the PubChem CID or None
         if not available.
     """
-    return pubchem_mesh_map.get(pubchem_cid)
+    return _pubchem_mesh.pubchem_mesh_map.get(pubchem_cid)
 
 
 def _load_pubchem_mesh_map():
@@ -132,4 +133,7 @@ def _load_pubchem_mesh_map():
     return mappings
 
 
-pubchem_mesh_map = _load_pubchem_mesh_map()
+_pubchem_mesh = LazyResource(
+    _load_pubchem_mesh_map, ['pubchem_mesh_map'], globals(),
+    sources=[get_resource_path('pubchem_mesh_map.tsv')])
+__getattr__ = make_module_getattr(__name__, _pubchem_mesh)
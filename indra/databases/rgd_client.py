@@ -4,7 +4,8 @@ from collections import defaultdict
 from typing import List, Union
 
 from indra.util import read_unicode_csv
-from indra.resources import get_resource_path
+from indra.resources import get_resource_path, LazyResource, \
+    make_module_getattr
 
 
 def get_id_from_name(name: str) -> Union[str, None]:
@@ -20,7 +21,7 @@ def get_id_from_name(name: str) -> Union[str, None]:
     :
         The RGD ID (without prefix) or None if not available.
     """
-    return rgd_name_to_id.get(name)
+    return _rgd.rgd_name_to_id.get(name)
 
 
 def get_name_from_id(rgd_id: str) -> Union[str, None]:
@@ -36,7 +37,7 @@ def get_name_from_id(rgd_id: str) -> Union[str, None]:
     :
         The RGD symbol for the given ID or None if not available.
     """
-    return rgd_id_to_name.get(rgd_id)
+    return _rgd.rgd_id_to_name.get(rgd_id)
 
 
 def get_synonyms(rgd_id: str) -> List[str]:
@@ -53,7 +54,7 @@ def get_synonyms(rgd_id: str) -> List[str]:
         The list of synonyms corresponding to the RGD ID, or an empty list
         if not available.
     """
-    return rgd_synonyms.get(rgd_id, [])
+    return _rgd.rgd_synonyms.get(rgd_id, [])
 
 
 def get_id_from_name_synonym(name_synonym: str) -> Union[None, str, List[str]]:
@@ -77,10 +78,10 @@ def get_id_from_name_synonym(name_synonym: str) -> Union[None, str, List[str]]:
         The RGD ID (without prefix) of a single gene, a list of RGD IDs,
         or None.
     """
-    rgd_id = rgd_name_to_id.get(name_synonym)
+    rgd_id = _rgd.rgd_name_to_id.get(name_synonym)
     if rgd_id:
         return rgd_id
-    rgd_ids = rgd_synonyms_reverse.get(name_synonym)
+    rgd_ids = _rgd.rgd_synonyms_reverse.get(name_synonym)
     if rgd_ids:
         if len(rgd_ids) == 1:
             return rgd_ids[0]
@@ -103,7 +104,7 @@ def get_ensembl_id(rgd_id: str) -> Union[str, None]:
         A list of Ensembl IDs corresponding to the RGD ID,
         or None if not available.
     """
-    return rgd_id_to_ensembl.get(rgd_id)
+    return _rgd.rgd_id_to_ensembl.get(rgd_id)
 
 
 def _read_rgd():
@@ -134,5 +135,8 @@ def _read_rgd():
         dict(rgd_synonyms_reverse), rgd_id_to_ensembl, ensemble_id_to_rgd
 
 
-rgd_id_to_name, rgd_name_to_id, rgd_synonyms, rgd_synonyms_reverse, \
-   rgd_id_to_ensembl, ensemble_id_to_rgd = _read_rgd()
+_rgd = LazyResource(_read_rgd, ['rgd_id_to_name', 'rgd_name_to_id',
+                                 'rgd_synonyms', 'rgd_synonyms_reverse',
+                                 'rgd_id_to_ensembl', 'ensemble_id_to_rgd'],
+                    globals(), sources=[get_resource_path('rgd_entries.tsv')])
+__getattr__ = make_module_getattr(__name__, _rgd)
@@ -64,14 +64,8 @@ def get_text_content_for_pmids(pmids):
         else:
             pmc_pmids.discard(pmid)
 
-    pmc_xmls = []
+    pmc_xmls = list(pmc_client.get_xml_many(pmc_ids).values())
     failed = set()
-    for pmc_id in pmc_ids:
-        if pmc_id is not None:
-            pmc_xmls.append(pmc_client.get_xml(pmc_id))
-        else:
-            failed.add(pmid)
-        time.sleep(0.5)
 
     remaining_pmids = set(pmids) - pmc_pmids | failed
     abstracts = []
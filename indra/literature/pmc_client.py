@@ -1,13 +1,17 @@
 from __future__ import absolute_import, print_function, unicode_literals
 from builtins import dict, str
 import re
+import gzip
+import hashlib
 import logging
 import os.path
-import requests
+import threading
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 from lxml import etree
-from lxml.etree import QName
 import xml.etree.ElementTree as ET
 
+from indra.config import get_config
 from indra.literature import pubmed_client
 from indra.util import UnicodeXMLTreeBuilder as UTB
 
@@ -95,18 +99,101 @@ def get_ids(search_term, retmax=1000):
     return pubmed_client.get_ids(search_term, retmax=retmax, db='pmc')
 
 
-def get_xml(pmc_id):
-    """Returns XML for the article corresponding to a PMC ID."""
+def get_xml(pmc_id, cache=None):
+    """Returns XML for the article corresponding to a PMC ID.
+
+    Parameters
+    ----------
+    pmc_id : str
+        A PMC ID, with or without the PMC prefix.
+    cache : Optional[XmlCache]
+        An on-disk cache in which the XML is looked up before it is
+        downloaded, and to which downloaded XML is added. If None, the cache
+        configured by INDRA_PMC_CACHE_DIR is used, if any. Set to False to
+        disable caching. Default: None
+
+    Returns
+    -------
+    str or None
+        The XML of the article, or None if it couldn't be downloaded.
+    """
+    if cache is None:
+        cache = get_default_xml_cache()
+    pmc_id = _strip_pmc_prefix(pmc_id)
+    if cache:
+        xml_str = cache.get(pmc_id)
+        if xml_str is not None:
+            return xml_str
+    xml_str = _download_xml(pmc_id)
+    if xml_str is not None and cache:
+        cache.put(pmc_id, xml_str)
+    return xml_str
+
+
+def get_xml_many(pmc_ids, max_workers=None, cache=None):
+    """Return the XML of the articles corresponding to a list of PMC IDs.
+
+    Articles found in the cache are read from it, the others are downloaded
+    in parallel, while the overall rate of requests is kept within the
+    limits set by NCBI (see
+    :func:`indra.literature.pubmed_client.get_rate_limiter`).
+
+    Parameters
+    ----------
+    pmc_ids : list of str
+        A list of PMC IDs, with or without the PMC prefix.
+    max_workers : Optional[int]
+        The number of articles downloaded in parallel. Default: the number of
+        requests per second allowed by NCBI.
+    cache : Optional[XmlCache]
+        An on-disk cache in which the XML is looked up before it is
+        downloaded, and to which downloaded XML is added. If None, the cache
+        configured by INDRA_PMC_CACHE_DIR is used, if any. Set to False to
+        disable caching. Default: None
+
+    Returns
+    -------
+    dict
+        A dict of the XML of each article (or None if it couldn't be
+        downloaded) keyed by the PMC IDs as given.
+    """
+    if cache is None:
+        cache = get_default_xml_cache() or False
+    if max_workers is None:
+        max_workers = int(pubmed_client.get_rate_limiter().rate)
+    results = {}
+    to_download = []
+    for pmc_id in dict.fromkeys(pmc_ids):
+        xml_str = cache.get(_strip_pmc_prefix(pmc_id)) if cache else None
+        if xml_str is not None:
+            results[pmc_id] = xml_str
+        else:
+            to_download.append(pmc_id)
+    logger.info('Found %d articles in the cache, downloading %d articles'
+                % (len(results), len(to_download)))
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        downloaded = executor.map(lambda pmc_id: get_xml(pmc_id, cache=cache),
+                                  to_download)
+        results.update(zip(to_download, downloaded))
+    return {pmc_id: results[pmc_id] for pmc_id in pmc_ids}
+
+
+def _strip_pmc_prefix(pmc_id):
     if pmc_id.upper().startswith('PMC'):
         pmc_id = pmc_id[3:]
+    return pmc_id
+
+
+def _download_xml(pmc_id):
     # Request params
     params = {}
     params['verb'] = 'GetRecord'
     params['identifier'] = 'oai:pubmedcentral.nih.gov:%s' % pmc_id
     params['metadataPrefix'] = 'pmc'
-    # Submit the request
-    res = requests.get(pmc_url, params)
-    if not res.status_code == 200:
+    # Submit the request through the rate limited session shared with
+    # the PubMed client
+    res = pubmed_client._get_response(pmc_url, params)
+    if res is None:
         logger.warning("Couldn't download %s" % pmc_id)
         return None
     # Read the bytestream
@@ -126,6 +213,106 @@ def get_xml(pmc_id):
         return xml_bytes.decode('utf-8')
 
 
+class XmlCache(object):
+    """A content-addressed on-disk cache of article XML.
+
+    The XML of each article is stored compressed in a file named after the
+    SHA-256 digest of its content, and a small reference file per PMC ID
+    points to that digest. Identical content is therefore only stored once,
+    files are never partially overwritten, and corrupted files are detected
+    (and treated as missing) when read.
+
+    Parameters
+    ----------
+    cache_dir : str
+        The folder in which the XML is stored. It is created if it doesn't
+        exist.
+    """
+    def __init__(self, cache_dir):
+        self.cache_dir = os.path.expanduser(cache_dir)
+        os.makedirs(os.path.join(self.cache_dir, 'refs'), exist_ok=True)
+        os.makedirs(os.path.join(self.cache_dir, 'objects'), exist_ok=True)
+
+    def _get_ref_path(self, pmc_id):
+        return os.path.join(self.cache_dir, 'refs', pmc_id)
+
+    def _get_object_path(self, digest):
+        return os.path.join(self.cache_dir, 'objects', digest[:2],
+                            digest + '.xml.gz')
+
+    def get(self, pmc_id):
+        """Return the cached XML of an article or None if it isn't cached.
+
+        Parameters
+        ----------
+        pmc_id : str
+            A PMC ID without the PMC prefix.
+
+        Returns
+        -------
+        str or None
+            The XML of the article.
+        """
+        try:
+            with open(self._get_ref_path(pmc_id), 'r') as fh:
+                digest = fh.read().strip()
+            with gzip.open(self._get_object_path(digest), 'rb') as fh:
+                xml_bytes = fh.read()
+        except (OSError, EOFError):
+            return None
+        if hashlib.sha256(xml_bytes).hexdigest() != digest:
+            logger.warning('Cached XML for %s is corrupted' % pmc_id)
+            return None
+        return xml_bytes.decode('utf-8')
+
+    def put(self, pmc_id, xml_str):
+        """Add the XML of an article to the cache.
+
+        Parameters
+        ----------
+        pmc_id : str
+            A PMC ID without the PMC prefix.
+        xml_str : str
+            The XML of the article.
+        """
+        xml_bytes = xml_str.encode('utf-8')
+        digest = hashlib.sha256(xml_bytes).hexdigest()
+        obj_path = self._get_object_path(digest)
+        if not os.path.exists(obj_path):
+            os.makedirs(os.path.dirname(obj_path), exist_ok=True)
+            with _atomic_open(obj_path) as fh:
+                with gzip.GzipFile(fileobj=fh, mode='wb') as gz_fh:
+                    gz_fh.write(xml_bytes)
+        with _atomic_open(self._get_ref_path(pmc_id)) as fh:
+            fh.write(digest.encode('utf-8'))
+
+
+@contextmanager
+def _atomic_open(path):
+    # Write to a temporary file first so that concurrent readers never see
+    # a partially written file.
+    tmp_path = '%s.%d.%d.tmp' % (path, os.getpid(), threading.get_ident())
+    with open(tmp_path, 'wb') as fh:
+        yield fh
+    os.replace(tmp_path, path)
+
+
+def get_default_xml_cache():
+    """Return an XML cache based on the INDRA configuration, if any.
+
+    The cache is configured by setting ``INDRA_PMC_CACHE_DIR``.
+
+    Returns
+    -------
+    XmlCache or None
+        The configured XML cache or None if no cache folder is set.
+    """
+    cache_dir = get_config('INDRA_PMC_CACHE_DIR', failure_ok=True)
+    if not cache_dir:
+        return None
+    return XmlCache(cache_dir)
+
+
 def extract_text(xml_string):
     """Get plaintext from the body of the given NLM XML string.
 
@@ -188,40 +375,9 @@ def extract_paragraphs(xml_string):
     list of str
         List of extracted paragraphs from the input NLM XML
     """
-    output = []
     tree = etree.fromstring(xml_string.encode('utf-8'))
-    # Remove namespaces if any exist
-    if tree.tag.startswith('{'):
-        for element in tree.getiterator():
-            # The following code will throw a ValueError for some
-            # exceptional tags such as comments and processing instructions.
-            # It's safe to just leave these tag names unchanged.
-            try:
-                element.tag = etree.QName(element).localname
-            except ValueError:
-                continue
-        etree.cleanup_namespaces(tree)
-    # Strip out latex
-    _remove_elements_by_tag(tree, 'tex-math')
-    # Strip out all content in unwanted elements except the captions
-    _replace_unwanted_elements_with_their_captions(tree)
-    # First process front element. Titles alt-titles and abstracts
-    # are pulled from here.
-    front_elements = _select_from_top_level(tree, 'front')
-    for element in front_elements:
-        output.extend(_extract_from_front(element))
-    # All paragraphs except those in unwanted elements are extracted
-    # from the article body
-    body_elements = _select_from_top_level(tree, 'body')
-    for element in body_elements:
-        output.extend(_extract_from_body(element))
-    # Only the body sections of subarticles are processed. All
-    # unwanted elements are removed entirely, including captions.
-    # Even boxed-text elements are removed.
-    subarticles = _select_from_top_level(tree, 'sub-article')
-    for element in subarticles:
-        output.extend(_extract_from_subarticle(element))
-    return output
+    extractor = _ParagraphExtractor(tree)
+    return extractor.extract_paragraphs()
 
 
 def filter_pmids(pmid_list, source_type):
@@ -256,239 +412,183 @@ def filter_pmids(pmid_list, source_type):
                                 pmids_fulltext_dict.get(source_type)))
 
 
-def _select_from_top_level(tree, tag):
-    """Select direct children of the article element of a tree by tag.
-
-    Different versions of NLM XML place the article element in different
-    places. We cannot rely on a hard coded path to the article element.  This
-    helper function helps select top level elements beneath article from their
-    tag name. We use this to pull out the front, body, and sub-article elements
-    of an article.
+class _ParagraphExtractor(object):
+    """Extract paragraphs from an NLM XML tree in a single traversal.
 
-    An assumption is made that there is only one article element in the input
-    XML tree. If this is not the case, only the firt article will be
-    processed.
+    The tree isn't modified. Instead, the elements that are to be removed
+    (LaTeX), replaced by their captions (figures, tables and other floating
+    elements) or stripped (all tags except paragraphs and titles) are dealt
+    with as they are encountered, and the text of each paragraph is
+    collected in the same way as if the tree had been rewritten before.
+    Note that, as when removing or replacing elements in an lxml tree, the
+    text following a removed or replaced element (its tail) is dropped.
 
     Parameters
     ----------
     tree : :py:class:`lxml.etree._Element`
         lxml element for entire tree of a valid NLM XML
-
-    tag : str
-        Tag of top level elements to return
-    Returns
-    -------
-    list
-        List containing lxml Element objects of selected top level elements.
-        Typically there is only one front and one body that are direct chilren
-        of the article element, but there can be multiple subarticles.
-    """
-    if tree.tag == 'article':
-        article = tree
-    else:
-        article = tree.xpath('.//article')
-        if not len(article):
-            raise ValueError('Input XML contains no article element')
-        # Assume there is only one article
-        article = article[0]
-    output = []
-    xpath = './%s' % tag
-    for element in article.xpath(xpath):
-        output.append(element)
-    return output
-
-
-def _extract_from_front(front_element):
-    """Return list of titles and paragraphs from front of NLM XML
-
-    Parameters
-    ----------
-    front_element : :py:class:`lxml.etree._Element`
-        etree element for front of a valid NLM XML
-    Returns
-    -------
-    list of str
-        List of relevant plain text titles and paragraphs taken from front
-        section of NLM XML. These include the article title, alt title,
-        and paragraphs within abstracts. Unwanted paragraphs such as
-        author statements are excluded.
     """
-    output = []
-    title_xpath = './article-meta/title-group/article-title'
-    alt_title_xpath = './article-meta/title-group/alt-title'
-    abstracts_xpath = './article-meta/abstract'
-    for element in front_element.xpath(_xpath_union(title_xpath,
-                                                    alt_title_xpath,
-                                                    abstracts_xpath)):
-        if element.tag == 'abstract':
-            # Extract paragraphs from abstracts
-            output.extend(_extract_paragraphs_from_tree(element))
-        else:
-            # No paragraphs in titles, Just strip tags
-            output.append(' '.join(element.itertext()))
-    return output
-
-
-def _extract_from_body(body_element):
-    """Return list of paragraphs from main article body of NLM XML
-
-    See DocString for extract_paragraphs for more info
-    """
-    return _extract_paragraphs_from_tree(body_element)
-
-
-def _extract_from_subarticle(subarticle_element):
-    """Return list of relevant paragraphs from a subarticle
-
-    See DocString for extract_paragraphs for more info.
-    """
-    # Get only body element
-    body = subarticle_element.xpath('./body')
-    if not body:
-        return []
-    body = body[0]
-    # Remove float elements. From observation these do not appear to
-    # contain any meaningful information within sub-articles.
-    for element in body.xpath(".//*[@position='float']"):
-        element.getparent().remove(element)
-    return _extract_paragraphs_from_tree(body)
-
-
-def _remove_elements_by_tag(tree, *tags):
-    """Remove elements with given tags
-
-    Removes all element along with all of its content.
-    Modifies input tree inplace
-
-    Parameters
-    ----------
-    tree : :py:class:`lxml.etree._Element`
-        etree element for valid NLM XML
-    """
-    bad_xpath = _xpath_union(*['.//%s' % tag for tag in tags])
-    for element in tree.xpath(bad_xpath):
-        element.getparent().remove(element)
-
-
-def _replace_unwanted_elements_with_their_captions(tree):
-    """Replace all unwanted elements with their captions
-
-    Modifies input tree inplace.
-
-    Parameters
-    ----------
-    tree : :py:class:`lxml.etree._Element`
-        etree element for valid NLM XML
-    """
-    floats_xpath = "//*[@position='float']"
-    figs_xpath = './/fig'
-    tables_xpath = './/table-wrap'
-    unwanted_xpath = _xpath_union(floats_xpath, figs_xpath, tables_xpath)
-    unwanted = tree.xpath(unwanted_xpath)
-    # Iterating through xpath nodes in reverse leads to processing these
-    # nodes from bottom up.
-    for element in unwanted[::-1]:
-        # Don't remove floats that are boxed-text elements. These often contain
+    def __init__(self, tree):
+        self.tree = tree
+        # Namespaces are ignored if the root element has one
+        self.strip_namespaces = tree.tag.startswith('{')
+
+    def get_tag(self, element):
+        """Return the tag of an element, or None for comments and PIs."""
+        tag = element.tag
+        if not isinstance(tag, str):
+            return None
+        if self.strip_namespaces and tag.startswith('{'):
+            tag = tag.split('}', 1)[1]
+        return tag
+
+    def is_removed(self, element):
+        """Return True if an element is removed along with its captions."""
+        return self.get_tag(element) == 'tex-math'
+
+    def is_unwanted(self, element):
+        """Return True if an element is replaced by its captions."""
+        tag = self.get_tag(element)
+        if tag in ('fig', 'table-wrap'):
+            return True
+        # Floating boxed-text elements are kept since they often contain
         # useful information
-        if element.tag == 'boxed-text':
-            continue
-        captions = element.xpath('./caption')
-        captions_element = etree.Element('captions')
-        for caption in captions:
-            captions_element.append(caption)
-        element.getparent().replace(element, captions_element)
-
-
-def _retain_only_pars(tree):
-    """Strip out all tags except title and p tags
-
-    Function also changes title tags into p tags. This is a helpful
-    preprocessing step that makes it easier to extract paragraphs in
-    the order of a pre-ordered traversal.
-
-    Modifies input tree inplace.
-
-    Parameters
-    ----------
-    tree : :py:class:`lxml.etree._Element`
-        etree element for valid NLM XML
-    """
-    for element in tree.xpath('.//*'):
-        if element.tag == 'title':
-            element.tag = 'p'
-    for element in tree.xpath('.//*'):
-        parent = element.getparent()
-        if parent is not None and element.tag != 'p':
-            etree.strip_tags(element.getparent(), element.tag)
-
-
-def _pull_nested_paragraphs_to_top(tree):
-    """Flatten nested paragraphs in pre-ordered traversal
-
-    Requires _retain_only_pars to be run first.
-
-    Modifies input tree inplace.
+        return element.get('position') == 'float' and tag != 'boxed-text'
+
+    def get_children(self, element, tag):
+        """Return the children of an element with a given tag."""
+        return [child for child in element
+                if self.get_tag(child) == tag and not self.is_removed(child)
+                and not self.is_unwanted(child)]
+
+    def get_article(self):
+        """Return the (first) article element of the tree."""
+        if self.get_tag(self.tree) == 'article':
+            return self.tree
+        for element in self.tree.iterdescendants():
+            if self.get_tag(element) == 'article':
+                return element
+        raise ValueError('Input XML contains no article element')
+
+    def extract_paragraphs(self):
+        """Return the list of paragraphs of the article."""
+        output = []
+        article = self.get_article()
+        # First process front element. Titles alt-titles and abstracts
+        # are pulled from here.
+        for front in self.get_children(article, 'front'):
+            for meta in self.get_children(front, 'article-meta'):
+                for element in meta:
+                    tag = self.get_tag(element)
+                    if tag == 'title-group' and \
+                            not self.is_unwanted(element):
+                        for title in element:
+                            if self.get_tag(title) in ('article-title',
+                                                       'alt-title') and \
+                                    not self.is_unwanted(title):
+                                output.append(self.get_text(title))
+                    elif tag == 'abstract' and not self.is_unwanted(element):
+                        output.extend(self.get_paragraphs(element))
+        # All paragraphs except those in unwanted elements are extracted
+        # from the article body
+        for body in self.get_children(article, 'body'):
+            output.extend(self.get_paragraphs(body))
+        # Only the body sections of subarticles are processed. Floating
+        # boxed-text elements are removed from these entirely.
+        for subarticle in self.get_children(article, 'sub-article'):
+            bodies = self.get_children(subarticle, 'body')
+            if bodies:
+                output.extend(self.get_paragraphs(bodies[0],
+                                                  in_subarticle=True))
+        return output
+
+    def get_title(self):
+        """Return the title of the article, if any."""
+        article = self.get_article()
+        for front in self.get_children(article, 'front'):
+            for meta in self.get_children(front, 'article-meta'):
+                for group in self.get_children(meta, 'title-group'):
+                    for title in self.get_children(group, 'article-title'):
+                        return self.get_text(title)
+        return None
 
-    Parameters
-    ----------
-    tree : :py:class:`lxml.etree._Element`
-        etree element for valid NLM XML
-    """
-    # Since _retain_only_pars must be called first, input will contain only p
-    # tags except for possibly the outer most tag. p elements directly beneath
-    # the root will be called depth 1, those beneath depth 1 elements will be
-    # called depth 2 and so on.  Proceed iteratively. At each step identify all
-    # p elements with depth 2.  Cut all of the depth 2 p elements out of each
-    # parent and append them in order as siblings following the parent (these
-    # depth 2 elements may themselves be the parents of additional p elements).
-    # The algorithm terminates when there are no depth 2 elements remaining.
-    # Find depth 2 p elements
-    nested_paragraphs = tree.xpath('./p/p')
-    while nested_paragraphs:
-        # This points to the location where the next depth 2 p element will
-        # be appended
-        last = None
-        # Store parent of previously processed element to track when parent
-        # changes.
-        old_parent = None
-        for p in nested_paragraphs:
-            parent = p.getparent()
-            # When the parent changes last must be set to the new parent
-            # element. This ensures children will be appended in order
-            # after there parents.
-            if parent != old_parent:
-                last = parent
-            # Remove child element from its parent
-            parent.remove(p)
-            # The parents text occuring after the current child p but before
-            # p's following sibling is stored in p.tail. Append this text to
-            # the parent's text and then clear out p.tail
-            if not parent.text and p.tail:
-                parent.text = p.tail
-                p.tail = ''
-            elif parent.text and p.tail:
-                parent.text += ' ' + p.tail
-                p.tail = ''
-            # Place child in its new location
-            last.addnext(p)
-            last = p
-        nested_paragraphs = tree.xpath('./p/p')
-
-
-def _extract_paragraphs_from_tree(tree):
-    """Preprocess tree and return it's paragraphs."""
-    _retain_only_pars(tree)
-    _pull_nested_paragraphs_to_top(tree)
-    paragraphs = []
-    for element in tree.xpath('./p'):
-        paragraph = ''.join([x.strip() for x in element.itertext()])
-        paragraphs.append(paragraph)
-    return paragraphs
-
-
-def _xpath_union(*xpath_list):
-    """Form union of xpath expressions"""
-    return ' | '.join(xpath_list)
+    def get_text(self, element):
+        """Return the text of an element with its pieces joined by spaces."""
+        pieces = []
+        self._collect(element, pieces, flatten=True)
+        return ' '.join(pieces)
+
+    def get_paragraphs(self, element, in_subarticle=False):
+        """Return the paragraphs within an element in pre-order."""
+        content = []
+        self._collect(element, content, in_subarticle=in_subarticle)
+        paragraphs = []
+        for item in content:
+            if isinstance(item, list):
+                _add_paragraphs(item, paragraphs)
+        return paragraphs
+
+    def _collect(self, element, content, in_subarticle=False, flatten=False):
+        # Append the content of an element to a list: strings for text,
+        # lists for the content of paragraphs (and titles, which are
+        # treated as paragraphs), and None for comments and processing
+        # instructions, whose text is ignored but which separate the text
+        # that comes before and after them. If flatten is True, paragraphs
+        # aren't distinguished and only strings are appended.
+        if element.text:
+            content.append(element.text)
+        for child in element:
+            tag = self.get_tag(child)
+            if tag is None:
+                if not flatten:
+                    content.append(None)
+            elif self.is_removed(child):
+                continue
+            elif self.is_unwanted(child):
+                for caption in self.get_children(child, 'caption'):
+                    self._collect(caption, content, in_subarticle, flatten)
+                    if caption.tail:
+                        content.append(caption.tail)
+                continue
+            elif in_subarticle and child.get('position') == 'float':
+                continue
+            elif tag in ('p', 'title') and not flatten:
+                paragraph = []
+                self._collect(child, paragraph, in_subarticle)
+                content.append(paragraph)
+            else:
+                self._collect(child, content, in_subarticle, flatten)
+            if child.tail:
+                content.append(child.tail)
+
+
+def _add_paragraphs(content, paragraphs):
+    """Add a paragraph and the paragraphs nested in it in pre-order."""
+    # The text before the first nested paragraph or comment, and the text
+    # following each of these
+    text = ''
+    following = []
+    for item in content:
+        if isinstance(item, str):
+            if following:
+                following[-1][1] += item
+            else:
+                text += item
+        else:
+            following.append([item, ''])
+    # The text following nested paragraphs is added to the text of the
+    # paragraph, while text following comments is kept separately.
+    for item, tail in following:
+        if item is not None and tail:
+            text = text + ' ' + tail if text else tail
+    paragraphs.append(text.strip() + ''.join(tail.strip()
+                                             for item, tail in following
+                                             if item is None))
+    # Note that the paragraphs nested in a paragraph follow it in reverse
+    # order.
+    for item, _ in reversed(following):
+        if item is not None:
+            _add_paragraphs(item, paragraphs)
 
 
 def get_title(pmcid):
@@ -496,25 +596,4 @@ def get_title(pmcid):
     if not xml_string:
         return
     tree = etree.fromstring(xml_string.encode('utf-8'))
-    # Remove namespaces if any exist
-    if tree.tag.startswith('{'):
-        for element in tree.getiterator():
-            # The following code will throw a ValueError for some
-            # exceptional tags such as comments and processing instructions.
-            # It's safe to just leave these tag names unchanged.
-            try:
-                element.tag = etree.QName(element).localname
-            except ValueError:
-                continue
-        etree.cleanup_namespaces(tree)
-    # Strip out latex
-    _remove_elements_by_tag(tree, 'tex-math')
-    # Strip out all content in unwanted elements except the captions
-    _replace_unwanted_elements_with_their_captions(tree)
-    # First process front element. Titles alt-titles and abstracts
-    # are pulled from here.
-    front_elements = _select_from_top_level(tree, 'front')
-    title_xpath = './article-meta/title-group/article-title'
-    for front_element in front_elements:
-        for element in front_element.xpath(title_xpath):
-            return ' '.join(element.itertext())
+    return _ParagraphExtractor(tree).get_title()
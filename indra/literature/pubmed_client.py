@@ -7,6 +7,9 @@ import gzip
 import os
 import re
 import time
+import pickle
+import sqlite3
+import threading
 from io import StringIO
 
 import tqdm
@@ -14,12 +17,15 @@ import logging
 import random
 import subprocess
 import requests
+from requests.adapters import HTTPAdapter
 from time import sleep
 from typing import List, Dict, Optional
 from pathlib import Path
 from functools import lru_cache
 import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
 from lxml import etree as lxml_etree
+from indra.config import get_config
 from indra.resources import RESOURCES_PATH
 from indra.util import UnicodeXMLTreeBuilder as UTB
 from indra.util import batch_iter, pretty_save_xml
@@ -27,38 +33,136 @@ from indra.util import batch_iter, pretty_save_xml
 
 logger = logging.getLogger(__name__)
 
-pubmed_search = 'https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esearch.fcgi'
-pubmed_fetch = 'https://eutils.ncbi.nlm.nih.gov/entrez/eutils/efetch.fcgi'
+eutils_url = 'https://eutils.ncbi.nlm.nih.gov/entrez/eutils/'
+pubmed_search = eutils_url + 'esearch.fcgi'
+pubmed_fetch = eutils_url + 'efetch.fcgi'
 pubmed_archive = "https://ftp.ncbi.nlm.nih.gov/pubmed"
 pubmed_archive_baseline = pubmed_archive + "/baseline/"
 pubmed_archive_update = pubmed_archive + "/updatefiles/"
 RETRACTIONS_FILE = os.path.join(RESOURCES_PATH, "pubmed_retractions.tsv")
 
 
+#: The number of connections kept open to the E-utilities, which should be
+#: at least the number of batches of metadata requested in parallel.
+PUBMED_POOL_SIZE = 10
+#: The number of requests per second allowed by NCBI without an API key
+#: and with an API key, respectively.
+REQUESTS_PER_SECOND = 3
+REQUESTS_PER_SECOND_API_KEY = 10
+
+_session = None
+_rate_limiter = None
+_session_lock = threading.Lock()
+
+
+class RateLimiter(object):
+    """A thread-safe token bucket limiting the rate of requests.
+
+    Parameters
+    ----------
+    rate : float
+        The number of requests allowed per second, on average.
+    burst : Optional[int]
+        The number of requests that can be made at once after a period
+        of inactivity. Default: 1
+    """
+    def __init__(self, rate, burst=1):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = burst
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a request is allowed to be made."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens +
+                                   (now - self._last) * self.rate)
+                self._last = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            sleep(wait)
+
+
+def get_api_key():
+    """Return the NCBI API key set in the configuration, if any."""
+    return get_config('NCBI_API_KEY', failure_ok=True) or None
+
+
+def get_rate_limiter():
+    """Return the rate limiter shared by all requests to the E-utilities.
+
+    NCBI allows 3 requests per second, or 10 requests per second if an
+    API key is set as NCBI_API_KEY in the INDRA configuration.
+    """
+    global _rate_limiter
+    rate = REQUESTS_PER_SECOND_API_KEY if get_api_key() \
+        else REQUESTS_PER_SECOND
+    with _session_lock:
+        if _rate_limiter is None or _rate_limiter.rate != rate:
+            _rate_limiter = RateLimiter(rate)
+    return _rate_limiter
+
+
+def get_session():
+    """Return the HTTP session shared by all requests to the E-utilities."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=PUBMED_POOL_SIZE,
+                                  pool_maxsize=PUBMED_POOL_SIZE)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            _session = session
+    return _session
+
+
+def _get_response(url, data, retry_pause=1, max_tries=3, stream=False):
+    if url.startswith(eutils_url) and 'api_key' not in data:
+        api_key = get_api_key()
+        if api_key:
+            data = dict(data, api_key=api_key)
+    while True:
+        get_rate_limiter().acquire()
+        try:
+            res = get_session().get(url, params=data, stream=stream)
+        except requests.exceptions.Timeout as e:
+            logger.error('PubMed request timed out')
+            logger.error('url: %s, data: %s' % (url, data))
+            logger.error(e)
+            return None
+        except requests.exceptions.RequestException as e:
+            logger.error('PubMed request exception')
+            logger.error('url: %s, data: %s' % (url, data))
+            logger.error(e)
+            return None
+        if res.status_code in {400, 429, 502, 503} and max_tries > 0:
+            res.close()
+            sleep(retry_pause)
+            # Increase the sleep time at random to avoid multiple clients
+            # retrying at the same time for e.g. tests
+            retry_pause += 0.5 + 1.5 * random.random()
+            max_tries -= 1
+            continue
+        if not res.status_code == 200:
+            logger.error('Got return code %d from pubmed client.'
+                         % res.status_code)
+            res.close()
+            return None
+        return res
+
+
 # Send request can't be cached by lru_cache because it takes a dict
 # (a mutable/unhashable type) as an argument. We cache the callers instead.
 def send_request(url, data, retry_pause=1, max_tries=3):
-    try:
-        res = requests.get(url, params=data)
-    except requests.exceptions.Timeout as e:
-        logger.error('PubMed request timed out')
-        logger.error('url: %s, data: %s' % (url, data))
-        logger.error(e)
-        return None
-    except requests.exceptions.RequestException as e:
-        logger.error('PubMed request exception')
-        logger.error('url: %s, data: %s' % (url, data))
-        logger.error(e)
-        return None
-    if res.status_code in {400, 429, 502, 503} and max_tries > 0:
-        sleep(retry_pause)
-        # Increase the sleep time at random to avoid multiple clients
-        # retrying at the same time for e.g. tests
-        retry_pause += 0.5 + 1.5 * random.random()
-        return send_request(url, data, retry_pause, max_tries - 1)
-    if not res.status_code == 200:
-        logger.error('Got return code %d from pubmed client.'
-                     % res.status_code)
+    res = _get_response(url, data, retry_pause=retry_pause,
+                        max_tries=max_tries)
+    if res is None:
         return None
     tree = ET.XML(res.content, parser=UTB())
     return tree
@@ -955,23 +1059,54 @@ def get_metadata_for_ids(pmid_list, get_issns_from_nlm=False,
     params = {'db': 'pubmed',
               'retmode': 'xml',
               'id': pmid_list}
-    tree = send_request(pubmed_fetch, params)
-    if tree is None:
+    res = _get_response(pubmed_fetch, params, stream=True)
+    if res is None:
         return None
-    return get_metadata_from_xml_tree(tree, get_issns_from_nlm, get_abstracts,
-                                      prepend_title,
-                                      detailed_authors=detailed_authors,
-                                      references_included=references_included)
+    # The articles are parsed one by one as the response is streamed in,
+    # instead of first building the tree of the whole response.
+    results = {}
+    parser = ET.XMLPullParser(events=('end',))
+    try:
+        with res:
+            for chunk in res.iter_content(chunk_size=2 ** 16):
+                parser.feed(chunk)
+                _add_metadata_from_events(
+                    parser, results, get_issns_from_nlm=get_issns_from_nlm,
+                    get_abstracts=get_abstracts, prepend_title=prepend_title,
+                    detailed_authors=detailed_authors,
+                    references_included=references_included)
+        parser.close()
+    except (ET.ParseError, requests.exceptions.RequestException) as e:
+        logger.error('Could not read metadata from PubMed: %s' % e)
+        return None
+    _add_metadata_from_events(
+        parser, results, get_issns_from_nlm=get_issns_from_nlm,
+        get_abstracts=get_abstracts, prepend_title=prepend_title,
+        detailed_authors=detailed_authors,
+        references_included=references_included)
+    return results
+
+
+def _add_metadata_from_events(parser, results, **kwargs):
+    for _, elem in parser.read_events():
+        if elem.tag == 'PubmedArticle':
+            result = get_metadata_from_pubmed_article(elem, **kwargs)
+            results[result['pmid']] = result
+            # The article is no longer needed once its metadata is extracted
+            elem.clear()
 
 
 def get_metadata_for_all_ids(pmid_list, get_issns_from_nlm=False,
                              get_abstracts=False, prepend_title=False,
-                             detailed_authors=False, references_included=None):
+                             detailed_authors=False, references_included=None,
+                             max_workers=None, cache=None):
     """Get article metadata for any number of PMIDs from the Pubmed database.
 
     This differs from get_metadata_for_ids in that it can handle any number of
     PMIDs, and implements batch iteration to avoid the 200 PMID limit of the
-    Pubmed API.
+    Pubmed API. Batches are requested in parallel, while the overall rate of
+    requests is kept within the limits set by NCBI (see
+    :func:`get_rate_limiter`).
 
     Parameters
     ----------
@@ -993,6 +1128,14 @@ def get_metadata_for_all_ids(pmid_list, get_issns_from_nlm=False,
     references_included : Optional[str]
         If 'detailed', include detailed references in the results. If 'pmid', only include
         the PMID of the reference. If None, don't include references. Default: None
+    max_workers : Optional[int]
+        The number of batches requested in parallel. Default: the number of
+        requests per second allowed by NCBI.
+    cache : Optional[MetadataCache]
+        An on-disk cache of metadata in which PMIDs are looked up before
+        they are requested, and which the metadata of requested PMIDs is
+        added to. If None, the cache configured by INDRA_PUBMED_CACHE_DIR is
+        used, if any. Set to False to disable caching. Default: None
 
     Returns
     -------
@@ -1001,19 +1144,156 @@ def get_metadata_for_all_ids(pmid_list, get_issns_from_nlm=False,
         following fields: 'doi', 'title', 'authors', 'journal_title',
         'journal_abbrev', 'journal_nlm_id', 'issn_list', 'page'.
     """
-    all_metadata = {}
-    for ids in tqdm.tqdm(batch_iter(pmid_list, 200), desc='Retrieving metadata',
-                         total=len(pmid_list)//200+1):
-        time.sleep(0.1)
-        metadata = get_metadata_for_ids(list(ids),
-                                        get_issns_from_nlm=get_issns_from_nlm,
-                                        get_abstracts=get_abstracts,
-                                        prepend_title=prepend_title,
-                                        detailed_authors=detailed_authors,
-                                        references_included=references_included)
-        if metadata is not None:
-            all_metadata.update(metadata)
-    return all_metadata
+    options = {'get_issns_from_nlm': get_issns_from_nlm,
+               'get_abstracts': get_abstracts,
+               'prepend_title': prepend_title,
+               'detailed_authors': detailed_authors,
+               'references_included': references_included}
+    if cache is None:
+        cache = get_default_metadata_cache()
+    cache = cache or None
+    if max_workers is None:
+        max_workers = int(get_rate_limiter().rate)
+
+    pmids = list(dict.fromkeys(pmid_list))
+    all_metadata = cache.get_many(pmids, options) if cache else {}
+    missing = [pmid for pmid in pmids if pmid not in all_metadata]
+    if cache:
+        logger.info('Found metadata for %d PMIDs in the cache, requesting '
+                    '%d PMIDs' % (len(all_metadata), len(missing)))
+
+    def _get_batch_metadata(ids):
+        metadata = get_metadata_for_ids(ids, **options)
+        if metadata and cache:
+            cache.put_many(metadata, options)
+        return metadata
+
+    batches = [missing[i:i + 200] for i in range(0, len(missing), 200)]
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        for metadata in tqdm.tqdm(executor.map(_get_batch_metadata, batches),
+                                  desc='Retrieving metadata',
+                                  total=len(batches)):
+            if metadata is not None:
+                all_metadata.update(metadata)
+    # Return the metadata in the order of the PMIDs given
+    results = {pmid: all_metadata.pop(pmid) for pmid in pmids
+               if pmid in all_metadata}
+    results.update(all_metadata)
+    return results
+
+
+class MetadataCache(object):
+    """An on-disk cache of article metadata keyed by PMID.
+
+    The metadata is stored in an SQLite file, so that repeatedly getting
+    the metadata of a large set of articles only requests the ones that
+    were not requested before. Metadata obtained with different options
+    (e.g., with or without abstracts) is cached separately.
+
+    Parameters
+    ----------
+    path : str
+        The path to the SQLite file. The file and its folder are created
+        if they don't exist.
+    """
+    def __init__(self, path):
+        self.path = os.path.expanduser(path)
+        self._lock = threading.Lock()
+        self._conn = None
+        self._pid = None
+        dirname = os.path.dirname(self.path)
+        if dirname:
+            os.makedirs(dirname, exist_ok=True)
+        with self._lock:
+            conn = self._get_conn()
+            conn.execute('CREATE TABLE IF NOT EXISTS metadata '
+                         '(pmid TEXT, options TEXT, value BLOB, '
+                         'PRIMARY KEY (pmid, options))')
+            conn.commit()
+
+    def _get_conn(self):
+        # SQLite connections can't be shared with forked child processes
+        if self._conn is None or self._pid != os.getpid():
+            self._conn = sqlite3.connect(self.path, timeout=60,
+                                         check_same_thread=False)
+            self._pid = os.getpid()
+        return self._conn
+
+    @staticmethod
+    def _get_options_key(options):
+        return repr(sorted(options.items()))
+
+    def get_many(self, pmids, options):
+        """Return the cached metadata for a list of PMIDs.
+
+        Parameters
+        ----------
+        pmids : list of str
+            The PMIDs to look up.
+        options : dict
+            The keyword arguments the metadata was obtained with.
+
+        Returns
+        -------
+        dict of dicts
+            The metadata of the PMIDs found in the cache, indexed by PMID.
+        """
+        options_key = self._get_options_key(options)
+        results = {}
+        with self._lock:
+            conn = self._get_conn()
+            for ids in batch_iter(pmids, 500, return_func=list):
+                rows = conn.execute(
+                    'SELECT pmid, value FROM metadata WHERE options = ? AND '
+                    'pmid IN (%s)' % ','.join('?' * len(ids)),
+                    [options_key] + [str(pmid) for pmid in ids]).fetchall()
+                results.update({pmid: pickle.loads(value)
+                                for pmid, value in rows})
+        return results
+
+    def put_many(self, metadata, options):
+        """Add the metadata of a set of PMIDs to the cache.
+
+        Parameters
+        ----------
+        metadata : dict of dicts
+            The metadata indexed by PMID.
+        options : dict
+            The keyword arguments the metadata was obtained with.
+        """
+        options_key = self._get_options_key(options)
+        with self._lock:
+            conn = self._get_conn()
+            conn.executemany('INSERT OR REPLACE INTO metadata '
+                             'VALUES (?, ?, ?)',
+                             [(str(pmid), options_key,
+                               pickle.dumps(value, protocol=4))
+                              for pmid, value in metadata.items()])
+            conn.commit()
+
+    def clear(self):
+        """Remove all metadata from the cache."""
+        with self._lock:
+            conn = self._get_conn()
+            conn.execute('DELETE FROM metadata')
+            conn.commit()
+
+
+def get_default_metadata_cache():
+    """Return a metadata cache based on the INDRA configuration, if any.
+
+    The cache is configured by setting ``INDRA_PUBMED_CACHE_DIR``.
+
+    Returns
+    -------
+    MetadataCache or None
+        The configured metadata cache or None if no cache folder is set.
+    """
+    cache_dir = get_config('INDRA_PUBMED_CACHE_DIR', failure_ok=True)
+    if not cache_dir:
+        return None
+    return MetadataCache(os.path.join(os.path.expanduser(cache_dir),
+                                      'pubmed_metadata.sqlite'))
 
 
 @lru_cache(maxsize=1000)
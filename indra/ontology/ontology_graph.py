@@ -680,6 +680,55 @@ class IndraOntology(networkx.DiGraph):
                 self.transitive_closure.add((self.label(ns, id),
                                              self.label(pns, pid)))
 
+    @with_initialize
+    def get_tables(self):
+        """Return the tables the graph is stored in, keyed by name.
+
+        These can be given to :meth:`set_tables` of another ontology, e.g.,
+        once shared with worker processes (see
+        :mod:`indra.util.shared_tables`).
+
+        Returns
+        -------
+        dict
+            The attributes of the nodes under `nodes`, the edges from and to
+            each node under `successors` and `predecessors`, the groundings
+            by name under `name_to_grounding`, and the transitive closure
+            as a dict whose keys are the pairs of labels in it under
+            `transitive_closure`, if it has been built.
+        """
+        tables = {'nodes': self._node, 'successors': self._succ,
+                  'predecessors': self._pred,
+                  'name_to_grounding': self.name_to_grounding}
+        if self.transitive_closure:
+            tables['transitive_closure'] = \
+                dict.fromkeys(self.transitive_closure, True)
+        return tables
+
+    def set_tables(self, tables):
+        """Make the graph use the given tables instead of initializing it.
+
+        The graph is then read-only, since the tables, e.g., shared ones,
+        may not support being changed.
+
+        Parameters
+        ----------
+        tables : dict
+            The tables of an ontology, as returned by :meth:`get_tables`.
+        """
+        self._node = tables['nodes']
+        self._succ = self._adj = tables['successors']
+        self._pred = tables['predecessors']
+        self.name_to_grounding = tables['name_to_grounding']
+        self.transitive_closure = tables.get('transitive_closure', set())
+        # networkx caches its views of the tables on first use
+        for view in ['nodes', 'adj', 'succ', 'pred', 'edges', 'out_edges',
+                     'in_edges', 'degree', 'in_degree', 'out_degree']:
+            self.__dict__.pop(view, None)
+        if getattr(self, '__networkx_cache__', None):
+            self.__networkx_cache__.clear()
+        self._initialized = True
+
     @with_initialize
     def print_stats(self):
         logger.info('Number of nodes: %d' % len(self.nodes))
@@ -1,2 +1,3 @@
 from .pipeline import AssemblyPipeline, RunnableArgument
-from .decorators import register_pipeline, pipeline_functions
+from .decorators import register_pipeline, pipeline_functions, \
+    register_stmt_predicate, register_stmt_map
@@ -0,0 +1,215 @@
+"""Checkpoints of the results of the steps of an AssemblyPipeline.
+
+When an :class:`indra.pipeline.AssemblyPipeline` is given a
+:class:`CheckpointStore`, the result of each of its steps is stored under
+a key derived from the input of the pipeline and the steps run so far.
+The key of the first step is a digest of the input statements (their
+ordered full hashes and beliefs) and of the step's function name, args
+and kwargs, and the key of each subsequent step is a digest of the key of
+the previous step and of the step itself. When the pipeline is run again
+on the same statements, the longest prefix of steps whose result is in the
+store is skipped and its result is loaded instead, so that, e.g., changing
+the last filter of a pipeline doesn't require re-running the grounding
+mapping and preassembly steps before it.
+
+Since keys only depend on the definition of the steps, steps are assumed
+to be deterministic, and a store should be cleared when the
+implementation of a step changes.
+"""
+
+__all__ = ['CheckpointStore', 'get_input_digest', 'get_step_key']
+
+import os
+import json
+import pickle
+import hashlib
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+def get_input_digest(statements):
+    """Return a digest of a list of statements given as a pipeline input.
+
+    Parameters
+    ----------
+    statements : list[indra.statements.Statement]
+        The statements.
+
+    Returns
+    -------
+    str
+        The hex digest of the ordered full hashes and beliefs of the
+        statements.
+    """
+    hasher = hashlib.sha256()
+    for stmt in statements:
+        hasher.update(b'%d:%r;' % (stmt.get_hash(shallow=False, refresh=True),
+                                   stmt.belief))
+    return hasher.hexdigest()
+
+
+def get_step_key(input_key, step):
+    """Return the key of the result of a step run on a given input.
+
+    Parameters
+    ----------
+    input_key : str
+        The digest of the input of the pipeline if the step is the first
+        one, otherwise the key of the previous step.
+    step : dict
+        The step, with its function name, args and kwargs.
+
+    Returns
+    -------
+    str
+        The key of the result of the step.
+    """
+    step_json = json.dumps(step, sort_keys=True, default=repr)
+    return hashlib.sha256(('%s\n%s' % (input_key, step_json))
+                          .encode('utf-8')).hexdigest()
+
+
+class CheckpointStore(object):
+    """A folder in which the results of pipeline steps are pickled.
+
+    Parameters
+    ----------
+    cache_dir : str
+        The folder in which results are stored. It is created if it
+        doesn't exist.
+    max_size : Optional[int]
+        The maximum total size of the stored results, in bytes. If exceeded
+        after storing a result, results are evicted until it isn't.
+        Default: no limit.
+    max_entries : Optional[int]
+        The maximum number of stored results. Default: no limit.
+    eviction : Optional[str]
+        The results evicted first when a limit is exceeded. 'lru' evicts
+        the least recently used (stored or loaded) results, 'fifo' the
+        least recently stored ones. Default: 'lru'.
+    """
+    def __init__(self, cache_dir, max_size=None, max_entries=None,
+                 eviction='lru'):
+        if eviction not in {'lru', 'fifo'}:
+            raise ValueError('Unknown eviction policy: %s' % eviction)
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+        self.max_entries = max_entries
+        self.eviction = eviction
+        self._lock = threading.Lock()
+
+    def get_path(self, key):
+        """Return the path to the file of the result with the given key."""
+        return os.path.join(self.cache_dir, '%s.pkl' % key)
+
+    def __contains__(self, key):
+        return os.path.exists(self.get_path(key))
+
+    def get(self, key):
+        """Return the result stored under a key.
+
+        Parameters
+        ----------
+        key : str
+            The key of the result.
+
+        Returns
+        -------
+        object
+            The stored result. A KeyError is raised if there is no result
+            stored under the key.
+        """
+        path = self.get_path(key)
+        try:
+            with open(path, 'rb') as fh:
+                value = pickle.load(fh)
+        except FileNotFoundError:
+            raise KeyError(key)
+        if self.eviction == 'lru':
+            try:
+                os.utime(path)
+            except OSError:
+                pass
+        return value
+
+    def put(self, key, value):
+        """Store a result under a key, evicting results if needed.
+
+        Parameters
+        ----------
+        key : str
+            The key of the result.
+        value : object
+            The result to store, which has to be picklable.
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self.get_path(key)
+        tmp_path = '%s.%d.%d.tmp' % (path, os.getpid(), threading.get_ident())
+        with open(tmp_path, 'wb') as fh:
+            pickle.dump(value, fh, protocol=4)
+        os.replace(tmp_path, path)
+        self.evict(keep=key)
+
+    def get_entries(self):
+        """Return the stored results as (mtime, size, key) tuples.
+
+        Returns
+        -------
+        list[tuple]
+            The entries, in the order in which they are evicted.
+        """
+        entries = []
+        if not os.path.isdir(self.cache_dir):
+            return entries
+        for fname in os.listdir(self.cache_dir):
+            if not fname.endswith('.pkl'):
+                continue
+            try:
+                stat = os.stat(os.path.join(self.cache_dir, fname))
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, fname[:-4]))
+        return sorted(entries)
+
+    def evict(self, keep=None):
+        """Remove results until the limits of the store are respected.
+
+        Parameters
+        ----------
+        keep : Optional[str]
+            The key of a result that is never evicted, e.g., the one
+            just stored.
+        """
+        if self.max_size is None and self.max_entries is None:
+            return
+        with self._lock:
+            entries = self.get_entries()
+            total_size = sum(size for _, size, _ in entries)
+            num_entries = len(entries)
+            for _, size, key in entries:
+                if (self.max_size is None or total_size <= self.max_size) \
+                        and (self.max_entries is None
+                             or num_entries <= self.max_entries):
+                    break
+                if key == keep:
+                    continue
+                logger.debug('Evicting pipeline checkpoint %s' % key)
+                try:
+                    os.remove(self.get_path(key))
+                except FileNotFoundError:
+                    pass
+                total_size -= size
+                num_entries -= 1
+
+    def clear(self):
+        """Remove all the stored results."""
+        for _, _, key in self.get_entries():
+            try:
+                os.remove(self.get_path(key))
+            except FileNotFoundError:
+                pass
+
+    def __repr__(self):
+        return '%s(%r)' % (self.__class__.__name__, self.cache_dir)
@@ -11,5 +11,43 @@ def register_pipeline(function):
     return function
 
 
+def register_stmt_predicate(factory):
+    """Decorator to declare a pipeline function as a filter of statements
+    that decides about each statement independently.
+
+    Consecutive steps of such functions (and of those declared with
+    `register_stmt_map`) can be fused by the AssemblyPipeline into a single
+    pass over the statements.
+
+    Parameters
+    ----------
+    factory : function
+        A function which takes the same arguments as the decorated function
+        except for the statements, and returns a function that takes a
+        single statement and returns True if the statement is kept.
+    """
+    def decorator(function):
+        function.stmt_predicate = factory
+        return function
+    return decorator
+
+
+def register_stmt_map(factory):
+    """Decorator to declare a pipeline function as transforming each
+    statement independently.
+
+    Parameters
+    ----------
+    factory : function
+        A function which takes the same arguments as the decorated function
+        except for the statements, and returns a function that takes a
+        single statement and returns the transformed statement.
+    """
+    def decorator(function):
+        function.stmt_map = factory
+        return function
+    return decorator
+
+
 class ExistingFunctionError(Exception):
     pass
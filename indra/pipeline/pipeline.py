@@ -1,8 +1,11 @@
+import os
 import json
 import logging
 import inspect
 
 from .decorators import pipeline_functions, register_pipeline
+from .checkpoint import CheckpointStore, get_input_digest, get_step_key
+from .profiling import RunReport, profile_step
 from indra.statements import get_statement_by_name, Statement
 
 
@@ -82,8 +85,42 @@ class AssemblyPipeline():
         contain a key-value pair {'no_run': True}. If an argument is a type
         of a statement, it should be represented as a dictionary {'stmt_type':
         <name of a statement type>}.
+    checkpoints : Optional[str or indra.pipeline.checkpoint.CheckpointStore]
+        If given, the result of each step is stored in this checkpoint store
+        (or in a store in this folder), and when the pipeline is run again
+        on the same statements, the steps whose results are already stored
+        are skipped (see :mod:`indra.pipeline.checkpoint`). Default: None
+    profile_dir : Optional[str]
+        If given, each step is run under cProfile and its statistics are
+        dumped into this folder, in a file named after the index and the
+        function of the step. Default: None
+    fuse_steps : Optional[bool]
+        If True, consecutive steps whose functions decide about or transform
+        each statement independently (i.e., that are registered with
+        `register_stmt_predicate` or `register_stmt_map`, like most filters
+        in :mod:`indra.tools.assemble_corpus`) are run in a single pass over
+        the statements instead of each building a new list. Such fused steps
+        are reported and checkpointed as a single step. Default: False
+    n_procs : Optional[int]
+        If given, the number of processes used by the steps whose function
+        has an `n_procs` argument (e.g., `map_grounding`, `filter_human_only`
+        or `expand_families`) unless it is set in the step itself. Unlike
+        kwargs given to `run`, this doesn't prevent the results of the steps
+        from being checkpointed. Default: None
+    report_callback : Optional[function]
+        A function called with the metrics of each step (see
+        :class:`indra.pipeline.profiling.RunReport`) as soon as the step is
+        done, e.g., to send them to a monitoring service. Default: None
+
+    Attributes
+    ----------
+    report : indra.pipeline.profiling.RunReport or None
+        The wall and CPU time, peak RSS increase, and statement and evidence
+        counts of each step of the last run of the pipeline. Use its
+        `to_json` method to get a JSON run report.
     """
-    def __init__(self, steps=None):
+    def __init__(self, steps=None, checkpoints=None, profile_dir=None,
+                 fuse_steps=False, n_procs=None, report_callback=None):
         # This import is here to avoid circular imports
         # It is enough to import one function to get all registered functions
         from indra.tools.assemble_corpus import filter_grounded_only
@@ -91,14 +128,22 @@ class AssemblyPipeline():
         from indra.preassembler.grounding_mapper.gilda import ground_statements
         from indra.preassembler.custom_preassembly import agent_grounding_matches
         self.steps = steps if steps else []
+        if isinstance(checkpoints, str):
+            checkpoints = CheckpointStore(checkpoints)
+        self.checkpoints = checkpoints
+        self.profile_dir = profile_dir
+        self.fuse_steps = fuse_steps
+        self.n_procs = n_procs
+        self.report_callback = report_callback
+        self.report = None
 
     @classmethod
-    def from_json_file(cls, filename):
+    def from_json_file(cls, filename, **kwargs):
         """Create an instance of AssemblyPipeline from a JSON file with
-        steps."""
+        steps. Kwargs are passed to the AssemblyPipeline constructor."""
         with open(filename, 'r') as f:
             steps = json.load(f)
-        ap = AssemblyPipeline(steps)
+        ap = AssemblyPipeline(steps, **kwargs)
         return ap
 
     def to_json_file(self, filename):
@@ -127,13 +172,104 @@ class AssemblyPipeline():
         -------
         list[indra.statements.Statement]
             The list of INDRA Statements resulting from running the pipeline
-            on the list of input Statements.
+            on the list of input Statements. The metrics of the steps are
+            available in the `report` attribute of the pipeline afterwards.
         """
         logger.info('Running the pipeline')
-        for step in self.steps:
-            statements = self.run_function(step, statements, **kwargs)
+        self.report = RunReport()
+        start = 0
+        if self.checkpoints is None:
+            keys = [None] * len(self.steps)
+        else:
+            keys = self.get_step_keys(statements, **kwargs)
+            # Skip the longest prefix of steps whose result is stored
+            for ix in reversed(range(len(keys))):
+                if keys[ix] is None or keys[ix] not in self.checkpoints:
+                    continue
+                try:
+                    statements = self.checkpoints.get(keys[ix])
+                except KeyError:
+                    continue
+                logger.info('Loaded the result of the first %d steps from '
+                            'checkpoint' % (ix + 1))
+                start = ix + 1
+                break
+        for ix, step in enumerate(self.steps[:start]):
+            self._report_step(ix, step['function'], 'checkpoint')
+        ix = start
+        while ix < len(self.steps):
+            # Consecutive fusable steps are run together
+            end = ix + 1
+            if self.fuse_steps and self.can_fuse(self.steps[ix]):
+                while end < len(self.steps) and \
+                        self.can_fuse(self.steps[end]):
+                    end += 1
+            statements = self._run_steps(ix, self.steps[ix:end], statements,
+                                         **kwargs)
+            if keys[end - 1] is not None:
+                self.checkpoints.put(keys[end - 1], statements)
+            ix = end
+        return statements
+
+    def _run_steps(self, ix, steps, statements, **kwargs):
+        func_name = '+'.join(step['function'] for step in steps)
+        profile_path = os.path.join(self.profile_dir, '%02d_%s.prof'
+                                    % (ix, func_name)) \
+            if self.profile_dir else None
+        if len(steps) == 1:
+            def run(stmts):
+                return self.run_function(steps[0], stmts, **kwargs)
+        else:
+            def run(stmts):
+                return self.run_fused_functions(steps, stmts, **kwargs)
+        statements, metrics = profile_step(run, statements, profile_path)
+        logger.info('Finished %s in %.2fs (%.2fs CPU)'
+                    % (func_name, metrics['wall_time'], metrics['cpu_time']))
+        self._report_step(ix, func_name, 'run', metrics)
         return statements
 
+    def _report_step(self, ix, func_name, status, metrics=None):
+        entry = self.report.add_step(ix, func_name, status, metrics)
+        if self.report_callback is not None:
+            self.report_callback(entry)
+
+    def get_step_keys(self, statements, **kwargs):
+        """Return the checkpoint keys of the results of the steps.
+
+        Parameters
+        ----------
+        statements : list[indra.statements.Statement]
+            A list of INDRA Statements to run the pipeline on.
+        **kwargs : kwargs
+            The kwargs given to the entire pipeline.
+
+        Returns
+        -------
+        list[str or None]
+            The keys of the results of the steps, in order. Since the kwargs
+            given to the entire pipeline can't be reliably digested, the key
+            of a step that uses any of them, and of all the following steps,
+            is None, i.e., their results are not checkpointed.
+        """
+        keys = []
+        key = get_input_digest(statements)
+        for step in self.steps:
+            if key is not None and kwargs:
+                func_name, _, func_kwargs = \
+                    self.get_function_parameters(step)
+                func_args = inspect.getfullargspec(
+                    self.get_function_from_name(func_name)).args
+                if any(k not in func_kwargs and k in func_args
+                       for k in kwargs):
+                    logger.info('Not checkpointing %s and the following '
+                                'steps since they use pipeline kwargs'
+                                % func_name)
+                    key = None
+            if key is not None:
+                key = get_step_key(key, step)
+            keys.append(key)
+        return keys
+
     def append(self, func, *args, **kwargs):
         """Append a step to the end of the pipeline.
 
@@ -304,10 +440,33 @@ class AssemblyPipeline():
         object
             Any value that the given function returns.
         """
+        logger.info('Calling %s' % func_dict['function'])
+        func, new_args, new_kwargs = self.get_function_arguments(func_dict,
+                                                                 **kwargs)
+        if statements is not None:
+            new_kwargs['statements'] = statements
+        return self.run_simple_function(func, *new_args, **new_kwargs)
+
+    def get_function_arguments(self, func_dict, **kwargs):
+        """Return a function and the values of its args and kwargs.
+
+        Parameters
+        ----------
+        func_dict : dict
+            A dict representing the function to call, its args and kwargs.
+        kwargs : kwargs
+            Kwargs given to the entire pipeline, which are added to the
+            kwargs of the function if it expects them.
+
+        Returns
+        -------
+        tuple of function, list and dict
+            The function, the values of its args, and the values of its
+            kwargs.
+        """
         func_name, func_args, func_kwargs = self.get_function_parameters(
             func_dict)
         func = self.get_function_from_name(func_name)
-        logger.info('Calling %s' % func_name)
         new_args = []
         new_kwargs = {}
         for arg in func_args:
@@ -316,13 +475,71 @@ class AssemblyPipeline():
         for k, v in func_kwargs.items():
             kwarg_value = self.get_argument_value(v)
             new_kwargs[k] = kwarg_value
-        if statements is not None:
-            new_kwargs['statements'] = statements
         if kwargs:
             for k, v in kwargs.items():
                 if k not in new_kwargs and k in inspect.getfullargspec(func).args:
                     new_kwargs[k] = v
-        return self.run_simple_function(func, *new_args, **new_kwargs)
+        if self.n_procs is not None and 'n_procs' not in new_kwargs and \
+                'n_procs' in inspect.getfullargspec(func).args:
+            new_kwargs['n_procs'] = self.n_procs
+        return func, new_args, new_kwargs
+
+    def can_fuse(self, func_dict):
+        """Return True if a step can be fused with its neighbors.
+
+        Steps can be fused if their function is declared with
+        `register_stmt_predicate` or `register_stmt_map`, and they are not
+        asked to save their results.
+
+        Parameters
+        ----------
+        func_dict : dict
+            A dict representing the function to call, its args and kwargs.
+
+        Returns
+        -------
+        bool
+            True if the step can be fused.
+        """
+        func_name, _, func_kwargs = self.get_function_parameters(func_dict)
+        func = self.get_function_from_name(func_name)
+        return (hasattr(func, 'stmt_predicate') or
+                hasattr(func, 'stmt_map')) and not func_kwargs.get('save')
+
+    def run_fused_functions(self, func_dicts, statements, **kwargs):
+        """Run a sequence of steps in a single pass over the statements.
+
+        Parameters
+        ----------
+        func_dicts : list[dict]
+            Dicts representing the functions to call, all of which have to
+            be fusable (see `can_fuse`).
+        statements : list[indra.statements.Statement]
+            The statements to run the functions on.
+        kwargs : kwargs
+            Kwargs given to the entire pipeline.
+
+        Returns
+        -------
+        list[indra.statements.Statement]
+            The statements which are kept by all the predicates, as
+            transformed by all the maps.
+        """
+        funcs = []
+        for func_dict in func_dicts:
+            func, args, func_kwargs = self.get_function_arguments(func_dict,
+                                                                  **kwargs)
+            if hasattr(func, 'stmt_predicate'):
+                funcs.append((True, func.stmt_predicate(*args, **func_kwargs)))
+            else:
+                funcs.append((False, func.stmt_map(*args, **func_kwargs)))
+        logger.info('Calling %s in a single pass over %d statements'
+                    % (', '.join(func_dict['function']
+                                 for func_dict in func_dicts),
+                       len(statements)))
+        stmts_out = list(_stream_statements(statements, funcs))
+        logger.info('%d statements after fused steps...' % len(stmts_out))
+        return stmts_out
 
     @staticmethod
     def is_function(argument, keyword='function'):
@@ -368,6 +585,18 @@ class AssemblyPipeline():
         return iter(self.steps)
 
 
+def _stream_statements(statements, funcs):
+    for stmt in statements:
+        for is_predicate, func in funcs:
+            if is_predicate:
+                if not func(stmt):
+                    break
+            else:
+                stmt = func(stmt)
+        else:
+            yield stmt
+
+
 class NotRegisteredFunctionError(Exception):
     pass
 
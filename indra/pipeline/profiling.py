@@ -0,0 +1,173 @@
+"""Metrics of the steps of an AssemblyPipeline run.
+
+Each time an :class:`indra.pipeline.AssemblyPipeline` is run, it records
+for each of its steps the wall time, the CPU time, how much the step
+raised the peak resident set size (RSS) of the process, and the number of
+statements and evidences going in and out of the step, into a
+:class:`RunReport` that is available as the `report` attribute of the pipeline. If the
+pipeline is given a folder to store profiles in, each step is also run
+under cProfile and its statistics are dumped into that folder, to be
+inspected, e.g., with :mod:`pstats` or snakeviz.
+"""
+
+__all__ = ['RunReport', 'profile_step', 'get_peak_rss']
+
+import os
+import sys
+import json
+import time
+import cProfile
+import datetime
+
+try:
+    import resource
+except ImportError:
+    # The resource module is only available on Unix
+    resource = None
+
+
+def get_peak_rss():
+    """Return the peak resident set size of the process, in bytes.
+
+    Returns
+    -------
+    int or None
+        The peak RSS, or None if it can't be obtained on this platform.
+    """
+    if resource is None:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes on Linux
+    return max_rss if sys.platform == 'darwin' else max_rss * 1024
+
+
+def _count_statements(statements):
+    if not isinstance(statements, list):
+        return None, None
+    try:
+        num_evidence = sum(len(stmt.evidence) for stmt in statements)
+    except AttributeError:
+        return None, None
+    return len(statements), num_evidence
+
+
+def profile_step(func, statements, profile_path=None):
+    """Run a pipeline step on a list of statements and measure it.
+
+    Parameters
+    ----------
+    func : function
+        The step, a function taking the list of statements as its only
+        argument.
+    statements : list[indra.statements.Statement]
+        The statements to run the step on.
+    profile_path : Optional[str]
+        If given, the step is run under cProfile and the statistics are
+        dumped into this file.
+
+    Returns
+    -------
+    object
+        The value returned by the step.
+    dict
+        The metrics of the step. `peak_rss_increase` is how much the step
+        raised the peak RSS of the process (see :func:`get_peak_rss`), in
+        bytes. It is 0 if the memory used by the step stayed below the peak
+        reached before it, so it shows which steps set new highs rather
+        than how much memory each step used.
+    """
+    num_stmts_in, num_evidence_in = _count_statements(statements)
+    rss_start = get_peak_rss()
+    profiler = cProfile.Profile() if profile_path else None
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    if profiler is not None:
+        profiler.enable()
+    try:
+        result = func(statements)
+    finally:
+        if profiler is not None:
+            profiler.disable()
+    cpu_time = time.process_time() - cpu_start
+    wall_time = time.perf_counter() - wall_start
+    rss_end = get_peak_rss()
+    if profiler is not None:
+        os.makedirs(os.path.dirname(os.path.abspath(profile_path)),
+                    exist_ok=True)
+        profiler.dump_stats(profile_path)
+    num_stmts_out, num_evidence_out = _count_statements(result)
+    metrics = {
+        'wall_time': wall_time,
+        'cpu_time': cpu_time,
+        'peak_rss_increase': (rss_end - rss_start
+                           if rss_start is not None else None),
+        'num_statements_in': num_stmts_in,
+        'num_evidence_in': num_evidence_in,
+        'num_statements_out': num_stmts_out,
+        'num_evidence_out': num_evidence_out,
+        'profile': profile_path,
+    }
+    return result, metrics
+
+
+class RunReport(object):
+    """The metrics of the steps of a pipeline run.
+
+    Attributes
+    ----------
+    start_time : str
+        The time at which the run started, in ISO format.
+    steps : list[dict]
+        The metrics of each step, in order. Each has the index and function
+        name of the step, whether it was 'run' or loaded from a
+        'checkpoint' as its status and, for steps that were run, the
+        metrics returned by :func:`profile_step`.
+    """
+    def __init__(self):
+        self.start_time = datetime.datetime.now().isoformat()
+        self.steps = []
+
+    def add_step(self, index, function, status, metrics=None):
+        """Add the metrics of a step to the report and return them."""
+        entry = {'index': index, 'function': function, 'status': status}
+        entry.update(metrics or {})
+        self.steps.append(entry)
+        return entry
+
+    def get_total(self, metric):
+        """Return the sum of a metric over the steps that were run."""
+        return sum(step[metric] for step in self.steps
+                   if step.get(metric) is not None)
+
+    def to_json(self):
+        """Return the report as a JSON-serializable dict."""
+        return {'start_time': self.start_time,
+                'wall_time': self.get_total('wall_time'),
+                'cpu_time': self.get_total('cpu_time'),
+                'steps': self.steps}
+
+    def to_json_file(self, filename):
+        """Save the report into a JSON file."""
+        with open(filename, 'w') as fh:
+            json.dump(self.to_json(), fh, indent=1)
+
+    def __str__(self):
+        lines = ['%-4s %-32s %10s %10s %12s %10s'
+                 % ('#', 'function', 'wall (s)', 'cpu (s)', 'peak RSS +',
+                    'stmts out')]
+        for step in self.steps:
+            if step['status'] != 'run':
+                lines.append('%-4d %-32s %s' % (step['index'],
+                                                step['function'],
+                                                step['status']))
+                continue
+            rss = step['peak_rss_increase']
+            lines.append('%-4d %-32s %10.2f %10.2f %12s %10s'
+                         % (step['index'], step['function'],
+                            step['wall_time'], step['cpu_time'],
+                            '%.1f MB' % (rss / 2 ** 20)
+                            if rss is not None else '-',
+                            step['num_statements_out']
+                            if step['num_statements_out'] is not None
+                            else '-'))
+        return '\n'.join(lines)
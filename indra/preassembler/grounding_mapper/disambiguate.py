@@ -1,4 +1,5 @@
 import logging
+from collections import OrderedDict
 from indra.config import get_config, has_config
 from indra.ontology.standardize \
     import standardize_agent_name
@@ -25,8 +26,20 @@ class DisambManager(object):
 
     Has methods to run disambiguation with either adeft or gilda. Each instance
     of this class uses a single database connection.
+
+    Texts obtained for disambiguation are kept in a bounded cache so that
+    the text of a given paper is only fetched once for all the Statements
+    extracted from it. The texts for a set of Statements can be fetched
+    in bulk ahead of disambiguation with :meth:`prefetch_texts`.
+
+    Parameters
+    ----------
+    text_cache_size : Optional[int]
+        The maximum number of texts kept in the cache. Default: 10000
     """
-    def __init__(self):
+    def __init__(self, text_cache_size=10000):
+        self.text_cache_size = text_cache_size
+        self._text_cache = OrderedDict()
         self.has_local_text_db = False
         if has_config('INDRA_DB_LITE_LOCATION'):
             try:
@@ -232,64 +245,190 @@ class DisambManager(object):
         text : str
             Text for Adeft disambiguation
         """
-        text = None
+        refs = _get_evidence_refs(stmt.evidence[0])
+        trid = refs.get('TRID')
+        pmid = refs.get('PMID')
         # First we will try to get content from a local text content DB if
         # available since this is the fastest option
-        if self.has_local_text_db:
-            try:
-                from indra_db_lite import get_plaintexts_for_text_ref_ids, \
-                    get_text_ref_ids_for_pmids
-                refs = stmt.evidence[0].text_refs
-                trid = refs.get('TRID')
-                pmid = refs.get('PMID')
-                if trid:
-                    text_content = get_plaintexts_for_text_ref_ids([trid])
-                    _, content = next(text_content.trid_content_pairs())
-                    if content:
-                        return content
-                elif pmid:
-                    mappings = get_text_ref_ids_for_pmids([int(pmid)])
-                    if int(pmid) in mappings:
-                        trid = mappings[int(pmid)]
-                        text_content = get_plaintexts_for_text_ref_ids([trid])
-                        _, content = next(text_content.trid_content_pairs())
-                        if content:
-                            return content
-            except Exception as e:
-                logger.info('Could not get text from local DB: %s' % e)
+        if self.has_local_text_db and (trid or pmid):
+            key = ('LOCAL', 'TRID', trid) if trid else ('LOCAL', 'PMID', pmid)
+            if key not in self._text_cache:
+                self._prefetch_local_db([trid] if trid else [],
+                                        [pmid] if not trid else [])
+            content = self._get_cached_text(key)
+            if content:
+                return content
         # If the above is not available or fails, we try the INDRA DB
         # if available.
         if self.__tc is not None:
-            try:
-                from indra.literature.adeft_tools import universal_extract_text
-                refs = stmt.evidence[0].text_refs
-                # Prioritize the pmid attribute if given
-                if stmt.evidence[0].pmid:
-                    refs['PMID'] = stmt.evidence[0].pmid
-                logger.debug('Obtaining text for disambiguation with refs: %s'
-                             % refs)
-                content = self.__tc.get_text_content_from_text_refs(refs)
-                if not content:
-                    raise ValueError('Text obtained from DB is empty')
-                text = universal_extract_text(content, contains=agent_text)
-                if text:
-                    return text
-            except Exception as e:
-                logger.info('Could not get text for disambiguation from DB: %s'
-                            % e)
+            key = ('DB', _get_refs_key(refs))
+            if key not in self._text_cache:
+                self._fetch_db_content(refs)
+            content = self._get_cached_text(key)
+            if content:
+                from indra.literature.adeft_tools import \
+                    universal_extract_text
+                try:
+                    text = universal_extract_text(content,
+                                                  contains=agent_text)
+                    if text:
+                        return text
+                except Exception as e:
+                    logger.info('Could not get text for disambiguation '
+                                'from DB: %s' % e)
         # If that doesn't work, we try PubMed next trying to fetch an abstract
-        if text is None:
-            from indra.literature import pubmed_client
-            pmid = stmt.evidence[0].pmid
-            if pmid:
+        if pmid:
+            key = ('PUBMED', pmid)
+            if key not in self._text_cache:
                 logger.debug('Obtaining abstract for disambiguation for PMID%s'
                              % pmid)
-                text = pubmed_client.get_abstract(pmid)
-                if text:
-                    return text
+                from indra.literature import pubmed_client
+                self._cache_text(key, pubmed_client.get_abstract(pmid))
+            text = self._get_cached_text(key)
+            if text:
+                return text
         # Finally, falling back on the evidence sentence
-        if text is None:
-            logger.info('Falling back on sentence-based disambiguation')
-            text = stmt.evidence[0].text
-            return text
-        return None
+        logger.info('Falling back on sentence-based disambiguation')
+        return stmt.evidence[0].text
+
+    def prefetch_texts(self, stmts):
+        """Fetch the texts used to disambiguate Agents in given Statements.
+
+        The texts for all the papers the Statements' evidences come from
+        are fetched in bulk from the local text database if available, and
+        otherwise from the INDRA DB or PubMed, and added to the text cache
+        so that subsequent disambiguation of Agents in these Statements
+        doesn't need to fetch texts one by one.
+
+        Parameters
+        ----------
+        stmts : list[indra.statements.Statement]
+            The Statements whose Agents will be disambiguated.
+        """
+        refs_list = []
+        for stmt in stmts:
+            if stmt.evidence:
+                refs_list.append(_get_evidence_refs(stmt.evidence[0]))
+        if not refs_list:
+            return
+        logger.info('Prefetching texts for disambiguation for %d statements'
+                    % len(refs_list))
+        has_text = set()
+        if self.has_local_text_db:
+            trids = {refs['TRID'] for refs in refs_list if refs.get('TRID')}
+            pmids = {refs['PMID'] for refs in refs_list
+                     if refs.get('PMID') and not refs.get('TRID')}
+            self._prefetch_local_db(
+                [t for t in trids if ('LOCAL', 'TRID', t)
+                 not in self._text_cache],
+                [p for p in pmids if ('LOCAL', 'PMID', p)
+                 not in self._text_cache])
+            for refs in refs_list:
+                key = ('LOCAL', 'TRID', refs['TRID']) if refs.get('TRID') \
+                    else ('LOCAL', 'PMID', refs.get('PMID'))
+                if self._text_cache.get(key):
+                    has_text.add(_get_refs_key(refs))
+        refs_list = [refs for refs in refs_list
+                     if _get_refs_key(refs) not in has_text]
+        if self.__tc is not None:
+            for refs in {_get_refs_key(refs): refs
+                         for refs in refs_list}.values():
+                if ('DB', _get_refs_key(refs)) not in self._text_cache:
+                    self._fetch_db_content(refs)
+                if self._text_cache.get(('DB', _get_refs_key(refs))):
+                    has_text.add(_get_refs_key(refs))
+        pmids = sorted({refs['PMID'] for refs in refs_list
+                        if refs.get('PMID') and ('PUBMED', refs['PMID'])
+                        not in self._text_cache and
+                        _get_refs_key(refs) not in has_text})
+        if pmids:
+            self._prefetch_abstracts(pmids)
+
+    def clear_text_cache(self):
+        """Remove all texts from the text cache."""
+        self._text_cache.clear()
+
+    def _get_cached_text(self, key):
+        text = self._text_cache.get(key)
+        if key in self._text_cache:
+            self._text_cache.move_to_end(key)
+        return text
+
+    def _cache_text(self, key, text):
+        if not self.text_cache_size:
+            return
+        self._text_cache[key] = text
+        self._text_cache.move_to_end(key)
+        while len(self._text_cache) > self.text_cache_size:
+            self._text_cache.popitem(last=False)
+
+    def _prefetch_local_db(self, trids, pmids):
+        try:
+            from indra_db_lite import get_plaintexts_for_text_ref_ids, \
+                get_text_ref_ids_for_pmids
+            trid_keys = {trid: [('LOCAL', 'TRID', trid)] for trid in trids}
+            if pmids:
+                mappings = get_text_ref_ids_for_pmids(
+                    [int(pmid) for pmid in pmids])
+                for pmid in pmids:
+                    trid = mappings.get(int(pmid))
+                    if trid is not None:
+                        trid_keys.setdefault(trid, []).append(
+                            ('LOCAL', 'PMID', pmid))
+                    else:
+                        self._cache_text(('LOCAL', 'PMID', pmid), None)
+            if not trid_keys:
+                return
+            text_content = get_plaintexts_for_text_ref_ids(list(trid_keys))
+            contents = {str(trid): content for trid, content
+                        in text_content.trid_content_pairs()}
+            for trid, keys in trid_keys.items():
+                for key in keys:
+                    self._cache_text(key, contents.get(str(trid)))
+        except Exception as e:
+            logger.info('Could not get text from local DB: %s' % e)
+
+    def _fetch_db_content(self, refs):
+        key = ('DB', _get_refs_key(refs))
+        content = None
+        try:
+            logger.debug('Obtaining text for disambiguation with refs: %s'
+                         % refs)
+            content = self.__tc.get_text_content_from_text_refs(refs)
+            if not content:
+                raise ValueError('Text obtained from DB is empty')
+        except Exception as e:
+            logger.info('Could not get text for disambiguation from DB: %s'
+                        % e)
+        self._cache_text(key, content)
+
+    def _prefetch_abstracts(self, pmids):
+        from indra.literature import pubmed_client
+        for i in range(0, len(pmids), 200):
+            batch = pmids[i:i + 200]
+            try:
+                metadata = pubmed_client.get_metadata_for_ids(
+                    batch, get_abstracts=True, prepend_title=True) or {}
+            except Exception as e:
+                logger.info('Could not get abstracts from PubMed: %s' % e)
+                continue
+            for pmid in batch:
+                abstract = metadata.get(pmid, {}).get('abstract')
+                self._cache_text(('PUBMED', pmid), abstract or None)
+
+
+def _get_evidence_refs(evidence):
+    """Return the text refs used to get the text of an Evidence's paper.
+
+    The texts are looked up and cached by these refs, which are a copy of
+    the Evidence's text refs with the PMID taken from its pmid attribute if
+    given, so that the prefetched texts are found when disambiguating.
+    """
+    refs = dict(evidence.text_refs)
+    if evidence.pmid:
+        refs['PMID'] = evidence.pmid
+    return refs
+
+
+def _get_refs_key(refs):
+    return tuple(sorted((k, str(v)) for k, v in refs.items() if v))
@@ -3,13 +3,16 @@ and contains functions to help apply it during the course of INDRA assembly."""
 
 import logging
 import requests
+import multiprocessing
 from copy import deepcopy
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Callable, List, Mapping, Optional, Tuple
 from urllib.parse import urljoin
 from indra.ontology.standardize \
     import standardize_agent_name
 from indra.config import get_config, has_config
 from indra.pipeline import register_pipeline
+from indra.sources.grounding_cache import GroundingCache
 
 
 logger = logging.getLogger(__name__)
@@ -17,6 +20,26 @@ logger = logging.getLogger(__name__)
 grounding_service_url = get_config('GILDA_URL', failure_ok=True) \
     if has_config('GILDA_URL') else 'http://grounding.indra.bio/'
 
+#: The number of texts sent to the web service in a single batch request
+GILDA_BATCH_SIZE = 100
+
+#: A cache of Gilda groundings keyed by mode, text and context. It can be
+#: persisted between runs with its save and load methods.
+gilda_cache = GroundingCache(maxsize=100000)
+
+_session = None
+
+
+def _get_session():
+    global _session
+    if _session is None:
+        _session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=1,
+                                                pool_maxsize=20)
+        _session.mount('http://', adapter)
+        _session.mount('https://', adapter)
+    return _session
+
 
 def get_grounding(
     txt: str,
@@ -25,6 +48,8 @@ def get_grounding(
 ) -> Tuple[Mapping[str, Any], List[Any]]:
     """Return the top Gilda grounding for a given text.
 
+    Results are cached in :data:`gilda_cache`.
+
     Parameters
     ----------
     txt : str
@@ -44,22 +69,131 @@ def get_grounding(
     list
         The list of ScoredMatches
     """
-    grounding = {}
+    try:
+        return gilda_cache.get(get_grounding, mode, (txt, context))
+    except KeyError:
+        pass
     if mode == 'web':
-        resp = requests.post(urljoin(grounding_service_url, 'ground'),
-                             json={'text': txt, 'context': context})
+        resp = _get_session().post(urljoin(grounding_service_url, 'ground'),
+                                   json={'text': txt, 'context': context})
         results = resp.json()
-        if results:
-            grounding = {results[0]['term']['db']: results[0]['term']['id']}
     else:
-        from gilda import ground
-        results = ground(txt, context)
-        if results:
-            grounding = {results[0].term.db: results[0].term.id}
-            results = [sm.to_json() for sm in results]
+        results = _ground_local(txt, context)
+    grounding = _get_top_grounding(results)
+    gilda_cache.put(get_grounding, mode, (txt, context),
+                    (grounding, results))
     return grounding, results
 
 
+def get_groundings(
+    texts: List[Tuple[str, Optional[str]]],
+    mode: Optional[str] = 'web',
+    max_workers: Optional[int] = None,
+) -> List[Tuple[Mapping[str, Any], List[Any]]]:
+    """Return the top Gilda groundings for a list of texts in batch.
+
+    Each unique text and context pair is only grounded once, and results
+    are taken from and added to :data:`gilda_cache`. In web mode, the
+    texts that need grounding are sent to the web service's batch
+    endpoint in groups of :data:`GILDA_BATCH_SIZE`, falling back to
+    concurrent requests for individual texts if the service doesn't
+    support batch requests.
+
+    Parameters
+    ----------
+    texts : list[tuple]
+        A list of tuples of the text to ground and its context (which
+        can be None).
+    mode : Optional[str]
+        If 'web', the web service given in the GILDA_URL config setting or
+        environmental variable is used. Otherwise, the gilda package is
+        attempted to be imported and used. Default: web
+    max_workers : Optional[int]
+        In web mode, the number of batch requests sent concurrently. In
+        local mode, the number of processes used for grounding. By default,
+        one at a time in local mode and 4 in web mode.
+
+    Returns
+    -------
+    list[tuple]
+        For each text in the input, in the same order, a tuple of the top
+        grounding (which is an empty dict if there is no grounding) and
+        the list of ScoredMatches as returned by :func:`get_grounding`.
+    """
+    cached = {}
+    to_ground = []
+    for txt_ctx in dict.fromkeys(texts):
+        try:
+            cached[txt_ctx] = gilda_cache.get(get_grounding, mode, txt_ctx)
+        except KeyError:
+            to_ground.append(txt_ctx)
+    if to_ground:
+        logger.info('Grounding %d unique texts with Gilda (%d cached)'
+                    % (len(to_ground), len(cached)))
+        if mode == 'web':
+            all_results = _ground_web_batch(to_ground, max_workers or 4)
+        else:
+            all_results = _ground_local_batch(to_ground, max_workers or 1)
+        for txt_ctx, results in zip(to_ground, all_results):
+            value = (_get_top_grounding(results), results)
+            gilda_cache.put(get_grounding, mode, txt_ctx, value)
+            cached[txt_ctx] = value
+    return [deepcopy(cached[txt_ctx]) for txt_ctx in texts]
+
+
+def _get_top_grounding(results):
+    if not results:
+        return {}
+    return {results[0]['term']['db']: results[0]['term']['id']}
+
+
+def _ground_local(txt, context):
+    from gilda import ground
+    return [sm.to_json() for sm in ground(txt, context)]
+
+
+def _ground_local_texts(texts):
+    return [_ground_local(txt, context) for txt, context in texts]
+
+
+def _ground_local_batch(texts, n_procs):
+    if n_procs == 1:
+        return _ground_local_texts(texts)
+    batches = _get_batches(texts, max(1, len(texts) // (4 * n_procs)))
+    with multiprocessing.Pool(n_procs) as pool:
+        return [results for batch_results in
+                pool.imap(_ground_local_texts, batches)
+                for results in batch_results]
+
+
+def _ground_web_texts(texts):
+    session = _get_session()
+    resp = session.post(urljoin(grounding_service_url, 'ground_multi'),
+                        json=[{'text': txt, 'context': context}
+                              for txt, context in texts])
+    # Older versions of the service don't have a batch endpoint so we
+    # ground the texts one by one
+    if resp.status_code in {404, 405}:
+        return [session.post(urljoin(grounding_service_url, 'ground'),
+                             json={'text': txt, 'context': context}).json()
+                for txt, context in texts]
+    resp.raise_for_status()
+    return resp.json()
+
+
+def _ground_web_batch(texts, max_workers):
+    batches = _get_batches(texts, GILDA_BATCH_SIZE)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return [results for batch_results in
+                executor.map(_ground_web_texts, batches)
+                for results in batch_results]
+
+
+def _get_batches(texts, batch_size):
+    return [texts[i:i + batch_size]
+            for i in range(0, len(texts), batch_size)]
+
+
 def get_gilda_models(mode='web'):
     """Return a list of strings for which Gilda has a disambiguation model.
 
@@ -104,12 +238,16 @@ def ground_agent(agent, txt, context=None, mode='web'):
         attempted to be imported and used. Default: web
     """
     gr, results = get_grounding(txt, context, mode)
+    _set_agent_grounding(agent, txt, gr)
+    return results
+
+
+def _set_agent_grounding(agent, txt, gr):
     if gr:
         db_refs = {'TEXT': txt}
         db_refs.update(gr)
         agent.db_refs = db_refs
         standardize_agent_name(agent, standardize_refs=True)
-    return results
 
 
 def ground_statement(stmt, mode='web', ungrounded_only=False):
@@ -129,6 +267,11 @@ def ground_statement(stmt, mode='web', ungrounded_only=False):
         If True, only ungrounded Agents will be grounded, and ones that
         are already grounded will not be modified. Default: False
     """
+    for agent, txt, context in _get_agents_to_ground(stmt, ungrounded_only):
+        ground_agent(agent, txt, context, mode=mode)
+
+
+def _get_agents_to_ground(stmt, ungrounded_only=False):
     if stmt.evidence and stmt.evidence[0].text:
         context = stmt.evidence[0].text
     else:
@@ -138,14 +281,18 @@ def ground_statement(stmt, mode='web', ungrounded_only=False):
             txt = agent.db_refs['TEXT']
             gr = agent.get_grounding()
             if not ungrounded_only or gr[0] is None:
-                ground_agent(agent, txt, context, mode=mode)
+                yield agent, txt, context
 
 
 @register_pipeline
-def ground_statements(stmts, mode='web', sources=None, ungrounded_only=False):
+def ground_statements(stmts, mode='web', sources=None, ungrounded_only=False,
+                      max_workers=None):
     """Set grounding for Agents in a list of Statements using Gilda.
 
     This function modifies the original Statements/Agents in place.
+    The texts of all the Agents to be grounded are grounded together in
+    batch with :func:`get_groundings`, so that each unique text and
+    context pair is only grounded once.
 
     Parameters
     ----------
@@ -163,6 +310,10 @@ def ground_statements(stmts, mode='web', sources=None, ungrounded_only=False):
     ungrounded_only : Optional[str]
         If True, only ungrounded Agents will be grounded, and ones that
         are already grounded will not be modified. Default: False
+    max_workers : Optional[int]
+        In web mode, the number of batch requests sent concurrently. In
+        local mode, the number of processes used for grounding. See
+        :func:`get_groundings`.
 
     Returns
     -------
@@ -171,8 +322,14 @@ def ground_statements(stmts, mode='web', sources=None, ungrounded_only=False):
     """
     source_filter = set(sources) if sources else set()
     grounded_stmts = deepcopy(stmts)
+    agents_to_ground = []
     for stmt in grounded_stmts:
         if not source_filter or (stmt.evidence and stmt.evidence[0].source_api
                                  in source_filter):
-            ground_statement(stmt, mode=mode, ungrounded_only=ungrounded_only)
+            agents_to_ground += _get_agents_to_ground(stmt, ungrounded_only)
+    groundings = get_groundings([(txt, context) for _, txt, context
+                                 in agents_to_ground],
+                                mode=mode, max_workers=max_workers)
+    for (agent, txt, _), (gr, _) in zip(agents_to_ground, groundings):
+        _set_agent_grounding(agent, txt, gr)
     return grounded_stmts
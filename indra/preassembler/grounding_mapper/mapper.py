@@ -5,10 +5,12 @@ import os
 import csv
 import json
 import logging
+import multiprocessing
 from copy import deepcopy
 from indra.statements import Agent
 from indra.databases import hgnc_client
 from indra.util import read_unicode_csv
+from indra.sources.grounding_cache import GroundingCache
 from indra.preassembler.grounding_mapper.gilda import get_gilda_models
 from indra.ontology.standardize import standardize_db_refs, \
     standardize_agent_name
@@ -47,9 +49,18 @@ class GroundingMapper(object):
         is assumed to be the web service endpoint through which Gilda is used.
         If 'local', we assume that the gilda Python package is installed
         and will be used.
+    memo_size : Optional[int]
+        The maximum number of distinct Agent groundings whose mapping is
+        memoized, so that Agents with the same name and db_refs are only
+        mapped once. Disambiguation, which depends on the context of each
+        Statement, is not memoized. If 0, nothing is memoized. Since the
+        memoized mappings are based on the grounding, agent and
+        misgrounding maps, :meth:`clear_cache` has to be called if these
+        maps are changed after mapping. Default: 100000
     """
     def __init__(self, grounding_map=None, agent_map=None, ignores=None,
-                 misgrounding_map=None, use_adeft=True, gilda_mode=None):
+                 misgrounding_map=None, use_adeft=True, gilda_mode=None,
+                 memo_size=100000):
         self.grounding_map = grounding_map if grounding_map is not None \
             else default_grounding_map
         self.check_grounding_map(self.grounding_map)
@@ -62,6 +73,24 @@ class GroundingMapper(object):
         self.disamb_manager = DisambManager()
         self.gilda_mode = gilda_mode
         self._gilda_models = None
+        self._agent_cache = GroundingCache(maxsize=memo_size)
+
+    def __getstate__(self):
+        # The disambiguation manager holds a database connection and the
+        # cache holds a lock, so neither of them is sent to other processes
+        state = self.__dict__.copy()
+        state.pop('disamb_manager')
+        state['_agent_cache'] = state['_agent_cache'].maxsize
+        return state
+
+    def __setstate__(self, state):
+        state['_agent_cache'] = GroundingCache(maxsize=state['_agent_cache'])
+        self.__dict__.update(state)
+        self.disamb_manager = DisambManager()
+
+    def clear_cache(self):
+        """Clear the memoized Agent mappings."""
+        self._agent_cache.clear()
 
     @property
     def gilda_models(self):
@@ -85,7 +114,7 @@ class GroundingMapper(object):
                 raise ValueError('HGNC:%s for key %s in the grounding map is '
                                  'not a valid ID' % (refs['HGNC'], key))
 
-    def map_stmts(self, stmts, do_rename=True):
+    def map_stmts(self, stmts, do_rename=True, n_procs=1, chunk_size=10000):
         """Return a new list of statements whose agents have been mapped
 
         Parameters
@@ -97,6 +126,13 @@ class GroundingMapper(object):
             If do_rename is True the priority for setting the name is
             FamPlex ID, HGNC symbol, then the gene name
             from Uniprot. Default: True
+        n_procs : Optional[int]
+            If larger than 1, the statements are mapped in chunks by a pool
+            of this many processes, each with its own copy of this
+            GroundingMapper. Default: 1
+        chunk_size : Optional[int]
+            The number of statements in each chunk sent to a process if
+            n_procs is larger than 1. Default: 10000
 
         Returns
         -------
@@ -109,17 +145,55 @@ class GroundingMapper(object):
         num_skipped = 0
         # Iterate over the statements
         import tqdm
-        it = tqdm.tqdm(stmts) if len(stmts) > 1e5 else stmts
-        for stmt in it:
-            mapped_stmt = self.map_agents_for_stmt(stmt, do_rename)
-            # Check if we should skip the statement
-            if mapped_stmt is not None:
-                mapped_stmts.append(mapped_stmt)
-            else:
-                num_skipped += 1
+        chunks = [stmts[i:i + chunk_size]
+                  for i in range(0, len(stmts), chunk_size)]
+        if n_procs > 1 and len(stmts) > chunk_size:
+            pool = multiprocessing.Pool(n_procs, initializer=_init_worker,
+                                        initargs=(self, do_rename))
+            try:
+                chunks_it = pool.imap(_map_chunk, chunks)
+                if len(stmts) > 1e5:
+                    chunks_it = tqdm.tqdm(chunks_it, total=len(chunks))
+                mapped_stmts, num_skipped = _collect_mapped(
+                    mapped_stmt for chunk_mapped in chunks_it
+                    for mapped_stmt in chunk_mapped)
+            finally:
+                pool.close()
+                pool.join()
+        else:
+            chunks_it = tqdm.tqdm(chunks) if len(stmts) > 1e5 else chunks
+            try:
+                mapped_stmts, num_skipped = _collect_mapped(
+                    mapped_stmt for chunk in chunks_it
+                    for mapped_stmt in self._map_stmts_chunk(chunk,
+                                                             do_rename))
+            finally:
+                self.disamb_manager.clear_text_cache()
         logger.info('%s statements filtered out' % num_skipped)
         return mapped_stmts
 
+    def _map_stmts_chunk(self, stmts, do_rename):
+        # The texts needed for disambiguating Agents in these Statements are
+        # fetched in bulk before mapping the Statements one by one.
+        disamb_stmts = self._get_stmts_to_disambiguate(stmts)
+        if disamb_stmts:
+            self.disamb_manager.prefetch_texts(disamb_stmts)
+        return [self.map_agents_for_stmt(stmt, do_rename) for stmt in stmts]
+
+    def _get_stmts_to_disambiguate(self, stmts):
+        disamb_txts = set()
+        if self.use_adeft:
+            disamb_txts |= set(adeft_disambiguators)
+        if self.gilda_mode:
+            disamb_txts |= set(self.gilda_models) - set(self.grounding_map)
+        if not disamb_txts:
+            return []
+        return [stmt for stmt in stmts
+                if any(agent is not None and
+                       {agent.db_refs.get('TEXT'),
+                        agent.db_refs.get('TEXT_NORM')} & disamb_txts
+                       for agent in stmt.agent_list())]
+
     def map_agents_for_stmt(self, stmt, do_rename=True):
         """Return a new Statement whose agents have been grounding mapped.
 
@@ -191,7 +265,7 @@ class GroundingMapper(object):
 
             # If Adeft and Gilda were not used or didn't succeed, we do
             # grounding mapping
-            new_agent = self.map_agent(agent, do_rename) \
+            new_agent = self._map_agent_memoized(agent, do_rename) \
                 if not (adeft_success or gilda_success) else agent
 
             # If the old agent had bound conditions, but the new agent does
@@ -207,7 +281,7 @@ class GroundingMapper(object):
         for agent in agent_list:
             if agent is not None:
                 for bc in agent.bound_conditions:
-                    bc.agent = self.map_agent(bc.agent, do_rename)
+                    bc.agent = self._map_agent_memoized(bc.agent, do_rename)
                     if not bc.agent:
                         # Skip the entire statement if the agent maps to None
                         # in the grounding map
@@ -215,6 +289,35 @@ class GroundingMapper(object):
 
         return mapped_stmt
 
+    def _map_agent_memoized(self, agent, do_rename):
+        # The mapping of an Agent only depends on its name and db_refs,
+        # so we remember the name and db_refs it was mapped to, or the new
+        # Agent it was replaced by, and apply that to Agents with the same
+        # name and db_refs.
+        try:
+            key = (do_rename, frozenset(agent.db_refs.items()))
+        except TypeError:
+            return self.map_agent(agent, do_rename)
+        try:
+            mapped = self._agent_cache.get(GroundingMapper.map_agent,
+                                           agent.name, key)
+        except KeyError:
+            name = agent.name
+            new_agent = self.map_agent(agent, do_rename)
+            if new_agent is agent:
+                mapped = (agent.name, agent.db_refs, None)
+            else:
+                mapped = (None, None, new_agent)
+            self._agent_cache.put(GroundingMapper.map_agent, name, key,
+                                  mapped)
+            return new_agent
+        name, db_refs, new_agent = mapped
+        if new_agent is not None:
+            return new_agent
+        agent.name = name
+        agent.db_refs = db_refs
+        return agent
+
     def map_agent(self, agent, do_rename):
         """Return the given Agent with its grounding mapped.
 
@@ -397,6 +500,32 @@ class GroundingMapper(object):
         return mapped_stmts
 
 
+def _collect_mapped(mapped_stmts_it):
+    mapped_stmts = []
+    num_skipped = 0
+    for mapped_stmt in mapped_stmts_it:
+        # Check if we should skip the statement
+        if mapped_stmt is not None:
+            mapped_stmts.append(mapped_stmt)
+        else:
+            num_skipped += 1
+    return mapped_stmts, num_skipped
+
+
+_worker_mapper = None
+_worker_do_rename = True
+
+
+def _init_worker(mapper, do_rename):
+    global _worker_mapper, _worker_do_rename
+    _worker_mapper = mapper
+    _worker_do_rename = do_rename
+
+
+def _map_chunk(stmts):
+    return _worker_mapper._map_stmts_chunk(stmts, _worker_do_rename)
+
+
 # TODO: handle the cases when there is more than one entry for the same
 # key (e.g., ROS, ER)
 def load_grounding_map(grounding_map_path, lineterminator='\r\n',
@@ -1,5 +1,6 @@
 import logging
 import textwrap
+import multiprocessing
 from copy import deepcopy
 from functools import lru_cache
 from protmapper.api import ProtMapper, default_site_map
@@ -122,6 +123,8 @@ class SiteMapper(ProtMapper):
         self.do_methionine_offset = do_methionine_offset
         self.do_orthology_mapping = do_orthology_mapping
         self.do_isoform_mapping = do_isoform_mapping
+        # A table of sites resolved ahead of mapping a set of statements
+        self._resolved_sites = {}
 
     def map_stmt_sites(self, stmt):
         stmt_copy = deepcopy(stmt)
@@ -189,7 +192,7 @@ class SiteMapper(ProtMapper):
             mapped_stmt = None
         return mapped_stmt
 
-    def map_sites(self, stmts):
+    def map_sites(self, stmts, n_procs=1):
         """Check a set of statements for invalid modification sites.
 
         Statements are checked against Uniprot reference sequences to determine
@@ -207,6 +210,11 @@ class SiteMapper(ProtMapper):
         ----------
         stmts : list of :py:class:`indra.statement.Statement`
             The statements to check for site errors.
+        n_procs : Optional[int]
+            The distinct (UniProt ID, residue, position) sites appearing in
+            the statements are resolved once before the statements are
+            mapped. If n_procs is larger than 1, the sites are resolved by a
+            pool of this many processes. Default: 1
 
         Returns
         -------
@@ -222,24 +230,108 @@ class SiteMapper(ProtMapper):
         valid_statements = []
         mapped_statements = []
 
-        for stmt in stmts:
-            # Check for errors in the position str
-            # TODO: this could also be used on agent conditions, here
-            # it's only applied to statement position arguments
-            if isinstance(stmt, (Modification, SelfModification)) and \
-                    not _valid_position_str(stmt.position):
-                continue
-            mapped_stmt = self.map_stmt_sites(stmt)
-            # If we got a MappedStatement as a return value, we add that to the
-            # list of mapped statements, otherwise, the original Statement is
-            # not invalid so we add it to the other list directly.
-            if mapped_stmt is not None:
-                mapped_statements.append(mapped_stmt)
-            else:
-                valid_statements.append(stmt)
+        # Check for errors in the position str
+        # TODO: this could also be used on agent conditions, here
+        # it's only applied to statement position arguments
+        stmts = [stmt for stmt in stmts
+                 if not isinstance(stmt, (Modification, SelfModification))
+                 or _valid_position_str(stmt.position)]
+        self._resolved_sites = self.resolve_sites(self.get_sites(stmts),
+                                                  n_procs=n_procs)
+        try:
+            for stmt in stmts:
+                mapped_stmt = self.map_stmt_sites(stmt)
+                # If we got a MappedStatement as a return value, we add that
+                # to the list of mapped statements, otherwise, the original
+                # Statement is not invalid so we add it to the other list
+                # directly.
+                if mapped_stmt is not None:
+                    mapped_statements.append(mapped_stmt)
+                else:
+                    valid_statements.append(stmt)
+        finally:
+            self._resolved_sites = {}
 
         return valid_statements, mapped_statements
 
+    @staticmethod
+    def get_sites(stmts):
+        """Return the distinct sites that need to be mapped in statements.
+
+        Parameters
+        ----------
+        stmts : list of :py:class:`indra.statement.Statement`
+            The statements whose modification sites are collected.
+
+        Returns
+        -------
+        list[tuple]
+            The distinct (UniProt ID, residue, position) tuples of the
+            modifications of the statements' agents (including agents in
+            bound conditions) and of modification statements themselves.
+        """
+        sites = {}
+        for stmt in stmts:
+            for agent in stmt.agent_list():
+                if agent is None:
+                    continue
+                for ag in [agent] + [bc.agent for bc
+                                     in agent.bound_conditions]:
+                    for mod in ag.mods:
+                        site = _get_site(ag, mod.residue, mod.position)
+                        if site:
+                            sites[site] = None
+            if isinstance(stmt, (Modification, SelfModification)):
+                agent = stmt.sub if isinstance(stmt, Modification) \
+                    else stmt.enz
+                site = _get_site(agent, stmt.residue, stmt.position)
+                if site:
+                    sites[site] = None
+        return list(sites)
+
+    def resolve_sites(self, sites, n_procs=1):
+        """Return the results of mapping each of a list of sites.
+
+        Parameters
+        ----------
+        sites : list[tuple]
+            A list of (UniProt ID, residue, position) tuples.
+        n_procs : Optional[int]
+            If larger than 1, the sites are mapped by a pool of this many
+            processes. Default: 1
+
+        Returns
+        -------
+        dict
+            A dict of the mapped sites (protmapper.MappedSite) keyed by the
+            (UniProt ID, residue, position) tuples they were mapped from.
+        """
+        logger.info('Resolving %d distinct sites' % len(sites))
+        if n_procs > 1 and len(sites) > n_procs:
+            chunk_size = max(1, len(sites) // (4 * n_procs))
+            chunks = [sites[i:i + chunk_size]
+                      for i in range(0, len(sites), chunk_size)]
+            with multiprocessing.Pool(n_procs, initializer=_init_worker,
+                                      initargs=(self,)) as pool:
+                mapped_sites = [mapped_site for chunk_mapped in
+                                pool.imap(_resolve_chunk, chunks)
+                                for mapped_site in chunk_mapped]
+        else:
+            mapped_sites = [self._resolve_site(*site) for site in sites]
+        resolved = dict(zip(sites, mapped_sites))
+        # Sites resolved in other processes are added to the cache here
+        for site, mapped_site in resolved.items():
+            if mapped_site is not None and mapped_site.error_code is None:
+                self._cache.setdefault(site, mapped_site)
+        return resolved
+
+    def _resolve_site(self, up_id, residue, position):
+        return self.map_to_human_ref(
+            up_id, 'uniprot', residue, position,
+            do_methionine_offset=self.do_methionine_offset,
+            do_orthology_mapping=self.do_orthology_mapping,
+            do_isoform_mapping=self.do_isoform_mapping)
+
     def _map_agent_sites(self, agent):
         """Check an agent for invalid sites and update if necessary.
 
@@ -308,17 +400,36 @@ class SiteMapper(ProtMapper):
         # If no site information for this residue, skip
         if mod_condition.position is None or mod_condition.residue is None:
             return None
-        # Otherwise, try to map it and return the mapped site
-        mapped_site = \
-            self.map_to_human_ref(up_id, 'uniprot',
-                mod_condition.residue,
-                mod_condition.position,
-                do_methionine_offset=self.do_methionine_offset,
-                do_orthology_mapping=self.do_orthology_mapping,
-                do_isoform_mapping=self.do_isoform_mapping)
+        # Otherwise, look the site up among the ones resolved in advance,
+        # or try to map it and return the mapped site
+        site = (up_id, mod_condition.residue, mod_condition.position)
+        mapped_site = self._resolved_sites.get(site)
+        if mapped_site is None:
+            mapped_site = self._resolve_site(*site)
         return mapped_site
 
 
+def _get_site(agent, residue, position):
+    if residue is None or position is None:
+        return None
+    up_id = _get_uniprot_id(agent)
+    if not up_id:
+        return None
+    return up_id, residue, position
+
+
+_worker_mapper = None
+
+
+def _init_worker(mapper):
+    global _worker_mapper
+    _worker_mapper = mapper
+
+
+def _resolve_chunk(sites):
+    return [_worker_mapper._resolve_site(*site) for site in sites]
+
+
 default_mapper = SiteMapper(default_site_map)
 
 
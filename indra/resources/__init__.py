@@ -2,6 +2,9 @@
 to perform tasks such as name standardization and ID mapping."""
 import os
 import json
+import threading
+
+from indra.resources.resource_cache import get_resource_cache
 
 RESOURCES_PATH = os.path.dirname(os.path.abspath(__file__))
 
@@ -36,3 +39,134 @@ def load_resource_json(fname):
     """
     with open(get_resource_path(fname), 'r') as fh:
         return json.load(fh)
+
+
+class LazyResource(object):
+    """A group of tables built from resource files when first accessed.
+
+    Clients that look up information in tables built from resource files
+    use this to defer reading the files until a lookup is actually made,
+    instead of doing it when the client module is imported. Tables are
+    accessed as attributes of the LazyResource, and the first such access
+    triggers loading all the tables of the group.
+
+    Parameters
+    ----------
+    loader : function
+        A function without arguments which returns the tables, as a tuple
+        in the order of `names` or as a single value if there is only one
+        name.
+    names : list[str]
+        The names of the tables returned by the loader.
+    module_globals : Optional[dict]
+        The globals of the module that the tables belong to. If given, the
+        tables are added to the module once they are loaded, so that from
+        then on, they are regular attributes of the module.
+    sources : Optional[list[str]]
+        The paths to the resource files the tables are built from. If
+        given and a resource cache is configured (see
+        :mod:`indra.resources.resource_cache`), the tables are compiled
+        into the cache and looked up from there instead of being rebuilt
+        from the resource files in each process.
+    """
+    def __init__(self, loader, names, module_globals=None, sources=None):
+        self._loader = loader
+        self.names = tuple(names)
+        self._module_globals = module_globals
+        self.sources = sources
+        self._lock = threading.RLock()
+        self._rest_loader = None
+        self.loaded = False
+
+    def __getattr__(self, name):
+        # This is only called for attributes that are not set yet, i.e., for
+        # tables that haven't been loaded.
+        if name.startswith('_') or name not in self.names:
+            raise AttributeError(name)
+        self.load()
+        return self.__dict__[name]
+
+    def load(self):
+        """Load the tables unless they have already been loaded."""
+        with self._lock:
+            if self.loaded:
+                return
+            if self._rest_loader is not None:
+                self.set_tables(self._rest_loader())
+                if self.loaded:
+                    return
+            cache = get_resource_cache() if self.sources else None
+            if cache is not None:
+                values = cache.get_tables(self.get_cache_name(),
+                                          self.sources, self.names,
+                                          self._load_tables)
+            else:
+                values = self._load_tables()
+            # Tables that were already set are kept
+            self.set_tables({name: value
+                             for name, value in zip(self.names, values)
+                             if name not in self.__dict__})
+
+    def set_tables(self, tables, rest_loader=None):
+        """Set the tables instead of loading them from the resource files.
+
+        This is used, for instance, to make the tables of the resource in a
+        worker process refer to tables shared by the parent process (see
+        :mod:`indra.util.shared_tables`). Tables that are not given are
+        still loaded when they are first accessed.
+
+        Parameters
+        ----------
+        tables : dict
+            The tables keyed by their names.
+        rest_loader : Optional[function]
+            A function without arguments which returns the tables that are
+            not given, keyed by their names. If given, it is called instead
+            of the loader when one of these tables is first accessed, so
+            that the given tables don't have to be built again.
+        """
+        with self._lock:
+            if rest_loader is not None:
+                self._rest_loader = rest_loader
+            self.__dict__.update(tables)
+            if self._module_globals is not None:
+                self._module_globals.update(tables)
+            self.loaded = all(name in self.__dict__ for name in self.names)
+
+    def _load_tables(self):
+        values = self._loader()
+        if len(self.names) == 1:
+            values = (values,)
+        return values
+
+    def get_cache_name(self):
+        """Return the name of the tables' compiled file in the cache."""
+        module_name = self._module_globals.get('__name__') \
+            if self._module_globals is not None else self._loader.__module__
+        return '%s.%s' % (module_name.split('.')[-1], self.names[0])
+
+
+def make_module_getattr(module_name, *resources):
+    """Return a module-level __getattr__ that loads tables on access.
+
+    Parameters
+    ----------
+    module_name : str
+        The name of the module, used in error messages.
+    *resources : LazyResource
+        The LazyResources whose tables can be accessed as attributes of the
+        module.
+
+    Returns
+    -------
+    function
+        A function to be assigned to `__getattr__` in the module (see
+        PEP 562).
+    """
+    def __getattr__(name):
+        for resource in resources:
+            if name in resource.names:
+                return getattr(resource, name)
+        raise AttributeError('module %r has no attribute %r'
+                             % (module_name, name))
+    return __getattr__
@@ -0,0 +1,397 @@
+"""A cache of resource tables compiled into indexed SQLite files.
+
+Database clients build their lookup tables by parsing resource files such
+as `hgnc_entries.tsv` row by row, which every process has to repeat. If
+the `INDRA_RESOURCE_CACHE_DIR` configuration option is set, the tables of
+a :class:`indra.resources.LazyResource` that declares its source files
+are instead compiled once into an SQLite file in that folder, and
+subsequently looked up directly from that file through
+:class:`CompiledTable`. A compiled file is rebuilt whenever the checksum
+of its source files changes. The checksum is only computed when the sizes
+or modification times of the source files differ from the ones stored in
+the compiled file, so that processes don't read the source files in full
+just to validate the cache.
+
+Since lookups go through the (memory mapped) database file, a cold lookup
+only touches the pages it needs, and processes forked from a parent
+share these pages through the operating system's page cache instead of
+each holding a private copy of the tables.
+
+All compiled tables can be built ahead of time by running
+
+    python -m indra.resources.resource_cache
+"""
+
+__all__ = ['CompiledTable', 'ResourceCache', 'get_resource_cache',
+           'compile_resources']
+
+import os
+import json
+import pickle
+import hashlib
+import logging
+import sqlite3
+import importlib
+import threading
+from collections.abc import Mapping, ItemsView, ValuesView
+
+from indra.config import get_config
+
+logger = logging.getLogger(__name__)
+
+#: The size of the memory map used to access compiled files, in bytes
+MMAP_SIZE = 2 ** 30
+
+#: Database client modules whose tables can be compiled
+DEFAULT_MODULES = ['indra.databases.hgnc_client',
+                   'indra.databases.mesh_client',
+                   'indra.databases.chebi_client',
+                   'indra.databases.chembl_client',
+                   'indra.databases.drugbank_client',
+                   'indra.databases.pubchem_client',
+                   'indra.databases.mgi_client',
+                   'indra.databases.rgd_client']
+
+
+def _encode(obj):
+    # Strings, by far the most common keys and values, are stored as text,
+    # everything else is pickled into a blob. Since SQLite never considers
+    # a text and a blob equal, the two can't collide.
+    if isinstance(obj, str):
+        return obj
+    return pickle.dumps(obj, protocol=4)
+
+
+def _decode(value):
+    if isinstance(value, bytes):
+        return pickle.loads(value)
+    return value
+
+
+class CompiledTable(Mapping):
+    """A read-only dict-like table stored in a compiled SQLite file.
+
+    Parameters
+    ----------
+    path : str
+        The path to the compiled SQLite file.
+    name : str
+        The name of the table in the file.
+    """
+    def __init__(self, path, name):
+        self.path = path
+        self.name = name
+        self._lock = threading.Lock()
+        self._conn = None
+        self._pid = None
+        self._len = None
+
+    def _get_conn(self):
+        # SQLite connections can't be shared with forked child processes
+        # so each process opens its own.
+        if self._conn is None or self._pid != os.getpid():
+            self._conn = _connect(self.path, read_only=True)
+            self._pid = os.getpid()
+        return self._conn
+
+    def _query(self, sql, args=()):
+        with self._lock:
+            return self._get_conn().execute(sql, args).fetchall()
+
+    def __getitem__(self, key):
+        rows = self._query('SELECT value FROM "%s" WHERE key = ?' % self.name,
+                           (_encode(key),))
+        if not rows:
+            raise KeyError(key)
+        return _decode(rows[0][0])
+
+    def __contains__(self, key):
+        return bool(self._query('SELECT 1 FROM "%s" WHERE key = ?'
+                                % self.name, (_encode(key),)))
+
+    def __iter__(self):
+        for key, in self._query('SELECT key FROM "%s" ORDER BY rowid'
+                                % self.name):
+            yield _decode(key)
+
+    def __len__(self):
+        if self._len is None:
+            self._len = self._query('SELECT COUNT(*) FROM "%s"'
+                                    % self.name)[0][0]
+        return self._len
+
+    def __repr__(self):
+        return '%s(%r, %r)' % (self.__class__.__name__, self.path, self.name)
+
+    def __getstate__(self):
+        return {'path': self.path, 'name': self.name}
+
+    def __setstate__(self, state):
+        self.__init__(state['path'], state['name'])
+
+    def _iter_items(self):
+        for key, value in self._query('SELECT key, value FROM "%s" '
+                                      'ORDER BY rowid' % self.name):
+            yield _decode(key), _decode(value)
+
+    def items(self):
+        return _CompiledItemsView(self)
+
+    def values(self):
+        return _CompiledValuesView(self)
+
+    def copy(self):
+        """Return the contents of the table as a dict."""
+        return dict(self._iter_items())
+
+
+class _CompiledItemsView(ItemsView):
+    def __iter__(self):
+        yield from self._mapping._iter_items()
+
+
+class _CompiledValuesView(ValuesView):
+    def __iter__(self):
+        for _, value in self._mapping._iter_items():
+            yield value
+
+
+class ResourceCache(object):
+    """A folder of resource tables compiled into SQLite files.
+
+    Parameters
+    ----------
+    cache_dir : str
+        The folder in which the compiled files are stored. It is created
+        if it doesn't exist.
+    """
+    def __init__(self, cache_dir):
+        self.cache_dir = cache_dir
+        self._lock = threading.Lock()
+
+    def get_path(self, name):
+        """Return the path to the compiled file with the given name."""
+        return os.path.join(self.cache_dir, '%s.sqlite' % name)
+
+    def get_tables(self, name, sources, names, loader):
+        """Return tables from a compiled file, compiling it if needed.
+
+        Parameters
+        ----------
+        name : str
+            The name of the compiled file.
+        sources : list[str]
+            The paths to the resource files the tables are built from.
+            Source files that don't exist are ignored in the checksum.
+        names : list[str]
+            The names of the tables.
+        loader : function
+            A function without arguments that builds the tables from the
+            source files, returning them in the order of `names`.
+
+        Returns
+        -------
+        list
+            The tables in the order of `names`. Tables that are dicts are
+            returned as :class:`CompiledTable` instances, other tables
+            (e.g., lists or sets) are returned as is.
+        """
+        path = self.get_path(name)
+        stats = get_stats(sources)
+        with self._lock:
+            meta = _get_meta(path)
+            if meta.get('stats') != stats:
+                checksum = get_checksum(sources)
+                if meta.get('checksum') != checksum:
+                    values = loader()
+                    try:
+                        self._compile(path, checksum, stats, names, values)
+                    except (OSError, sqlite3.Error) as e:
+                        logger.warning('Could not compile %s: %s'
+                                       % (path, e))
+                        return values
+                else:
+                    # The files were touched but not changed
+                    _set_meta(path, 'stats', stats)
+        return _open_tables(path, names)
+
+    def _compile(self, path, checksum, stats, names, values):
+        logger.info('Compiling resource tables into %s' % path)
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp_path = '%s.%d.tmp' % (path, os.getpid())
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        conn = _connect(tmp_path)
+        try:
+            conn.execute('CREATE TABLE _meta (key TEXT PRIMARY KEY, '
+                         'value BLOB)')
+            for name, value in zip(names, values):
+                if isinstance(value, dict):
+                    conn.execute('CREATE TABLE "%s" (key PRIMARY KEY, value)'
+                                 % name)
+                    conn.executemany('INSERT INTO "%s" VALUES (?, ?)' % name,
+                                     ((_encode(k), _encode(v))
+                                      for k, v in value.items()))
+                else:
+                    conn.execute('INSERT INTO _meta VALUES (?, ?)',
+                                 ('object:%s' % name,
+                                  pickle.dumps(value, protocol=4)))
+            conn.executemany('INSERT INTO _meta VALUES (?, ?)',
+                             [('checksum', checksum), ('stats', stats)])
+            conn.commit()
+        finally:
+            conn.close()
+        os.replace(tmp_path, path)
+
+
+def _connect(path, read_only=False):
+    if read_only:
+        conn = sqlite3.connect('file:%s?mode=ro' % path, uri=True,
+                               check_same_thread=False)
+    else:
+        conn = sqlite3.connect(path)
+    conn.execute('PRAGMA mmap_size = %d' % MMAP_SIZE)
+    return conn
+
+
+def _get_meta(path):
+    # Returns the checksum and the stats of the source files stored in a
+    # compiled file, if any
+    if not os.path.exists(path):
+        return {}
+    try:
+        conn = _connect(path, read_only=True)
+        try:
+            rows = conn.execute('SELECT key, value FROM _meta WHERE key IN '
+                                '(?, ?)', ('checksum', 'stats')).fetchall()
+        finally:
+            conn.close()
+    except sqlite3.Error:
+        return {}
+    return dict(rows)
+
+
+def _set_meta(path, key, value):
+    try:
+        conn = _connect(path)
+        try:
+            conn.execute('INSERT OR REPLACE INTO _meta VALUES (?, ?)',
+                         (key, value))
+            conn.commit()
+        finally:
+            conn.close()
+    except sqlite3.Error as e:
+        logger.warning('Could not update %s: %s' % (path, e))
+
+
+def _open_tables(path, names):
+    conn = _connect(path, read_only=True)
+    try:
+        objects = dict(conn.execute('SELECT key, value FROM _meta').fetchall())
+    finally:
+        conn.close()
+    tables = []
+    for name in names:
+        key = 'object:%s' % name
+        if key in objects:
+            tables.append(pickle.loads(objects[key]))
+        else:
+            tables.append(CompiledTable(path, name))
+    return tables
+
+
+def get_stats(sources):
+    """Return the sizes and modification times of a list of files.
+
+    Parameters
+    ----------
+    sources : list[str]
+        The paths to the files. Files that don't exist are skipped.
+
+    Returns
+    -------
+    str
+        The name, size and modification time (in nanoseconds) of each file,
+        serialized as JSON.
+    """
+    stats = []
+    for source in sources:
+        if not os.path.exists(source):
+            continue
+        stat = os.stat(source)
+        stats.append([os.path.basename(source), stat.st_size,
+                      stat.st_mtime_ns])
+    return json.dumps(stats)
+
+
+def get_checksum(sources):
+    """Return a checksum of the contents of a list of files.
+
+    Parameters
+    ----------
+    sources : list[str]
+        The paths to the files. Files that don't exist are skipped.
+
+    Returns
+    -------
+    str
+        The hex digest of the SHA-256 checksum of the files.
+    """
+    hasher = hashlib.sha256()
+    for source in sources:
+        if not os.path.exists(source):
+            continue
+        hasher.update(os.path.basename(source).encode('utf-8'))
+        with open(source, 'rb') as fh:
+            for chunk in iter(lambda: fh.read(2 ** 20), b''):
+                hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+_resource_cache = None
+
+
+def get_resource_cache():
+    """Return the resource cache set in the configuration, if any.
+
+    Returns
+    -------
+    ResourceCache or None
+        The cache in the folder given by the `INDRA_RESOURCE_CACHE_DIR`
+        configuration option, or None if it isn't set.
+    """
+    global _resource_cache
+    cache_dir = get_config('INDRA_RESOURCE_CACHE_DIR', failure_ok=True)
+    if not cache_dir:
+        return None
+    cache_dir = os.path.expanduser(cache_dir)
+    if _resource_cache is None or _resource_cache.cache_dir != cache_dir:
+        _resource_cache = ResourceCache(cache_dir)
+    return _resource_cache
+
+
+def compile_resources(modules=None):
+    """Compile the resource tables of database clients into the cache.
+
+    Parameters
+    ----------
+    modules : Optional[list[str]]
+        The names of the client modules whose tables are compiled.
+        Default: all the modules in :data:`DEFAULT_MODULES`.
+    """
+    from indra.resources import LazyResource
+    if get_resource_cache() is None:
+        raise ValueError('INDRA_RESOURCE_CACHE_DIR is not configured.')
+    for module_name in (modules or DEFAULT_MODULES):
+        module = importlib.import_module(module_name)
+        for value in list(vars(module).values()):
+            if isinstance(value, LazyResource) and value.sources:
+                try:
+                    value.load()
+                except FileNotFoundError as e:
+                    logger.warning('Could not compile tables of %s: %s'
+                                   % (module_name, e))
+
+
+if __name__ == '__main__':
+    compile_resources()
@@ -20,7 +20,8 @@ from indra.databases import (
     identifiers
 )
 from indra.resources import get_resource_path
-from indra.ontology.standardize import standardize_name_db_refs
+from indra.sources.grounding_cache import grounding_cache, \
+    standardize_name_db_refs_cached
 from indra.assemblers.pybel.assembler import _pybel_indra_act_map
 
 __all__ = [
@@ -474,6 +475,12 @@ def get_db_refs_by_name(ns, name, node_data):
         The grounding for the given entity.
 
     """
+    # Node data is only used for logging so it isn't part of the cache key
+    return grounding_cache.resolve(_get_db_refs_by_name, ns, name,
+                                   ns, name, node_data)
+
+
+def _get_db_refs_by_name(ns, name, node_data):
     db_refs = None
     if ns == 'HGNC':
         # Assumption: name is an HGNC symbol
@@ -670,7 +677,8 @@ def get_db_refs_by_ident(ns, ident, node_data):
     if ns in ns_list:
         mapped_ns = ns_mappings.get(ns, ns)
         raw_db_refs = {mapped_ns: ident}
-        std_name, std_db_refs = standardize_name_db_refs(raw_db_refs)
+        std_name, std_db_refs = \
+            standardize_name_db_refs_cached(raw_db_refs)
         if std_name is None:
             std_name = raw_name
         if std_db_refs is None:
@@ -1,14 +1,15 @@
+import os
 import re
-import csv
 import tqdm
 import logging
-import requests
-from io import BytesIO, StringIO
+import tempfile
+from io import TextIOWrapper
 from zipfile import ZipFile
 from collections import namedtuple
-from indra.util import read_unicode_csv
+from indra.util import read_unicode_csv, read_unicode_csv_fileobj
 from indra.statements import Agent, Complex, Evidence
 from indra.ontology.standardize import standardize_name_db_refs
+from indra.sources.utils import Processor, download_file
 
 logger = logging.getLogger(__name__)
 
@@ -35,17 +36,26 @@ columns = ['biogrid_int_id',
 _BiogridRow = namedtuple('BiogridRow', columns)
 
 
-class BiogridProcessor(object):
+class BiogridProcessor(Processor):
     """Extracts INDRA Complex statements from Biogrid interaction data.
 
     Parameters
     ----------
     biogrid_file : str
-        The file containing the Biogrid data in .tab2 format. If not provided,
-        the BioGrid data is downloaded from the BioGrid website.
+        The file containing the Biogrid data in .tab2 format, or a zip
+        archive containing such a file. If not provided, the BioGrid data
+        is downloaded from the BioGrid website.
     physical_only : boolean
         If True, only physical interactions are included (e.g., genetic
         interactions are excluded). If False, all interactions are included).
+    lazy : Optional[bool]
+        If True, the statements are not extracted immediately, rather, they
+        can be generated one by one using `iter_statements`. If False, the
+        `statements` attribute is populated immediately. Default: False
+    cache_file : Optional[str]
+        If given, and no biogrid_file is provided, the zip archive downloaded
+        from the BioGrid website is saved into this file, and if the file
+        already exists, it is used instead of downloading the data again.
 
     Attributes
     ----------
@@ -55,54 +65,74 @@ class BiogridProcessor(object):
         Indicates whether only physical interactions were included during
         statement processing.
     """
-    def __init__(self, biogrid_file=None, physical_only=True):
+    name = 'biogrid'
+
+    def __init__(self, biogrid_file=None, physical_only=True, lazy=False,
+                 cache_file=None):
         self.statements = []
         self.physical_only = physical_only
-
+        self.biogrid_file = biogrid_file
+        self.cache_file = cache_file
+        if not lazy:
+            self.extract_statements()
+
+    def extract_statements(self):
+        """Extract statements from the Biogrid data and return them."""
+        self.statements = list(self.iter_statements())
+        return self.statements
+
+    def iter_statements(self):
+        """Iterate over statements extracted row by row from the data."""
         # If a path to the file is included, process it, skipping the header
-        if biogrid_file:
-            rows = read_unicode_csv(biogrid_file, '\t', skiprows=1)
+        if self.biogrid_file:
+            if self.biogrid_file.endswith('.zip'):
+                rows = _read_biogrid_zip(self.biogrid_file)
+            else:
+                rows = read_unicode_csv(self.biogrid_file, '\t', skiprows=1)
         # If no file is provided, download from web
         else:
-            logger.info('No data file specified, downloading from BioGrid '
-                        'at %s' % biogrid_file_url)
-            rows = _download_biogrid_data(biogrid_file_url)
+            rows = _download_biogrid_data(biogrid_file_url,
+                                          cache_file=self.cache_file)
 
         # Process the rows into Statements
         for row in tqdm.tqdm(rows, desc='Processing BioGRID rows'):
-            # There are some extra columns that we don't need to take and
-            # thereby save space in annotations
-            filt_row = [None if item == '-' else item
-                        for item in row][:len(columns)]
-            bg_row = _BiogridRow(*filt_row)
-            # Filter out non-physical interactions if desired
-            if self.physical_only and bg_row.exp_system_type != 'physical':
-                continue
-            # Ground agents
-            agent_a = self._make_agent(bg_row.symbol_a, bg_row.entrez_a,
-                                       bg_row.swissprot_a, bg_row.trembl_a)
-            agent_b = self._make_agent(bg_row.symbol_b, bg_row.entrez_b,
-                                       bg_row.swissprot_b, bg_row.trembl_b)
-            # Skip any agents with neither HGNC grounding or string name
-            if agent_a is None or agent_b is None:
-                continue
-            # Get evidence
-            pmid_match = re.match(r'PUBMED:(\d+)',
-                                  bg_row.publication)
-            doi_match = re.match(r'DOI:(.*)', bg_row.publication)
-            text_refs = {}
-            if pmid_match:
-                text_refs['PMID'] = pmid_match.groups()[0]
-            elif doi_match:
-                text_refs['DOI'] = doi_match.groups()[0]
-            ev = Evidence(source_api='biogrid',
-                          source_id=bg_row.biogrid_int_id,
-                          pmid=text_refs.get('PMID'),
-                          text_refs=text_refs,
-                          annotations=dict(bg_row._asdict()))
-            # Make statement
-            s = Complex([agent_a, agent_b], evidence=ev)
-            self.statements.append(s)
+            stmt = self._process_row(row)
+            if stmt is not None:
+                yield stmt
+
+    def _process_row(self, row):
+        # There are some extra columns that we don't need to take and
+        # thereby save space in annotations
+        filt_row = [None if item == '-' else item
+                    for item in row][:len(columns)]
+        bg_row = _BiogridRow(*filt_row)
+        # Filter out non-physical interactions if desired
+        if self.physical_only and bg_row.exp_system_type != 'physical':
+            return None
+        # Ground agents
+        agent_a = self._make_agent(bg_row.symbol_a, bg_row.entrez_a,
+                                   bg_row.swissprot_a, bg_row.trembl_a)
+        agent_b = self._make_agent(bg_row.symbol_b, bg_row.entrez_b,
+                                   bg_row.swissprot_b, bg_row.trembl_b)
+        # Skip any agents with neither HGNC grounding or string name
+        if agent_a is None or agent_b is None:
+            return None
+        # Get evidence
+        pmid_match = re.match(r'PUBMED:(\d+)',
+                              bg_row.publication)
+        doi_match = re.match(r'DOI:(.*)', bg_row.publication)
+        text_refs = {}
+        if pmid_match:
+            text_refs['PMID'] = pmid_match.groups()[0]
+        elif doi_match:
+            text_refs['DOI'] = doi_match.groups()[0]
+        ev = Evidence(source_api='biogrid',
+                      source_id=bg_row.biogrid_int_id,
+                      pmid=text_refs.get('PMID'),
+                      text_refs=text_refs,
+                      annotations=dict(bg_row._asdict()))
+        # Make statement
+        return Complex([agent_a, agent_b], evidence=ev)
 
     def _make_agent(self, symbol, entrez_id, swissprot_id, trembl_id):
         """Make an Agent object, appropriately grounded.
@@ -145,33 +175,55 @@ class BiogridProcessor(object):
         return Agent(name, db_refs=db_refs)
 
 
-def _download_biogrid_data(url):
+def _download_biogrid_data(url, cache_file=None):
     """Downloads zipped, tab-separated Biogrid data in .tab2 format.
 
-    Parameters:
-    -----------
+    The archive is streamed to disk rather than held in memory, and the
+    rows are then read one by one from the compressed member of the
+    archive.
+
+    Parameters
+    ----------
     url : str
         URL of the BioGrid zip file.
+    cache_file : Optional[str]
+        If given, the archive is kept in this file after downloading it,
+        and if the file already exists, it is read instead of downloading
+        the archive again.
 
     Returns
     -------
-    csv.reader
-        A csv.reader object for iterating over the rows (header has already
+    generator
+        A generator over the rows of the data (the header has already
         been skipped).
     """
-    res = requests.get(biogrid_file_url)
-    if res.status_code != 200:
-        raise Exception('Unable to download Biogrid data: status code %s'
-                        % res.status_code)
-    zip_bytes = BytesIO(res.content)
-    zip_file = ZipFile(zip_bytes)
-    zip_info_list = zip_file.infolist()
-    # There should be only one file in this zip archive
-    if len(zip_info_list) != 1:
-        raise Exception('There should be exactly zipfile in BioGrid zip '
-                        'archive: %s' % str(zip_info_list))
-    unzipped_bytes = zip_file.read(zip_info_list[0]) # Unzip the file
-    biogrid_str = StringIO(unzipped_bytes.decode('utf8')) # Make file-like obj
-    csv_reader = csv.reader(biogrid_str, delimiter='\t') # Get csv reader
-    next(csv_reader) # Skip the header
-    return csv_reader
+    if cache_file:
+        if os.path.exists(cache_file):
+            logger.info('Loading BioGrid data from %s' % cache_file)
+        else:
+            logger.info('Downloading BioGrid data from %s into %s'
+                        % (url, cache_file))
+            download_file(url, cache_file)
+        yield from _read_biogrid_zip(cache_file)
+    else:
+        logger.info('No data file specified, downloading from BioGrid '
+                    'at %s' % url)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            zip_path = download_file(url, os.path.join(tmp_dir,
+                                                       'biogrid.zip'))
+            yield from _read_biogrid_zip(zip_path)
+
+
+def _read_biogrid_zip(fname):
+    """Return a generator over the rows of a zipped BioGrid file."""
+    with ZipFile(fname) as zip_file:
+        zip_info_list = zip_file.infolist()
+        # There should be only one file in this zip archive
+        if len(zip_info_list) != 1:
+            raise Exception('There should be exactly zipfile in BioGrid zip '
+                            'archive: %s' % str(zip_info_list))
+        with zip_file.open(zip_info_list[0]) as fh:
+            # Decode the member as it is being decompressed
+            text_fh = TextIOWrapper(fh, encoding='utf-8', newline='')
+            yield from read_unicode_csv_fileobj(text_fh, delimiter='\t',
+                                                skiprows=1)
@@ -157,7 +157,7 @@ def process_pc_pathsfromto(source_genes, target_genes, neighbor_limit=1,
         return process_model(model)
 
 
-def process_owl(owl_filename, encoding=None):
+def process_owl(owl_filename, encoding=None, lazy=False):
     """Returns a BiopaxProcessor for a BioPAX OWL file.
 
     Parameters
@@ -166,6 +166,10 @@ def process_owl(owl_filename, encoding=None):
         The name of the OWL file to process.
     encoding : Optional[str]
         The encoding type to be passed to :func:`pybiopax.model_from_owl_file`.
+    lazy : Optional[bool]
+        If True, the statements are not extracted immediately, rather, they
+        can be generated one by one using the processor's `iter_statements`
+        method. Default: False
 
     Returns
     -------
@@ -173,16 +177,20 @@ def process_owl(owl_filename, encoding=None):
         A BiopaxProcessor containing the obtained BioPAX model in bp.model.
     """
     model = model_from_owl_file(owl_filename, encoding=encoding)
-    return process_model(model)
+    return process_model(model, lazy=lazy)
 
 
-def process_owl_gz(owl_gz_filename):
+def process_owl_gz(owl_gz_filename, lazy=False):
     """Returns a BiopaxProcessor for a gzipped BioPAX OWL file.
 
     Parameters
     ----------
     owl_gz_filename : str
         The name of the gzipped OWL file to process.
+    lazy : Optional[bool]
+        If True, the statements are not extracted immediately, rather, they
+        can be generated one by one using the processor's `iter_statements`
+        method. Default: False
 
     Returns
     -------
@@ -190,7 +198,7 @@ def process_owl_gz(owl_gz_filename):
         A BiopaxProcessor containing the obtained BioPAX model in bp.model.
     """
     model = model_from_owl_gz(owl_gz_filename)
-    return process_model(model)
+    return process_model(model, lazy=lazy)
 
 
 def process_owl_str(owl_str):
@@ -210,13 +218,17 @@ def process_owl_str(owl_str):
     return process_model(model)
 
 
-def process_model(model):
+def process_model(model, lazy=False):
     """Returns a BiopaxProcessor for a BioPAX model object.
 
     Parameters
     ----------
     model : org.biopax.paxtools.model.Model
         A BioPAX model object.
+    lazy : Optional[bool]
+        If True, the statements are not extracted immediately, rather, they
+        can be generated one by one using the processor's `iter_statements`
+        method. Default: False
 
     Returns
     -------
@@ -224,5 +236,6 @@ def process_model(model):
         A BiopaxProcessor containing the obtained BioPAX model in bp.model.
     """
     bp = BiopaxProcessor(model)
-    bp.process_all()
+    if not lazy:
+        bp.process_all()
     return bp
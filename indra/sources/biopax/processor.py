@@ -13,6 +13,7 @@ from indra.util import flatten
 from indra.statements.validate import print_validation_report, \
     assert_valid_db_refs, validate_id
 from indra.ontology.standardize import standardize_name_db_refs
+from indra.sources.utils import Processor
 from indra.databases import hgnc_client, uniprot_client, chebi_client, \
     parse_identifiers_url, bioregistry_client
 
@@ -30,7 +31,7 @@ logger = logging.getLogger(__name__)
 # - Implement extracting modifications with Complex substrate
 
 
-class BiopaxProcessor(object):
+class BiopaxProcessor(Processor):
     """The BiopaxProcessor extracts INDRA Statements from a BioPAX model.
 
     The BiopaxProcessor uses pattern searches in a BioPAX OWL model to
@@ -59,6 +60,8 @@ class BiopaxProcessor(object):
     statements : list[indra.statements.Statement]
         A list of INDRA Statements that were extracted from the model.
     """
+    name = 'biopax'
+
     def __init__(self, model, use_conversion_level_evidence=False):
         self.model = model
         self.statements = []
@@ -78,6 +81,31 @@ class BiopaxProcessor(object):
         self.eliminate_exact_duplicates()
         print_validation_report(self.statements)
 
+    def extract_statements(self):
+        """Extract all Statements from the BioPAX model and return them."""
+        self.process_all()
+        return self.statements
+
+    def iter_statements(self):
+        """Iterate over Statements as they are extracted from the model.
+
+        Exact duplicates are eliminated along the way, as in
+        :meth:`eliminate_exact_duplicates`, by only keeping track of the
+        hashes of Statements that have already been yielded.
+        """
+        self._extract_features()
+        seen_hashes = set()
+        for stmt in itertools.chain(self._iter_modifications(),
+                                    self._iter_regulate_activities(),
+                                    self._iter_activity_modification(),
+                                    self._iter_regulate_amounts(),
+                                    self._iter_conversions(),
+                                    self._iter_gap_gef()):
+            stmt_hash = stmt.get_hash(shallow=False, refresh=True)
+            if stmt_hash not in seen_hashes:
+                seen_hashes.add(stmt_hash)
+                yield stmt
+
     def save_model(self, file_name):
         """Save the BioPAX model object in an OWL file.
 
@@ -278,6 +306,9 @@ class BiopaxProcessor(object):
 
     def get_modifications(self):
         """Extract INDRA Modification Statements from the BioPAX model."""
+        self.statements.extend(self._iter_modifications())
+
+    def _iter_modifications(self):
         for enz, sub, gained_mods, lost_mods, \
                 activity_change, ev in self._conversion_state_iter():
             for mods, is_gain in ((gained_mods, True), (lost_mods, False)):
@@ -291,10 +322,13 @@ class BiopaxProcessor(object):
                     stmt = stmt_class(enz, sub, mod.residue,
                                       mod.position, evidence=ev)
                     stmt = _remove_redundant_mods(stmt)
-                    self.statements.append(stmt)
+                    yield stmt
 
     def get_regulate_activities(self):
         """Get Activation/Inhibition INDRA Statements from the BioPAX model."""
+        self.statements.extend(self._iter_regulate_activities())
+
+    def _iter_regulate_activities(self):
         for subj, obj, gained_mods, lost_mods, \
                 activity_change, ev in self._conversion_state_iter():
             # We don't want to have gained or lost modification features
@@ -304,10 +338,13 @@ class BiopaxProcessor(object):
                 else Inhibition
             stmt = stmt_class(subj, obj, 'activity',
                               evidence=ev)
-            self.statements.append(stmt)
+            yield stmt
 
     def get_activity_modification(self):
         """Extract INDRA ActiveForm statements from the BioPAX model."""
+        self.statements.extend(self._iter_activity_modification())
+
+    def _iter_activity_modification(self):
         for agent, gained_mods, lost_mods, activity_change, ev in \
                 self._conversion_no_control_iter():
             # We have to have both a modification change and an activity
@@ -327,15 +364,18 @@ class BiopaxProcessor(object):
                 ag = copy.deepcopy(agent)
                 ag.mods = list(gained_mods)
                 stmt = ActiveForm(ag, 'activity', is_active, evidence=ev)
-                self.statements.append(stmt)
+                yield stmt
             if lost_mods:
                 ag = copy.deepcopy(agent)
                 ag.mods = list(lost_mods)
                 stmt = ActiveForm(ag, 'activity', not is_active, evidence=ev)
-                self.statements.append(stmt)
+                yield stmt
 
     def get_regulate_amounts(self):
         """Extract INDRA RegulateAmount Statements from the BioPAX model."""
+        self.statements.extend(self._iter_regulate_amounts())
+
+    def _iter_regulate_amounts(self):
         for subj, ev, control, conversion in \
                 self._control_conversion_iter(bp.TemplateReaction, 'all'):
             stmt_type = IncreaseAmount if control.control_type == 'ACTIVATION' \
@@ -344,10 +384,13 @@ class BiopaxProcessor(object):
                 product_agents = self._get_agents_from_entity(product)
                 for obj in _listify(product_agents):
                     stmt = stmt_type(subj, obj, evidence=ev)
-                    self.statements.append(stmt)
+                    yield stmt
 
     def get_conversions(self):
         """Extract Conversion INDRA Statements from the BioPAX model."""
+        self.statements.extend(self._iter_conversions())
+
+    def _iter_conversions(self):
         for subj, ev, control, conversion in \
                 self._control_conversion_iter(bp.Conversion, 'primary'):
             # We only extract conversions for small molecules
@@ -375,7 +418,7 @@ class BiopaxProcessor(object):
             if not obj_from and not obj_to:
                 continue
             st = Conversion(subj, obj_from, obj_to, evidence=ev)
-            self.statements.append(st)
+            yield st
 
     @staticmethod
     def find_gdp_gtp_complex(cplxes):
@@ -398,6 +441,9 @@ class BiopaxProcessor(object):
 
     def get_gap_gef(self):
         """Extract Gap and Gef INDRA Statements."""
+        self.statements.extend(self._iter_gap_gef())
+
+    def _iter_gap_gef(self):
         for gap_gef, ev, control, conversion in \
                 self._control_conversion_iter(bp.Conversion, 'primary'):
             assert isinstance(gap_gef, Agent)
@@ -422,7 +468,7 @@ class BiopaxProcessor(object):
             ras_agents = self._get_agents_from_entity(left_ras)
             for ras in _listify(ras_agents):
                 st = stmt_type(gap_gef, ras, evidence=ev)
-                self.statements.append(st)
+                yield st
 
     @staticmethod
     def _get_entity_mods(bpe):
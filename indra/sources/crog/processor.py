@@ -32,11 +32,21 @@ class CrogProcessor(RemoteProcessor):
     def extract_statements(self):
         super().extract_statements()
         for stmt in self.statements:
-            # We remap the source API to crog to align with the belief model
-            for ev in stmt.evidence:
-                ev.source_api = 'crog'
-            # We also change the name of targets whose names are ECCODEs to
-            # have the EC prefix in their name
-            for agent in stmt.real_agent_list():
-                if agent.name == agent.db_refs.get('ECCODE'):
-                    agent.name = 'EC %s' % agent.name
+            _fix_statement(stmt)
+        return self.statements
+
+    def iter_statements(self):
+        for stmt in super().iter_statements():
+            _fix_statement(stmt)
+            yield stmt
+
+
+def _fix_statement(stmt):
+    # We remap the source API to crog to align with the belief model
+    for ev in stmt.evidence:
+        ev.source_api = 'crog'
+    # We also change the name of targets whose names are ECCODEs to
+    # have the EC prefix in their name
+    for agent in stmt.real_agent_list():
+        if agent.name == agent.db_refs.get('ECCODE'):
+            agent.name = 'EC %s' % agent.name
@@ -17,7 +17,7 @@ processors = {
 }
 
 
-def process_from_web(subset, url=None):
+def process_from_web(subset, url=None, lazy=False):
     """Process a subset of CTD from the web into INDRA Statements.
 
     Parameters
@@ -29,6 +29,10 @@ def process_from_web(subset, url=None):
         If not provided, the default CTD URL is used (beware, it usually
         gives permission denied). If provided, the given URL is used to
         access a tsv or tsv.gz file.
+    lazy : Optional[bool]
+        If True, the statements are not extracted immediately, rather, they
+        can be generated one by one using the processor's `iter_statements`
+        method. Default: False
 
     Returns
     -------
@@ -39,10 +43,10 @@ def process_from_web(subset, url=None):
     if subset not in urls:
         raise ValueError('%s is not a valid CTD subset.' % subset)
     url = url if url else urls[subset]
-    return _process_url_or_file(url, subset)
+    return _process_url_or_file(url, subset, lazy=lazy)
 
 
-def process_tsv(fname, subset):
+def process_tsv(fname, subset, lazy=False):
     """Process a subset of CTD from a tsv or tsv.gz file into INDRA Statements.
 
     Parameters
@@ -52,6 +56,10 @@ def process_tsv(fname, subset):
     subset : str
         A CTD subset, one of chemical_gene, chemical_disease,
         gene_disease.
+    lazy : Optional[bool]
+        If True, the statements are not extracted immediately, rather, they
+        can be generated one by one using the processor's `iter_statements`
+        method. Default: False
 
     Returns
     -------
@@ -59,16 +67,16 @@ def process_tsv(fname, subset):
         A CTDProcessor which contains INDRA Statements extracted from the
         given CTD subset as its statements attribute.
     """
-    return _process_url_or_file(fname, subset)
+    return _process_url_or_file(fname, subset, lazy=lazy)
 
 
-def _process_url_or_file(path, subset):
+def _process_url_or_file(path, subset, lazy=False):
     df = pandas.read_csv(path, sep='\t', comment='#',
                          header=None, dtype=str, keep_default_na=False)
-    return process_dataframe(df, subset)
+    return process_dataframe(df, subset, lazy=lazy)
 
 
-def process_dataframe(df, subset):
+def process_dataframe(df, subset, lazy=False):
     """Process a subset of CTD from a DataFrame into INDRA Statements.
 
     Parameters
@@ -78,6 +86,10 @@ def process_dataframe(df, subset):
     subset : str
         A CTD subset, one of chemical_gene, chemical_disease,
         gene_disease.
+    lazy : Optional[bool]
+        If True, the statements are not extracted immediately, rather, they
+        can be generated one by one using the processor's `iter_statements`
+        method. Default: False
 
     Returns
     -------
@@ -88,5 +100,6 @@ def process_dataframe(df, subset):
     if subset not in processors:
         raise ValueError('%s is not a valid CTD subset.' % subset)
     cp = processors[subset](df)
-    cp.extract_statements()
+    if not lazy:
+        cp.extract_statements()
     return cp
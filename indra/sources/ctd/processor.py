@@ -2,7 +2,8 @@ import tqdm
 from indra.statements import *
 from indra.databases import hgnc_client
 from indra.statements.validate import assert_valid_db_refs
-from indra.ontology.standardize import standardize_db_refs, get_standard_agent
+from indra.sources.utils import Processor
+from indra.sources.grounding_cache import get_standard_agent_cached
 
 
 # These mappings are only relevant for chemical-gene relations, for
@@ -45,17 +46,25 @@ rel_mapping = {
 }
 
 
-class CTDProcessor:
+class CTDProcessor(Processor):
     """Parent class for CTD relation-specific processors."""
+    name = 'ctd'
+
     def __init__(self, df):
         self.df = df
         self.statements = []
 
+    def extract_statements(self):
+        """Extract statements from the data frame and return them."""
+        self.statements.extend(self.iter_statements())
+        return self.statements
+
 
 class CTDChemicalDiseaseProcessor(CTDProcessor):
     """Processes chemical-disease relationships from CTD."""
 
-    def extract_statements(self):
+    def iter_statements(self):
+        """Iterate over statements extracted row by row from the data."""
         df = self.df[self.df[5] == 'therapeutic']
         for _, row in tqdm.tqdm(df.iterrows(), total=len(df)):
             chem_name, chem_mesh_id, chem_cas_id, disease_name, disease_id,\
@@ -70,13 +79,14 @@ class CTDChemicalDiseaseProcessor(CTDProcessor):
                    for pmid in pmids.split('|')]
             stmt = Inhibition(chem_agent, disease_agent,
                               evidence=evs)
-            self.statements.append(stmt)
+            yield stmt
 
 
 class CTDGeneDiseaseProcessor(CTDProcessor):
     """Processes gene-disease relationships from CTD."""
 
-    def extract_statements(self):
+    def iter_statements(self):
+        """Iterate over statements extracted row by row from the data."""
         df = self.df[self.df[4] == 'therapeutic']
         for _, row in tqdm.tqdm(df.iterrows(), total=len(df)):
             gene_name, gene_entrez_id, disease_name, disease_id, direct_ev, \
@@ -90,13 +100,14 @@ class CTDGeneDiseaseProcessor(CTDProcessor):
                    for pmid in pmids.split('|')]
             stmt = Inhibition(gene_agent, disease_agent,
                               evidence=evs)
-            self.statements.append(stmt)
+            yield stmt
 
 
 class CTDChemicalGeneProcessor(CTDProcessor):
     """Processes chemical-gene relationships from CTD."""
 
-    def extract_statements(self):
+    def iter_statements(self):
+        """Iterate over statements extracted row by row from the data."""
         for _, row in tqdm.tqdm(self.df.iterrows(), total=len(self.df)):
             chem_name, chem_mesh_id, chem_cas_id, gene_name, gene_entrez_id, \
                 gene_forms, organism_name, organism_tax_id, txt, \
@@ -113,7 +124,7 @@ class CTDChemicalGeneProcessor(CTDProcessor):
                                 context=context)
                        for pmid in pmids.split('|')]
                 stmt = stmt_type(chem_agent, gene_agent, evidence=evs)
-                self.statements.append(stmt)
+                yield stmt
 
     @staticmethod
     def get_statement_types(rel_str, chem_name, txt):
@@ -172,7 +183,7 @@ def get_disease_agent(name, disease_id):
     for gr in groundings:
         db_ns, db_id = gr.split(':')
         db_refs[db_ns] = db_id
-    return get_standard_agent(name, db_refs)
+    return get_standard_agent_cached(name, db_refs)
 
 
 def get_gene_agent(name, gene_entrez_id):
@@ -180,11 +191,11 @@ def get_gene_agent(name, gene_entrez_id):
     hgnc_id = hgnc_client.get_hgnc_id(name)
     if hgnc_id:
         db_refs['HGNC'] = hgnc_id
-    return get_standard_agent(name, db_refs)
+    return get_standard_agent_cached(name, db_refs)
 
 
 def get_chemical_agent(name, mesh_id, cas_id):
     db_refs = {'MESH': mesh_id}
     if cas_id:
         db_refs['CAS'] = cas_id
-    return get_standard_agent(name, db_refs)
\ No newline at end of file
+    return get_standard_agent_cached(name, db_refs)
\ No newline at end of file
@@ -11,6 +11,7 @@ def process_from_web(
     password: Optional[str] = None,
     version: Optional[str] = None,
     prefix: Union[None, str, Sequence[str]] = None,
+    lazy: bool = False,
 ) -> DrugbankProcessor:
     """Get a processor using :func:`process_xml` with :mod:`drugbank_downloader`.
 
@@ -28,6 +29,10 @@ def process_from_web(
     prefix :
         The prefix and subkeys passed to :func:`pystow.ensure` to specify
         a non-default location to download the data to.
+    lazy :
+        If True, the statements are not extracted immediately, rather, they
+        can be generated one by one using the processor's `iter_statements`
+        method. Default: False
 
     Returns
     -------
@@ -43,16 +48,20 @@ def process_from_web(
         version=version,
         prefix=prefix,
     )
-    return process_element_tree(et)
+    return process_element_tree(et, lazy=lazy)
 
 
-def process_xml(fname):
+def process_xml(fname, lazy=False):
     """Return a processor by extracting Statements from DrugBank XML.
 
     Parameters
     ----------
     fname : str
         The path to a DrugBank XML file to process.
+    lazy : Optional[bool]
+        If True, the statements are not extracted immediately, rather, they
+        can be generated one by one using the processor's `iter_statements`
+        method. Default: False
 
     Returns
     -------
@@ -63,16 +72,20 @@ def process_xml(fname):
     """
     logger.info('Loading %s...' % fname)
     et = ElementTree.parse(fname)
-    return process_element_tree(et)
+    return process_element_tree(et, lazy=lazy)
 
 
-def process_element_tree(et):
+def process_element_tree(et, lazy=False):
     """Return a processor by extracting Statement from DrugBank XML.
 
     Parameters
     ----------
     et : xml.etree.ElementTree
         An ElementTree loaded from the DrugBank XML file to process.
+    lazy : Optional[bool]
+        If True, the statements are not extracted immediately, rather, they
+        can be generated one by one using the processor's `iter_statements`
+        method. Default: False
 
     Returns
     -------
@@ -83,5 +96,6 @@ def process_element_tree(et):
     """
     logger.info('Extracting DrugBank statements...')
     dp = DrugbankProcessor(et)
-    dp.extract_statements()
+    if not lazy:
+        dp.extract_statements()
     return dp
@@ -6,13 +6,14 @@ from indra.databases.identifiers import ensure_chebi_prefix, \
 from indra.statements.validate import assert_valid_db_refs
 from indra.ontology.standardize import standardize_name_db_refs, \
     get_standard_agent
+from indra.sources.utils import Processor
 
 logger = logging.getLogger(__name__)
 
 drugbank_ns = {'db': 'http://www.drugbank.ca'}
 
 
-class DrugbankProcessor:
+class DrugbankProcessor(Processor):
     """Processor to extract INDRA Statements from DrugBank content.
 
     The processor assumes that an ElementTree is available which it then
@@ -28,15 +29,22 @@ class DrugbankProcessor:
     statements : list of indra.statements.Statement
         A list of INDRA Statements that were extracted from DrugBank content.
     """
+    name = 'drugbank'
+
     def __init__(self, xml_tree: ElementTree.ElementTree):
         self.xml_tree = xml_tree
         self.statements = []
 
     def extract_statements(self):
+        """Extract statements from the XML tree and return them."""
+        self.statements.extend(self.iter_statements())
+        return self.statements
+
+    def iter_statements(self):
+        """Iterate over statements extracted drug by drug from the XML."""
         root = self.xml_tree.getroot()
         for drug in db_findall(root, 'db:drug'):
-            for stmt in self._extract_statements_for_drug(drug):
-                self.statements.append(stmt)
+            yield from self._extract_statements_for_drug(drug)
 
     @staticmethod
     def _extract_statements_for_drug(drug_element):
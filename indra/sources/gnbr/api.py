@@ -113,8 +113,8 @@ def process_chemical_disease(part1_path: str, part2_path: str,
 
 
 def process_from_files(part1_path: str, part2_path: str, first_type: str,
-                       second_type: str, indicator_only: bool = True) \
-        -> GnbrProcessor:
+                       second_type: str, indicator_only: bool = True,
+                       lazy: bool = False) -> GnbrProcessor:
     """Loading the databases from the given files.
 
     Parameters
@@ -130,6 +130,10 @@ def process_from_files(part1_path: str, part2_path: str, first_type: str,
     indicator_only :
         A switch to filter the data which is part of the flagship path set
         for each theme.
+    lazy :
+        If True, the statements are not extracted immediately, rather, they
+        can be generated one by one using the processor's `iter_statements`
+        method. Default: False
 
     Returns
     -------
@@ -143,7 +147,8 @@ def process_from_files(part1_path: str, part2_path: str, first_type: str,
     df2: pd.DataFrame = pd.read_csv(part2_path, sep='\t', header=None)
     gp: GnbrProcessor = GnbrProcessor(df1, df2, first_type, second_type,
                                       indicator_only=indicator_only)
-    gp.extract_stmts()
+    if not lazy:
+        gp.extract_stmts()
     return gp
 
 
@@ -222,8 +227,8 @@ def process_chemical_disease_from_web(indicator_only: bool = True)\
                              indicator_only=indicator_only)
 
 
-def process_from_web(first_type, second_type, indicator_only: bool = True)\
-        -> GnbrProcessor:
+def process_from_web(first_type, second_type, indicator_only: bool = True,
+                     lazy: bool = False) -> GnbrProcessor:
     """Loading the databases from the given urls.
 
     Parameters
@@ -235,6 +240,10 @@ def process_from_web(first_type, second_type, indicator_only: bool = True)\
     indicator_only :
         A switch to filter the data which is part of the flagship path set
         for each theme.
+    lazy :
+        If True, the statements are not extracted immediately, rather, they
+        can be generated one by one using the processor's `iter_statements`
+        method. Default: False
 
     Returns
     -------
@@ -247,4 +256,4 @@ def process_from_web(first_type, second_type, indicator_only: bool = True)\
     fname2 = (f'{base_url}/part-ii-dependency-paths-{first_type}-{second_type}'
               f'-sorted-with-themes.txt.gz')
     return process_from_files(fname1, fname2, first_type, second_type,
-                               indicator_only=indicator_only)
\ No newline at end of file
+                              indicator_only=indicator_only, lazy=lazy)
\ No newline at end of file
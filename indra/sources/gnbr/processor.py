@@ -2,13 +2,14 @@
 corresponding to different kinds of interactions."""
 import re
 import itertools as it
-from typing import List
+from typing import Iterable, List
 from copy import deepcopy
 import pandas as pd
 from indra.statements import *
 from indra.databases import mesh_client
 from indra.ontology.bio import bio_ontology
 from indra.ontology.standardize import get_standard_agent
+from indra.sources.utils import Processor
 
 
 gene_gene_stmt_mappings = {
@@ -51,7 +52,7 @@ omim_pattern = re.compile(r'^OMIM:(\d+)$')
 omim_no_prefix_pattern = re.compile(r'^(\d+)$')
 
 
-class GnbrProcessor:
+class GnbrProcessor(Processor):
     """A processor for interactions in the GNBR dataset.
 
     Parameters
@@ -82,6 +83,21 @@ class GnbrProcessor:
 
     def extract_stmts(self):
         """Extend the statements list with mappings."""
+        self.statements.extend(self.iter_statements())
+
+    def extract_statements(self) -> List[Statement]:
+        """Extend the statements list with mappings and return it."""
+        self.extract_stmts()
+        return self.statements
+
+    def iter_statements(self) -> Iterable[Statement]:
+        """Iterate over statements extracted from the dataframes.
+
+        Yields
+        ------
+        stmt :
+            Statements produced from the dataframes.
+        """
         if self.first_type == 'gene' and self.second_type == 'gene':
             statement_mappings = gene_gene_stmt_mappings
         elif self.first_type == 'chemical' and self.second_type == 'gene':
@@ -95,8 +111,7 @@ class GnbrProcessor:
             if self.indicator_only:
                 constraint &= (self.df1['%s.ind' % rel_type] == 1)
             df_part = self.df1[constraint]
-            self.statements.extend(self._extract_stmts_by_class(df_part,
-                                                                stmt_type))
+            yield from self._extract_stmts_by_class(df_part, stmt_type)
 
     def _extract_stmts_by_class(self, df, stmt_class):
         """Make a given class of Statements from a subset of the dataframe.
@@ -0,0 +1,293 @@
+"""A shared, size-bounded cache for grounding resolution in processors.
+
+Knowledge base processors such as the BEL, SIGNOR, CTD and OmniPath
+processors resolve the same few thousand entities over and over again
+while processing hundreds of thousands of rows or edges. The
+:class:`GroundingCache` defined here memoizes the result of resolving
+a given (namespace, identifier or name) pair so that the standardization
+of each distinct entity is only done once.
+
+The module-level :data:`grounding_cache` instance is shared by all
+processors. Its contents can be persisted between runs by calling
+:meth:`GroundingCache.save` and :meth:`GroundingCache.load`.
+"""
+
+__all__ = ['GroundingCache', 'grounding_cache',
+           'standardize_name_db_refs_cached', 'get_standard_agent_cached']
+
+import os
+import copy
+import pickle
+import logging
+import threading
+from collections import OrderedDict
+
+from indra.statements import Agent
+from indra.statements.validate import assert_valid_db_refs
+from indra.ontology.standardize import standardize_name_db_refs
+
+logger = logging.getLogger(__name__)
+
+
+class GroundingCache(object):
+    """A size-bounded LRU cache of grounding resolution results.
+
+    Entries are keyed by the name of the resolving function together
+    with a namespace and an identifier or name in that namespace.
+    Cached values are copied both when they are stored and when they
+    are returned so that callers can freely modify them (e.g., add
+    entries to a db_refs dict) without corrupting the cache.
+
+    Parameters
+    ----------
+    maxsize : Optional[int]
+        The maximum number of entries kept in the cache. Once the cache
+        is full, the least recently used entries are evicted. If 0,
+        nothing is cached. Default: 100000
+    cache_file : Optional[str]
+        A path to a pickle file from which the cache is initialized if
+        it exists, and into which it is written by :meth:`save` if no
+        other path is given.
+    """
+    def __init__(self, maxsize=100000, cache_file=None):
+        self.maxsize = maxsize
+        self.cache_file = cache_file
+        self._cache = OrderedDict()
+        self._lock = threading.RLock()
+        self._stats = dict.fromkeys(['hits', 'misses', 'evictions'], 0)
+        if cache_file and os.path.exists(cache_file):
+            self.load(cache_file)
+
+    def __len__(self):
+        return len(self._cache)
+
+    def __contains__(self, key):
+        return key in self._cache
+
+    def resolve(self, func, db_ns, db_id, *args, **kwargs):
+        """Return the result of a grounding function, using the cache.
+
+        Parameters
+        ----------
+        func : function
+            The function that resolves the grounding if there is no
+            entry for it in the cache yet.
+        db_ns : str or tuple
+            The namespace of the entity being resolved.
+        db_id : str or tuple
+            The identifier or name of the entity being resolved.
+        *args :
+            Positional arguments passed to func.
+        **kwargs :
+            Keyword arguments passed to func.
+
+        Returns
+        -------
+        object
+            A copy of the value returned by func for the given arguments.
+        """
+        try:
+            return self.get(func, db_ns, db_id)
+        except KeyError:
+            pass
+        value = func(*args, **kwargs)
+        self.put(func, db_ns, db_id, value)
+        return value
+
+    def get(self, func, db_ns, db_id):
+        """Return a copy of a cached value, raising a KeyError if missing.
+
+        Parameters
+        ----------
+        func : function
+            The function that resolves the grounding.
+        db_ns : str or tuple
+            The namespace of the entity being resolved.
+        db_id : str or tuple
+            The identifier or name of the entity being resolved.
+
+        Returns
+        -------
+        object
+            A copy of the cached value.
+        """
+        key = (_get_func_key(func), db_ns, db_id)
+        with self._lock:
+            try:
+                value = self._cache[key]
+            except KeyError:
+                self._stats['misses'] += 1
+                raise
+            self._cache.move_to_end(key)
+            self._stats['hits'] += 1
+            return copy.deepcopy(value)
+
+    def put(self, func, db_ns, db_id, value):
+        """Add a value resolved by a given function to the cache.
+
+        Parameters
+        ----------
+        func : function
+            The function that resolved the grounding.
+        db_ns : str or tuple
+            The namespace of the entity that was resolved.
+        db_id : str or tuple
+            The identifier or name of the entity that was resolved.
+        value : object
+            The value returned by func, a copy of which is cached.
+        """
+        if not self.maxsize:
+            return
+        key = (_get_func_key(func), db_ns, db_id)
+        with self._lock:
+            self._cache[key] = copy.deepcopy(value)
+            self._cache.move_to_end(key)
+            self._shrink()
+
+    def _shrink(self):
+        while len(self._cache) > self.maxsize:
+            self._cache.popitem(last=False)
+            self._stats['evictions'] += 1
+
+    def cache_info(self):
+        """Return statistics about the usage of the cache.
+
+        Returns
+        -------
+        dict
+            A dict with the number of cache hits, misses and evictions
+            so far, as well as the current size and the maximum size
+            of the cache.
+        """
+        with self._lock:
+            info = self._stats.copy()
+            info['size'] = len(self._cache)
+            info['maxsize'] = self.maxsize
+        return info
+
+    def clear(self):
+        """Remove all entries from the cache and reset its statistics."""
+        with self._lock:
+            self._cache.clear()
+            self._stats = dict.fromkeys(self._stats, 0)
+
+    def save(self, fname=None):
+        """Save the contents of the cache into a pickle file.
+
+        Parameters
+        ----------
+        fname : Optional[str]
+            The path to the file to save the cache into. If not given,
+            the cache_file the cache was constructed with is used.
+        """
+        fname = fname or self.cache_file
+        if not fname:
+            raise ValueError('No file name given to save the cache into.')
+        with self._lock:
+            entries = list(self._cache.items())
+        with open(fname, 'wb') as fh:
+            pickle.dump(entries, fh, protocol=pickle.HIGHEST_PROTOCOL)
+        logger.info('Saved %d grounding cache entries into %s'
+                    % (len(entries), fname))
+
+    def load(self, fname=None):
+        """Load entries into the cache from a pickle file.
+
+        Entries loaded from the file are added to the entries that are
+        already in the cache, respecting the maximum size of the cache.
+
+        Parameters
+        ----------
+        fname : Optional[str]
+            The path to the file to load the cache from. If not given,
+            the cache_file the cache was constructed with is used.
+        """
+        fname = fname or self.cache_file
+        if not fname:
+            raise ValueError('No file name given to load the cache from.')
+        with open(fname, 'rb') as fh:
+            entries = pickle.load(fh)
+        with self._lock:
+            for key, value in entries:
+                self._cache[key] = value
+            if self.maxsize:
+                self._shrink()
+        logger.info('Loaded %d grounding cache entries from %s'
+                    % (len(entries), fname))
+
+
+def _get_func_key(func):
+    return '%s.%s' % (func.__module__, func.__qualname__)
+
+
+#: The grounding cache shared by all processors
+grounding_cache = GroundingCache()
+
+
+def standardize_name_db_refs_cached(db_refs):
+    """Return a standardized name and db refs dict using the shared cache.
+
+    This is equivalent to calling
+    :func:`indra.ontology.standardize.standardize_name_db_refs` with the
+    default ontology and namespace order, except that the results are
+    memoized in :data:`grounding_cache`.
+
+    Parameters
+    ----------
+    db_refs : dict
+        A dict of db refs that may not be standardized.
+
+    Returns
+    -------
+    str or None
+        The standard name based on the db refs, None if not available.
+    dict
+        The db_refs dict with standardized entries.
+    """
+    db_ns, db_id = _get_db_refs_key(db_refs)
+    # Unhashable groundings, e.g., lists of IDs, can't be cached
+    try:
+        hash(db_id)
+    except TypeError:
+        return standardize_name_db_refs(db_refs)
+    return grounding_cache.resolve(standardize_name_db_refs, db_ns, db_id,
+                                   db_refs)
+
+
+def get_standard_agent_cached(name, db_refs, **kwargs):
+    """Get a standard agent based on the name and db_refs using the cache.
+
+    This is equivalent to calling
+    :func:`indra.ontology.standardize.get_standard_agent` with the default
+    ontology and namespace order, except that the standardization of the
+    db_refs is memoized in :data:`grounding_cache`.
+
+    Parameters
+    ----------
+    name : str
+        The name of the agent that may not be standardized.
+    db_refs : dict
+        A dict of db refs that may not be standardized.
+    kwargs :
+        Keyword arguments to pass to :func:`Agent.__init__`.
+
+    Returns
+    -------
+    Agent
+        A standard agent
+    """
+    standard_name, db_refs = standardize_name_db_refs_cached(db_refs)
+    if standard_name:
+        name = standard_name
+    assert_valid_db_refs(db_refs)
+    return Agent(name, db_refs=db_refs, **kwargs)
+
+
+def _get_db_refs_key(db_refs):
+    # Single-entry db_refs, by far the most common case, are keyed by
+    # their namespace and ID directly, otherwise we use tuples of
+    # namespaces and IDs sorted by namespace.
+    if len(db_refs) == 1:
+        return next(iter(db_refs.items()))
+    items = sorted(db_refs.items())
+    return tuple(k for k, _ in items), tuple(v for _, v in items)
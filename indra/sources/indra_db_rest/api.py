@@ -219,7 +219,8 @@ from indra.sources.indra_db_rest.util import make_db_rest_request, get_url_base
 def get_statements(subject=None, object=None, agents=None, stmt_type=None,
                    use_exact_type=False, limit=None, persist=True, timeout=None,
                    strict_stop=False, ev_limit=10, sort_by='ev_count', tries=3,
-                   use_obtained_counts=False, api_key=None):
+                   use_obtained_counts=False, api_key=None, max_workers=1,
+                   cache=None):
     """Get Statements from the INDRA DB web API matching given agents and type.
 
     You get a :py:class:`DBQueryStatementProcessor
@@ -296,6 +297,13 @@ def get_statements(subject=None, object=None, agents=None, stmt_type=None,
         Default: False
     api_key : Optional[str]
         Override or use in place of the API key given in the INDRA config file.
+    max_workers : Optional[int]
+        The number of pages of results that are requested in parallel once
+        the first page has been retrieved. Default is 1.
+    cache : Optional[indra.util.response_cache.ResponseCache]
+        An on-disk cache of responses. If None, the cache configured by
+        INDRA_DB_REST_CACHE_DIR is used, if any. Set to False to disable
+        caching entirely. Default is None.
 
     Returns
     -------
@@ -334,13 +342,15 @@ def get_statements(subject=None, object=None, agents=None, stmt_type=None,
                                      sort_by=sort_by, tries=tries,
                                      strict_stop=strict_stop,
                                      use_obtained_counts=use_obtained_counts,
-                                     api_key=api_key)
+                                     api_key=api_key, max_workers=max_workers,
+                                     cache=cache)
 
 
 @clockit
 def get_statements_by_hash(hash_list, limit=None, ev_limit=10,
                            sort_by='ev_count', persist=True, timeout=None,
-                           strict_stop=False, tries=3, api_key=None):
+                           strict_stop=False, tries=3, api_key=None,
+                           max_workers=1, cache=None):
     """Get Statements from a list of hashes.
 
     Parameters
@@ -379,6 +389,13 @@ def get_statements_by_hash(hash_list, limit=None, ev_limit=10,
         willing to wait. Default is 3.
     api_key : Optional[str]
         Override or use in place of the API key given in the INDRA config file.
+    max_workers : Optional[int]
+        The number of pages of results that are requested in parallel once
+        the first page has been retrieved. Default is 1.
+    cache : Optional[indra.util.response_cache.ResponseCache]
+        An on-disk cache of responses. If None, the cache configured by
+        INDRA_DB_REST_CACHE_DIR is used, if any. Set to False to disable
+        caching entirely. Default is None.
 
     Returns
     -------
@@ -390,7 +407,8 @@ def get_statements_by_hash(hash_list, limit=None, ev_limit=10,
                                      ev_limit=ev_limit, sort_by=sort_by,
                                      persist=persist, timeout=timeout,
                                      tries=tries, strict_stop=strict_stop,
-                                     api_key=api_key)
+                                     api_key=api_key, max_workers=max_workers,
+                                     cache=cache)
 
 
 def get_statements_for_paper(*args, **kwargs):
@@ -403,7 +421,8 @@ def get_statements_for_paper(*args, **kwargs):
 @clockit
 def get_statements_for_papers(ids, limit=None, ev_limit=10, sort_by='ev_count',
                               persist=True, timeout=None, strict_stop=False,
-                              tries=3, filter_ev=True, api_key=None):
+                              tries=3, filter_ev=True, api_key=None,
+                              max_workers=1, cache=None):
     """Get Statements extracted from the papers with the given ref ids.
 
     Parameters
@@ -449,6 +468,13 @@ def get_statements_for_papers(ids, limit=None, ev_limit=10, sort_by='ev_count',
         wait. Default is 3.
     api_key : Optional[str]
         Override or use in place of the API key given in the INDRA config file.
+    max_workers : Optional[int]
+        The number of pages of results that are requested in parallel once
+        the first page has been retrieved. Default is 1.
+    cache : Optional[indra.util.response_cache.ResponseCache]
+        An on-disk cache of responses. If None, the cache configured by
+        INDRA_DB_REST_CACHE_DIR is used, if any. Set to False to disable
+        caching entirely. Default is None.
 
     Returns
     -------
@@ -460,7 +486,8 @@ def get_statements_for_papers(ids, limit=None, ev_limit=10, sort_by='ev_count',
                                      ev_limit=ev_limit, sort_by=sort_by,
                                      persist=persist, timeout=timeout,
                                      tries=tries, filter_ev=filter_ev,
-                                     strict_stop=strict_stop, api_key=api_key)
+                                     strict_stop=strict_stop, api_key=api_key,
+                                     max_workers=max_workers, cache=cache)
 
 
 @clockit
@@ -468,7 +495,7 @@ def get_statements_from_query(query, limit=None, ev_limit=10,
                               sort_by='ev_count', persist=True, timeout=None,
                               strict_stop=False, tries=3, filter_ev=True,
                               use_obtained_counts=False,
-                              api_key=None):
+                              api_key=None, max_workers=1, cache=None):
     """Get Statements using a Query.
 
     Example
@@ -525,6 +552,13 @@ def get_statements_from_query(query, limit=None, ev_limit=10,
         wait. Default is 3.
     api_key : Optional[str]
         Override or use in place of the API key given in the INDRA config file.
+    max_workers : Optional[int]
+        The number of pages of results that are requested in parallel once
+        the first page has been retrieved. Default is 1.
+    cache : Optional[indra.util.response_cache.ResponseCache]
+        An on-disk cache of responses. If None, the cache configured by
+        INDRA_DB_REST_CACHE_DIR is used, if any. Set to False to disable
+        caching entirely. Default is None.
 
     Returns
     -------
@@ -538,7 +572,8 @@ def get_statements_from_query(query, limit=None, ev_limit=10,
                                      tries=tries, filter_ev=filter_ev,
                                      strict_stop=strict_stop,
                                      use_obtained_counts=use_obtained_counts,
-                                     api_key=api_key)
+                                     api_key=api_key, max_workers=max_workers,
+                                     cache=cache)
 
 
 def submit_curation(hash_val, tag, curator_email, text=None,
@@ -8,6 +8,8 @@ functions in :py:mod:`indra.sources.indra_db_rest.api`.
 
 import logging
 from copy import deepcopy
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
 from threading import Thread
 from datetime import datetime
@@ -19,7 +21,7 @@ from indra.util.statement_presentation import get_available_source_counts, \
     get_available_ev_counts
 
 from .query import Query
-from .util import RecordableLogger
+from .util import RecordableLogger, get_default_response_cache
 from .util import logger as util_logger
 from .exceptions import IndraDBRestResponseError
 
@@ -65,12 +67,22 @@ class IndraDBQueryProcessor:
         willing to wait. Default is 3
     api_key : str or None
         Override or use in place of the API key given in the INDRA config file.
+    max_workers : int > 0
+        The number of pages of results that are requested in parallel once
+        the first page has been retrieved. The pages are added to the results
+        in order, so the results are the same as when paging sequentially.
+        Default is 1, i.e., pages are requested one after the other.
+    cache : indra.util.response_cache.ResponseCache or None
+        An on-disk cache in which responses are looked up before they are
+        requested, and stored after they were received. If None, the cache
+        configured by INDRA_DB_REST_CACHE_DIR is used, if any. Set to False to
+        disable caching entirely. Default is None.
     """
     result_type = NotImplemented
 
     def __init__(self, query: Query, limit=None, sort_by='ev_count',
                  timeout=None, strict_stop=False, persist=True, tries=3,
-                 api_key=None):
+                 api_key=None, max_workers=1, cache=None):
         self.query = query
         self.limit = limit
         self.sort_by = sort_by
@@ -81,6 +93,10 @@ class IndraDBQueryProcessor:
         self.__offset = 0
         self.__quota = limit
         self.__api_key = api_key
+        self.__max_workers = max(1, max_workers)
+        if cache is None:
+            cache = get_default_response_cache()
+        self.__cache = cache or None
         self.__canceled = False
         self.__start_time = None
         self.__th = None
@@ -178,43 +194,39 @@ class IndraDBQueryProcessor:
     def _set_special_params(self, **params):
         self.__special_params = params
 
-    def _run_query(self):
+    def _get_query_timeout(self):
         # If we are in strict stop mode, we want to be sure we give up after
         # the given overall timeout, so we need to account for time spend on
-        # other queries.
+        # other queries. A timeout of 0 means there is no time left.
         if self.__strict_stop:
-            query_timeout = self.__timeout - self._time_since_start()
-            if query_timeout <= 0:
-                return
-        else:
-            query_timeout = None
-
-        # Run the query.
-        try:
-            r = self.requests_completed
-            nth = f"{r}{['st', 'nd', 'rd'][r-1] if 0 < r < 4 else 'th'}"
-            request_logger.info(f"Running {nth} request for {self.result_type}")
-            request_logger.info(f"  LIMIT: {self.__quota}")
-            request_logger.info(f"  OFFSET: {self.__offset}")
-            if query_timeout:
-                request_logger.info(f"  TIMEOUT: {query_timeout}")
-
-            result = self.query.get(self.result_type, offset=self.__offset,
-                                    limit=self.__quota, sort_by=self.sort_by,
-                                    timeout=query_timeout, n_tries=self.tries,
-                                    api_key=self.__api_key,
-                                    **self.__special_params)
-        except Timeout:
-            # Make sure this is the timeout we think it is.
-            self.__timed_out = True
-            if not self.__strict_stop or not self._strict_time_is_up():
-                raise
-            logger.info(f"Query timed out after {self._time_since_start()} "
-                        f"seconds, {self.requests_completed} requests, and "
-                        f"after retrieving {len(self._evidence_counts)} "
-                        f"results, with {self.__quota} remaining.")
-            return
-
+            return max(self.__timeout - self._time_since_start(), 0)
+        return None
+
+    def _request_page(self, offset, limit, query_timeout):
+        r = self.requests_completed
+        nth = f"{r}{['st', 'nd', 'rd'][r-1] if 0 < r < 4 else 'th'}"
+        request_logger.info(f"Running {nth} request for {self.result_type}")
+        request_logger.info(f"  LIMIT: {limit}")
+        request_logger.info(f"  OFFSET: {offset}")
+        if query_timeout:
+            request_logger.info(f"  TIMEOUT: {query_timeout}")
+
+        return self.query.get(self.result_type, offset=offset, limit=limit,
+                              sort_by=self.sort_by, timeout=query_timeout,
+                              n_tries=self.tries, api_key=self.__api_key,
+                              cache=self.__cache, **self.__special_params)
+
+    def _handle_timeout(self):
+        # Make sure this is the timeout we think it is.
+        self.__timed_out = True
+        if not self.__strict_stop or not self._strict_time_is_up():
+            raise
+        logger.info(f"Query timed out after {self._time_since_start()} "
+                    f"seconds, {self.requests_completed} requests, and "
+                    f"after retrieving {len(self._evidence_counts)} "
+                    f"results, with {self.__quota} remaining.")
+
+    def _add_result(self, result):
         # Update results
         self._evidence_counts.update(result.evidence_counts)
         self._belief_scores.update(result.belief_scores)
@@ -230,8 +242,78 @@ class IndraDBQueryProcessor:
         # Increment the number of queries run.
         self.requests_completed += 1
 
+    def _run_query(self):
+        query_timeout = self._get_query_timeout()
+        if query_timeout == 0:
+            return
+
+        # Run the query.
+        try:
+            result = self._request_page(self.__offset, self.__quota,
+                                        query_timeout)
+        except Timeout:
+            self._handle_timeout()
+            return
+
+        self._add_result(result)
         return
 
+    def _run_queries_concurrently(self):
+        """Get the remaining pages using a pool of worker threads.
+
+        The size of the first page is used to predict the offsets of the
+        following pages, which are requested in parallel. Results are added
+        strictly in the order of the pages, and if a page turns out not to
+        start where the previous one ended, the pages requested after it are
+        discarded and requested again from the correct offset.
+        """
+        # The first page has been retrieved at this point, so the query has
+        # been compiled and the workers only read its compiled JSON.
+        page_size = self.__offset
+        if not page_size:
+            return
+        pending = deque()
+        with ThreadPoolExecutor(self.__max_workers) as executor:
+            next_offset = self.__offset
+            while not self._done():
+                # Keep the workers busy with the pages that come next.
+                while len(pending) < self.__max_workers:
+                    limit = self.__quota
+                    if limit is not None:
+                        limit -= next_offset - self.__offset
+                        if limit <= 0:
+                            break
+                    query_timeout = self._get_query_timeout()
+                    if query_timeout == 0:
+                        break
+                    future = executor.submit(self._request_page, next_offset,
+                                             limit, query_timeout)
+                    pending.append((next_offset, future))
+                    next_offset += page_size
+                if not pending:
+                    break
+
+                offset, future = pending.popleft()
+                if offset != self.__offset:
+                    logger.debug(f"Expected a page at offset {self.__offset} "
+                                 f"but got one at {offset}, re-requesting.")
+                    future.cancel()
+                    while pending:
+                        pending.popleft()[1].cancel()
+                    next_offset = self.__offset
+                    continue
+
+                try:
+                    result = future.result()
+                except Timeout:
+                    self._handle_timeout()
+                    break
+                self._add_result(result)
+
+            # Don't wait for pages that are no longer needed.
+            for _, future in pending:
+                future.cancel()
+
     def _run_queries(self, persist):
         """Use paging to get all statements requested."""
         self._mark_start()
@@ -243,8 +325,11 @@ class IndraDBQueryProcessor:
             return
 
         # Get the rest of the content.
-        while not self._done():
-            self._run_query()
+        if self.__max_workers > 1:
+            self._run_queries_concurrently()
+        else:
+            while not self._done():
+                self._run_query()
 
         # Create the actual statements.
         self._compile_results()
@@ -347,6 +432,13 @@ class DBQueryStatementProcessor(IndraDBQueryProcessor):
         willing to wait. Default is 3.
     api_key : str or None
         Override or use in place of the API key given in the INDRA config file.
+    max_workers : int > 0
+        The number of pages of results that are requested in parallel once
+        the first page has been retrieved. Default is 1.
+    cache : indra.util.response_cache.ResponseCache or None
+        An on-disk cache of responses. If None, the cache configured by
+        INDRA_DB_REST_CACHE_DIR is used, if any. Set to False to disable
+        caching entirely. Default is None.
 
     """
     result_type = 'statements'
@@ -354,7 +446,7 @@ class DBQueryStatementProcessor(IndraDBQueryProcessor):
     def __init__(self, query: Query, limit=None, sort_by='ev_count',
                  ev_limit=10, filter_ev=True, timeout=None, strict_stop=False,
                  persist=True, use_obtained_counts=False, tries=3,
-                 api_key=None):
+                 api_key=None, max_workers=1, cache=None):
 
         self.statements = []
         self.statements_sample = None
@@ -367,7 +459,7 @@ class DBQueryStatementProcessor(IndraDBQueryProcessor):
         super(DBQueryStatementProcessor, self).\
             __init__(query, limit=limit, sort_by=sort_by, timeout=timeout,
                      strict_stop=strict_stop, persist=persist, tries=tries,
-                     api_key=api_key)
+                     api_key=api_key, max_workers=max_workers, cache=cache)
 
     # Metadata Retrieval methods.
 
@@ -486,6 +578,13 @@ class DBQueryHashProcessor(IndraDBQueryProcessor):
         timeout will often succeed fast enough to avoid a timeout. This can
         also help gracefully handle an unreliable connection, if you're
         willing to wait. Default is 3.
+    max_workers : int > 0
+        The number of pages of results that are requested in parallel once
+        the first page has been retrieved. Default is 1.
+    cache : indra.util.response_cache.ResponseCache or None
+        An on-disk cache of responses. If None, the cache configured by
+        INDRA_DB_REST_CACHE_DIR is used, if any. Set to False to disable
+        caching entirely. Default is None.
     """
     result_type = 'hashes'
 
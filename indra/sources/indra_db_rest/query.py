@@ -216,7 +216,8 @@ class Query:
     # Here are defined some other functions to get info from the server.
 
     def get(self, result_type, limit=None, sort_by=None, offset=None,
-            timeout=None, n_tries=2, api_key=None, **other_params):
+            timeout=None, n_tries=2, api_key=None, cache=None,
+            **other_params):
         """Get results from the API of the given type.
 
         Parameters
@@ -241,6 +242,9 @@ class Query:
         api_key : str or None
             Override or use in place of the API key given in the INDRA config
             file.
+        cache : Optional[:py:class:`ResponseCache`]
+            If given, the response is looked up in this on-disk cache before
+            the request is made, and stored in it afterwards.
 
         Other Parameters
         ----------------
@@ -260,21 +264,38 @@ class Query:
             have already come up in the agent groups returned. This prevents
             duplication.
         """
-        simple = self.__compiled_json is None
-        if simple:
-            query_json = self.to_simple_json()
-        else:
-            query_json = self.__compiled_json
-        resp = make_db_rest_request('post', f'query/{result_type}',
-                                    data={'query': query_json,
-                                          'kwargs': jsonify_args(other_params)},
-                                    params=dict(limit=limit, sort_by=sort_by,
-                                                offset=offset, simple=simple),
-                                    timeout=timeout, tries=n_tries,
-                                    api_key=api_key)
-        resp_json = resp.json()
-        self.__compiled_json = resp_json['query_json']
-        self.__compiled_str = None
+        # Pages of a query can be requested from several threads, so the
+        # compiled JSON is only read once here, and only set by the first
+        # request (all the requests of a query get the same compiled JSON).
+        compiled_json = self.__compiled_json
+        resp_json = None
+        if cache is not None:
+            # The simple JSON is used in the key because it doesn't depend on
+            # whether the query has been compiled by the server yet.
+            cache_key = cache.get_key(result_type, self.to_simple_json(),
+                                      jsonify_args(other_params), limit,
+                                      sort_by, offset)
+            resp_json = cache.get(cache_key)
+        if resp_json is None:
+            simple = compiled_json is None
+            if simple:
+                query_json = self.to_simple_json()
+            else:
+                query_json = compiled_json
+            resp = make_db_rest_request(
+                'post', f'query/{result_type}',
+                data={'query': query_json,
+                      'kwargs': jsonify_args(other_params)},
+                params=dict(limit=limit, sort_by=sort_by, offset=offset,
+                            simple=simple),
+                timeout=timeout, tries=n_tries, api_key=api_key
+            )
+            resp_json = resp.json()
+            if cache is not None:
+                cache.put(cache_key, resp_json)
+        if compiled_json is None:
+            self.__compiled_json = resp_json['query_json']
+            self.__compiled_str = None
         return QueryResult.from_json(resp_json)
 
     def get_query_json(self):
@@ -1,11 +1,14 @@
 import json
 import logging
+import threading
 from io import StringIO
 from contextlib import contextmanager
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from indra import get_config
+from indra.util.response_cache import ResponseCache
 from indra.sources.indra_db_rest.exceptions import IndraDBRestAPIError
 
 
@@ -120,7 +123,7 @@ def make_db_rest_request(meth, end_point, query_str='', data=None, params=None,
     logger.info(f'params: {remove_api_key(str(params))}')
     logger.info(f'data: {remove_api_key(str(data))}')
     logger.debug(f'headers: {remove_api_key(str(headers))}')
-    method_func = getattr(requests, meth.lower())
+    method_func = getattr(get_session(), meth.lower())
     while tries > 0:
         tries -= 1
         resp = method_func(url_path, headers=headers, data=json_data,
@@ -133,6 +136,55 @@ def make_db_rest_request(meth, end_point, query_str='', data=None, params=None,
             raise IndraDBRestAPIError(resp)
 
 
+# The number of connections kept open to the REST API, which should be at
+# least the number of pages of results that are requested in parallel.
+DB_REST_POOL_SIZE = 20
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session():
+    """Return the HTTP session shared by all requests to the REST API.
+
+    Using a single session allows connections to be reused between
+    consecutive requests, and its connection pool is large enough to
+    serve several requests made in parallel threads.
+
+    Returns
+    -------
+    requests.Session
+        The shared session.
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=DB_REST_POOL_SIZE,
+                                  pool_maxsize=DB_REST_POOL_SIZE)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            _session = session
+    return _session
+
+
+def get_default_response_cache():
+    """Return a response cache based on the INDRA configuration, if any.
+
+    The cache is configured by setting ``INDRA_DB_REST_CACHE_DIR`` and,
+    optionally, ``INDRA_DB_REST_CACHE_TTL`` (in seconds).
+
+    Returns
+    -------
+    ResponseCache or None
+        The configured response cache or None if no cache directory is set.
+    """
+    cache_dir = get_config('INDRA_DB_REST_CACHE_DIR', failure_ok=True)
+    if not cache_dir:
+        return None
+    ttl = get_config('INDRA_DB_REST_CACHE_TTL', failure_ok=True)
+    return ResponseCache(cache_dir, ttl=float(ttl) if ttl else None)
+
+
 def jsonify_args(d):
     new_d = d.copy()
     for key, val in d.items():
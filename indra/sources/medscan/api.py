@@ -30,7 +30,7 @@ def process_directory_statements_sorted_by_pmid(directory_name):
     return s_dict
 
 
-def process_directory(directory_name, lazy=False):
+def process_directory(directory_name, lazy=False, n_procs=1):
     """Processes a directory filled with CSXML files, first normalizing the
     character encodings to utf-8, and then processing into a list of INDRA
     statements.
@@ -44,6 +44,9 @@ def process_directory(directory_name, lazy=False):
         a generator will be formulated, and statements can be retrieved by
         using `iter_statements`. If False, the `statements` attribute will be
         populated immediately. Default is False.
+    n_procs : int
+        The number of processes used to process the documents in each file
+        in parallel. Default is 1.
 
     Returns
     -------
@@ -54,7 +57,7 @@ def process_directory(directory_name, lazy=False):
 
     # Parent Medscan processor containing extractions from all files
     mp = MedscanProcessor()
-    mp.process_directory(directory_name, lazy)
+    mp.process_directory(directory_name, lazy, n_procs=n_procs)
     return mp
 
 
@@ -81,7 +84,7 @@ def process_file_sorted_by_pmid(file_name):
     return s_dict
 
 
-def process_file(filename, interval=None, lazy=False):
+def process_file(filename, interval=None, lazy=False, n_procs=1):
     """Process a CSXML file for its relevant information.
 
     Consider running the fix_csxml_character_encoding.py script in
@@ -103,6 +106,10 @@ def process_file(filename, interval=None, lazy=False):
         a generator will be formulated, and statements can be retrieved by
         using `iter_statements`. If False, the `statements` attribute will be
         populated immediately. Default is False.
+    n_procs : int
+        The number of processes used to process ranges of documents in the
+        file in parallel. The statements are returned in the same order as
+        when processing the file in a single process. Default is 1.
 
     Returns
     -------
@@ -110,5 +117,5 @@ def process_file(filename, interval=None, lazy=False):
         A MedscanProcessor object containing extracted statements
     """
     mp = MedscanProcessor()
-    mp.process_csxml_file(filename, interval, lazy)
+    mp.process_csxml_file(filename, interval, lazy, n_procs=n_procs)
     return mp
@@ -7,6 +7,7 @@ import time
 import shutil
 import tempfile
 import logging
+import multiprocessing
 from math import floor
 
 import gilda
@@ -20,6 +21,7 @@ from indra.databases.chebi_client import get_chebi_id_from_cas, \
 from indra.databases.hgnc_client import get_hgnc_from_entrez, get_uniprot_id, \
         get_hgnc_name
 from indra.util import read_unicode_csv
+from indra.sources.utils import Processor
 from indra.sources.reach.processor import ReachProcessor, Site
 
 from .fix_csxml_character_encoding import fix_character_encoding
@@ -226,7 +228,7 @@ ALL_INHIBITION_VERBS = INHIBITION_VERBS + D_INHIBITION_VERBS
 PMID_PATT = re.compile(r'info:pmid/(\d+)')
 
 
-class MedscanProcessor(object):
+class MedscanProcessor(Processor):
     """Processes Medscan data into INDRA statements.
 
     The special StateEffect event conveys information about the binding
@@ -264,17 +266,30 @@ class MedscanProcessor(object):
         self.last_site_info_in_sentence = None
         self.files_processed = 0
         self._gen = None
+        # Set once all the statements of the generator are in statements
+        self._extracted = False
         self._tmp_dir = None
         self._pmids_handled = set()
         self._sentences_handled = set()
         self.__f = None
         return
 
+    name = 'medscan'
+
     def iter_statements(self, populate=True):
-        if self._gen is None and not self.statements:
+        """Iterate over the statements extracted by the processor.
+
+        Parameters
+        ----------
+        populate : Optional[bool]
+            If True, statements that are generated lazily are also added
+            to the `statements` attribute as they are yielded.
+            Default: True
+        """
+        if self._gen is None and not self._extracted and not self.statements:
             raise InputError("No generator has been initialized. Use "
                              "`process_directory` or `process_file` first.")
-        if self.statements and not self._gen:
+        if self._gen is None:
             for stmt in self.statements:
                 yield stmt
         else:
@@ -282,19 +297,31 @@ class MedscanProcessor(object):
                 if populate:
                     self.statements.append(stmt)
                 yield stmt
-
-    def process_directory(self, directory_name, lazy=False):
+            # Once the generator is exhausted, all its statements are in the
+            # statements list so subsequent iterations can use that
+            if populate:
+                self._gen = None
+                self._extracted = True
+
+    def extract_statements(self):
+        """Extract all statements from the generator and return them."""
+        if self._gen is not None:
+            self.statements.extend(self._gen)
+            self._gen = None
+            self._extracted = True
+        return self.statements
+
+    def process_directory(self, directory_name, lazy=False, n_procs=1):
         # Process each file
         glob_pattern = os.path.join(directory_name, '*.csxml')
         files = glob.glob(glob_pattern)
-        self._gen = self._iter_over_files(files)
+        self._gen = self._iter_over_files(files, n_procs=n_procs)
         if not lazy:
-            for stmt in self._gen:
-                self.statements.append(stmt)
+            self.extract_statements()
 
         return
 
-    def _iter_over_files(self, files):
+    def _iter_over_files(self, files, n_procs=1):
         # Create temporary directory into which to put the csxml files with
         # normalized character encodings
         self.__tmp_dir = tempfile.mkdtemp('indra_medscan_processor')
@@ -308,9 +335,14 @@ class MedscanProcessor(object):
         for filename in files:
             logger.info('Processing %s' % filename)
             fix_character_encoding(filename, tmp_file)
-            with open(tmp_file, 'rb') as self.__f:
-                for stmt in self._iter_through_csxml_file_from_handle():
+            if n_procs > 1:
+                for stmt in self._iter_through_csxml_file_parallel(tmp_file,
+                                                                   n_procs):
                     yield stmt
+            else:
+                with open(tmp_file, 'rb') as self.__f:
+                    for stmt in self._iter_through_csxml_file_from_handle():
+                        yield stmt
 
             percent_done_now = floor(100.0 * self.files_processed / num_files)
             if percent_done_now > percent_done:
@@ -327,7 +359,8 @@ class MedscanProcessor(object):
         shutil.rmtree(self.__tmp_dir)
         return
 
-    def process_csxml_file(self, filename, interval=None, lazy=False):
+    def process_csxml_file(self, filename, interval=None, lazy=False,
+                           n_procs=1):
         """Processes a filehandle to MedScan csxml input into INDRA
         statements.
 
@@ -368,6 +401,11 @@ class MedscanProcessor(object):
         lazy : bool
             If True, only create a generator which can be used by the
             `get_statements` method. If True, populate the statements list now.
+        n_procs : int
+            The number of processes to use. If more than 1, the documents of
+            the file are located using :func:`index_csxml_file`, and ranges
+            of documents are processed in parallel, with the statements
+            merged in document order. Default: 1
         """
         if interval is None:
             interval = (None, None)
@@ -375,13 +413,61 @@ class MedscanProcessor(object):
         tmp_fname = tempfile.mktemp(os.path.basename(filename))
         fix_character_encoding(filename, tmp_fname)
 
-        self.__f = open(tmp_fname, 'rb')
-        self._gen = self._iter_through_csxml_file_from_handle(*interval)
+        if n_procs > 1:
+            self._gen = self._iter_through_csxml_file_parallel(
+                tmp_fname, n_procs, *interval, remove_file=True)
+        else:
+            self.__f = open(tmp_fname, 'rb')
+            self._gen = self._iter_through_csxml_file_from_handle(*interval)
         if not lazy:
-            for stmt in self._gen:
-                self.statements.append(stmt)
+            self.extract_statements()
         return
 
+    def _iter_through_csxml_file_parallel(self, filename, n_procs, start=None,
+                                          stop=None, remove_file=False):
+        doc_index, end_offset = index_csxml_file(filename)
+        offsets = [offset for offset, _ in doc_index] + [end_offset]
+        doc_idxs = range(len(doc_index))[start:stop]
+        logger.info('Processing %d documents from %s using %d processes'
+                    % (len(doc_idxs), filename, n_procs))
+
+        if not doc_idxs:
+            if remove_file:
+                os.remove(filename)
+            self.files_processed += 1
+            return
+
+        # Documents with a PMID that was already seen in an earlier
+        # document are skipped, just as when processing the file serially,
+        # so each range is given the PMIDs of its documents seen before it.
+        tasks = []
+        pmids_seen = set(self._pmids_handled)
+        n_ranges = min(len(doc_idxs), n_procs * 4)
+        for i, j in _get_doc_ranges(doc_idxs.start, doc_idxs.stop, n_ranges):
+            pmids = {pmid for _, pmid in doc_index[i:j] if pmid is not None}
+            tasks.append((filename, offsets[i], offsets[j],
+                          pmids & pmids_seen))
+            pmids_seen |= pmids
+
+        try:
+            with multiprocessing.Pool(n_procs) as pool:
+                # imap returns the results in the order of the ranges
+                for stmts, num_entities, num_entities_not_found, pmids in \
+                        pool.imap(_process_csxml_range, tasks):
+                    self.num_entities += num_entities
+                    self.num_entities_not_found += num_entities_not_found
+                    self._pmids_handled |= pmids
+                    for stmt in stmts:
+                        yield stmt
+        finally:
+            if remove_file:
+                os.remove(filename)
+        self.files_processed += 1
+
+    def _iter_through_csxml_byte_range(self, filename, start, end):
+        self.__f = _CsxmlByteRange(filename, start, end)
+        return self._iter_through_csxml_file_from_handle()
+
     def _iter_through_csxml_file_from_handle(self, start=None, stop=None):
         pmid = None
         sec = None
@@ -406,6 +492,7 @@ class MedscanProcessor(object):
                 continue
             # If opening up a new doc, set the PMID
             if event == 'start' and elem.tag == 'doc':
+                skipping_doc = False
                 if start is not None and doc_idx < start:
                     logger.info("Skipping document number %d." % doc_idx)
                     skipping_doc = True
@@ -514,7 +601,8 @@ class MedscanProcessor(object):
                 # Give a status update
                 if doc_idx % 100 == 0:
                     logger.info("Processed %d documents" % doc_idx)
-                self._pmids_handled.add(pmid_num)
+                if not skipping_doc:
+                    self._pmids_handled.add(pmid_num)
                 self._sentences_handled = set()
 
             # Solution for memory leak found here:
@@ -851,6 +939,125 @@ class MedscanProcessor(object):
                 return ag, bounds
 
 
+DOC_TAG_PATT = re.compile(rb'<doc(?:\s[^>]*)?>')
+DOC_URI_PATT = re.compile(rb'\suri="([^"]*)"')
+
+
+def index_csxml_file(filename, chunk_size=16 * 1024 * 1024):
+    """Return the byte offset of each document in a CSXML file.
+
+    The file is scanned for the opening `<doc>` tags without parsing the
+    XML, which is much faster than a full parse, and allows ranges of
+    documents to be processed independently of each other.
+
+    Parameters
+    ----------
+    filename : str
+        The path to a Medscan CSXML file.
+    chunk_size : Optional[int]
+        The number of bytes to read from the file at a time.
+
+    Returns
+    -------
+    doc_index : list[tuple]
+        A list of (offset, pmid) tuples for each document in the file in
+        order, where offset is the byte offset of the opening tag of the
+        document, and pmid is its PMID as an int, or None if it can't
+        be determined.
+    end_offset : int
+        The byte offset at which the last document ends.
+    """
+    doc_index = []
+    # Bytes kept from the end of a chunk in case they contain the beginning
+    # of a tag that is split between chunks
+    overlap = 4096
+    base = 0
+    buf = b''
+    with open(filename, 'rb') as fh:
+        while True:
+            chunk = fh.read(chunk_size)
+            buf += chunk
+            cut = len(buf) - overlap if chunk else len(buf)
+            for match in DOC_TAG_PATT.finditer(buf):
+                if match.start() >= cut:
+                    break
+                uri_match = DOC_URI_PATT.search(match.group())
+                pmid_match = PMID_PATT.match(uri_match.group(1).decode()) \
+                    if uri_match else None
+                pmid = int(pmid_match.group(1)) if pmid_match else None
+                doc_index.append((base + match.start(), pmid))
+            if not chunk:
+                break
+            if cut > 0:
+                buf = buf[cut:]
+                base += cut
+        # The last document ends where the root element is closed
+        end_offset = fh.seek(0, os.SEEK_END)
+        fh.seek(max(end_offset - overlap, 0))
+        tail = fh.read()
+        batch_end = tail.rfind(b'</batch>')
+        if batch_end >= 0:
+            end_offset -= len(tail) - batch_end
+    return doc_index, end_offset
+
+
+def _get_doc_ranges(start, stop, n_ranges):
+    """Split the documents between start and stop into contiguous ranges."""
+    n_docs = stop - start
+    if n_docs <= 0 or n_ranges <= 0:
+        return []
+    bounds = [start + (n_docs * k) // n_ranges for k in range(n_ranges + 1)]
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def _process_csxml_range(args):
+    """Return the statements from a byte range of a CSXML file."""
+    filename, start, end, pmids_handled = args
+    mp = MedscanProcessor()
+    mp._pmids_handled = set(pmids_handled)
+    stmts = list(mp._iter_through_csxml_byte_range(filename, start, end))
+    return stmts, mp.num_entities, mp.num_entities_not_found, \
+        mp._pmids_handled
+
+
+class _CsxmlByteRange(object):
+    """A file-like object over a range of documents in a CSXML file.
+
+    The documents are wrapped in a root element so that the range can be
+    parsed as a standalone XML document.
+    """
+    header = b'<?xml version="1.0"?>\n<batch>\n'
+    footer = b'\n</batch>\n'
+
+    def __init__(self, filename, start, end):
+        self.name = filename
+        self._fh = open(filename, 'rb')
+        self._fh.seek(start)
+        self._remaining = end - start
+        self._buf = self.header
+        self._footer_added = False
+
+    def read(self, size=-1):
+        if size is None or size < 0:
+            size = len(self._buf) + self._remaining + len(self.footer)
+        while len(self._buf) < size and not self._footer_added:
+            if self._remaining > 0:
+                data = self._fh.read(min(self._remaining,
+                                         max(size, 1024 * 1024)))
+                self._remaining -= len(data)
+                self._buf += data
+                if not data:
+                    self._remaining = 0
+            else:
+                self._buf += self.footer
+                self._footer_added = True
+        data, self._buf = self._buf[:size], self._buf[size:]
+        return data
+
+    def close(self):
+        self._fh.close()
+
+
 class MedscanRelation(object):
     """A structure representing the information contained in a Medscan
     SVO xml element as well as associated entities and properties.
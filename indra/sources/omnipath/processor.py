@@ -3,7 +3,7 @@ from __future__ import unicode_literals
 import copy
 import logging
 from indra.statements.validate import validate_text_refs
-from indra.ontology.standardize import standardize_agent_name
+from indra.sources.grounding_cache import standardize_name_db_refs_cached
 from indra.statements import modtype_to_modclass, Agent, Evidence, Complex, \
     get_statement_by_name as stmt_by_name, BoundCondition
 
@@ -159,10 +159,8 @@ class OmniPathProcessor(object):
     def _agent_from_up_id(up_id):
         """Build an Agent object from a Uniprot ID. Adds db_refs for both
         Uniprot and HGNC where available."""
-        db_refs = {'UP': up_id}
-        ag = Agent(up_id, db_refs=db_refs)
-        standardize_agent_name(ag)
-        return ag
+        name, db_refs = standardize_name_db_refs_cached({'UP': up_id})
+        return Agent(name or up_id, db_refs=db_refs)
 
     def _bc_agent_from_up_list(self, up_id_list):
         # Return the first agent with the remaining agents as a bound condition
@@ -4,7 +4,8 @@ from xml.etree import ElementTree as ET
 from .processor import SemRepXmlProcessor
 
 
-def process_xml_file(fname, use_gilda_grounding=False, predicate_mappings=None):
+def process_xml_file(fname, use_gilda_grounding=False, predicate_mappings=None,
+                     lazy=False):
     """Process a SemRep output XML file and extract INDRA Statements.
 
     Parameters
@@ -17,6 +18,10 @@ def process_xml_file(fname, use_gilda_grounding=False, predicate_mappings=None):
     predicate_mappings : Optional[dict]
         Allows providing a custom mapping of SemRep predicates to INDRA
         Statement types. If not provided, default ones are used.
+    lazy : Optional[bool]
+        If True, the statements are not extracted immediately, rather, they
+        can be generated one by one using the processor's `iter_statements`
+        method. Default: False
 
     Returns
     -------
@@ -27,5 +32,6 @@ def process_xml_file(fname, use_gilda_grounding=False, predicate_mappings=None):
     tree = ET.parse(fname)
     sp = SemRepXmlProcessor(tree, use_gilda_grounding=use_gilda_grounding,
                             predicate_mappings=predicate_mappings)
-    sp.process_statements()
+    if not lazy:
+        sp.process_statements()
     return sp
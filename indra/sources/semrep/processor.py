@@ -3,10 +3,13 @@ __all__ = ['SemRepXmlProcessor', 'default_predicate_mappings']
 from indra.ontology.standardize import get_standard_agent, \
     standardize_agent_name
 from indra.statements import *
+from indra.sources.utils import Processor
 
 
-class SemRepXmlProcessor:
+class SemRepXmlProcessor(Processor):
     """Processor for XML output from SemRep."""
+    name = 'semrep'
+
     def __init__(self, tree, use_gilda_grounding=False,
                  predicate_mappings=None):
         self.tree = tree
@@ -18,12 +21,21 @@ class SemRepXmlProcessor:
 
     def process_statements(self):
         """Extract all Statements from an XML tree."""
+        self.statements.extend(self.iter_statements())
+
+    def extract_statements(self):
+        """Extract all Statements from an XML tree and return them."""
+        self.process_statements()
+        return self.statements
+
+    def iter_statements(self):
+        """Iterate over Statements extracted predication by predication."""
         for doc in self.tree.findall('Document'):
             for utterance in doc.findall('Utterance'):
                 for predication in utterance.findall('Predication'):
                     stmt = self.extract_predication(predication, utterance)
                     if stmt:
-                        self.statements.append(stmt)
+                        yield stmt
 
     def extract_predication(self, predication, utterance):
         """Extract a Statement from a single predication."""
@@ -1,12 +1,12 @@
 from __future__ import absolute_import, print_function, unicode_literals
 from builtins import dict, str
-import sys
+import os
 import logging
 import requests
-from io import StringIO, BytesIO
 from collections import namedtuple
 from .processor import SignorProcessor
 from indra.util import read_unicode_csv, read_unicode_csv_fileobj
+from indra.sources.utils import download_file, open_response_text
 
 logger = logging.getLogger(__name__)
 
@@ -78,11 +78,13 @@ def process_from_file(signor_data_file, signor_complexes_file=None,
     return _processor_from_data(data_iter, complexes_iter)
 
 
-def process_from_web(signor_data_file=None, signor_complexes_file=None):
+def process_from_web(signor_data_file=None, signor_complexes_file=None,
+                     use_cache=False):
     """Process Signor interaction data from the web.
 
     This downloads the latest interaction data directly from the Signor
-    website without an intermediate local file.
+    website without an intermediate local file. The data is processed
+    line by line as it is received.
 
     Parameters
     ----------
@@ -90,6 +92,10 @@ def process_from_web(signor_data_file=None, signor_complexes_file=None):
         If specified, the interaction data will be written to this file.
     signor_complexes_file : Optional[str]
         If specified, the complex data will be written to this file.
+    use_cache : Optional[bool]
+        If True, and the files given as signor_data_file and
+        signor_complexes_file already exist, they are processed instead of
+        downloading the data again. Default: False
 
     Returns
     -------
@@ -98,36 +104,50 @@ def process_from_web(signor_data_file=None, signor_complexes_file=None):
     """
     # Get interaction data
     data_url = 'https://signor.uniroma2.it/download_entity.php'
-    res = requests.post(data_url, data={'organism': 'human', 'format': 'csv',
-                                        'submit': 'Download'})
-    data_iter = _handle_response(res, '\t', fname=signor_data_file)
+    data_iter = _get_csv_rows(data_url, '\t', fname=signor_data_file,
+                              use_cache=use_cache,
+                              data={'organism': 'human', 'format': 'csv',
+                                    'submit': 'Download'})
     # Get complexes
     complexes_url = 'https://signor.uniroma2.it/download_complexes.php'
-    res = requests.post(complexes_url,
-                        data={'submit': 'Download complex data'})
-    complexes_iter = _handle_response(res, ';', fname=signor_complexes_file)
+    complexes_iter = _get_csv_rows(complexes_url, ';',
+                                   fname=signor_complexes_file,
+                                   use_cache=use_cache,
+                                   data={'submit': 'Download complex data'})
     return _processor_from_data(data_iter, complexes_iter)
 
 
+def _get_csv_rows(url, delimiter, fname=None, use_cache=False, **kwargs):
+    """Return a generator over the rows of CSV data posted at a URL.
+
+    If a file name is given, the data is downloaded into the file first
+    (unless it already exists and use_cache is True) and then read from it,
+    otherwise it is read from the response as it arrives.
+    """
+    if fname:
+        if not (use_cache and os.path.exists(fname)):
+            download_file(url, fname, method='post', **kwargs)
+        yield from read_unicode_csv(fname, delimiter=delimiter, skiprows=1)
+    else:
+        with requests.post(url, stream=True, **kwargs) as res:
+            yield from _handle_response(res, delimiter)
+
+
 def _handle_response(res, delimiter, fname=None):
     """Get an iterator over the CSV data from the response."""
     if res.status_code == 200:
-        # Python 2 -- csv.reader will need bytes
-        if sys.version_info[0] < 3:
-            csv_io = BytesIO(res.content)
-            # Optionally write to file
-            if fname:
-                with open(fname, 'wb') as fh:
-                    fh.write(res.content)
-        # Python 3 -- csv.reader needs str
+        # Optionally write to file, and then read it back
+        if fname:
+            with open(fname, 'wb') as fh:
+                for chunk in res.iter_content(chunk_size=1024 * 1024):
+                    fh.write(chunk)
+            data_iter = read_unicode_csv(fname, delimiter=delimiter,
+                                         skiprows=1)
+        # Otherwise decode the content line by line as it is read
         else:
-            csv_io = StringIO(res.text)
-            # Optionally write to file
-            if fname:
-                with open(fname, 'wt') as fh:
-                    fh.write(res.text)
-        data_iter = read_unicode_csv_fileobj(csv_io, delimiter=delimiter,
-                                             skiprows=1)
+            data_iter = read_unicode_csv_fileobj(open_response_text(res),
+                                                 delimiter=delimiter,
+                                                 skiprows=1)
     else:
         raise Exception('Could not download Signor data.')
     return data_iter
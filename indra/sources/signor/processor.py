@@ -17,8 +17,8 @@ import tqdm
 from indra.statements import *
 from indra.util import read_unicode_csv
 from indra.resources import get_resource_path
-from indra.ontology.standardize import standardize_name_db_refs, \
-    get_standard_agent
+from indra.sources.grounding_cache import \
+    standardize_name_db_refs_cached, get_standard_agent_cached
 from indra.sources.reach.processor import parse_amino_acid_string
 from indra.databases import hgnc_client, uniprot_client, chebi_client
 from indra.databases.identifiers import ensure_prefix
@@ -220,7 +220,7 @@ class SignorProcessor(object):
             return agent
         elif ent_type == 'mirna' and id.startswith('URS'):
             db_refs = {'RNACENTRAL': id}
-            return get_standard_agent(name, db_refs=db_refs)
+            return get_standard_agent_cached(name, db_refs=db_refs)
         else:
             gnd_type = _type_db_map[(ent_type, database)]
             if gnd_type == 'UP':
@@ -258,7 +258,7 @@ class SignorProcessor(object):
             else:
                 name = ent_name
                 db_refs = {}
-            return get_standard_agent(name, db_refs=db_refs)
+            return get_standard_agent_cached(name, db_refs=db_refs)
 
     def _recursively_lookup_complex(self, complex_id):
         """Looks up the constitutents of a complex. If any constituent is
@@ -562,7 +562,7 @@ def get_ref_context(db_ns, db_id):
     db_id = db_id.strip()
     if db_ns in {'BTO'}:
         db_id = ensure_prefix(db_ns, db_id)
-    standard_name, db_refs = standardize_name_db_refs({db_ns: db_id})
+    standard_name, db_refs = standardize_name_db_refs_cached({db_ns: db_id})
     return RefContext(standard_name, db_refs)
 
 
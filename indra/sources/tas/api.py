@@ -1,12 +1,12 @@
 __all__ = ['process_csv', 'process_from_web']
 
-import csv
+import os
 import logging
-import requests
-from hashlib import md5
+import tempfile
 
 from .processor import TasProcessor
 from indra.util import read_unicode_csv
+from indra.sources.utils import download_file
 
 tas_data_url = 'https://bigmech.s3.amazonaws.com/indra-db/tas.csv'
 tas_resource_md5 = '554ccba4617aae7b3b06a62893424c7f'
@@ -17,17 +17,16 @@ logger = logging.getLogger(__name__)
 
 def _load_data(data_iter):
     # Get the headers.
-    headers = data_iter[0]
+    data_iter = iter(data_iter)
+    headers = next(data_iter)
 
-    # For some reason this heading is oddly formatted and inconsistent with the
-    # rest, or with the usual key-style for dicts.
-    data = [{header: val for header, val in zip(headers, line)}
-            for line in data_iter[1:]]
-    return data
+    # Rows are turned into dicts one by one as the processor consumes them.
+    for line in data_iter:
+        yield {header: val for header, val in zip(headers, line)}
 
 
 def process_from_web(affinity_class_limit=2, named_only=False,
-                     standardized_only=False):
+                     standardized_only=False, cache_file=None):
     """Return a TasProcessor for the contents of the TAS dump online.
 
     Interactions are classified into the following classes based on affinity:
@@ -55,6 +54,10 @@ def process_from_web(affinity_class_limit=2, named_only=False,
         default_ns_order name spaces, and consequently have any
         groundings and their name standardized) are extracted.
         Default: False
+    cache_file : Optional[str]
+        If given, the downloaded CSV file is saved into this file, and if the
+        file already exists, it is processed instead of downloading the data
+        again.
 
     Returns
     -------
@@ -63,20 +66,21 @@ def process_from_web(affinity_class_limit=2, named_only=False,
         from the CSV file representing drug-target inhibitions in its
         statements attribute.
     """
-    logger.info('Downloading TAS data from %s' % tas_data_url)
-    res = requests.get(tas_data_url)
-    observed_checksum = md5(res.text.encode('utf-8')).hexdigest()
-    logger.info('Verifying md5 checksum of data')
-    if tas_resource_md5 != observed_checksum:
-        raise RuntimeError('Checksum for downloaded TAS data does not'
-                           ' match expected value')
-    res.raise_for_status()
-    logger.info('Finished downloading TAS data from %s' % tas_data_url)
-    data_iter = list(csv.reader(res.text.splitlines(), delimiter=','))
-    return TasProcessor(_load_data(data_iter),
-                        affinity_class_limit=affinity_class_limit,
-                        named_only=named_only,
-                        standardized_only=standardized_only)
+    if cache_file and os.path.exists(cache_file):
+        logger.info('Loading TAS data from %s' % cache_file)
+        return process_csv(cache_file,
+                           affinity_class_limit=affinity_class_limit,
+                           named_only=named_only,
+                           standardized_only=standardized_only)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        fname = cache_file or os.path.join(tmp_dir, 'tas.csv')
+        logger.info('Downloading TAS data from %s' % tas_data_url)
+        # The checksum is verified while the data is being written to disk
+        download_file(tas_data_url, fname, md5=tas_resource_md5)
+        logger.info('Finished downloading TAS data from %s' % tas_data_url)
+        return process_csv(fname, affinity_class_limit=affinity_class_limit,
+                           named_only=named_only,
+                           standardized_only=standardized_only)
 
 
 def process_csv(fname, affinity_class_limit=2, named_only=False,
@@ -118,7 +122,7 @@ def process_csv(fname, affinity_class_limit=2, named_only=False,
         from the CSV file representing drug-target inhibitions in its
         statements attribute.
     """
-    data_iter = list(read_unicode_csv(fname))
+    data_iter = read_unicode_csv(fname)
     return TasProcessor(_load_data(data_iter),
                         affinity_class_limit=affinity_class_limit,
                         named_only=named_only,
@@ -2,8 +2,12 @@
 
 """Processor for remote INDRA JSON files."""
 
+import os
+import json
 import pickle
-from typing import ClassVar, Iterable, List, TYPE_CHECKING
+import hashlib
+from io import TextIOWrapper
+from typing import ClassVar, Iterable, List, Optional, TYPE_CHECKING
 
 import requests
 
@@ -15,6 +19,9 @@ if TYPE_CHECKING:
 __all__ = [
     "Processor",
     'RemoteProcessor',
+    'download_file',
+    'open_response_text',
+    'iter_json_array',
 ]
 
 
@@ -27,6 +34,16 @@ class Processor:
         """Extract statements from the remote JSON file."""
         raise NotImplementedError
 
+    def iter_statements(self) -> Iterable[Statement]:
+        """Iterate over the statements extracted by this processor.
+
+        Processors that can produce statements incrementally override this
+        so that statements can be consumed in bounded memory without first
+        being accumulated in a list. By default, this falls back on
+        :meth:`extract_statements`.
+        """
+        yield from self.extract_statements()
+
     @classmethod
     def get_cli(cls) -> "click.Command":
         """Get the CLI for this processor."""
@@ -85,6 +102,168 @@ class RemoteProcessor(Processor):
         self._statements = stmts_from_json(res.json())
         return self._statements
 
+    def iter_statements(self) -> Iterable[Statement]:
+        """Iterate over the statements in the remote JSON file.
+
+        If the statements have already been extracted, those are returned,
+        otherwise, the file is streamed and each statement is parsed and
+        deserialized only as it is consumed.
+        Note that in the latter case, the uuids in the `supports` and
+        `supported_by` lists of statements are not resolved.
+        """
+        if self._statements is not None:
+            yield from self._statements
+            return
+        with requests.get(self.url, stream=True) as res:
+            res.raise_for_status()
+            for stmt_json in iter_json_array(open_response_text(res)):
+                yield from stmts_from_json([stmt_json],
+                                           on_missing_support='ignore')
+
     def print_summary(self) -> None:
         """Print a summary of the statements."""
         print_stmt_summary(self.statements)
+
+
+def download_file(url: str, fname: str, method: str = 'get',
+                  md5: Optional[str] = None, chunk_size: int = 1024 * 1024,
+                  **kwargs) -> str:
+    """Stream the body of the response from a URL into a local file.
+
+    The body is written in chunks so that the memory used doesn't depend on
+    the size of the download. The content is first written into a temporary
+    file next to the given one, which is only renamed once the download is
+    complete, so an interrupted download never leaves a truncated file
+    behind that could be mistaken for a cached copy.
+
+    Parameters
+    ----------
+    url :
+        The URL to download.
+    fname :
+        The path of the file to write the content into.
+    method :
+        The HTTP method to use for the request. Default: get
+    md5 :
+        If given, the md5 checksum of the downloaded content is compared to
+        this value and a RuntimeError is raised if they don't match.
+    chunk_size :
+        The number of bytes read from the response at a time.
+    kwargs :
+        Additional keyword arguments passed to the request, e.g., data.
+
+    Returns
+    -------
+    :
+        The path of the file the content was written into.
+    """
+    tmp_fname = '%s.%d.part' % (fname, os.getpid())
+    checksum = hashlib.md5()
+    try:
+        with requests.request(method, url, stream=True, **kwargs) as res:
+            res.raise_for_status()
+            with open(tmp_fname, 'wb') as fh:
+                for chunk in res.iter_content(chunk_size=chunk_size):
+                    checksum.update(chunk)
+                    fh.write(chunk)
+        if md5 is not None and checksum.hexdigest() != md5:
+            raise RuntimeError('Checksum for content downloaded from %s does '
+                               'not match expected value' % url)
+        os.replace(tmp_fname, fname)
+    finally:
+        if os.path.exists(tmp_fname):
+            os.remove(tmp_fname)
+    return fname
+
+
+def open_response_text(res: requests.Response,
+                       encoding: str = 'utf-8') -> TextIOWrapper:
+    """Return a text stream over the body of a streamed response.
+
+    Parameters
+    ----------
+    res :
+        A response returned by a request made with `stream=True`.
+    encoding :
+        The encoding of the content. Default: utf-8
+
+    Returns
+    -------
+    :
+        A file-like object from which the decoded content can be read
+        line by line, e.g., by a csv.reader, as it arrives.
+    """
+    # Let urllib3 undo any gzip or deflate transfer encoding, and keep the
+    # raw stream open at the end of the content so that the text wrapper
+    # can detect the end of the data itself
+    res.raw.decode_content = True
+    res.raw.auto_close = False
+    return TextIOWrapper(res.raw, encoding=encoding, newline='')
+
+
+def iter_json_array(fh, chunk_size: int = 1024 * 1024) -> Iterable:
+    """Iterate over the elements of a JSON array read from a text stream.
+
+    The stream is read in chunks and each element is decoded as soon as it
+    has been read entirely, so that the whole array doesn't have to be in
+    memory at once.
+
+    Parameters
+    ----------
+    fh :
+        A file-like object containing a JSON array, e.g., as returned by
+        :func:`open_response_text`.
+    chunk_size :
+        The number of characters read from the stream at a time.
+
+    Returns
+    -------
+    :
+        The decoded elements of the array.
+    """
+    decoder = json.JSONDecoder()
+    buf, pos, eof = '', 0, False
+    # One of start (before the array), first (before the first element),
+    # element (after a comma) or next (after an element)
+    state = 'start'
+    while True:
+        while pos < len(buf) and buf[pos].isspace():
+            pos += 1
+        if pos == len(buf):
+            buf, pos = fh.read(chunk_size), 0
+            if not buf:
+                raise ValueError('Unexpected end of the JSON array')
+            continue
+        char = buf[pos]
+        if state == 'start':
+            if char != '[':
+                raise ValueError('Expected a JSON array')
+            pos += 1
+            state = 'first'
+        elif state == 'next':
+            if char == ']':
+                return
+            elif char != ',':
+                raise ValueError('Expected , or ] at position %d' % pos)
+            pos += 1
+            state = 'element'
+        elif state == 'first' and char == ']':
+            return
+        else:
+            try:
+                element, end = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                end = None
+            # Read more unless the element is certainly complete, e.g., a
+            # number at the end of the buffer could continue in the next
+            # chunk
+            if end is None or (end == len(buf) and not eof):
+                chunk = fh.read(chunk_size)
+                eof = not chunk
+                buf, pos = buf[pos:] + chunk, 0
+                continue
+            yield element
+            pos = end
+            state = 'next'
@@ -155,15 +155,21 @@ class Evidence(object):
         return json_dict
 
     @classmethod
-    def _from_json(cls, json_dict):
+    def _from_json(cls, json_dict, copy_json=True):
         source_api = json_dict.get('source_api')
         source_id = json_dict.get('source_id')
         pmid = json_dict.get('pmid')
         text = json_dict.get('text')
-        annotations = copy(json_dict.get('annotations', {}))
-        epistemics = copy(json_dict.get('epistemics', {}))
+        annotations = json_dict.get('annotations', {})
+        epistemics = json_dict.get('epistemics', {})
         context_entry = json_dict.get('context')
-        text_refs = copy(json_dict.get('text_refs', {}))
+        text_refs = json_dict.get('text_refs', {})
+        # The dicts of the JSON don't need to be copied if nothing else
+        # refers to the JSON, e.g., if it was just loaded from a file
+        if copy_json:
+            annotations = copy(annotations)
+            epistemics = copy(epistemics)
+            text_refs = copy(text_refs)
         if context_entry:
             context = Context.from_json(context_entry)
         else:
@@ -1,14 +1,19 @@
 __all__ = ['stmts_from_json', 'stmts_from_json_file', 'stmts_to_json',
-           'stmts_to_json_file', 'draw_stmt_graph', 'pretty_print_stmts',
+           'stmts_to_json_file', 'iter_stmts_json', 'draw_stmt_graph',
+           'pretty_print_stmts',
            'UnresolvedUuidError', 'InputError',
            'set_pretty_print_max_width', 'print_stmt_summary',
            'stmt_from_json', 'stmt_from_json_str']
 
+import gc
 import json
 import logging
 import os
 import pathlib
+import threading
 from collections import Counter
+from contextlib import contextmanager
+from json.encoder import encode_basestring_ascii, INFINITY
 from typing import Collection, List, Optional, Union
 
 from indra.statements.statements import Statement, Unresolved
@@ -52,16 +57,21 @@ def stmts_from_json(json_in, on_missing_support='handle'):
         A list of INDRA Statements.
     """
 
+    return _stmts_from_json(json_in, on_missing_support)
+
+
+def _stmts_from_json(json_in, on_missing_support='handle', copy_json=True):
     stmts = []
     uuid_dict = {}
-    for json_stmt in json_in:
-        try:
-            st = Statement._from_json(json_stmt)
-        except Exception as e:
-            logger.warning("Error creating statement: %s" % e)
-            continue
-        stmts.append(st)
-        uuid_dict[st.uuid] = st
+    with _gc_paused():
+        for json_stmt in json_in:
+            try:
+                st = Statement._from_json(json_stmt, copy_json=copy_json)
+            except Exception as e:
+                logger.warning("Error creating statement: %s" % e)
+                continue
+            stmts.append(st)
+            uuid_dict[st.uuid] = st
     for st in stmts:
         _promote_support(st.supports, uuid_dict, on_missing_support)
         _promote_support(st.supported_by, uuid_dict, on_missing_support)
@@ -98,7 +108,9 @@ def stmt_from_json_str(json_in):
     stmt : :py:class:`Statement`
         The deserialized INDRA Statement.
     """
-    return stmt_from_json(json.loads(json_in))
+    stmt = _stmts_from_json([json.loads(json_in)], on_missing_support='ignore',
+                            copy_json=False)
+    return stmt[0]
 
 
 def stmts_from_json_file(
@@ -119,12 +131,12 @@ def stmts_from_json_file(
     list[indra.statements.Statement]
         The list of INDRA Statements loaded from the JSOn file.
     """
-    with open(fname, 'r') as fh:
+    with open(fname, 'rb') as fh, _gc_paused():
         if format == 'json':
-            return stmts_from_json(json.load(fh))
+            json_in = json.loads(fh.read())
         else:
-            return stmts_from_json([json.loads(line)
-                                    for line in fh.readlines()])
+            json_in = [json.loads(line) for line in fh if line.strip()]
+    return _stmts_from_json(json_in, copy_json=False)
 
 
 def stmts_to_json_file(
@@ -145,16 +157,180 @@ def stmts_to_json_file(
         One of 'json' to use regular JSON with indent=1 formatting or
         'jsonl' to put each statement on a new line without indents.
     """
-    sj = stmts_to_json(stmts, **kwargs)
     with open(fname, 'w') as fh:
+        if not isinstance(stmts, list):
+            sj = stmts_to_json(stmts, **kwargs)
+            if format == 'json':
+                fh.write(_dumps_indented(sj))
+            else:
+                json.dump(sj, fh)
+                fh.write('\n')
+            return
+        # Statements are serialized and written one at a time
         if format == 'json':
-            json.dump(sj, fh, indent=1)
+            for part in iter_stmts_json(stmts, indent=1, **kwargs):
+                fh.write(part)
         else:
-            for json_stmt in sj:
-                json.dump(json_stmt, fh)
+            for stmt in stmts:
+                json.dump(stmt.to_json(**kwargs), fh)
                 fh.write('\n')
 
 
+def iter_stmts_json(stmts, indent=None, **kwargs):
+    """Iterate over the parts of the JSON array of a list of Statements.
+
+    Each Statement is only serialized when its part is reached, so that the
+    JSON of all the Statements doesn't need to be in memory at once, e.g.,
+    when writing it into a file or streaming it in a response.
+
+    Parameters
+    ----------
+    stmts : list[indra.statements.Statement]
+        The Statements to serialize.
+    indent : Optional[int]
+        If given, the JSON is formatted as by json.dumps with this indent,
+        otherwise it is compact, as by json.dumps without indent.
+        Default: None
+    **kwargs :
+        Keyword arguments passed to the to_json method of each Statement.
+
+    Returns
+    -------
+    iterator[str]
+        The parts of the JSON array, which make up the whole array when
+        concatenated.
+    """
+    if not stmts:
+        yield '[]'
+        return
+    if indent:
+        start, sep = '[\n' + ' ' * indent, ',\n' + ' ' * indent
+    else:
+        start, sep = '[', ', '
+    for idx, stmt in enumerate(stmts):
+        json_stmt = stmt.to_json(**kwargs)
+        yield (sep if idx else start) + \
+            (_dumps_indented(json_stmt, indent, level=1) if indent
+             else json.dumps(json_stmt))
+    yield '\n]' if indent else ']'
+
+
+# Garbage collection is paused process-wide as long as any thread is in a
+# _gc_paused block, and resumed when the last one leaves it
+_gc_lock = threading.Lock()
+_gc_pauses = 0
+_gc_was_enabled = False
+
+
+@contextmanager
+def _gc_paused():
+    """Pause garbage collection, e.g., while creating many objects.
+
+    The objects created while loading JSON and deserializing Statements are
+    all still referenced afterwards, so the garbage collection passes
+    triggered by their allocation, each of which traverses all the objects
+    in memory, are pure overhead. Pauses can overlap across threads, and
+    garbage collection is only enabled again, if it was enabled before the
+    first of them, once they have all ended.
+    """
+    global _gc_pauses, _gc_was_enabled
+    with _gc_lock:
+        if not _gc_pauses:
+            _gc_was_enabled = gc.isenabled()
+            gc.disable()
+        _gc_pauses += 1
+    try:
+        yield
+    finally:
+        with _gc_lock:
+            _gc_pauses -= 1
+            if not _gc_pauses and _gc_was_enabled:
+                gc.enable()
+
+
+def _dumps_indented(json_in, indent=1, level=0):
+    """Return a JSON string with the same format as json.dumps with indent.
+
+    Unlike json.dumps, whose indented output is generated in pure Python by
+    a generic encoder, this writes the parts of the output into a list in a
+    single recursive pass, which is about twice as fast for the deeply
+    nested JSON of Statements.
+    """
+    parts = []
+    _encode_indented(json_in, parts, ' ' * indent, '\n' + ' ' * indent * level)
+    return ''.join(parts)
+
+
+def _encode_indented(obj, parts, indent, newline):
+    obj_type = type(obj)
+    if obj_type is str:
+        parts.append(encode_basestring_ascii(obj))
+    elif obj is None:
+        parts.append('null')
+    elif obj is True:
+        parts.append('true')
+    elif obj is False:
+        parts.append('false')
+    elif obj_type is dict or isinstance(obj, dict):
+        if not obj:
+            parts.append('{}')
+            return
+        inner = newline + indent
+        sep = '{' + inner
+        for key, value in obj.items():
+            parts.append(sep + _encode_key(key) + ': ')
+            sep = ',' + inner
+            _encode_indented(value, parts, indent, inner)
+        parts.append(newline + '}')
+    elif obj_type is list or isinstance(obj, (list, tuple)):
+        if not obj:
+            parts.append('[]')
+            return
+        inner = newline + indent
+        sep = '[' + inner
+        for value in obj:
+            parts.append(sep)
+            sep = ',' + inner
+            _encode_indented(value, parts, indent, inner)
+        parts.append(newline + ']')
+    elif isinstance(obj, int):
+        parts.append(int.__repr__(obj))
+    elif isinstance(obj, float):
+        parts.append(_encode_float(obj))
+    elif isinstance(obj, str):
+        parts.append(encode_basestring_ascii(obj))
+    else:
+        raise TypeError('Object of type %s is not JSON serializable'
+                        % obj_type.__name__)
+
+
+def _encode_key(key):
+    if isinstance(key, str):
+        return encode_basestring_ascii(key)
+    elif key is True:
+        return '"true"'
+    elif key is False:
+        return '"false"'
+    elif key is None:
+        return '"null"'
+    elif isinstance(key, int):
+        return '"%s"' % int.__repr__(key)
+    elif isinstance(key, float):
+        return '"%s"' % _encode_float(key)
+    raise TypeError('keys must be str, int, float, bool or None, not %s'
+                    % type(key).__name__)
+
+
+def _encode_float(value):
+    if value != value:
+        return 'NaN'
+    elif value == INFINITY:
+        return 'Infinity'
+    elif value == -INFINITY:
+        return '-Infinity'
+    return float.__repr__(value)
+
+
 def stmts_to_json(stmts_in, use_sbo=False, matches_fun=None):
     """Return the JSON-serialized form of one or more INDRA Statements.
 
@@ -222,8 +222,8 @@ __all__ = [
 
     # Functions and values
     'stmts_from_json', 'get_unresolved_support_uuids', 'stmts_to_json',
-    'stmts_from_json_file', 'stmts_to_json_file', 'stmt_from_json',
-    'stmt_from_json_str', 'get_valid_residue',
+    'stmts_from_json_file', 'stmts_to_json_file', 'iter_stmts_json',
+    'stmt_from_json', 'stmt_from_json_str', 'get_valid_residue',
     'draw_stmt_graph', 'get_all_descendants','make_statement_camel',
     'amino_acids', 'amino_acids_reverse', 'activity_types',
     'modtype_to_modclass',
@@ -528,12 +528,13 @@ class Statement(object):
         return json_dict
 
     @classmethod
-    def _from_json(cls, json_dict):
+    def _from_json(cls, json_dict, copy_json=True):
         stmt_type = json_dict.get('type')
         stmt_cls = getattr(sys.modules[__name__], stmt_type)
         stmt = stmt_cls._from_json(json_dict)
         evidence = json_dict.get('evidence', [])
-        stmt.evidence = [Evidence._from_json(ev) for ev in evidence]
+        stmt.evidence = [Evidence._from_json(ev, copy_json=copy_json)
+                         for ev in evidence]
         stmt.supports = json_dict.get('supports', [])[:]
         stmt.supported_by = json_dict.get('supported_by', [])[:]
         stmt.belief = json_dict.get('belief', 1.0)
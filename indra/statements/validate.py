@@ -8,10 +8,17 @@ the given input is valid or invalid.
 
 For validating namespaces and identifiers, there are two validators available,
 one that uses data from identifiers.org and another for Bioregistry.
+
+To validate many Statements at once, e.g., a whole corpus,
+:func:`get_validation_report` checks each distinct grounding of the corpus
+only once, optionally with a pool of processes, and returns the first error
+of each invalid Statement in a JSON-serializable report.
 """
 
 import re
 import logging
+import multiprocessing
+from collections import Counter
 from indra.statements import *
 from indra.databases import bioregistry_client, identifiers
 
@@ -148,6 +155,76 @@ class BioregistryValidator:
 default_validator = IdentifiersValidator()
 
 
+class BatchValidator:
+    """A validator which remembers the result of checking each namespace,
+    (namespace, ID) pair and db_refs with another validator.
+
+    When validating many Statements, e.g., a corpus, each distinct grounding
+    is then only checked once, and checking the others is a lookup.
+
+    Parameters
+    ----------
+    validator : Optional[IdentifiersValidator or BioregistryValidator]
+        The validator used to check the namespaces and IDs.
+        Default: IdentifiersValidator
+    """
+    def __init__(self, validator=default_validator):
+        self.validator = validator
+        self.ns_errors = {}
+        self.id_errors = {}
+        self.db_refs_errors = {}
+
+    def assert_valid_db_refs(self, db_refs):
+        # Agents often have the same db_refs, so the result of checking each
+        # distinct db_refs is also kept
+        try:
+            key = tuple(db_refs.items())
+            error = self.db_refs_errors.get(key, False)
+        except TypeError:
+            return self._assert_valid_db_refs(db_refs)
+        if error is False:
+            error = _get_error(self._assert_valid_db_refs, db_refs)
+            self.db_refs_errors[key] = error
+        _raise_error(error)
+
+    def _assert_valid_db_refs(self, db_refs):
+        for db_ns, db_id in db_refs.items():
+            self.assert_valid_ns(db_ns)
+            self.assert_valid_id(db_ns, db_id)
+
+    def assert_valid_ns(self, db_ns):
+        if db_ns not in self.ns_errors:
+            self.ns_errors[db_ns] = _get_error(self.validator.assert_valid_ns,
+                                               db_ns)
+        _raise_error(self.ns_errors[db_ns])
+
+    def assert_valid_id(self, db_ns, db_id):
+        try:
+            error = self.id_errors.get((db_ns, db_id), False)
+        except TypeError:
+            return self.validator.assert_valid_id(db_ns, db_id)
+        if error is False:
+            error = _get_error(self.validator.assert_valid_id, db_ns, db_id)
+            self.id_errors[(db_ns, db_id)] = error
+        _raise_error(error)
+
+
+def _get_error(func, *args):
+    # The type and arguments of the error are kept rather than the error
+    # itself, so that a new error is raised each time
+    try:
+        func(*args)
+    except Exception as e:
+        return type(e), e.args
+    return None
+
+
+def _raise_error(error):
+    if error is not None:
+        error_cls, args = error
+        raise error_cls(*args)
+
+
 def validate_ns(db_ns, validator=default_validator):
     """Return True if the given namespace is known.
 
@@ -244,6 +321,8 @@ def assert_valid_db_refs(db_refs, validator=default_validator):
     db_refs : dict
         A dict of database references, typically part of an INDRA Agent.
     """
+    if isinstance(validator, BatchValidator):
+        return validator.assert_valid_db_refs(db_refs)
     for db_ns, db_id in db_refs.items():
         assert_valid_ns(db_ns, validator=validator)
         assert_valid_id(db_ns, db_id, validator=validator)
@@ -367,23 +446,91 @@ def assert_valid_statements(stmts, validator=default_validator):
     stmts : list[indra.statements.Statement]
         A list of INDRA Statements to validate.
     """
+    batch_validator = BatchValidator(validator)
     for stmt in stmts:
-        assert_valid_statement(stmt, validator=validator)
+        assert_valid_statement(stmt, validator=batch_validator)
 
 
-def print_validation_report(stmts, validator=default_validator):
-    """Log the first validation error encountered for each given statement.
+def get_validation_report(stmts, validator=default_validator, n_procs=1):
+    """Return the first validation error of each given statement.
 
     Parameters
     ----------
     stmts : list[indra.statements.Statement]
         A list of INDRA Statements to validate.
+    n_procs : Optional[int]
+        The number of processes validating the statements. Each process
+        validates a range of the statements, which are sent to each process
+        once when the pool is started. Default: 1
+
+    Returns
+    -------
+    dict
+        A JSON-serializable report with the number of statements under
+        `num_statements`, of invalid statements under `num_invalid`, the
+        number of errors of each type under `error_counts` and the errors
+        under `errors`, each with the `index` and `uuid` of the statement,
+        the `error` type and its `message`.
     """
-    for idx, stmt in enumerate(stmts):
+    if n_procs and n_procs > 1 and len(stmts) > 1:
+        chunk_size = max(1, len(stmts) // (4 * n_procs))
+        ranges = [(start, min(start + chunk_size, len(stmts)))
+                  for start in range(0, len(stmts), chunk_size)]
+        logger.info('Validating %d statements with %d processes'
+                    % (len(stmts), n_procs))
+        with multiprocessing.Pool(n_procs,
+                                  initializer=_init_validation_worker,
+                                  initargs=(stmts, validator)) as pool:
+            errors = [error for range_errors
+                      in pool.imap(_validate_range, ranges)
+                      for error in range_errors]
+    else:
+        errors = _get_validation_errors(stmts, BatchValidator(validator))
+    return {'num_statements': len(stmts),
+            'num_invalid': len(errors),
+            'error_counts': dict(Counter(error['error']
+                                         for error in errors)),
+            'errors': errors}
+
+
+def _get_validation_errors(stmts, validator, offset=0):
+    errors = []
+    for idx, stmt in enumerate(stmts, start=offset):
         try:
             assert_valid_statement(stmt, validator=validator)
         except Exception as e:
-            logger.info(f'{idx}: {type(e).__name__} - {e}')
+            errors.append({'index': idx, 'uuid': stmt.uuid,
+                           'error': type(e).__name__, 'message': str(e)})
+    return errors
+
+
+def _init_validation_worker(stmts, validator):
+    global _worker_stmts, _worker_validator
+    _worker_stmts = stmts
+    _worker_validator = BatchValidator(validator)
+
+
+def _validate_range(stmt_range):
+    start, end = stmt_range
+    return _get_validation_errors(_worker_stmts[start:end],
+                                  _worker_validator, offset=start)
+
+
+def print_validation_report(stmts, validator=default_validator, n_procs=1):
+    """Log the first validation error encountered for each given statement.
+
+    Parameters
+    ----------
+    stmts : list[indra.statements.Statement]
+        A list of INDRA Statements to validate.
+    n_procs : Optional[int]
+        The number of processes validating the statements. Default: 1
+    """
+    report = get_validation_report(stmts, validator=validator,
+                                   n_procs=n_procs)
+    for error in report['errors']:
+        logger.info(f"{error['index']}: {error['error']} - "
+                    f"{error['message']}")
 
 
 def assert_valid_text_refs(text_refs):
@@ -396,7 +543,7 @@ def assert_valid_text_refs(text_refs):
         if ns in text_refs:
             if text_refs[ns] is None:
                 raise InvalidTextRefs(f'{ns}:{text_refs[ns]}')
-            elif not re.match(pattern, text_refs[ns]):
+            elif not pattern.match(text_refs[ns]):
                 raise InvalidTextRefs(f'{ns}:{text_refs[ns]}')
 
 
@@ -1,4 +1,5 @@
 import pickle
+import multiprocessing
 from copy import deepcopy
 from indra.statements import *
 from indra.tools import assemble_corpus as ac
@@ -823,3 +824,86 @@ def test_filter_inconsequential():
     stmts_out = ac.filter_inconsequential(
         stmts, mod_whitelist=mod_whitelist, act_whitelist=act_whitelist)
     assert len(stmts_out) == 2, stmts_out
+
+
+def test_n_procs():
+    braf_mut = Agent('BRAF', mutations=MutCondition('600', 'V', 'E'))
+    stmts = [deepcopy(st) for st in [st1, st3, st5, st6, st18] * 5] + \
+        [Phosphorylation(braf_mut, Agent('a'))]
+    cur = {'pa_hash': st5.get_hash(),
+           'source_hash': st5.evidence[0].get_source_hash(), 'tag': 'wrong'}
+    for func, args, kwargs in [
+            (ac.filter_genes_only, [], {'remove_bound': True}),
+            (ac.strip_agent_context, [], {}),
+            (ac.filter_by_curation, [[cur]], {})]:
+        serial = func(deepcopy(stmts), *args, **kwargs)
+        parallel = func(deepcopy(stmts), *args, n_procs=2, **kwargs)
+        assert [st.to_json() for st in parallel] == \
+            [st.to_json() for st in serial], func.__name__
+    # Statements without a missing agent for the mutation status filter
+    stmts = [st for st in stmts if None not in st.agent_list()]
+    muts = {'BRAF': [('V', '600', 'E')]}
+    serial = ac.filter_mutation_status(deepcopy(stmts), muts, ['d'])
+    parallel = ac.filter_mutation_status(deepcopy(stmts), muts, ['d'],
+                                         n_procs=2)
+    assert [st.to_json() for st in parallel] == \
+        [st.to_json() for st in serial]
+
+
+def test_n_procs_linked():
+    # Parallel steps keep the statements and their support links
+    stmts = [deepcopy(st) for st in [st1, st3, st5, st6] * 3]
+    for general, specific in zip(stmts[::2], stmts[1::2]):
+        general.supported_by.append(specific)
+        specific.supports.append(general)
+    out = ac.filter_in_chunks(stmts, bool, n_procs=2)
+    assert all(st_out is st for st_out, st in zip(out, stmts))
+    serial = ac.filter_genes_only(stmts)
+    out = ac.filter_genes_only(stmts, n_procs=2)
+    assert len(out) == len(serial)
+    assert all(st_out is st for st_out, st in zip(out, serial))
+    cur = {'pa_hash': st5.get_hash(),
+           'source_hash': st5.evidence[0].get_source_hash(), 'tag': 'wrong'}
+    out = ac.filter_by_curation(stmts, [cur], n_procs=2)
+    assert [id(st) for st in out] == \
+        [id(st) for st in ac.filter_by_curation(stmts, [cur])]
+    assert out[0].supported_by[0] is out[1]
+    out = ac.apply_in_chunks(stmts, list, n_procs=2)
+    assert out[0] is stmts[0]
+    assert out[0].supported_by[0] is out[1]
+
+
+def test_n_procs_spawn(monkeypatch):
+    # The chunk functions have to be picklable when the processes of the
+    # pool are spawned rather than forked
+    monkeypatch.setattr(ac, 'multiprocessing',
+                        multiprocessing.get_context('spawn'))
+    stmts = [deepcopy(st) for st in [st1, st3, st5] * 3]
+    cur = {'pa_hash': st5.get_hash(),
+           'source_hash': st5.evidence[0].get_source_hash(), 'tag': 'wrong'}
+    for policy in ['any', 'all']:
+        serial = ac.filter_by_curation(deepcopy(stmts), [cur], policy)
+        parallel = ac.filter_by_curation(deepcopy(stmts), [cur], policy,
+                                         n_procs=2)
+        assert [st.to_json() for st in parallel] == \
+            [st.to_json() for st in serial], policy
+    serial = ac.strip_agent_context(deepcopy(stmts))
+    parallel = ac.strip_agent_context(deepcopy(stmts), n_procs=2)
+    assert [st.to_json() for st in parallel] == \
+        [st.to_json() for st in serial]
+
+
+def test_align_statements():
+    st1_other = Phosphorylation(a, b, evidence=[Evidence(text='a-b')])
+    stmts1 = [st1, st3, st2, st6]
+    stmts2 = [st4, st1_other, st2, st1, st7]
+    # st1 matches the first of the two statements with agents a and b
+    matches = ac.align_statements(stmts1, stmts2)
+    assert matches == [(st1, st1_other), (st3, None), (st2, st2),
+                       (st6, None), (None, st4), (None, st7)]
+    matches = ac.align_statements(stmts1, stmts2, all_matches=True)
+    assert matches == [(st1, st1_other), (st1, st1), (st3, None),
+                       (st2, st2), (st6, None), (None, st4), (None, st7)]
+    matches = ac.align_statements(stmts1, stmts2, keyfun=lambda s: s.uuid)
+    assert matches == [(st1, st1), (st3, None), (st2, st2), (st6, None),
+                       (None, st4), (None, st1_other), (None, st7)]
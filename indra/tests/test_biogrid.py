@@ -1,6 +1,9 @@
 import os
+import tempfile
+from zipfile import ZipFile
+from indra.util import read_unicode_csv
 from indra.statements import Complex
-from indra.sources.biogrid import BiogridProcessor
+from indra.sources.biogrid import BiogridProcessor, _read_biogrid_zip
 
 this_dir = os.path.dirname(__file__)
 test_file = os.path.join(this_dir, 'biogrid_tests_data/biogrid_test.txt')
@@ -28,3 +31,20 @@ def test_biogrid_tsv():
     assert s0.members[1].name == 'DDX23', s0
     assert set(s0.members[0].db_refs) == {'HGNC', 'UP', 'EGID'}
     assert set(s0.members[1].db_refs) == {'HGNC', 'UP', 'EGID'}
+
+
+def test_biogrid_iter_statements():
+    bp = BiogridProcessor(test_file, physical_only=False, lazy=True)
+    assert not bp.statements
+    statements = list(bp.iter_statements())
+    assert len(statements) == 50, len(statements)
+    assert all(isinstance(stmt, Complex) for stmt in statements)
+
+
+def test_read_biogrid_zip():
+    zip_file = os.path.join(tempfile.mkdtemp(), 'biogrid_test.zip')
+    with ZipFile(zip_file, 'w') as zf:
+        zf.write(test_file, 'biogrid_test.txt')
+    rows = list(_read_biogrid_zip(zip_file))
+    assert rows == list(read_unicode_csv(test_file, '\t', skiprows=1))
+    assert len(rows) == 50, len(rows)
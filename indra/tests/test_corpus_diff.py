@@ -0,0 +1,41 @@
+from copy import deepcopy
+from indra.statements import *
+from indra.tools.corpus_diff import diff_corpora
+
+
+a = Agent('a', db_refs={'HGNC': '1234'})
+b = Agent('b', db_refs={'HGNC': '5678'})
+st1 = Phosphorylation(a, b, evidence=[Evidence(text='a->b')])
+st2 = Activation(a, b, evidence=[Evidence(text='a->b')])
+st3 = Complex([a, b], evidence=[Evidence(text='a-b')])
+st4 = Inhibition(b, a, evidence=[Evidence(text='b-|a')])
+
+
+def test_diff_corpora():
+    st2_more_ev = deepcopy(st2)
+    st2_more_ev.evidence.append(Evidence(text='a activates b'))
+    st3_belief = deepcopy(st3)
+    st3_belief.belief = 0.9
+    diff = diff_corpora([st1, st2, st3], [st4, st3_belief, st2_more_ev, st1])
+    assert diff.added == [st4]
+    assert diff.removed == []
+    assert diff.changed == [(st3, st3_belief), (st2, st2_more_ev)]
+    assert diff.num_unchanged == 1
+    assert str(diff) == ('1 statements added, 0 removed, 2 changed and 1 '
+                         'unchanged')
+    diff = diff_corpora([st1, st2, st3], [st3_belief, st1],
+                        belief_tolerance=0.2)
+    assert diff.removed == [st2]
+    assert not diff.changed and diff.num_unchanged == 2
+    diff_json = diff.to_json()
+    assert diff_json['removed'][0]['hash'] == st2.get_hash()
+    assert diff_json['removed'][0]['num_evidence'] == 1
+
+
+def test_diff_corpora_duplicates():
+    st1_dup = deepcopy(st1)
+    diff = diff_corpora([st1, st1_dup, st4], [st1])
+    assert diff.removed == [st1_dup, st4]
+    assert diff.num_unchanged == 1
+    diff = diff_corpora([st1], [st1_dup, st1])
+    assert diff.added == [st1]
@@ -28,3 +28,13 @@ def test_chemical_gene():
     assert cp.statements[1].enz.name == 'YM-254890'
     assert isinstance(cp.statements[2], Phosphorylation)
     assert cp.statements[2].enz.name == 'zinc atom'
+
+
+def test_chemical_gene_lazy():
+    fname = os.path.join(HERE, 'ctd_chem_gene_20522546.tsv')
+    cp = ctd.process_tsv(fname, 'chemical_gene', lazy=True)
+    assert not cp.statements
+    stmts = list(cp.iter_statements())
+    assert len(stmts) == 3, stmts
+    assert isinstance(stmts[0], Dephosphorylation)
+    assert stmts[0].enz.name == 'wortmannin'
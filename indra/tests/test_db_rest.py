@@ -1,12 +1,18 @@
+import json
+import tempfile
 import unittest
 from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
 from time import sleep
 from unittest import SkipTest
+from urllib.parse import urlparse, parse_qs
 
 import pytest
 from indra.sources import indra_db_rest as dbr
 from indra.sources.indra_db_rest.api import get_statement_queries
 from indra.sources.indra_db_rest.query import HasAgent, HasEvidenceBound
+from indra.util.response_cache import ResponseCache
 from indra.statements import Agent, Phosphorylation
 
 
@@ -347,3 +353,90 @@ def test_namespace_only_agent_query():
     assert all(any("CHEBI" in ag.db_refs for ag in s.agent_list())
                and any(ag.db_refs.get("FPLX") == "MEK" for ag in s.agent_list())
                for s in p.statements)
+
+
+class _StubDbRestHandler(BaseHTTPRequestHandler):
+    """Serve pages of made-up Statements like the REST API does."""
+    n_stmts = 23
+    page_size = 5
+    offsets = []
+
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        self.rfile.read(int(self.headers.get('content-length', 0)))
+        if url.path == '/compile/string':
+            return self._send('stub query')
+        params = parse_qs(url.query)
+        offset = int(params.get('offset', ['0'])[0])
+        limit = int(params['limit'][0]) if 'limit' in params else None
+        self.offsets.append(offset)
+        # Make the pages come back out of order.
+        sleep(0.05 * (offset % 3))
+        size = self.page_size if limit is None else min(limit,
+                                                        self.page_size)
+        hashes = list(range(offset, min(offset + size, self.n_stmts)))
+        results = {str(h): Phosphorylation(Agent('A%d' % h),
+                                           Agent('B')).to_json()
+                   for h in hashes}
+        next_offset = offset + size if len(hashes) == size else None
+        self._send({'results': results, 'limit': size, 'offset': offset,
+                    'next_offset': next_offset, 'query_json': {},
+                    'evidence_counts': {str(h): 1 for h in hashes},
+                    'belief_scores': {str(h): 1.0 for h in hashes},
+                    'source_counts': {str(h): {'reach': 1} for h in hashes},
+                    'total_evidence': len(hashes), 'returned_evidence': 0,
+                    'result_type': 'statements', 'offset_comp': len(hashes)})
+
+    def _send(self, content):
+        body = json.dumps(content).encode('utf-8')
+        self.send_response(200)
+        self.send_header('content-type', 'application/json')
+        self.send_header('content-length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def stub_db_rest(monkeypatch):
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _StubDbRestHandler)
+    Thread(target=server.serve_forever, daemon=True).start()
+    monkeypatch.setenv('INDRA_DB_REST_URL',
+                       'http://127.0.0.1:%d' % server.server_port)
+    _StubDbRestHandler.offsets = []
+    yield _StubDbRestHandler
+    server.shutdown()
+
+
+@pytest.mark.parametrize('max_workers', [1, 4])
+def test_paging_stub_server(stub_db_rest, max_workers):
+    p = dbr.get_statements_from_query(HasAgent('B'), max_workers=max_workers,
+                                      cache=False)
+    hashes = [s.agent_list()[0].name for s in p.statements]
+    assert hashes == ['A%d' % h for h in range(23)], hashes
+    assert p.requests_completed == 5
+
+
+def test_paging_stub_server_limit(stub_db_rest):
+    p = dbr.get_statements_from_query(HasAgent('B'), limit=12, max_workers=4,
+                                      cache=False)
+    assert len(p.statements) == 12
+    assert max(stub_db_rest.offsets) < 12, stub_db_rest.offsets
+
+
+def test_response_cache(stub_db_rest):
+    cache = ResponseCache(tempfile.mkdtemp(), ttl=3600)
+    p = dbr.get_statements_from_query(HasAgent('B'), max_workers=4,
+                                      cache=cache)
+    n_requests = len(stub_db_rest.offsets)
+    p2 = dbr.get_statements_from_query(HasAgent('B'), max_workers=4,
+                                       cache=cache)
+    assert len(stub_db_rest.offsets) == n_requests
+    assert len(p2.statements) == len(p.statements) == 23
+    # Expired responses are requested again
+    cache.ttl = 0
+    sleep(0.01)
+    dbr.get_statements_from_query(HasAgent('B'), cache=cache)
+    assert len(stub_db_rest.offsets) == n_requests + 5
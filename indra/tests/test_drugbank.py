@@ -22,3 +22,11 @@ def test_drugbank_sample():
     assert target.db_refs['HGNC'] == '3535'
     assert target.db_refs['UP'] == 'P00734'
     assert target.db_refs['DRUGBANKV4.TARGET'] == 'BE0000048'
+
+
+def test_drugbank_sample_lazy():
+    dp = drugbank.process_xml(test_file, lazy=True)
+    assert not dp.statements
+    stmts = list(dp.iter_statements())
+    assert len(stmts) == 1
+    assert stmts[0].subj.name == 'lepirudin'
@@ -0,0 +1,68 @@
+import os
+import tempfile
+
+from indra.sources.grounding_cache import GroundingCache, _get_db_refs_key
+
+
+calls = []
+
+
+def _resolve(db_ns, db_id):
+    calls.append((db_ns, db_id))
+    return db_id.upper(), {db_ns: db_id}
+
+
+def test_resolve_hits_misses():
+    calls.clear()
+    cache = GroundingCache(maxsize=10)
+    name, db_refs = cache.resolve(_resolve, 'HGNC', 'kras', 'HGNC', 'kras')
+    assert name == 'KRAS'
+    assert db_refs == {'HGNC': 'kras'}
+    # Changing the returned value shouldn't affect the cached entry
+    db_refs['UP'] = 'P01116'
+    name, db_refs = cache.resolve(_resolve, 'HGNC', 'kras', 'HGNC', 'kras')
+    assert db_refs == {'HGNC': 'kras'}
+    assert calls == [('HGNC', 'kras')]
+    info = cache.cache_info()
+    assert info['hits'] == 1, info
+    assert info['misses'] == 1, info
+    assert info['size'] == 1, info
+
+
+def test_eviction():
+    calls.clear()
+    cache = GroundingCache(maxsize=2)
+    for db_id in ['a', 'b', 'a', 'c']:
+        cache.resolve(_resolve, 'X', db_id, 'X', db_id)
+    # b was the least recently used entry so it was evicted
+    assert len(cache) == 2
+    assert cache.cache_info()['evictions'] == 1
+    cache.resolve(_resolve, 'X', 'b', 'X', 'b')
+    assert calls == [('X', 'a'), ('X', 'b'), ('X', 'c'), ('X', 'b')]
+
+
+def test_no_caching():
+    calls.clear()
+    cache = GroundingCache(maxsize=0)
+    cache.resolve(_resolve, 'X', 'a', 'X', 'a')
+    cache.resolve(_resolve, 'X', 'a', 'X', 'a')
+    assert len(calls) == 2
+    assert len(cache) == 0
+
+
+def test_save_load():
+    calls.clear()
+    fname = os.path.join(tempfile.mkdtemp(), 'gnd_cache.pkl')
+    cache = GroundingCache(cache_file=fname)
+    cache.resolve(_resolve, 'X', 'a', 'X', 'a')
+    cache.save()
+    cache2 = GroundingCache(cache_file=fname)
+    assert len(cache2) == 1
+    assert cache2.resolve(_resolve, 'X', 'a', 'X', 'a') == ('A', {'X': 'a'})
+    assert len(calls) == 1
+
+
+def test_db_refs_key():
+    assert _get_db_refs_key({'UP': 'P12345'}) == ('UP', 'P12345')
+    assert _get_db_refs_key({'MESH': 'D1', 'CAS': '1-2-3'}) == \
+        (('CAS', 'MESH'), ('1-2-3', 'D1'))
@@ -1,8 +1,12 @@
+import json
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
 from indra.preassembler.grounding_mapper import default_mapper as gm
 from indra.preassembler.grounding_mapper import GroundingMapper
 from indra.preassembler.grounding_mapper.analysis import *
+from indra.preassembler.grounding_mapper import gilda
 from indra.preassembler.grounding_mapper.gilda import ground_statements, \
-    get_gilda_models, ground_statement
+    get_gilda_models, ground_statement, get_groundings
 from indra.statements import Agent, Phosphorylation, Complex, Inhibition, \
     Evidence, BoundCondition
 from indra.util import unicode_strs
@@ -308,6 +312,88 @@ def test_map_agent():
     assert mapped_ag.db_refs.get('FPLX') == 'ERK'
 
 
+def _make_mapping_stmts():
+    stmts = []
+    for idx in range(60):
+        txt = ['ERK1', 'p-ERK', 'NF-kappaB p65', 'xyz'][idx % 4]
+        bcs = [BoundCondition(Agent('x', db_refs={'TEXT': 'ERK1'}))] \
+            if idx % 3 == 0 else []
+        agent = Agent('a%d' % (idx % 5), db_refs={'TEXT': txt},
+                      bound_conditions=bcs)
+        stmts.append(Phosphorylation(Agent('b', db_refs={'TEXT': 'p-ERK'}),
+                                     agent))
+    return stmts
+
+
+def test_map_stmts_memoized():
+    g_map = {'ERK1': {'TEXT': 'ERK1', 'UP': 'P28482'},
+             'NF-kappaB p65': {'TEXT': 'NF-kappaB p65', 'UP': 'Q04206'}}
+    stmts = _make_mapping_stmts()
+    mapped_no_memo = GroundingMapper(g_map, agent_map=gm.agent_map,
+                                     memo_size=0).map_stmts(stmts)
+    mapper = GroundingMapper(g_map, agent_map=gm.agent_map)
+    mapped_memo = mapper.map_stmts(stmts)
+    assert [s.to_json() for s in mapped_memo] == \
+        [s.to_json() for s in mapped_no_memo]
+    assert mapper._agent_cache.cache_info()['hits'] > 0
+    # The input statements are not changed
+    assert stmts[0].sub.name == 'a0'
+    # Agents mapped based on the agent map are not shared between statements
+    assert mapped_memo[0].enz is not mapped_memo[1].enz
+
+
+def test_map_stmts_n_procs():
+    g_map = {'ERK1': {'TEXT': 'ERK1', 'UP': 'P28482'}}
+    stmts = _make_mapping_stmts()
+    mapper = GroundingMapper(g_map, agent_map=gm.agent_map,
+                             ignores=['xyz'])
+    mapped_serial = mapper.map_stmts(stmts)
+    mapped_parallel = mapper.map_stmts(stmts, n_procs=2, chunk_size=7)
+    assert len(mapped_serial) == 45
+    assert [s.to_json() for s in mapped_parallel] == \
+        [s.to_json() for s in mapped_serial]
+
+
+def test_disamb_text_prefetch(monkeypatch):
+    from indra.literature import pubmed_client
+    from indra.preassembler.grounding_mapper.disambiguate import DisambManager
+    requested = []
+
+    def get_metadata_for_ids(pmids, **kwargs):
+        requested.append(list(pmids))
+        return {pmid: {'abstract': 'Abstract of %s' % pmid}
+                for pmid in pmids if pmid != '3'}
+
+    def get_abstract(pmid, **kwargs):
+        assert False, 'Abstracts should be fetched in bulk'
+
+    monkeypatch.setattr(pubmed_client, 'get_metadata_for_ids',
+                        get_metadata_for_ids)
+    monkeypatch.setattr(pubmed_client, 'get_abstract', get_abstract)
+    stmts = [Phosphorylation(None, Agent('ER', db_refs={'TEXT': 'ER'}),
+                             evidence=[Evidence(pmid=str(idx % 3 + 1),
+                                                text='Sentence %d' % idx)])
+             for idx in range(30)]
+    dm = DisambManager()
+    dm.prefetch_texts(stmts)
+    assert requested == [['1', '2', '3']]
+    assert dm._get_text_for_grounding(stmts[0], 'ER') == 'Abstract of 1'
+    assert dm._get_text_for_grounding(stmts[1], 'ER') == 'Abstract of 2'
+    # There is no abstract for this paper so we fall back on the sentence
+    assert dm._get_text_for_grounding(stmts[2], 'ER') == 'Sentence 2'
+    assert len(requested) == 1
+    # The pmid attribute takes precedence over a different PMID in the text
+    # refs, both when prefetching and when getting the text
+    stmt = Phosphorylation(None, Agent('ER', db_refs={'TEXT': 'ER'}),
+                           evidence=[Evidence(pmid='4',
+                                              text_refs={'PMID': '5'},
+                                              text='Sentence')])
+    dm.prefetch_texts([stmt])
+    assert requested[1:] == [['4']]
+    assert dm._get_text_for_grounding(stmt, 'ER') == 'Abstract of 4'
+    assert stmt.evidence[0].text_refs == {'PMID': '5'}
+
+
 @pytest.mark.nonpublic
 def test_adeft_mapping():
     er1 = Agent('ER', db_refs={'TEXT': 'ER'})
@@ -547,3 +633,74 @@ def test_text_not_removed():
                                        'HGNC': '8941', 'EGID': '5265'})
     mapped_agent = gm.map_agent(agent, do_rename=True)
     assert mapped_agent.db_refs.get('TEXT') == 'PI', mapped_agent.db_refs
+
+
+class _StubGildaHandler(BaseHTTPRequestHandler):
+    """Ground texts of the form NS:ID like the Gilda web service does."""
+    requests = []
+
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        query = json.loads(self.rfile.read(
+            int(self.headers.get('content-length', 0))))
+        self.requests.append((self.path, query))
+        if self.path == '/ground_multi':
+            results = [self._ground(q['text']) for q in query]
+        else:
+            results = self._ground(query['text'])
+        body = json.dumps(results).encode('utf-8')
+        self.send_response(200)
+        self.send_header('content-type', 'application/json')
+        self.send_header('content-length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    @staticmethod
+    def _ground(txt):
+        if ':' not in txt:
+            return []
+        db, db_id = txt.split(':')
+        return [{'term': {'db': db, 'id': db_id, 'text': txt},
+                 'score': 1.0}]
+
+
+@pytest.fixture
+def stub_gilda(monkeypatch):
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _StubGildaHandler)
+    Thread(target=server.serve_forever, daemon=True).start()
+    monkeypatch.setattr(gilda, 'grounding_service_url',
+                        'http://127.0.0.1:%d/' % server.server_port)
+    monkeypatch.setattr(gilda, 'GILDA_BATCH_SIZE', 2)
+    gilda.gilda_cache.clear()
+    _StubGildaHandler.requests = []
+    yield _StubGildaHandler
+    gilda.gilda_cache.clear()
+    server.shutdown()
+
+
+def test_get_groundings_batch(stub_gilda):
+    texts = [('FPLX:MEK', None), ('HGNC:6877', 'x'), ('xyz', None),
+             ('FPLX:MEK', None), ('FPLX:ERK', None)]
+    groundings = get_groundings(texts)
+    assert [gr for gr, _ in groundings] == \
+        [{'FPLX': 'MEK'}, {'HGNC': '6877'}, {}, {'FPLX': 'MEK'},
+         {'FPLX': 'ERK'}]
+    assert groundings[1][1][0]['score'] == 1.0
+    # The four unique texts are sent in two batches
+    assert len(stub_gilda.requests) == 2
+    assert all(path == '/ground_multi' for path, _ in stub_gilda.requests)
+    # Groundings are now cached
+    get_groundings(texts[:2])
+    assert len(stub_gilda.requests) == 2
+
+
+def test_ground_statements_batch(stub_gilda):
+    stmts = [Phosphorylation(Agent('x', db_refs={'TEXT': 'FPLX:MEK'}),
+                             Agent('y', db_refs={'TEXT': 'FPLX:ERK'}))
+             for _ in range(5)]
+    grounded_stmts = ground_statements(stmts)
+    assert all(stmt.enz.db_refs['FPLX'] == 'MEK' and
+               stmt.sub.db_refs['FPLX'] == 'ERK' for stmt in grounded_stmts)
+    assert len(stub_gilda.requests) == 1
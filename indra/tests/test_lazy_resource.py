@@ -0,0 +1,51 @@
+import types
+from indra.resources import LazyResource, make_module_getattr
+
+
+def _make_module():
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return {'a': 1}, {1: 'a'}
+
+    module = types.ModuleType('lazy_test_module')
+    res = LazyResource(loader, ['name_to_id', 'id_to_name'],
+                       vars(module))
+    module.__getattr__ = make_module_getattr(module.__name__, res)
+    return module, res, calls
+
+
+def test_lazy_resource_load_once():
+    module, res, calls = _make_module()
+    assert not res.loaded
+    assert not calls
+    assert res.name_to_id == {'a': 1}
+    assert res.id_to_name == {1: 'a'}
+    assert res.loaded
+    assert len(calls) == 1
+
+
+def test_lazy_resource_module_getattr():
+    module, res, calls = _make_module()
+    assert 'id_to_name' not in vars(module)
+    assert module.id_to_name == {1: 'a'}
+    # After loading, the tables are regular attributes of the module
+    assert vars(module)['name_to_id'] == {'a': 1}
+    assert module.name_to_id is res.name_to_id
+    assert len(calls) == 1
+    try:
+        module.xyz
+        assert False, 'AttributeError expected'
+    except AttributeError:
+        pass
+
+
+def test_lazy_resource_single_table():
+    res = LazyResource(lambda: {'x': 'y'}, ['table'])
+    assert res.table == {'x': 'y'}
+    try:
+        res.other
+        assert False, 'AttributeError expected'
+    except AttributeError:
+        pass
@@ -1,5 +1,6 @@
 from __future__ import absolute_import, print_function, unicode_literals
 from builtins import dict, str
+import tempfile
 from os.path import join, dirname
 
 from indra.statements import *
@@ -7,6 +8,7 @@ from indra.sources.medscan.processor import *
 from indra.sources.medscan.processor import _urn_to_db_refs
 from indra.sources.medscan.api import *
 from indra.sources.medscan.processor import ProteinSiteInfo
+from indra.sources.medscan.processor import index_csxml_file
 
 # Path to the Medscan test/dummy data folder
 path_this = os.path.dirname(os.path.abspath(__file__))
@@ -371,6 +373,19 @@ def test_handle_duplicates():
     assert len(statements) == 1
 
 
+def test_iter_statements():
+    fname = os.path.join(data_folder, 'test_duplicate_SVO.csxml')
+    # Statements extracted up front are also available through iteration
+    mp = process_file(fname, None)
+    assert len(list(mp.iter_statements())) == 1
+    # Lazily extracted statements populate the statements list once
+    mp = process_file(fname, None, lazy=True)
+    assert not mp.statements
+    assert len(list(mp.iter_statements())) == 1
+    assert len(mp.statements) == 1
+    assert len(list(mp.iter_statements())) == 1
+
+
 def test_modification_site():
     # Can we detect the modification site and residue in a modification
     # event?
@@ -393,3 +408,59 @@ def test_site_text_parser():
     assert sites[0].position == '10'
     assert sites[1].residue == 'S'
     assert sites[1].position == '20'
+
+
+def _make_multi_doc_file():
+    # Put the documents of all test files into a single file, including
+    # some repeated ones which should be skipped
+    fnames = sorted(os.listdir(data_folder))
+    docs = []
+    for fname in fnames + fnames[:3]:
+        with open(os.path.join(data_folder, fname), 'rb') as fh:
+            content = fh.read()
+        start = content.index(b'<doc')
+        end = content.rindex(b'</doc>') + len(b'</doc>')
+        docs.append(content[start:end])
+    multi_fname = os.path.join(tempfile.mkdtemp(), 'multi.csxml')
+    with open(multi_fname, 'wb') as fh:
+        fh.write(b'<?xml version="1.0"?>\n<batch>\n')
+        fh.write(b'\n'.join(docs))
+        fh.write(b'\n</batch>\n')
+    return multi_fname, len(docs)
+
+
+def test_index_csxml_file():
+    fname, num_docs = _make_multi_doc_file()
+    doc_index, end_offset = index_csxml_file(fname, chunk_size=1000)
+    assert len(doc_index) == num_docs
+    assert doc_index == index_csxml_file(fname)[0]
+    with open(fname, 'rb') as fh:
+        content = fh.read()
+    for offset, pmid in doc_index:
+        assert content[offset:].startswith(b'<doc uri="info:pmid/%d"' % pmid)
+    assert content[end_offset:].startswith(b'</batch>')
+
+
+def test_process_file_parallel():
+    fname, _ = _make_multi_doc_file()
+    stmts = process_file(fname).statements
+    assert stmts
+    stmts_par = process_file(fname, n_procs=2).statements
+    assert [s.get_hash() for s in stmts] == \
+        [s.get_hash() for s in stmts_par]
+
+    stmts = process_file(fname, interval=(2, 9)).statements
+    stmts_par = process_file(fname, interval=(2, 9), n_procs=2).statements
+    assert [s.get_hash() for s in stmts] == \
+        [s.get_hash() for s in stmts_par]
+
+
+def test_process_file_parallel_no_documents():
+    fname, num_docs = _make_multi_doc_file()
+    mp = process_file(fname, interval=(num_docs, None), n_procs=2)
+    assert mp.statements == []
+    assert list(mp.iter_statements()) == []
+    empty_fname = tempfile.mktemp('.csxml')
+    with open(empty_fname, 'wb') as fh:
+        fh.write(b'<?xml version="1.0"?>\n<batch>\n</batch>\n')
+    assert process_file(empty_fname, n_procs=2).statements == []
@@ -1,3 +1,4 @@
+import tempfile
 from indra.databases import mesh_client
 
 
@@ -128,4 +129,66 @@ def test_supplementary_to_primary():
 
 def test_supplementary_tree_number():
     tree_numbers = mesh_client.get_mesh_tree_numbers('C009879')
-    assert 'D25.720.327.782' in tree_numbers
\ No newline at end of file
+    assert 'D25.720.327.782' in tree_numbers
+
+
+def _make_tree_index():
+    return mesh_client.MeshTreeIndex(
+        {'D000001': ['D12'], 'D000002': ['D12.776'],
+         'D000003': ['D12.776.157', 'C04.557'], 'D000004': ['C04'],
+         'D000005': ['D08.811']},
+        {'C000001': ['D000003', 'D000005']})
+
+
+def test_tree_index_prefixes():
+    index = _make_tree_index()
+    assert index.has_tree_prefix('D000003', 'D12')
+    assert index.has_tree_prefix('D000003', 'C')
+    assert index.has_tree_prefix('D000003', 'C04.557')
+    assert not index.has_tree_prefix('D000003', 'D08')
+    # Prefixes that don't end at a level of the hierarchy
+    assert index.has_tree_prefix('D000003', 'D12.77')
+    assert not index.has_tree_prefix('D000003', 'D12.8')
+    # Supplementary concepts get the tree numbers of their primary terms
+    assert index.has_tree_prefix('C000001', 'D08')
+    assert index.has_tree_prefix('C000001', 'D12.776')
+    assert sorted(index.get_tree_numbers('C000001')) == \
+        ['C04.557', 'D08.811', 'D12.776.157']
+    assert not index.has_tree_prefix('D999999', 'D')
+    assert not index.has_tree_prefix('C999999', 'D')
+    # IDs that are not in the tables are not stored in the index
+    n_entries = len(index._entries)
+    assert index.get_tree_numbers('D999998') == []
+    assert len(index._entries) == n_entries
+
+
+def test_tree_index_isa():
+    index = _make_tree_index()
+    assert index.isa('D000003', 'D000002')
+    assert index.isa('D000003', 'D000001')
+    assert index.isa('D000003', 'D000004')
+    assert index.isa('D000003', 'D000003')
+    assert not index.isa('D000002', 'D000003')
+    assert not index.isa('D000005', 'D000001')
+    assert index.isa('C000001', 'D000002')
+    assert index.get_ancestors('D000003') == {'D000001', 'D000002',
+                                              'D000004'}
+    assert index.get_ancestors('C000001') == {'D000001', 'D000002',
+                                              'D000003', 'D000004',
+                                              'D000005'}
+
+
+def test_web_cache(monkeypatch):
+    calls = []
+
+    @mesh_client._web_cached
+    def query(arg):
+        calls.append(arg)
+        return {'results': arg} if arg != 'missing' else None
+
+    monkeypatch.setenv('INDRA_MESH_WEB_CACHE_DIR', tempfile.mkdtemp())
+    assert query('x') == {'results': 'x'}
+    assert query('x') == {'results': 'x'}
+    assert query('missing') is None
+    assert query('missing') is None
+    assert calls == ['x', 'missing', 'missing']
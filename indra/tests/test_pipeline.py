@@ -1,7 +1,11 @@
+import tempfile
 import unittest
-from indra.pipeline import AssemblyPipeline, RunnableArgument
+from indra.pipeline import AssemblyPipeline, RunnableArgument, \
+    register_pipeline
+from indra.pipeline.checkpoint import CheckpointStore
 from indra.pipeline.pipeline import jsonify_arg_input
-from indra.tests.test_assemble_corpus import st1, st2, st3, st4
+from indra.tests.test_assemble_corpus import st1, st2, st3, st4, st10, \
+    st11, st12, st13
 from indra.tools.assemble_corpus import *
 from indra.belief import BeliefScorer
 from indra.statements import Activation
@@ -20,6 +24,136 @@ path_this = os.path.dirname(os.path.abspath(__file__))
 test_json = os.path.join(path_this, 'pipeline_test.json')
 
 
+checkpoint_calls = []
+
+
+@register_pipeline
+def count_checkpoint_calls(stmts_in, tag=None, extra=None):
+    checkpoint_calls.append(tag)
+    return stmts_in[1:]
+
+
+def _checkpoint_steps(last_tag):
+    return [{'function': 'filter_no_hypothesis'},
+            {'function': 'count_checkpoint_calls', 'kwargs': {'tag': 'a'}},
+            {'function': 'count_checkpoint_calls',
+             'kwargs': {'tag': last_tag}}]
+
+
+def test_pipeline_checkpoints():
+    cache_dir = tempfile.mkdtemp()
+    checkpoint_calls.clear()
+    ap = AssemblyPipeline(_checkpoint_steps('b'), checkpoints=cache_dir)
+    assert isinstance(ap.checkpoints, CheckpointStore)
+    res = ap.run(stmts)
+    assert len(res) == len(stmts) - 2
+    assert checkpoint_calls == ['a', 'b']
+    assert len(ap.checkpoints.get_entries()) == 3
+    # Running again, all steps are loaded from the checkpoints
+    res2 = ap.run(stmts)
+    assert [s.uuid for s in res2] == [s.uuid for s in res]
+    assert checkpoint_calls == ['a', 'b']
+    # Changing the last step only runs the last step
+    ap = AssemblyPipeline(_checkpoint_steps('c'), checkpoints=cache_dir)
+    ap.run(stmts)
+    assert checkpoint_calls == ['a', 'b', 'c']
+    # Different input statements don't hit the checkpoints
+    ap.run(stmts[:3])
+    assert checkpoint_calls == ['a', 'b', 'c', 'a', 'c']
+    # Steps that use the kwargs of the pipeline aren't checkpointed
+    keys = ap.get_step_keys(stmts, extra='x')
+    assert keys[0] is not None and keys[1:] == [None, None]
+    # unless the kwargs are given explicitly in the steps
+    assert None not in ap.get_step_keys(stmts, tag='x')
+
+
+def test_pipeline_report():
+    profile_dir = tempfile.mkdtemp()
+    entries = []
+    ap = AssemblyPipeline(_checkpoint_steps('b'), profile_dir=profile_dir,
+                          report_callback=entries.append)
+    ap.run(stmts)
+    report = ap.report.to_json()
+    assert [step['function'] for step in report['steps']] == \
+        ['filter_no_hypothesis', 'count_checkpoint_calls',
+         'count_checkpoint_calls']
+    assert entries == report['steps']
+    step = report['steps'][1]
+    assert step['status'] == 'run'
+    assert step['num_statements_in'] == len(stmts)
+    assert step['num_statements_out'] == len(stmts) - 1
+    assert step['num_evidence_in'] == sum(len(s.evidence) for s in stmts)
+    assert step['wall_time'] >= 0 and step['cpu_time'] >= 0
+    assert step['peak_rss_increase'] is None or \
+        step['peak_rss_increase'] >= 0
+    assert os.path.exists(step['profile'])
+    assert report['wall_time'] >= step['wall_time']
+    assert str(ap.report)
+    # Steps loaded from checkpoints are reported as such
+    ap.checkpoints = CheckpointStore(tempfile.mkdtemp())
+    ap.run(stmts)
+    ap.run(stmts)
+    assert {step['status'] for step in ap.report.steps} == {'checkpoint'}
+
+
+def test_fused_steps():
+    steps = [{'function': 'filter_no_hypothesis'},
+             {'function': 'filter_grounded_only'},
+             {'function': 'strip_agent_context'},
+             {'function': 'filter_direct'},
+             {'function': 'count_checkpoint_calls', 'kwargs': {'tag': 'f'}},
+             {'function': 'filter_by_type',
+              'args': [{'stmt_type': 'Phosphorylation'}]},
+             {'function': 'filter_genes_only', 'kwargs': {'save': None}}]
+    all_stmts = [st1, st2, st3, st4, st10, st11, st12, st13]
+    ap = AssemblyPipeline(steps)
+    assert ap.can_fuse(steps[0]) and ap.can_fuse(steps[2])
+    assert not ap.can_fuse(steps[4])
+    assert not ap.can_fuse({'function': 'filter_genes_only',
+                            'kwargs': {'save': 'x.pkl'}})
+    expected = ap.run(all_stmts)
+    ap = AssemblyPipeline(steps, fuse_steps=True)
+    res = ap.run(all_stmts)
+    assert [s.get_hash() for s in res] == [s.get_hash() for s in expected]
+    # The first four steps and the last two steps are run together
+    assert [step['function'] for step in ap.report.steps] == \
+        ['filter_no_hypothesis+filter_grounded_only+strip_agent_context+'
+         'filter_direct', 'count_checkpoint_calls',
+         'filter_by_type+filter_genes_only']
+    assert ap.report.steps[0]['num_statements_out'] == 4
+
+
+def test_pipeline_n_procs():
+    steps = [{'function': 'filter_genes_only'},
+             {'function': 'strip_agent_context', 'kwargs': {'n_procs': 1}},
+             {'function': 'count_checkpoint_calls'}]
+    ap = AssemblyPipeline(steps, n_procs=2)
+    _, _, kwargs = ap.get_function_arguments(steps[0])
+    assert kwargs == {'n_procs': 2}
+    assert ap.get_function_arguments(steps[1])[2] == {'n_procs': 1}
+    assert ap.get_function_arguments(steps[2])[2] == {}
+    res = ap.run(stmts)
+    expected = AssemblyPipeline(steps).run(stmts)
+    assert [s.get_hash() for s in res] == [s.get_hash() for s in expected]
+    # The number of processes doesn't prevent checkpointing
+    assert None not in ap.get_step_keys(stmts)
+
+
+def test_checkpoint_store_eviction():
+    store = CheckpointStore(tempfile.mkdtemp(), max_entries=2)
+    for key in ['a', 'b', 'c']:
+        store.put(key, [key])
+    assert 'a' not in store
+    assert store.get('c') == ['c']
+    store = CheckpointStore(tempfile.mkdtemp(), max_size=1)
+    store.put('a', [1])
+    store.put('b', [2])
+    # The result just stored is kept even if it exceeds the limit
+    assert 'a' not in store and 'b' in store
+    store.clear()
+    assert not store.get_entries()
+
+
 def test_running_pipeline():
     # From json file
     ap = AssemblyPipeline.from_json_file(test_json)
@@ -1,5 +1,7 @@
 from __future__ import absolute_import, print_function, unicode_literals
 from builtins import dict, str
+import os
+import tempfile
 import pytest
 from indra.literature import pmc_client
 from indra.util import unicode_strs
@@ -124,3 +126,60 @@ def test_get_title():
     assert title == (
         'BRAF vs RAS oncogenes: are mutations of the same pathway equal? '
         'differential signalling and therapeutic implications'), title
+
+
+def test_extract_paragraphs():
+    xml_str = (
+        '<article xmlns="http://jats.nlm.nih.gov"><front><article-meta>'
+        '<title-group><article-title>A <italic>title</italic></article-title>'
+        '</title-group><abstract><p>Abstract <tex-math>x^2</tex-math>text.'
+        '</p></abstract></article-meta></front><body><sec><title>Intro'
+        '</title><p>First <fig><caption><p>Fig caption</p></caption>'
+        '<graphic/></fig>dropped</p><p>Outer<list><list-item><p>inner 1</p>'
+        '</list-item><list-item><p>inner 2</p></list-item></list> tail</p>'
+        '<boxed-text position="float"><p>Box</p></boxed-text></sec></body>'
+        '<sub-article><body><p>Sub</p><boxed-text position="float"><p>Sub '
+        'box</p></boxed-text></body></sub-article></article>')
+    paragraphs = pmc_client.extract_paragraphs(xml_str)
+    assert paragraphs == ['A  title', 'Abstract', 'Intro', 'First',
+                          'Fig caption', 'Outer  tail', 'inner 2', 'inner 1',
+                          'Box', 'Sub'], paragraphs
+
+
+def test_extract_paragraphs_nxml():
+    fname = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                         'pmc_cont_example.nxml')
+    with open(fname, 'r') as fh:
+        xml_str = fh.read()
+    paragraphs = pmc_client.extract_paragraphs(xml_str)
+    assert len(paragraphs) == 8
+    assert paragraphs[0].strip() == \
+        'This is a test, containing no meaningful content.'
+    assert paragraphs[2] == '1. Introduction'
+    assert paragraphs[7].startswith('This should be enough to stand in')
+
+
+def test_get_xml_many_cache(monkeypatch):
+    downloaded = []
+
+    def download_xml(pmc_id):
+        downloaded.append(pmc_id)
+        return None if pmc_id == '3' else '<article>%s</article>' % pmc_id
+
+    monkeypatch.setattr(pmc_client, '_download_xml', download_xml)
+    cache = pmc_client.XmlCache(tempfile.mkdtemp())
+    xmls = pmc_client.get_xml_many(['PMC1', '2', '3'], cache=cache)
+    assert xmls == {'PMC1': '<article>1</article>',
+                    '2': '<article>2</article>', '3': None}
+    assert sorted(downloaded) == ['1', '2', '3']
+    # Only the article that couldn't be downloaded is downloaded again
+    xmls = pmc_client.get_xml_many(['1', 'PMC2', '3'], cache=cache)
+    assert xmls['PMC2'] == '<article>2</article>'
+    assert sorted(downloaded) == ['1', '2', '3', '3']
+    assert pmc_client.get_xml('PMC1', cache=cache) == '<article>1</article>'
+    # Identical content is stored once
+    cache.put('4', '<article>1</article>')
+    objects = [fname for _, _, fnames in
+               os.walk(os.path.join(cache.cache_dir, 'objects'))
+               for fname in fnames]
+    assert len(objects) == 2
@@ -1,4 +1,8 @@
 import time
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
 from indra.literature import pubmed_client
 import pytest
 
@@ -402,3 +406,90 @@ def test_get_publication_types():
     assert len(pub_types) > 0
     assert all(isinstance(pt, str) for pt in pub_types)
     assert "Retracted Publication" in pub_types
+
+
+_STUB_ARTICLE = """<PubmedArticle><MedlineCitation><PMID>{0}</PMID>
+<Article><Journal><ISSN IssnType="Print">1234-5678</ISSN>
+<JournalIssue><Volume>1</Volume><Issue>2</Issue>
+<PubDate><Year>2020</Year></PubDate></JournalIssue>
+<Title>Journal</Title><ISOAbbreviation>J</ISOAbbreviation></Journal>
+<ArticleTitle>Title {0}</ArticleTitle>
+<Abstract><AbstractText>Abstract {0}</AbstractText></Abstract>
+<AuthorList><Author><LastName>Smith</LastName></Author></AuthorList></Article>
+<MedlineJournalInfo><NlmUniqueID>1</NlmUniqueID></MedlineJournalInfo>
+</MedlineCitation><PubmedData><History><PubMedPubDate PubStatus="pubmed">
+<Year>2020</Year><Month>1</Month><Day>2</Day></PubMedPubDate></History>
+<ArticleIdList><ArticleId IdType="pubmed">{0}</ArticleId></ArticleIdList>
+</PubmedData></PubmedArticle>"""
+
+
+class _StubEfetchHandler(BaseHTTPRequestHandler):
+    """Serve made-up PubMed articles for the requested PMIDs."""
+    requested = []
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        pmids = parse_qs(urlparse(self.path).query)['id']
+        self.requested.append(pmids)
+        body = ('<PubmedArticleSet>%s</PubmedArticleSet>'
+                % ''.join(_STUB_ARTICLE.format(pmid) for pmid in pmids
+                          if pmid != 'missing')).encode('utf-8')
+        self.send_response(200)
+        self.send_header('content-type', 'text/xml')
+        self.send_header('content-length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def stub_efetch(monkeypatch):
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _StubEfetchHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    monkeypatch.setattr(pubmed_client, 'pubmed_fetch',
+                        'http://127.0.0.1:%d/efetch.fcgi' % server.server_port)
+    _StubEfetchHandler.requested = []
+    yield _StubEfetchHandler
+    server.shutdown()
+
+
+def test_get_metadata_for_all_ids_stub(stub_efetch):
+    pmids = [str(i) for i in range(450)] + ['missing', '3']
+    metadata = pubmed_client.get_metadata_for_all_ids(
+        pmids, get_abstracts=True, max_workers=3, cache=False)
+    # Duplicate PMIDs are requested once, in batches of at most 200
+    assert sorted(len(ids) for ids in stub_efetch.requested) == \
+        [51, 200, 200]
+    assert list(metadata) == [str(i) for i in range(450)]
+    assert metadata['123']['title'] == 'Title 123'
+    assert metadata['123']['abstract'] == 'Abstract 123'
+    assert metadata['123']['publication_date'] == \
+        {'year': 2020, 'month': 1, 'day': 2}
+
+
+def test_get_metadata_for_all_ids_cache(stub_efetch):
+    cache = pubmed_client.MetadataCache(
+        tempfile.mkdtemp() + '/pubmed_metadata.sqlite')
+    metadata = pubmed_client.get_metadata_for_all_ids(['1', '2'],
+                                                      cache=cache)
+    assert set(metadata) == {'1', '2'}
+    # Only the PMID that wasn't requested before is requested
+    metadata = pubmed_client.get_metadata_for_all_ids(['1', '2', '3'],
+                                                      cache=cache)
+    assert stub_efetch.requested == [['1', '2'], ['3']]
+    assert metadata['1']['title'] == 'Title 1'
+    assert list(metadata) == ['1', '2', '3']
+    # Metadata obtained with different options is cached separately
+    metadata = pubmed_client.get_metadata_for_all_ids(['1'], cache=cache,
+                                                      get_abstracts=True)
+    assert stub_efetch.requested[-1] == ['1']
+    assert metadata['1']['abstract'] == 'Abstract 1'
+
+
+def test_rate_limiter():
+    limiter = pubmed_client.RateLimiter(20)
+    start = time.monotonic()
+    for _ in range(11):
+        limiter.acquire()
+    assert time.monotonic() - start >= 0.45
@@ -0,0 +1,109 @@
+import os
+import pickle
+import tempfile
+from indra.resources import LazyResource
+from indra.resources import resource_cache
+from indra.resources.resource_cache import ResourceCache, CompiledTable
+
+
+def _make_source(content):
+    fname = os.path.join(tempfile.mkdtemp(), 'source.tsv')
+    with open(fname, 'w') as fh:
+        fh.write(content)
+    return fname
+
+
+def _read_source(fname, calls):
+    calls.append(fname)
+    name_to_id = {}
+    id_to_names = {}
+    with open(fname, 'r') as fh:
+        for line in fh:
+            name, db_id = line.strip().split('\t')
+            name_to_id[name] = db_id
+            id_to_names.setdefault(int(db_id), []).append(name)
+    return name_to_id, id_to_names, sorted(name_to_id)
+
+
+def test_compile_tables():
+    calls = []
+    source = _make_source('a\t1\nb\t2\nc\t1\n')
+    cache = ResourceCache(tempfile.mkdtemp())
+    names = ['name_to_id', 'id_to_names', 'all_names']
+    name_to_id, id_to_names, all_names = \
+        cache.get_tables('test', [source], names,
+                         lambda: _read_source(source, calls))
+    assert isinstance(name_to_id, CompiledTable)
+    assert name_to_id['a'] == '1'
+    assert name_to_id.get('x') is None
+    assert 'b' in name_to_id
+    assert len(name_to_id) == 3
+    assert list(name_to_id) == ['a', 'b', 'c']
+    assert dict(name_to_id.items()) == {'a': '1', 'b': '2', 'c': '1'}
+    # Non-string keys and values are supported
+    assert id_to_names[1] == ['a', 'c']
+    assert 3 not in id_to_names
+    # Tables that aren't dicts are returned as is
+    assert all_names == ['a', 'b', 'c']
+    # Compiled tables can be pickled, e.g., to be sent to other processes
+    assert pickle.loads(pickle.dumps(name_to_id))['b'] == '2'
+
+    # The second time around, the compiled file is used
+    cache.get_tables('test', [source], names,
+                     lambda: _read_source(source, calls))
+    assert len(calls) == 1
+
+    # If the source changes, the file is compiled again
+    with open(source, 'a') as fh:
+        fh.write('d\t3\n')
+    name_to_id, _, _ = cache.get_tables('test', [source], names,
+                                        lambda: _read_source(source, calls))
+    assert len(calls) == 2
+    assert name_to_id['d'] == '3'
+
+
+def test_compile_tables_stats(monkeypatch):
+    calls = []
+    source = _make_source('a\t1\n')
+    cache = ResourceCache(tempfile.mkdtemp())
+    names = ['name_to_id', 'id_to_names', 'all_names']
+    cache.get_tables('test', [source], names,
+                     lambda: _read_source(source, calls))
+    checksums = []
+    orig_get_checksum = resource_cache.get_checksum
+
+    def get_checksum(sources):
+        checksums.append(sources)
+        return orig_get_checksum(sources)
+
+    monkeypatch.setattr(resource_cache, 'get_checksum', get_checksum)
+    # The checksum isn't computed while the source is unchanged
+    cache.get_tables('test', [source], names,
+                     lambda: _read_source(source, calls))
+    assert not checksums
+    # If the source is touched, the checksum is computed but the file isn't
+    # compiled again, and the new modification time is stored
+    stat = os.stat(source)
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    name_to_id, _, _ = cache.get_tables('test', [source], names,
+                                        lambda: _read_source(source, calls))
+    assert len(checksums) == 1
+    assert len(calls) == 1
+    assert name_to_id['a'] == '1'
+    cache.get_tables('test', [source], names,
+                     lambda: _read_source(source, calls))
+    assert len(checksums) == 1
+
+
+def test_lazy_resource_cache(monkeypatch):
+    calls = []
+    source = _make_source('a\t1\n')
+    cache_dir = tempfile.mkdtemp()
+    monkeypatch.setenv('INDRA_RESOURCE_CACHE_DIR', cache_dir)
+    res = LazyResource(lambda: _read_source(source, calls),
+                       ['name_to_id', 'id_to_names', 'all_names'],
+                       {'__name__': 'indra.databases.test_client'},
+                       sources=[source])
+    assert res.name_to_id['a'] == '1'
+    assert os.path.exists(os.path.join(
+        cache_dir, 'test_client.name_to_id.sqlite'))
@@ -1,4 +1,6 @@
+import os
 import json
+import time
 from datetime import datetime
 from copy import deepcopy
 import pytest
@@ -154,6 +156,70 @@ def test_filter_uuid_list():
     assert len(st_out) == 1
 
 
+def test_indexed_corpus():
+    res = _call_api('post', 'preassembly/index_statements',
+                    json={'statements': stmts_to_json([st1, st2, st4])})
+    corpus_id = json.loads(res.get_data())['corpus_id']
+    route = 'preassembly/filter_gene_list'
+    res = _call_api('post', route, json={'corpus_id': corpus_id,
+                                         'gene_list': ['a', 'b'],
+                                         'policy': 'all'})
+    st_out = stmts_from_json(json.loads(res.get_data())['statements'])
+    assert [st.uuid for st in st_out] == [st1.uuid]
+    route = 'preassembly/filter_uuid_list'
+    res = _call_api('post', route, json={'corpus_id': corpus_id,
+                                         'uuids': [st1.uuid]})
+    st_out = stmts_from_json(json.loads(res.get_data())['statements'])
+    assert [st.uuid for st in st_out] == [st2.uuid, st4.uuid]
+
+
+def test_preassembly_jobs():
+    route = 'preassembly/filter_grounded_only'
+    req_json = {'statements': stmts_to_json([st1, st5, st6]),
+                'async': True}
+    res = _call_api('post', route, json=req_json)
+    job_id = json.loads(res.get_data())['job_id']
+    for _ in range(100):
+        res = _call_api('get', 'preassembly/jobs/%s' % job_id)
+        status = json.loads(res.get_data())['status']
+        if status != 'running':
+            break
+        time.sleep(0.1)
+    assert status == 'done', status
+    res = _call_api('get', 'preassembly/jobs/%s/result' % job_id)
+    st_out = stmts_from_json(json.loads(res.get_data())['statements'])
+    assert len(st_out) == 2
+    # The same request without async returns the result of the same job
+    req_json.pop('async')
+    res = _call_api('post', route, json=req_json)
+    st_out2 = stmts_from_json(json.loads(res.get_data())['statements'])
+    assert [st.uuid for st in st_out2] == [st.uuid for st in st_out]
+
+
+def test_preassembly_jobs_side_effects(tmpdir):
+    # Each request to dump statements writes the file again
+    route = 'preassembly/dump_statements'
+    fname = str(tmpdir.join('stmts.pkl'))
+    req_json = {'statements': stmts_to_json([st1]), 'fname': fname}
+    _call_api('post', route, json=req_json)
+    assert path.exists(fname)
+    os.remove(fname)
+    _call_api('post', route, json=req_json)
+    assert path.exists(fname)
+
+
+def test_preassembly_jobs_pipeline_side_effects(tmpdir):
+    # Pipeline steps saving their results are run again for each request
+    fname = str(tmpdir.join('stmts.pkl'))
+    p = [{'function': 'filter_grounded_only', 'kwargs': {'save': fname}}]
+    req_json = {'statements': stmts_to_json([st1]), 'pipeline': p}
+    _call_api('post', 'preassembly/pipeline', json=req_json)
+    assert path.exists(fname)
+    os.remove(fname)
+    _call_api('post', 'preassembly/pipeline', json=req_json)
+    assert path.exists(fname)
+
+
 def test_filter_genes_only():
     route = 'preassembly/filter_genes_only'
     st_out = _post_stmts_preassembly([st1, st5], route)
@@ -0,0 +1,176 @@
+import os
+import sys
+import types
+import pickle
+import tempfile
+import multiprocessing
+from indra.resources import LazyResource, make_module_getattr
+from indra.ontology import IndraOntology
+from indra.util.shared_tables import SharedTable, SharedResources, \
+    share_tables, share_resources, install_shared_resources
+
+
+def _lookup(args):
+    table, key = args
+    return table.get(key)
+
+
+def test_shared_table():
+    table = {'HGNC:1': 'A1BG', ('CHEBI', 'CHEBI:15996'): ['GTP'], 3: None}
+    table.update({'k%d' % i: 'v%d' % i for i in range(1000)})
+    shared = SharedTable.create(table,
+                                os.path.join(tempfile.mkdtemp(), 'table'))
+    try:
+        assert shared['HGNC:1'] == 'A1BG'
+        assert shared[('CHEBI', 'CHEBI:15996')] == ['GTP']
+        assert shared[3] is None
+        assert 3 in shared
+        assert 'x' not in shared
+        assert shared.get('x') is None
+        assert len(shared) == len(table)
+        assert list(shared) == list(table)
+        assert dict(shared.items()) == table
+        assert shared.copy() == table
+        assert pickle.loads(pickle.dumps(shared))['k999'] == 'v999'
+    finally:
+        shared.unlink()
+    assert not os.path.exists(shared.path)
+
+
+def test_shared_table_empty():
+    shared = SharedTable.create({})
+    try:
+        assert len(shared) == 0
+        assert 'a' not in shared
+        assert list(shared) == []
+    finally:
+        shared.unlink()
+
+
+def test_shared_table_worker():
+    shared = SharedTable.create({'a': '1', 'b': '2'})
+    try:
+        ctx = multiprocessing.get_context('spawn')
+        with ctx.Pool(2) as pool:
+            res = pool.map(_lookup, [(shared, k) for k in ['a', 'b', 'c']])
+        assert res == ['1', '2', None]
+    finally:
+        shared.unlink()
+
+
+def test_install_shared_resources():
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return {'a': 1}, ['a']
+
+    module = types.ModuleType('shared_test_module')
+    res = LazyResource(loader, ['name_to_id', 'all_names'], vars(module))
+    module.__getattr__ = make_module_getattr(module.__name__, res)
+    module.res = res
+    tables = share_tables({'name_to_id': {'a': 1}, 'all_names': ['a']},
+                          tempfile.mkdtemp())
+    assert isinstance(tables['name_to_id'], SharedTable)
+    assert tables['all_names'] == ['a']
+    with SharedResources([(module.__name__, 'res', tables, None)]) as \
+            shared:
+        sys.modules[module.__name__] = module
+        try:
+            install_shared_resources(shared)
+        finally:
+            sys.modules.pop(module.__name__)
+        assert res.loaded
+        assert module.name_to_id is tables['name_to_id']
+        assert module.name_to_id['a'] == 1
+        assert not calls
+    assert not os.path.exists(tables['name_to_id'].path)
+
+
+def test_install_shared_resources_partial():
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return {'a': 1}, ['a']
+
+    module = types.ModuleType('shared_test_module')
+    res = LazyResource(loader, ['name_to_id', 'all_names'], vars(module))
+    module.__getattr__ = make_module_getattr(module.__name__, res)
+    module.res = res
+    # Only the dict table is shared, the list is built when it's used
+    tables = share_tables({'name_to_id': {'a': 1}}, tempfile.mkdtemp())
+    with SharedResources([(module.__name__, 'res', tables, None)]) as \
+            shared:
+        sys.modules[module.__name__] = module
+        try:
+            install_shared_resources(shared)
+        finally:
+            sys.modules.pop(module.__name__)
+        assert not res.loaded
+        assert module.name_to_id is tables['name_to_id']
+        assert not calls
+        assert module.all_names == ['a']
+        assert calls == [1]
+        assert res.loaded
+        assert module.name_to_id is tables['name_to_id']
+
+
+def test_share_resources_rest_tables(monkeypatch):
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return {'a': 1}, ['a']
+
+    module = types.ModuleType('shared_test_module')
+    res = LazyResource(loader, ['name_to_id', 'all_names'], vars(module),
+                       sources=[__file__])
+    module.__getattr__ = make_module_getattr(module.__name__, res)
+    module.res = res
+    monkeypatch.setitem(sys.modules, module.__name__, module)
+    with share_resources([module.__name__], tempfile.mkdtemp()) as shared:
+        (_, _, tables, rest_path), = shared.resources
+        assert isinstance(tables['name_to_id'], SharedTable)
+        assert os.path.exists(rest_path)
+        # A fresh module, as in a worker process
+        module = types.ModuleType(module.__name__)
+        res = LazyResource(loader, ['name_to_id', 'all_names'], vars(module),
+                           sources=[__file__])
+        module.__getattr__ = make_module_getattr(module.__name__, res)
+        module.res = res
+        monkeypatch.setitem(sys.modules, module.__name__, module)
+        install_shared_resources(shared)
+        assert not res.loaded
+        assert module.all_names == ['a']
+        assert res.loaded
+        assert module.name_to_id is tables['name_to_id']
+        # The loader was only run to share the tables
+        assert calls == [1]
+    assert not os.path.exists(rest_path)
+    assert not os.path.exists(tables['name_to_id'].path)
+
+
+class _TestOntology(IndraOntology):
+    def initialize(self):
+        self.add_node('HGNC:1', name='A1BG')
+        self.add_node('FPLX:X', name='X')
+        self.add_edge('HGNC:1', 'FPLX:X', type='isa')
+        self._initialized = True
+
+
+def test_ontology_tables():
+    ontology = _TestOntology()
+    tables = share_tables(ontology.get_tables(), tempfile.mkdtemp())
+    assert isinstance(tables['successors'], SharedTable)
+    shared_ontology = _TestOntology()
+    shared_ontology.set_tables(tables)
+    try:
+        assert shared_ontology.isa('HGNC', '1', 'FPLX', 'X')
+        assert not shared_ontology.isa('FPLX', 'X', 'HGNC', '1')
+        assert shared_ontology.get_children('FPLX', 'X') == [('HGNC', '1')]
+        assert shared_ontology.get_name('HGNC', '1') == 'A1BG'
+        assert set(shared_ontology.nodes) == {'HGNC:1', 'FPLX:X'}
+    finally:
+        for table in tables.values():
+            table.unlink()
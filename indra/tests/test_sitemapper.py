@@ -1,7 +1,8 @@
 from protmapper import MappedSite
 from indra.statements import *
 from indra.util import unicode_strs
-from indra.preassembler.sitemapper import default_mapper as sm, MappedStatement
+from indra.preassembler.sitemapper import default_mapper as sm, \
+    MappedStatement, SiteMapper
 from indra.preassembler.sitemapper import _valid_position_str
 
 
@@ -233,6 +234,59 @@ def test_valid_pos_str():
     assert _valid_position_str('') is False
 
 
+def test_get_sites():
+    (mapk1_invalid, mapk3_invalid) = get_invalid_mapks()
+    mapk3_invalid.bound_conditions = [BoundCondition(mapk1_invalid)]
+    stmts = [Phosphorylation(mapk1_invalid, mapk3_invalid, 'Y', '204'),
+             Phosphorylation(None, mapk1_invalid, 'T', '183'),
+             Autophosphorylation(mapk1_invalid, 'Y', '185')]
+    sites = SiteMapper.get_sites(stmts)
+    assert sites == [('P28482', 'T', '183'), ('P28482', 'Y', '185'),
+                     ('P27361', 'T', '201'), ('P27361', 'Y', '203'),
+                     ('P27361', 'Y', '204')], sites
+
+
+def test_map_sites_resolved_once():
+    mapper = SiteMapper(sm.site_map)
+    resolved = []
+    map_to_human_ref = mapper.map_to_human_ref
+
+    def counting_map_to_human_ref(up_id, *args, **kwargs):
+        resolved.append((up_id,) + args[1:3])
+        return map_to_human_ref(up_id, *args, **kwargs)
+
+    mapper.map_to_human_ref = counting_map_to_human_ref
+    stmts = []
+    for _ in range(10):
+        (mapk1_invalid, mapk3_invalid) = get_invalid_mapks()
+        stmts.append(Phosphorylation(mapk1_invalid, mapk3_invalid,
+                                     'Y', '204'))
+    valid, mapped = mapper.map_sites(stmts)
+    assert not valid
+    assert len(mapped) == 10
+    # Each distinct site is resolved once for all the statements
+    assert len(resolved) == 5, resolved
+    validate_mapk1(mapped[0].mapped_stmt.enz)
+    validate_mapk1(mapped[-1].mapped_stmt.enz)
+
+
+def test_map_sites_n_procs():
+    stmts = []
+    for pos in ['183', '185', '202', '204']:
+        (mapk1_invalid, mapk3_invalid) = get_invalid_mapks()
+        stmts.append(Phosphorylation(mapk1_invalid, mapk3_invalid,
+                                     'T' if pos in {'183', '202'} else 'Y',
+                                     pos))
+    valid, mapped = SiteMapper(sm.site_map).map_sites(stmts)
+    valid_par, mapped_par = SiteMapper(sm.site_map).map_sites(stmts,
+                                                              n_procs=2)
+    assert valid == valid_par
+    assert [str(ms.mapped_stmt) for ms in mapped] == \
+        [str(ms.mapped_stmt) for ms in mapped_par]
+    assert [ms.mapped_mods for ms in mapped] == \
+        [ms.mapped_mods for ms in mapped_par]
+
+
 def get_invalid_mapks():
     """A handy function for getting the invalid MAPK agents we want."""
     mapk1_invalid = Agent('MAPK1',
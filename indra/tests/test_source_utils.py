@@ -0,0 +1,46 @@
+import io
+import json
+import pytest
+from indra.statements import Agent, Phosphorylation, stmts_to_json
+from indra.sources.utils import RemoteProcessor, iter_json_array
+
+
+def test_iter_json_array():
+    elements = [{'a': [1, 2.5, 'x,]']}, 12345, [], None, '', {}]
+    for indent in [None, 1]:
+        text = json.dumps(elements, indent=indent)
+        for chunk_size in [1, 3, 1000]:
+            assert list(iter_json_array(io.StringIO(text), chunk_size)) == \
+                elements
+    assert list(iter_json_array(io.StringIO(' [ ] '))) == []
+    for text in ['', '{}', '[1,', '[1 2]', '[{"a": 1']:
+        with pytest.raises(ValueError):
+            list(iter_json_array(io.StringIO(text), 2))
+
+
+def test_remote_processor_iter_statements(monkeypatch):
+    stmts = [Phosphorylation(Agent('A'), Agent('B'), 'S', str(idx))
+             for idx in range(3)]
+    content = json.dumps(stmts_to_json(stmts)).encode('utf-8')
+
+    class MockResponse:
+        def __init__(self):
+            self.raw = io.BytesIO(content)
+
+        def raise_for_status(self):
+            pass
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *args):
+            pass
+
+    def get(url, stream=False):
+        assert stream
+        return MockResponse()
+
+    monkeypatch.setattr('indra.sources.utils.requests.get', get)
+    rp = RemoteProcessor('http://example.com/stmts.json')
+    assert [stmt.uuid for stmt in rp.iter_statements()] == \
+        [stmt.uuid for stmt in stmts]
@@ -0,0 +1,89 @@
+from copy import deepcopy
+from indra.statements import *
+from indra.tools import assemble_corpus as ac
+from indra.tools.statement_index import StatementIndex
+
+
+a = Agent('a', db_refs={'HGNC': '1234', 'TEXT': 'a'})
+b = Agent('b', db_refs={'UP': 'P15056', 'TEXT': 'b'})
+c = Agent('c', db_refs={'FPLX': 'XXX', 'TEXT': 'c'})
+d = Agent('d', db_refs={'TEXT': 'd'})
+e = Agent('e', db_refs={'HGNC': '5678', 'TEXT': 'e'},
+          bound_conditions=[BoundCondition(d)])
+ev1 = Evidence(source_api='reach', pmid='1')
+ev2 = Evidence(source_api='sparser', pmid='2', text='x')
+
+stmts = [Phosphorylation(a, b, evidence=[ev1]),
+         Phosphorylation(c, d, evidence=[ev2]),
+         Activation(a, e, evidence=[ev1, ev2]),
+         Complex([a, e, c]),
+         Phosphorylation(None, a),
+         Translocation(e, 'cytoplasm', 'nucleus', evidence=[ev2])]
+
+
+def test_queries():
+    index = StatementIndex(stmts)
+    assert len(index) == len(stmts)
+    assert index.with_names(['a']) == {0, 2, 3, 4}
+    assert index.with_names(['d']) == {1}
+    assert index.with_names(['d'], include_bound=True) == {1, 2, 3, 5}
+    assert index.with_only_names(['a', 'e']) == {2, 4, 5}
+    assert index.with_only_names(['a', 'e'], include_bound=True) == {4}
+    assert index.with_groundings('HGNC', ['1234']) == {0, 2, 3, 4}
+    assert index.with_only_groundings('HGNC', ['1234', '5678']) == \
+        {2, 4, 5}
+    assert index.with_other_groundings('HGNC', ['1234']) == {2, 3, 5}
+    assert index.with_only_other_groundings('HGNC', ['1234']) == {5}
+    assert index.with_type(Modification) == {0, 1, 4}
+    assert index.with_source_apis(['sparser']) == {1, 2, 5}
+    assert index.with_pmids(['1']) == {0, 2}
+    assert index.with_uuids([stmts[3].uuid, 'x']) == {3}
+    assert index.with_hashes([stmts[1].get_hash()]) == {1}
+    positions = index.with_names(['a']) & index.with_type(Phosphorylation)
+    assert index.get_statements(positions) == [stmts[0], stmts[4]]
+    assert index.get_positions(stmts[3:1:-1]) == [3, 2]
+    assert index.get_positions([deepcopy(stmts[0])]) is None
+
+
+def test_indexed_filters():
+    index = StatementIndex(stmts)
+    subsets = [stmts, stmts[::-1][:4]]
+    cases = [(ac.filter_gene_list, [['a', 'e', 'c']], {}),
+             (ac.filter_gene_list, [['a', 'e', 'd']], {}),
+             (ac.filter_concept_names, [['a', 'e']], {}),
+             (ac.filter_by_db_refs, ['HGNC', ['1234', '5678']], {})]
+    for func, args, kwargs in cases:
+        for policy in ['one', 'all']:
+            for invert in [False, True]:
+                for sub in subsets:
+                    expected = func(sub, *args, policy, invert=invert,
+                                    **kwargs)
+                    res = func(sub, *args, policy, invert=invert,
+                               index=index, **kwargs)
+                    assert res == expected, (func.__name__, policy, invert)
+    for invert in [False, True]:
+        uuids = [stmts[0].uuid, stmts[3].uuid]
+        assert ac.filter_uuid_list(stmts, uuids, invert=invert,
+                                   index=index) == \
+            ac.filter_uuid_list(stmts, uuids, invert=invert)
+    # Statements that aren't indexed are filtered without the index
+    copies = deepcopy(stmts)
+    assert [st.uuid for st in ac.filter_gene_list(copies, ['b'], 'one',
+                                                  index=index)] == \
+        [stmts[0].uuid]
+
+
+def test_indexed_filter_by_curation():
+    curations = [{'pa_hash': stmts[0].get_hash(),
+                  'source_hash': ev1.get_source_hash(), 'tag': 'wrong'},
+                 {'pa_hash': stmts[2].get_hash(),
+                  'source_hash': ev1.get_source_hash(), 'tag': 'wrong'},
+                 {'pa_hash': stmts[1].get_hash(),
+                  'source_hash': ev2.get_source_hash(), 'tag': 'correct'}]
+    for policy in ['any', 'all']:
+        expected = ac.filter_by_curation(deepcopy(stmts), curations, policy)
+        indexed_stmts = deepcopy(stmts)
+        res = ac.filter_by_curation(indexed_stmts, curations, policy,
+                                    index=StatementIndex(indexed_stmts))
+        assert [st.to_json() for st in res] == \
+            [st.to_json() for st in expected], policy
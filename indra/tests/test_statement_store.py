@@ -0,0 +1,90 @@
+import os
+import shutil
+import pickle
+import tempfile
+from indra.statements import *
+from indra.tools import assemble_corpus as ac
+from indra.tools.statement_store import get_store_index, iter_chunks
+
+
+stmts = [Phosphorylation(Agent('a%d' % i), Agent('b%d' % i),
+                         evidence=[Evidence(source_api='reach',
+                                            pmid=str(i))])
+         for i in range(10)]
+
+
+def _assert_equal(stmts1, stmts2):
+    assert [st.to_json() for st in stmts1] == \
+        [st.to_json() for st in stmts2]
+
+
+def test_dump_load_store():
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        fname = os.path.join(tmp_dir, 'corpus.stmts')
+        for compression in ['gzip', 'lzma', None]:
+            ac.dump_statements(stmts, fname, chunk_size=4,
+                               compression=compression)
+            index = get_store_index(fname)
+            assert index['compression'] == compression
+            assert [c['num_statements'] for c in index['chunks']] == \
+                [4, 4, 2]
+            _assert_equal(ac.load_statements(fname), stmts)
+            _assert_equal(ac.load_statements(fname, max_workers=3), stmts)
+        # Overwriting removes the old chunks
+        assert len(os.listdir(fname)) == 4
+        # Partial loading
+        _assert_equal(ac.load_statements(fname, chunks=[2, 0]),
+                      stmts[8:] + stmts[:4])
+        _assert_equal([st for chunk in iter_chunks(fname, chunks=[1])
+                       for st in chunk], stmts[4:8])
+        # Appending
+        ac.dump_statements(stmts[:3], fname, append=True)
+        assert get_store_index(fname)['num_statements'] == 13
+        _assert_equal(ac.load_statements(fname), stmts + stmts[:3])
+    finally:
+        shutil.rmtree(tmp_dir)
+
+
+def test_load_pickle():
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        fname = os.path.join(tmp_dir, 'corpus.pkl')
+        ac.dump_statements(stmts, fname)
+        with open(fname, 'rb') as fh:
+            _assert_equal(pickle.load(fh), stmts)
+        _assert_equal(ac.load_statements(fname), stmts)
+    finally:
+        shutil.rmtree(tmp_dir)
+
+
+def test_dump_load_store_support():
+    # A hierarchy as made by preassembly, in which the general statement is
+    # supported by the two more specific ones
+    general = Phosphorylation(Agent('a'), Agent('b'))
+    specific = [Phosphorylation(Agent('a'), Agent('b'), 'T', str(i))
+                for i in range(2)]
+    for st in specific:
+        general.supported_by.append(st)
+        st.supports.append(general)
+    hierarchy = [general] + specific
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        fname = os.path.join(tmp_dir, 'corpus.stmts')
+        ac.dump_statements(hierarchy, fname, chunk_size=1)
+        # Dumping doesn't change the statements
+        assert general.supported_by == specific
+        _assert_equal(ac.load_statements(fname), hierarchy)
+        general2, spec1, spec2 = ac.load_statements(fname, max_workers=2)
+        assert general2.supported_by[0] is spec1
+        assert general2.supported_by[1] is spec2
+        assert spec1.supports[0] is general2
+        # Links to statements that aren't loaded are unresolved
+        spec1, = ac.load_statements(fname, chunks=[1])
+        assert isinstance(spec1.supports[0], Unresolved)
+        assert spec1.supports[0].uuid == general.uuid
+        chunk, = iter_chunks(fname, chunks=[0])
+        assert [st.uuid for st in chunk[0].supported_by] == \
+            [st.uuid for st in specific]
+    finally:
+        shutil.rmtree(tmp_dir)
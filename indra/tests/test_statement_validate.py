@@ -83,3 +83,38 @@ def test_statement_validate():
     assert not validate_statement(Gef(Agent('x'), None))
     assert not validate_statement(Complex([None, Agent('x')]))
     assert not validate_statement(Conversion(None, [None], [Agent('x')]))
+
+
+def test_validation_report():
+    stmts = [Phosphorylation(None, Agent('ERK', db_refs={'FPLX': 'ERK'})),
+             Phosphorylation(None, Agent('ERK', db_refs={'XXX': 'ERK'})),
+             Phosphorylation(None, None),
+             Phosphorylation(Agent('a', db_refs={'HGNC': 'ABCD1'}),
+                             Agent('ERK', db_refs={'FPLX': 'ERK'})),
+             Phosphorylation(None, Agent('ERK', db_refs={'XXX': 'ERK'}),
+                             evidence=[Evidence(pmid='1')])]
+    for n_procs in [1, 2]:
+        report = get_validation_report(stmts, n_procs=n_procs)
+        assert report['num_statements'] == 5
+        assert report['num_invalid'] == 4
+        assert report['error_counts'] == {'UnknownNamespace': 2,
+                                          'InvalidStatement': 1,
+                                          'InvalidIdentifier': 1}
+        assert [error['index'] for error in report['errors']] == [1, 2, 3, 4]
+        assert report['errors'][0]['uuid'] == stmts[1].uuid
+        assert report['errors'][0]['message'] == 'Unknown namespace: XXX'
+    with pytest.raises(UnknownNamespace):
+        assert_valid_statements(stmts)
+
+
+def test_batch_validator():
+    validator = BatchValidator()
+    for _ in range(2):
+        assert validate_db_refs({'HGNC': '1234'}, validator=validator)
+        with pytest.raises(InvalidIdentifier):
+            assert_valid_db_refs({'HGNC': 'ABCD1'}, validator=validator)
+        with pytest.raises(UnknownNamespace):
+            assert_valid_ns('XXX', validator=validator)
+        with pytest.raises(MissingIdentifier):
+            assert_valid_id('HGNC', None, validator=validator)
+    assert not validate_id('WM', [['a', 0.5]], validator=validator)
@@ -389,6 +389,62 @@ def test_file_serialization():
     assert stmts[0].matches(stmt)
 
 
+def test_file_serialization_identical(tmpdir):
+    ev2 = Evidence(source_api='reach', text='Unicode \u03b2 and "quotes"',
+                   annotations={'scores': [0.1, 2.5e-10, float('nan'),
+                                           float('inf'), 10**20],
+                                'empty': {}, 'nested': [[], {'a': None}],
+                                1: (True, False)})
+    stmts = [Phosphorylation(Agent('a', db_refs={'HGNC': '1'}),
+                             Agent('b', mods=[ModCondition('phosphorylation',
+                                                           'S', '10')]),
+                             evidence=[ev, ev2]),
+             Complex([Agent('a'), Agent('b')], evidence=[ev2])]
+    stmts[0].belief = 0.1 + 0.2
+    fname = str(tmpdir.join('stmts.json'))
+    stmts_to_json_file(stmts, fname)
+    with open(fname, 'r') as fh:
+        assert fh.read() == json.dumps(stmts_to_json(stmts), indent=1)
+    stmts_to_json_file([], fname)
+    with open(fname, 'r') as fh:
+        assert fh.read() == json.dumps([], indent=1)
+    stmts2 = stmts_from_json_file(fname)
+    assert stmts2 == []
+
+
+def test_iter_stmts_json():
+    stmts = [IncreaseAmount(Agent('a'), Agent('b'), evidence=[ev]),
+             Complex([Agent('a'), Agent('b')])]
+    for indent in [None, 1, 2]:
+        assert ''.join(iter_stmts_json(stmts, indent=indent)) == \
+            json.dumps(stmts_to_json(stmts), indent=indent)
+    assert ''.join(iter_stmts_json([])) == '[]'
+
+
+def test_gc_paused_threads():
+    import gc
+    import threading
+    from indra.statements.io import _gc_paused
+    assert gc.isenabled()
+    paused, release = threading.Event(), threading.Event()
+
+    def pause():
+        with _gc_paused():
+            paused.set()
+            release.wait()
+
+    thread = threading.Thread(target=pause)
+    thread.start()
+    paused.wait()
+    # Garbage collection stays paused until both pauses have ended
+    with _gc_paused():
+        assert not gc.isenabled()
+    assert not gc.isenabled()
+    release.set()
+    thread.join()
+    assert gc.isenabled()
+
+
 def test_file_serialization_json_lines():
     stmt = IncreaseAmount(Agent('a'), Agent('b'), evidence=[ev])
     stmts_to_json_file([stmt], 'test_indra_stmts.json', format='jsonl')
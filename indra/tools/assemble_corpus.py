@@ -10,13 +10,18 @@ except ImportError:
     import pickle
 
 import logging
+import multiprocessing
 from typing import List
+from functools import partial
 from collections import defaultdict
 from copy import deepcopy, copy
 from indra.statements import *
 from indra.belief import BeliefEngine
 from indra.util import read_unicode_csv
-from indra.pipeline import register_pipeline
+from indra.util.shared_tables import share_loaded_resources, \
+    install_shared_resources
+from indra.pipeline import register_pipeline, register_stmt_predicate, \
+    register_stmt_map
 from indra.mechlinker import MechLinker
 from indra.databases import hgnc_client
 from indra.ontology.bio import bio_ontology
@@ -24,6 +29,10 @@ from indra.preassembler import Preassembler, flatten_evidence
 from indra.resources import get_resource_path
 from indra.statements.validate import print_validation_report
 from indra.literature.pubmed_client import is_retracted
+from indra.tools.statement_store import STORE_SUFFIX, is_statement_store, \
+    dump_chunks, load_chunks
+from indra.tools.statement_index import get_indexed_positions, \
+    select_indexed
 import indra.tools.fix_invalidities
 
 
@@ -34,41 +43,221 @@ def _filter(kwargs, arg_list):
     return dict(filter(lambda x: x[0] in arg_list, kwargs.items()))
 
 
+def apply_in_chunks(stmts_in, chunk_func, n_procs=1, chunk_size=None):
+    """Apply a function to chunks of statements, optionally in parallel.
+
+    If n_procs is larger than 1, the chunks are processed by a pool of
+    processes. The function, along with any state it refers to (e.g., a
+    grounding map), is sent to each process once when the pool is started
+    rather than with each chunk. The tables of the database clients and the
+    bio ontology that are already loaded in this process are shared with
+    the processes (see
+    :func:`indra.util.shared_tables.share_loaded_resources`) rather than
+    copied or loaded again by each of them. Since the statements are
+    sent to and from the processes, the returned statements are copies of
+    the ones processed there, and any changes made to the statements in
+    place are only reflected in the returned statements. Statements linked
+    by supports or supported_by can't be copied this way without
+    duplicating the statements they are linked to, so if there are any,
+    the function is applied serially. To filter statements, use
+    :func:`filter_in_chunks` instead, which returns the original
+    statements.
+
+    Parameters
+    ----------
+    stmts_in : list[indra.statements.Statement]
+        A list of statements to process.
+    chunk_func : function
+        A function which takes a list of statements and returns a list of
+        statements, in which the output for each statement only depends on
+        that statement. If n_procs is larger than 1 and processes are not
+        started by forking, this function has to be picklable.
+    n_procs : Optional[int]
+        The number of processes to use. Default: 1
+    chunk_size : Optional[int]
+        The number of statements in each chunk sent to a process. By
+        default, the statements are split into four chunks per process.
+
+    Returns
+    -------
+    stmts_out : list[indra.statements.Statement]
+        The concatenation of the outputs of the function on the chunks, in
+        the order of the input statements.
+    """
+    if not n_procs or n_procs <= 1 or len(stmts_in) < 2:
+        return chunk_func(stmts_in)
+    if any(stmt.supports or stmt.supported_by for stmt in stmts_in):
+        logger.info('Processing statements with support links serially')
+        return chunk_func(stmts_in)
+    return [stmt for _, chunk_out in
+            _run_in_chunks(stmts_in, chunk_func, n_procs, chunk_size)
+            for stmt in chunk_out]
+
+
+def filter_in_chunks(stmts_in, predicate, n_procs=1, chunk_size=None):
+    """Filter statements in chunks, optionally in parallel.
+
+    If n_procs is larger than 1, the predicate is evaluated on chunks of
+    statements by a pool of processes (see :func:`apply_in_chunks`), which
+    only send back the positions of the statements to keep. The returned
+    statements are therefore the original ones, as when filtering serially.
+    The statements are sent to the processes without their supports and
+    supported_by links, so the predicate shouldn't depend on them, and
+    changes the predicate makes to the statements are not kept.
+
+    Parameters
+    ----------
+    stmts_in : list[indra.statements.Statement]
+        A list of statements to filter.
+    predicate : function
+        A function which takes a statement and returns True if it is to be
+        kept. If n_procs is larger than 1 and processes are not started by
+        forking, this function has to be picklable.
+    n_procs : Optional[int]
+        The number of processes to use. Default: 1
+    chunk_size : Optional[int]
+        The number of statements in each chunk sent to a process. By
+        default, the statements are split into four chunks per process.
+
+    Returns
+    -------
+    stmts_out : list[indra.statements.Statement]
+        The statements for which the predicate is True, in order.
+    """
+    return [stmt for stmt, _ in
+            _select_in_chunks(stmts_in, partial(_select_chunk, predicate),
+                              n_procs, chunk_size)]
+
+
+def _select_in_chunks(stmts_in, select_func, n_procs=1, chunk_size=None):
+    # The select function returns (position, value) pairs for the selected
+    # statements of a chunk, and the original statements at these
+    # positions are returned along with the values.
+    if not n_procs or n_procs <= 1 or len(stmts_in) < 2:
+        return [(stmts_in[pos], value) for pos, value in select_func(stmts_in)]
+    selected = []
+    for offset, chunk_out in _run_in_chunks(
+            [_without_links(stmt) for stmt in stmts_in], select_func,
+            n_procs, chunk_size):
+        selected += [(stmts_in[offset + pos], value)
+                     for pos, value in chunk_out]
+    return selected
+
+
+def _without_links(stmt):
+    # Support links would otherwise make the linked statements be pickled
+    # along with the statement.
+    if not stmt.supports and not stmt.supported_by:
+        return stmt
+    stmt = copy(stmt)
+    stmt.supports = []
+    stmt.supported_by = []
+    return stmt
+
+
+def _run_in_chunks(stmts_in, chunk_func, n_procs, chunk_size):
+    if chunk_size is None:
+        chunk_size = max(1, len(stmts_in) // (4 * n_procs))
+    offsets = range(0, len(stmts_in), chunk_size)
+    chunks = [stmts_in[i:i + chunk_size] for i in offsets]
+    logger.info('Processing %d statements in %d chunks with %d processes'
+                % (len(stmts_in), len(chunks), n_procs))
+    shared_resources = share_loaded_resources()
+    with multiprocessing.Pool(n_procs, initializer=_init_chunk_worker,
+                              initargs=(chunk_func, shared_resources)) as pool:
+        return list(zip(offsets, pool.imap(_run_chunk, chunks)))
+
+
+def _init_chunk_worker(chunk_func, shared_resources):
+    global _worker_chunk_func
+    install_shared_resources(shared_resources)
+    _worker_chunk_func = chunk_func
+
+
+def _run_chunk(stmts):
+    return _worker_chunk_func(stmts)
+
+
+def _select_chunk(predicate, stmts):
+    return [(pos, None) for pos, stmt in enumerate(stmts) if predicate(stmt)]
+
+
+def _map_chunk(func, stmts):
+    return [func(stmt) for stmt in stmts]
+
+
 @register_pipeline
-def dump_statements(stmts_in, fname, protocol=4):
-    """Dump a list of statements into a pickle file.
+def dump_statements(stmts_in, fname, protocol=4, chunk_size=None,
+                    compression='gzip', append=False):
+    """Dump a list of statements into a pickle file or a statement store.
+
+    If the file name ends with .stmts or a chunk size is given, the
+    statements are written into a chunked, compressed statement store (see
+    :mod:`indra.tools.statement_store`) which can be loaded in parallel,
+    partially, and appended to. Otherwise they are dumped into a single
+    pickle file.
 
     Parameters
     ----------
     fname : str
-        The name of the pickle file to dump statements into.
+        The name of the pickle file or statement store to dump statements
+        into.
     protocol : Optional[int]
         The pickle protocol to use (use 2 for Python 2 compatibility).
         Default: 4
+    chunk_size : Optional[int]
+        The number of statements per chunk of the statement store. If given,
+        a statement store is written. Default: None
+    compression : Optional[str]
+        The compression of the chunks of the statement store, one of gzip,
+        lzma, zstd (which requires the zstandard package) or None.
+        Default: gzip
+    append : Optional[bool]
+        If True, the statements are added at the end of the statement store
+        instead of overwriting it. Default: False
     """
+    if chunk_size or append or fname.endswith(STORE_SUFFIX):
+        logger.info('Dumping %d statements into statement store %s...'
+                    % (len(stmts_in), fname))
+        dump_chunks(list(stmts_in), fname, chunk_size=chunk_size,
+                    compression=compression, protocol=protocol,
+                    append=append)
+        return stmts_in
     logger.info('Dumping %d statements into %s...' % (len(stmts_in), fname))
     with open(fname, 'wb') as fh:
         pickle.dump(stmts_in, fh, protocol=protocol)
     return stmts_in
 
 
-def load_statements(fname, as_dict=False):
-    """Load statements from a pickle file.
+def load_statements(fname, as_dict=False, chunks=None, max_workers=1):
+    """Load statements from a pickle file or a statement store.
 
     Parameters
     ----------
     fname : str
-        The name of the pickle file to load statements from.
+        The name of the pickle file or statement store to load statements
+        from.
     as_dict : Optional[bool]
         If True and the pickle file contains a dictionary of statements, it
         is returned as a dictionary. If False, the statements are always
         returned in a list. Default: False
+    chunks : Optional[list[int]]
+        The positions of the chunks of the statement store to load. If None,
+        all the chunks are loaded. Default: None
+    max_workers : Optional[int]
+        The number of threads loading the chunks of the statement store in
+        parallel. Default: 1
 
     Returns
     -------
     stmts : list
         A list or dict of statements that were loaded.
     """
+    if is_statement_store(fname):
+        logger.info('Loading statement store %s...' % fname)
+        stmts = load_chunks(fname, chunks=chunks, max_workers=max_workers)
+        logger.info('Loaded %d statements' % len(stmts))
+        return stmts
     logger.info('Loading %s...' % fname)
     with open(fname, 'rb') as fh:
         # Encoding argument not available in pickle for Python 2
@@ -93,7 +282,8 @@ def load_statements(fname, as_dict=False):
 @register_pipeline
 def map_grounding(stmts_in, do_rename=True, grounding_map=None,
                   misgrounding_map=None, agent_map=None, ignores=None, use_adeft=True,
-                  gilda_mode=None, grounding_map_policy='replace', **kwargs):
+                  gilda_mode=None, grounding_map_policy='replace', n_procs=1,
+                  **kwargs):
     """Map grounding using the GroundingMapper.
 
     Parameters
@@ -125,6 +315,10 @@ def map_grounding(stmts_in, do_rename=True, grounding_map=None,
     grounding_map_policy : Optional[str]
         If a grounding map is provided, use the policy to extend or replace
         a default grounding map. Default: 'replace'.
+    n_procs : Optional[int]
+        If larger than 1, the statements are mapped in chunks by a pool of
+        this many processes, each with its own copy of the GroundingMapper.
+        Default: 1
 
     Returns
     -------
@@ -148,7 +342,7 @@ def map_grounding(stmts_in, do_rename=True, grounding_map=None,
     gm = GroundingMapper(gm, agent_map=agent_map,
                          misgrounding_map=misgm, ignores=ignores,
                          use_adeft=use_adeft, gilda_mode=gilda_mode)
-    stmts_out = gm.map_stmts(stmts_in, do_rename=do_rename)
+    stmts_out = gm.map_stmts(stmts_in, do_rename=do_rename, n_procs=n_procs)
     # Patch wrong locations in Translocation statements
     for stmt in stmts_out:
         if isinstance(stmt, Translocation):
@@ -247,7 +441,8 @@ def merge_groundings(stmts_in):
 
 @register_pipeline
 def map_sequence(stmts_in, do_methionine_offset=True,
-                 do_orthology_mapping=True, do_isoform_mapping=True, **kwargs):
+                 do_orthology_mapping=True, do_isoform_mapping=True, n_procs=1,
+                 **kwargs):
     """Map sequences using the SiteMapper.
 
     Parameters
@@ -276,6 +471,9 @@ def map_sequence(stmts_in, do_methionine_offset=True,
         SITEMAPPER_CACHE_PATH, defined in your INDRA config or the environment.
         If False, no cache is used. For more details on the cache, see the
         SiteMapper class definition.
+    n_procs : Optional[int]
+        If larger than 1, the distinct sites of the statements are resolved
+        by a pool of this many processes. Default: 1
     save : Optional[str]
         The name of a pickle file to save the results (stmts_out) into.
 
@@ -291,7 +489,7 @@ def map_sequence(stmts_in, do_methionine_offset=True,
                     do_methionine_offset=do_methionine_offset,
                     do_orthology_mapping=do_orthology_mapping,
                     do_isoform_mapping=do_isoform_mapping)
-    valid, mapped = sm.map_sites(stmts_in)
+    valid, mapped = sm.map_sites(stmts_in, n_procs=n_procs)
     correctly_mapped_stmts = []
     for ms in mapped:
         correctly_mapped = all([mm.has_mapping() for mm in ms.mapped_mods])
@@ -508,7 +706,16 @@ def run_preassembly_related(preassembler, beliefengine, **kwargs):
     return stmts_out
 
 
+def _by_type_predicate(stmt_type, invert=False, **kwargs):
+    if isinstance(stmt_type, str):
+        stmt_type = get_statement_by_name(stmt_type)
+    if not invert:
+        return lambda st: isinstance(st, stmt_type)
+    return lambda st: not isinstance(st, stmt_type)
+
+
 @register_pipeline
+@register_stmt_predicate(_by_type_predicate)
 def filter_by_type(stmts_in, stmt_type, invert=False, **kwargs):
     """Filter to a given statement type.
 
@@ -537,10 +744,8 @@ def filter_by_type(stmts_in, stmt_type, invert=False, **kwargs):
     logger.info('Filtering %d statements for type %s%s...' %
                 (len(stmts_in), 'not ' if invert else '',
                  stmt_type.__name__))
-    if not invert:
-        stmts_out = [st for st in stmts_in if isinstance(st, stmt_type)]
-    else:
-        stmts_out = [st for st in stmts_in if not isinstance(st, stmt_type)]
+    predicate = _by_type_predicate(stmt_type, invert)
+    stmts_out = [st for st in stmts_in if predicate(st)]
 
     logger.info('%d statements after filter...' % len(stmts_out))
     dump_pkl = kwargs.get('save')
@@ -619,7 +824,28 @@ def _any_bound_condition_fails_criterion(agent, criterion):
     return False
 
 
+def _grounded_only_predicate(score_threshold=None, remove_bound=False,
+                             **kwargs):
+    def criterion(agent):
+        return _agent_is_grounded(agent, score_threshold)
+
+    def is_grounded(st):
+        for agent in st.agent_list():
+            if agent is not None:
+                if not criterion(agent):
+                    return False
+                if not isinstance(agent, Agent):
+                    continue
+                if remove_bound:
+                    _remove_bound_conditions(agent, criterion)
+                elif _any_bound_condition_fails_criterion(agent, criterion):
+                    return False
+        return True
+    return is_grounded
+
+
 @register_pipeline
+@register_stmt_predicate(_grounded_only_predicate)
 def filter_grounded_only(stmts_in, score_threshold=None, remove_bound=False,
                          **kwargs):
     """Filter to statements that have grounded agents.
@@ -645,24 +871,8 @@ def filter_grounded_only(stmts_in, score_threshold=None, remove_bound=False,
     """
     logger.info('Filtering %d statements for grounded agents...' % 
                 len(stmts_in))
-    stmts_out = []
-    for st in stmts_in:
-        grounded = True
-        for agent in st.agent_list():
-            if agent is not None:
-                criterion = lambda x: _agent_is_grounded(x, score_threshold)
-                if not criterion(agent):
-                    grounded = False
-                    break
-                if not isinstance(agent, Agent):
-                    continue
-                if remove_bound:
-                    _remove_bound_conditions(agent, criterion)
-                elif _any_bound_condition_fails_criterion(agent, criterion):
-                    grounded = False
-                    break
-        if grounded:
-            stmts_out.append(st)
+    predicate = _grounded_only_predicate(score_threshold, remove_bound)
+    stmts_out = [st for st in stmts_in if predicate(st)]
     logger.info('%d statements after filter...' % len(stmts_out))
     dump_pkl = kwargs.get('save')
     if dump_pkl:
@@ -698,9 +908,28 @@ def _agent_is_gene(agent, specific_only):
     return True
 
 
+def _all_agents_meet_criterion(criterion, remove_bound, st):
+    for agent in st.agent_list():
+        if agent is not None:
+            if not criterion(agent):
+                return False
+            if remove_bound:
+                _remove_bound_conditions(agent, criterion)
+            elif _any_bound_condition_fails_criterion(agent, criterion):
+                return False
+    return True
+
+
+def _genes_only_predicate(specific_only=False, remove_bound=False, **kwargs):
+    return partial(_all_agents_meet_criterion,
+                   partial(_agent_is_gene, specific_only=specific_only),
+                   remove_bound)
+
+
 @register_pipeline
+@register_stmt_predicate(_genes_only_predicate)
 def filter_genes_only(stmts_in, specific_only=False, remove_bound=False,
-                      **kwargs):
+                      n_procs=1, **kwargs):
     """Filter to statements containing genes only.
 
     Parameters
@@ -717,6 +946,9 @@ def filter_genes_only(stmts_in, specific_only=False, remove_bound=False,
         If true, removes bound conditions that are not genes
         If false (default), filters out statements with non-gene bound
         conditions
+    n_procs : Optional[int]
+        If larger than 1 and remove_bound is False, the statements are
+        filtered in chunks by a pool of this many processes. Default: 1
 
     Returns
     -------
@@ -725,24 +957,11 @@ def filter_genes_only(stmts_in, specific_only=False, remove_bound=False,
     """
     logger.info('Filtering %d statements for ones containing genes only...' % 
                 len(stmts_in))
-    stmts_out = []
-    for st in stmts_in:
-        genes_only = True
-        for agent in st.agent_list():
-            if agent is not None:
-                criterion = lambda a: _agent_is_gene(a, specific_only)
-                if not criterion(agent):
-                    genes_only = False
-                    break
-                if remove_bound:
-                    _remove_bound_conditions(agent, criterion)
-                else:
-                    if _any_bound_condition_fails_criterion(agent, criterion):
-                        genes_only = False
-                        break
-
-        if genes_only:
-            stmts_out.append(st)
+    predicate = _genes_only_predicate(specific_only, remove_bound)
+    # Removing bound conditions changes the statements, which is only kept
+    # when filtering serially
+    stmts_out = filter_in_chunks(stmts_in, predicate,
+                                 1 if remove_bound else n_procs)
     logger.info('%d statements after filter...' % len(stmts_out))
     dump_pkl = kwargs.get('save')
     if dump_pkl:
@@ -750,7 +969,21 @@ def filter_genes_only(stmts_in, specific_only=False, remove_bound=False,
     return stmts_out
 
 
+def _belief_predicate(belief_cutoff, **kwargs):
+    def is_above_cutoff(stmt):
+        if stmt.belief < belief_cutoff:
+            return False
+        # We also eliminate supports/supported-by below the cutoff
+        stmt.supports = [st for st in stmt.supports
+                         if st.belief >= belief_cutoff]
+        stmt.supported_by = [st for st in stmt.supported_by
+                             if st.belief >= belief_cutoff]
+        return True
+    return is_above_cutoff
+
+
 @register_pipeline
+@register_stmt_predicate(_belief_predicate)
 def filter_belief(stmts_in, belief_cutoff, **kwargs):
     """Filter to statements with belief above a given cutoff.
 
@@ -772,23 +1005,8 @@ def filter_belief(stmts_in, belief_cutoff, **kwargs):
     dump_pkl = kwargs.get('save')
     logger.info('Filtering %d statements to above %f belief' %
                 (len(stmts_in), belief_cutoff))
-    # The first round of filtering is in the top-level list
-    stmts_out = []
-    # Now we eliminate supports/supported-by
-    for stmt in stmts_in:
-        if stmt.belief < belief_cutoff:
-            continue
-        stmts_out.append(stmt)
-        supp_by = []
-        supp = []
-        for st in stmt.supports:
-            if st.belief >= belief_cutoff:
-                supp.append(st)
-        for st in stmt.supported_by:
-            if st.belief >= belief_cutoff:
-                supp_by.append(st)
-        stmt.supports = supp
-        stmt.supported_by = supp_by
+    predicate = _belief_predicate(belief_cutoff)
+    stmts_out = [stmt for stmt in stmts_in if predicate(stmt)]
     logger.info('%d statements after filter...' % len(stmts_out))
     if dump_pkl:
         dump_statements(stmts_out, dump_pkl)
@@ -797,7 +1015,7 @@ def filter_belief(stmts_in, belief_cutoff, **kwargs):
 
 @register_pipeline
 def filter_gene_list(stmts_in, gene_list, policy, allow_families=False,
-                     remove_bound=False, invert=False, **kwargs):
+                     remove_bound=False, invert=False, index=None, **kwargs):
     """Return statements that contain genes given in a list.
 
     Parameters
@@ -824,6 +1042,9 @@ def filter_gene_list(stmts_in, gene_list, policy, allow_families=False,
     invert : Optional[bool]
         If True, the statements that do not match according to the policy
         are returned. Default: False
+    index : Optional[indra.tools.statement_index.StatementIndex]
+        If given and all the statements are in this index, the index is
+        used to find the matching statements unless remove_bound is True.
 
     Returns
     -------
@@ -850,50 +1071,63 @@ def filter_gene_list(stmts_in, gene_list, policy, allow_families=False,
             parents = bio_ontology.get_parents('HGNC', hgnc_id)
             filter_list += [db_id for db_ns, db_id in parents
                             if db_ns == 'FPLX']
+    filter_list = set(filter_list)
     stmts_out = []
 
-    if remove_bound:
-        # If requested, remove agents whose names are not in the list from
-        # all bound conditions
-        if not invert:
-            keep_criterion = lambda a: a.name in filter_list
+    positions = get_indexed_positions(index, stmts_in) \
+        if not remove_bound and policy in ('one', 'all') else None
+    if positions is not None:
+        if policy == 'one':
+            matching = index.with_names(filter_list, include_bound=True)
         else:
-            keep_criterion = lambda a: a.name not in filter_list
+            matching = index.with_only_names(filter_list, include_bound=True)
+        if invert:
+            matching = index.all() - matching
+        stmts_out = select_indexed(index, stmts_in, positions, matching)
+    else:
+        if remove_bound:
+            # If requested, remove agents whose names are not in the list
+            # from all bound conditions
+            if not invert:
+                keep_criterion = lambda a: a.name in filter_list
+            else:
+                keep_criterion = lambda a: a.name not in filter_list
 
-        for st in stmts_in:
-            for agent in st.agent_list():
-                _remove_bound_conditions(agent, keep_criterion)
+            for st in stmts_in:
+                for agent in st.agent_list():
+                    _remove_bound_conditions(agent, keep_criterion)
 
-    if policy == 'one':
-        for st in stmts_in:
-            found_gene = False
-            if not remove_bound:
-                agent_list = st.agent_list_with_bound_condition_agents()
-            else:
-                agent_list = st.agent_list()
-            for agent in agent_list:
-                if agent is not None:
-                    if agent.name in filter_list:
-                        found_gene = True
-                        break
-            if (found_gene and not invert) or (not found_gene and invert):
-                stmts_out.append(st)
-    elif policy == 'all':
-        for st in stmts_in:
-            found_genes = True
-            if not remove_bound:
-                agent_list = st.agent_list_with_bound_condition_agents()
-            else:
-                agent_list = st.agent_list()
-            for agent in agent_list:
-                if agent is not None:
-                    if agent.name not in filter_list:
-                        found_genes = False
-                        break
-            if (found_genes and not invert) or (not found_genes and invert):
-                stmts_out.append(st)
-    else:
-        stmts_out = stmts_in
+        if policy == 'one':
+            for st in stmts_in:
+                found_gene = False
+                if not remove_bound:
+                    agent_list = st.agent_list_with_bound_condition_agents()
+                else:
+                    agent_list = st.agent_list()
+                for agent in agent_list:
+                    if agent is not None:
+                        if agent.name in filter_list:
+                            found_gene = True
+                            break
+                if (found_gene and not invert) or (not found_gene and invert):
+                    stmts_out.append(st)
+        elif policy == 'all':
+            for st in stmts_in:
+                found_genes = True
+                if not remove_bound:
+                    agent_list = st.agent_list_with_bound_condition_agents()
+                else:
+                    agent_list = st.agent_list()
+                for agent in agent_list:
+                    if agent is not None:
+                        if agent.name not in filter_list:
+                            found_genes = False
+                            break
+                if (found_genes and not invert) or \
+                        (not found_genes and invert):
+                    stmts_out.append(st)
+        else:
+            stmts_out = stmts_in
 
     logger.info('%d statements after filter...' % len(stmts_out))
     dump_pkl = kwargs.get('save')
@@ -903,7 +1137,8 @@ def filter_gene_list(stmts_in, gene_list, policy, allow_families=False,
 
 
 @register_pipeline
-def filter_concept_names(stmts_in, name_list, policy, invert=False, **kwargs):
+def filter_concept_names(stmts_in, name_list, policy, invert=False,
+                         index=None, **kwargs):
     """Return Statements that refer to concepts/agents given as a list of names.
 
     Parameters
@@ -922,6 +1157,9 @@ def filter_concept_names(stmts_in, name_list, policy, invert=False, **kwargs):
     invert : Optional[bool]
         If True, the Statements that do not match according to the policy
         are returned. Default: False
+    index : Optional[indra.tools.statement_index.StatementIndex]
+        If given and all the Statements are in this index, the index is
+        used to find the matching Statements.
 
     Returns
     -------
@@ -937,8 +1175,19 @@ def filter_concept_names(stmts_in, name_list, policy, invert=False, **kwargs):
                      '%s...') % (len(stmts_in), inv_str, policy, name_str))
 
     stmts_out = []
+    name_list = set(name_list)
 
-    if policy == 'one':
+    positions = get_indexed_positions(index, stmts_in) \
+        if policy in ('one', 'all') else None
+    if positions is not None:
+        if policy == 'one':
+            matching = index.with_names(name_list)
+        else:
+            matching = index.with_only_names(name_list)
+        if invert:
+            matching = index.all() - matching
+        stmts_out = select_indexed(index, stmts_in, positions, matching)
+    elif policy == 'one':
         for st in stmts_in:
             found = False
             agent_list = st.agent_list()
@@ -972,7 +1221,7 @@ def filter_concept_names(stmts_in, name_list, policy, invert=False, **kwargs):
 
 @register_pipeline
 def filter_by_db_refs(stmts_in, namespace, values, policy, invert=False,
-                      match_suffix=False, **kwargs):
+                      match_suffix=False, index=None, **kwargs):
     """Filter to Statements whose agents are grounded to a matching entry.
 
     Statements are filtered so that the db_refs entry (of the given namespace)
@@ -1000,6 +1249,9 @@ def filter_by_db_refs(stmts_in, namespace, values, policy, invert=False,
     match_suffix : Optional[bool]
         If True, the suffix of the db_refs entry is matches agains the list
         of entries
+    index : Optional[indra.tools.statement_index.StatementIndex]
+        If given and all the Statements are in this index, the index is
+        used to find the matching Statements unless match_suffix is True.
 
     Returns
     -------
@@ -1038,9 +1290,20 @@ def filter_by_db_refs(stmts_in, namespace, values, policy, invert=False,
 
     enough = all if policy == 'all' else any
 
-    stmts_out = [s for s in stmts_in
-                 if enough([meets_criterion(ag) for ag in s.agent_list()
-                            if ag is not None])]
+    positions = get_indexed_positions(index, stmts_in) \
+        if not match_suffix else None
+    if positions is not None:
+        if policy == 'all':
+            matching = index.with_only_other_groundings(namespace, values) \
+                if invert else index.with_only_groundings(namespace, values)
+        else:
+            matching = index.with_other_groundings(namespace, values) \
+                if invert else index.with_groundings(namespace, values)
+        stmts_out = select_indexed(index, stmts_in, positions, matching)
+    else:
+        stmts_out = [s for s in stmts_in
+                     if enough([meets_criterion(ag) for ag in s.agent_list()
+                                if ag is not None])]
 
     logger.info('%d Statements after filter...' % len(stmts_out))
     dump_pkl = kwargs.get('save')
@@ -1049,8 +1312,22 @@ def filter_by_db_refs(stmts_in, namespace, values, policy, invert=False,
     return stmts_out
 
 
+def _agent_is_human(agent):
+    from indra.databases import uniprot_client
+    upid = agent.db_refs.get('UP')
+    if upid and not uniprot_client.is_human(upid):
+        return False
+    else:
+        return True
+
+
+def _human_only_predicate(remove_bound=False, **kwargs):
+    return partial(_all_agents_meet_criterion, _agent_is_human, remove_bound)
+
+
 @register_pipeline
-def filter_human_only(stmts_in, remove_bound=False, **kwargs):
+@register_stmt_predicate(_human_only_predicate)
+def filter_human_only(stmts_in, remove_bound=False, n_procs=1, **kwargs):
     """Filter out statements that are grounded, but not to a human gene.
 
     Parameters
@@ -1063,46 +1340,53 @@ def filter_human_only(stmts_in, remove_bound=False, **kwargs):
         If true, removes all bound conditions that are grounded but not to human
         genes. If false (default), filters out statements with boundary
         conditions that are grounded to non-human genes.
+    n_procs : Optional[int]
+        If larger than 1 and remove_bound is False, the statements are
+        filtered in chunks by a pool of this many processes. Default: 1
 
     Returns
     -------
     stmts_out : list[indra.statements.Statement]
         A list of filtered statements.
     """
-    from indra.databases import uniprot_client
     dump_pkl = kwargs.get('save')
     logger.info('Filtering %d statements for human genes only...' %
                 len(stmts_in))
-    stmts_out = []
-
-    def criterion(agent):
-        upid = agent.db_refs.get('UP')
-        if upid and not uniprot_client.is_human(upid):
-            return False
-        else:
-            return True
-
-    for st in stmts_in:
-        human_genes = True
-        for agent in st.agent_list():
-            if agent is not None:
-                if not criterion(agent):
-                    human_genes = False
-                    break
-                if remove_bound:
-                    _remove_bound_conditions(agent, criterion)
-                elif _any_bound_condition_fails_criterion(agent, criterion):
-                    human_genes = False
-                    break
-        if human_genes:
-            stmts_out.append(st)
+    predicate = _human_only_predicate(remove_bound)
+    # Removing bound conditions changes the statements, which is only kept
+    # when filtering serially
+    stmts_out = filter_in_chunks(stmts_in, predicate,
+                                 1 if remove_bound else n_procs)
     logger.info('%d statements after filter...' % len(stmts_out))
     if dump_pkl:
         dump_statements(stmts_out, dump_pkl)
     return stmts_out
 
 
+def _get_is_direct(stmt):
+    """Returns true if there is evidence that the statement is a direct
+    interaction.
+
+    If any of the evidences associated with the statement
+    indicates a direct interatcion then we assume the interaction
+    is direct. If there is no evidence for the interaction being indirect
+    then we default to direct.
+    """
+    any_indirect = False
+    for ev in stmt.evidence:
+        if ev.epistemics.get('direct') is True:
+            return True
+        elif ev.epistemics.get('direct') is False:
+            # This guarantees that we have seen at least
+            # some evidence that the statement is indirect
+            any_indirect = True
+    if any_indirect:
+        return False
+    return True
+
+
 @register_pipeline
+@register_stmt_predicate(lambda **kwargs: _get_is_direct)
 def filter_direct(stmts_in, **kwargs):
     """Filter to statements that are direct interactions
 
@@ -1118,31 +1402,8 @@ def filter_direct(stmts_in, **kwargs):
     stmts_out : list[indra.statements.Statement]
         A list of filtered statements.
     """
-    def get_is_direct(stmt):
-        """Returns true if there is evidence that the statement is a direct
-        interaction.
-
-        If any of the evidences associated with the statement
-        indicates a direct interatcion then we assume the interaction
-        is direct. If there is no evidence for the interaction being indirect
-        then we default to direct.
-        """
-        any_indirect = False
-        for ev in stmt.evidence:
-            if ev.epistemics.get('direct') is True:
-                return True
-            elif ev.epistemics.get('direct') is False:
-                # This guarantees that we have seen at least
-                # some evidence that the statement is indirect
-                any_indirect = True
-        if any_indirect:
-            return False
-        return True
     logger.info('Filtering %d statements to direct ones...' % len(stmts_in))
-    stmts_out = []
-    for st in stmts_in:
-        if get_is_direct(st):
-            stmts_out.append(st)
+    stmts_out = [st for st in stmts_in if _get_is_direct(st)]
     logger.info('%d statements after filter...' % len(stmts_out))
     dump_pkl = kwargs.get('save')
     if dump_pkl:
@@ -1150,7 +1411,20 @@ def filter_direct(stmts_in, **kwargs):
     return stmts_out
 
 
+def _is_not_hypothesis(st):
+    all_hypotheses = True
+    ev = None
+    for ev in st.evidence:
+        if not ev.epistemics.get('hypothesis', False):
+            all_hypotheses = False
+            break
+    if ev is None:
+        all_hypotheses = False
+    return not all_hypotheses
+
+
 @register_pipeline
+@register_stmt_predicate(lambda **kwargs: _is_not_hypothesis)
 def filter_no_hypothesis(stmts_in, **kwargs):
     """Filter to statements that are not marked as hypothesis in epistemics.
 
@@ -1167,18 +1441,7 @@ def filter_no_hypothesis(stmts_in, **kwargs):
         A list of filtered statements.
     """
     logger.info('Filtering %d statements to no hypothesis...' % len(stmts_in))
-    stmts_out = []
-    for st in stmts_in:
-        all_hypotheses = True
-        ev = None
-        for ev in st.evidence:
-            if not ev.epistemics.get('hypothesis', False):
-                all_hypotheses = False
-                break
-        if ev is None:
-            all_hypotheses = False
-        if not all_hypotheses:
-            stmts_out.append(st)
+    stmts_out = [st for st in stmts_in if _is_not_hypothesis(st)]
     logger.info('%d statements after filter...' % len(stmts_out))
     dump_pkl = kwargs.get('save')
     if dump_pkl:
@@ -1186,7 +1449,20 @@ def filter_no_hypothesis(stmts_in, **kwargs):
     return stmts_out
 
 
+def _is_not_negated(st):
+    all_negated = True
+    ev = None
+    for ev in st.evidence:
+        if not ev.epistemics.get('negated', False):
+            all_negated = False
+            break
+    if ev is None:
+        all_negated = False
+    return not all_negated
+
+
 @register_pipeline
+@register_stmt_predicate(lambda **kwargs: _is_not_negated)
 def filter_no_negated(stmts_in, **kwargs):
     """Filter to statements that are not marked as negated in epistemics.
 
@@ -1203,18 +1479,7 @@ def filter_no_negated(stmts_in, **kwargs):
         A list of filtered statements.
     """
     logger.info('Filtering %d statements to not negated...' % len(stmts_in))
-    stmts_out = []
-    for st in stmts_in:
-        all_negated = True
-        ev = None
-        for ev in st.evidence:
-            if not ev.epistemics.get('negated', False):
-                all_negated = False
-                break
-        if ev is None:
-            all_negated = False
-        if not all_negated:
-            stmts_out.append(st)
+    stmts_out = [st for st in stmts_in if _is_not_negated(st)]
     logger.info('%d statements after filter...' % len(stmts_out))
     dump_pkl = kwargs.get('save')
     if dump_pkl:
@@ -1222,7 +1487,23 @@ def filter_no_negated(stmts_in, **kwargs):
     return stmts_out
 
 
+def _evidence_source_predicate(source_apis, policy='one', **kwargs):
+    source_apis = set(source_apis)
+
+    def has_sources(st):
+        sources = set([ev.source_api for ev in st.evidence])
+        if policy == 'one':
+            return bool(sources & source_apis)
+        if policy == 'all':
+            return sources & source_apis == source_apis
+        if policy == 'none':
+            return not sources & source_apis
+        return False
+    return has_sources
+
+
 @register_pipeline
+@register_stmt_predicate(_evidence_source_predicate)
 def filter_evidence_source(stmts_in, source_apis, policy='one', **kwargs):
     """Filter to statements that have evidence from a given set of sources.
 
@@ -1248,18 +1529,8 @@ def filter_evidence_source(stmts_in, source_apis, policy='one', **kwargs):
     """
     logger.info('Filtering %d statements to evidence source "%s" of: %s...' %
                 (len(stmts_in), policy, ', '.join(source_apis)))
-    stmts_out = []
-    for st in stmts_in:
-        sources = set([ev.source_api for ev in st.evidence])
-        if policy == 'one':
-            if sources.intersection(source_apis):
-                stmts_out.append(st)
-        if policy == 'all':
-            if sources.intersection(source_apis) == set(source_apis):
-                stmts_out.append(st)
-        if policy == 'none':
-            if not sources.intersection(source_apis):
-                stmts_out.append(st)
+    predicate = _evidence_source_predicate(source_apis, policy)
+    stmts_out = [st for st in stmts_in if predicate(st)]
     logger.info('%d statements after filter...' % len(stmts_out))
     dump_pkl = kwargs.get('save')
     if dump_pkl:
@@ -1303,6 +1574,7 @@ def filter_retracted_sources(stmts_in, **kwargs):
 
 
 @register_pipeline
+@register_stmt_predicate(lambda **kwargs: lambda st: not st.supports)
 def filter_top_level(stmts_in, **kwargs):
     """Filter to statements that are at the top-level of the hierarchy.
 
@@ -1483,8 +1755,40 @@ def get_unreachable_mods(stmts_in):
     return unreachable_mods
 
 
+def _agent_has_mutation_status(mutations, deletions, agent):
+    if agent is not None and agent.name in deletions:
+        return False
+    if agent is not None and agent.mutations:
+        muts = mutations.get(agent.name, [])
+        for mut in agent.mutations:
+            mut_tup = (mut.residue_from, mut.position, mut.residue_to)
+            if mut_tup not in muts:
+                return False
+    return True
+
+
+def _has_mutation_status(criterion, remove_bound, stmt):
+    for agent in stmt.agent_list():
+        if not criterion(agent):
+            return False
+        if remove_bound:
+            _remove_bound_conditions(agent, criterion)
+        elif _any_bound_condition_fails_criterion(agent, criterion):
+            return False
+    return True
+
+
+def _mutation_status_predicate(mutations, deletions, remove_bound=False,
+                               **kwargs):
+    return partial(_has_mutation_status,
+                   partial(_agent_has_mutation_status, mutations, deletions),
+                   bool(remove_bound))
+
+
 @register_pipeline
-def filter_mutation_status(stmts_in, mutations, deletions, **kwargs):
+@register_stmt_predicate(_mutation_status_predicate)
+def filter_mutation_status(stmts_in, mutations, deletions, n_procs=1,
+                           **kwargs):
     """Filter statements based on existing mutations/deletions
 
     This filter helps to contextualize a set of statements to a given
@@ -1502,6 +1806,9 @@ def filter_mutation_status(stmts_in, mutations, deletions, **kwargs):
         Example: mutations = {'BRAF': [('V', '600', 'E')]}
     deletions : list
         A list of gene names that are deleted.
+    n_procs : Optional[int]
+        If larger than 1 and remove_bound is False, the statements are
+        filtered in chunks by a pool of this many processes. Default: 1
     save : Optional[str]
         The name of a pickle file to save the results (stmts_out) into.
 
@@ -1511,38 +1818,13 @@ def filter_mutation_status(stmts_in, mutations, deletions, **kwargs):
         A list of filtered statements.
     """
 
-    if 'remove_bound' in kwargs and kwargs['remove_bound']:
-        remove_bound = True
-    else:
-        remove_bound = False
-
-    def criterion(agent):
-        if agent is not None and agent.name in deletions:
-            return False
-        if agent is not None and agent.mutations:
-            muts = mutations.get(agent.name, [])
-            for mut in agent.mutations:
-                mut_tup = (mut.residue_from, mut.position, mut.residue_to)
-                if mut_tup not in muts:
-                    return False
-        return True
-
     logger.info('Filtering %d statements for mutation status...' %
                 len(stmts_in))
-    stmts_out = []
-    for stmt in stmts_in:
-        skip = False
-        for agent in stmt.agent_list():
-            if not criterion(agent):
-                skip = True
-                break
-            if remove_bound:
-                _remove_bound_conditions(agent, criterion)
-            elif _any_bound_condition_fails_criterion(agent, criterion):
-                skip = True
-                break
-        if not skip:
-            stmts_out.append(stmt)
+    predicate = _mutation_status_predicate(mutations, deletions, **kwargs)
+    # Removing bound conditions changes the statements, which is only kept
+    # when filtering serially
+    stmts_out = filter_in_chunks(stmts_in, predicate,
+                                 1 if kwargs.get('remove_bound') else n_procs)
     logger.info('%d statements after filter...' % len(stmts_out))
     dump_pkl = kwargs.get('save')
     if dump_pkl:
@@ -1663,7 +1945,7 @@ def filter_transcription_factor(stmts_in, **kwargs):
 
 
 @register_pipeline
-def filter_uuid_list(stmts_in, uuids, invert=True, **kwargs):
+def filter_uuid_list(stmts_in, uuids, invert=True, index=None, **kwargs):
     """Filter to Statements corresponding to given UUIDs
 
     Parameters
@@ -1677,6 +1959,9 @@ def filter_uuid_list(stmts_in, uuids, invert=True, **kwargs):
     invert : Optional[bool]
         Invert the filter to remove the Statements corresponding to the given
         UUIDs.
+    index : Optional[indra.tools.statement_index.StatementIndex]
+        If given and all the statements are in this index, the index is
+        used to find the statements with the given UUIDs.
 
     Returns
     -------
@@ -1685,14 +1970,22 @@ def filter_uuid_list(stmts_in, uuids, invert=True, **kwargs):
     """
     logger.info('Filtering %d statements for %d UUID%s...' %
                 (len(stmts_in), len(uuids), 's' if len(uuids) > 1 else ''))
-    stmts_out = []
-    for st in stmts_in:
-        if not invert:
-            if st.uuid in uuids:
-                stmts_out.append(st)
-        else:
-            if st.uuid not in uuids:
-                stmts_out.append(st)
+    uuids = set(uuids)
+    positions = get_indexed_positions(index, stmts_in)
+    if positions is not None:
+        matching = index.with_uuids(uuids)
+        if invert:
+            matching = index.all() - matching
+        stmts_out = select_indexed(index, stmts_in, positions, matching)
+    else:
+        stmts_out = []
+        for st in stmts_in:
+            if not invert:
+                if st.uuid in uuids:
+                    stmts_out.append(st)
+            else:
+                if st.uuid not in uuids:
+                    stmts_out.append(st)
 
     logger.info('%d statements after filter...' % len(stmts_out))
     dump_pkl = kwargs.get('save')
@@ -1703,7 +1996,8 @@ def filter_uuid_list(stmts_in, uuids, invert=True, **kwargs):
 
 @register_pipeline
 def filter_by_curation(stmts_in, curations, incorrect_policy='any',
-                       correct_tags=None, update_belief=True):
+                       correct_tags=None, update_belief=True, n_procs=1,
+                       index=None):
     """Filter out statements and update beliefs based on curations.
 
     Parameters
@@ -1727,6 +2021,13 @@ def filter_by_curation(stmts_in, curations, incorrect_policy='any',
     update_belief : Option[bool]
         If True, set a belief score to 1 for statements curated as correct.
         Default: True
+    n_procs : Optional[int]
+        If larger than 1, the statements are filtered in chunks by a pool of
+        this many processes. Default: 1
+    index : Optional[indra.tools.statement_index.StatementIndex]
+        If given and all the statements are in this index, the hashes of
+        the statements are taken from the index rather than calculated, and
+        the statements with incorrect curations are looked up in it.
     """
     if correct_tags is None:
         correct_tags = ['correct']
@@ -1748,43 +2049,17 @@ def filter_by_curation(stmts_in, curations, incorrect_policy='any',
                 correct_stmt_evid[pa_hash]['correct'].add(c['source_hash'])
             else:
                 correct_stmt_evid[pa_hash]['incorrect'].add(c['source_hash'])
-    stmts_out = []
     logger.info('Filtering %d statements with %s incorrect curations...' %
                 (len(stmts_in), incorrect_policy))
 
-    def _is_incorrect(stmt_hash, evid_hash):
-        # Evidence is incorrect if it was only curated as incorrect
-        if evid_hash in correct_stmt_evid[stmt_hash]['incorrect'] and \
-                evid_hash not in correct_stmt_evid[stmt_hash]['correct']:
-            return True
-        return False
-
-    def process_and_append(stmt, stmt_list):
-        # Filter out incorrect evidences for correct statements
-        stmt_hash = stmt.get_hash()  # Already refreshed when this is called
-        if stmt_hash in correct_stmt_evid:
-            evidence = []
-            for evid in stmt.evidence:
-                if _is_incorrect(stmt_hash, evid.get_source_hash()):
-                    continue
-                else:
-                    evidence.append(evid)
-            # If no evidence left, skip the statement
-            if len(evidence) == 0:
-                return
-            stmt.evidence = evidence
-        # Set belief to one for statements with correct curations
-        if update_belief and stmt_hash in correct:
-            stmt.belief = 1
-        stmt_list.append(stmt)
-
+    positions = get_indexed_positions(index, stmts_in)
+    excluded = set()
+    incorrect_stmt_evid = None
     if incorrect_policy == 'any':
         # Filter statements that have SOME incorrect and NO correct curations
         # (i.e. their hashes are in incorrect set)
-        for stmt in stmts_in:
-            stmt_hash = stmt.get_hash(refresh=True)
-            if stmt_hash not in incorrect:
-                process_and_append(stmt, stmts_out)
+        if positions is not None:
+            excluded = index.with_hashes(incorrect)
     elif incorrect_policy == 'all':
         # Filter out statements in which ALL evidences are curated
         # as incorrect.
@@ -1793,28 +2068,97 @@ def filter_by_curation(stmts_in, curations, incorrect_policy='any',
         for c in curations:
             if c['pa_hash'] in incorrect:
                 incorrect_stmt_evid[c['pa_hash']].add(c['source_hash'])
-        for stmt in stmts_in:
-            # Compare set of evidence hashes of given statements to set of
-            # hashes of curated evidences.
+        if positions is not None:
+            excluded = {
+                pos for pos in index.with_hashes(incorrect_stmt_evid)
+                if {ev.get_source_hash()
+                    for ev in index.statements[pos].evidence} <=
+                incorrect_stmt_evid[index.get_hash(pos)]}
+    if positions is not None and incorrect_policy in ('any', 'all'):
+        # The hashes of the statements were refreshed when the index was
+        # built, so that the statements can be processed directly
+        kept = [(stmt, stmt.get_hash())
+                for stmt in select_indexed(index, stmts_in, positions,
+                                           index.all() - excluded)]
+    else:
+        # Only the statements to keep are selected in chunks, along with
+        # their hashes, and their evidences and beliefs are updated here so
+        # that the original statements are returned.
+        kept = _select_in_chunks(
+            stmts_in, partial(_select_curated_chunk, incorrect_policy,
+                              incorrect, incorrect_stmt_evid), n_procs)
+    stmts_out = []
+    for stmt, stmt_hash in kept:
+        _process_curated_stmt(correct, correct_stmt_evid, update_belief,
+                              stmt, stmt_hash, stmts_out)
+    logger.info('%d statements after filter...' % len(stmts_out))
+    return stmts_out
+
+
+def _is_incorrect(correct_stmt_evid, stmt_hash, evid_hash):
+    # Evidence is incorrect if it was only curated as incorrect
+    if evid_hash in correct_stmt_evid[stmt_hash]['incorrect'] and \
+            evid_hash not in correct_stmt_evid[stmt_hash]['correct']:
+        return True
+    return False
+
+
+def _process_curated_stmt(correct, correct_stmt_evid, update_belief, stmt,
+                          stmt_hash, stmt_list):
+    # Filter out incorrect evidences for correct statements
+    if stmt_hash in correct_stmt_evid:
+        evidence = []
+        for evid in stmt.evidence:
+            if _is_incorrect(correct_stmt_evid, stmt_hash,
+                             evid.get_source_hash()):
+                continue
+            else:
+                evidence.append(evid)
+        # If no evidence left, skip the statement
+        if len(evidence) == 0:
+            return
+        stmt.evidence = evidence
+    # Set belief to one for statements with correct curations
+    if update_belief and stmt_hash in correct:
+        stmt.belief = 1
+    stmt_list.append(stmt)
+
+
+def _select_curated_chunk(incorrect_policy, incorrect, incorrect_stmt_evid,
+                          stmts):
+    selected = []
+    if incorrect_policy == 'any':
+        for pos, stmt in enumerate(stmts):
+            stmt_hash = stmt.get_hash(refresh=True)
+            if stmt_hash not in incorrect:
+                selected.append((pos, stmt_hash))
+    elif incorrect_policy == 'all':
+        for pos, stmt in enumerate(stmts):
+            # Compare set of evidence hashes of given statements to set
+            # of hashes of curated evidences.
             stmt_hash = stmt.get_hash(refresh=True)
             if stmt_hash in incorrect_stmt_evid and (
                     {ev.get_source_hash() for ev in stmt.evidence} <=
                     incorrect_stmt_evid[stmt_hash]):
                 continue
             else:
-                process_and_append(stmt, stmts_out)
-    logger.info('%d statements after filter...' % len(stmts_out))
-    return stmts_out
+                selected.append((pos, stmt_hash))
+    return selected
 
 
 @register_pipeline
-def expand_families(stmts_in, **kwargs):
+def expand_families(stmts_in, n_procs=1, **kwargs):
     """Expand FamPlex Agents to individual genes.
 
     Parameters
     ----------
     stmts_in : list[indra.statements.Statement]
         A list of statements to expand.
+    n_procs : Optional[int]
+        If larger than 1, the statements are expanded in chunks by a pool of
+        this many processes, which share the tables of the ontology, unless
+        some statements have supports or supported_by links, in which case
+        they are expanded serially. Default: 1
     save : Optional[str]
         The name of a pickle file to save the results (stmts_out) into.
 
@@ -1823,10 +2167,11 @@ def expand_families(stmts_in, **kwargs):
     stmts_out : list[indra.statements.Statement]
         A list of expanded statements.
     """
-    from indra.tools.expand_families import Expander
     logger.info('Expanding families on %d statements...' % len(stmts_in))
-    expander = Expander(bio_ontology)
-    stmts_out = expander.expand_families(stmts_in)
+    if n_procs and n_procs > 1 and not bio_ontology._initialized:
+        # The ontology is loaded once here so that the workers share it
+        bio_ontology.initialize()
+    stmts_out = apply_in_chunks(stmts_in, _expand_families_chunk, n_procs)
     logger.info('%d statements after expanding families...' % len(stmts_out))
     dump_pkl = kwargs.get('save')
     if dump_pkl:
@@ -1834,6 +2179,13 @@ def expand_families(stmts_in, **kwargs):
     return stmts_out
 
 
+def _expand_families_chunk(stmts):
+    # The ontology is looked up in the process the chunk is expanded in
+    # rather than being pickled along with the function.
+    from indra.tools.expand_families import Expander
+    return Expander(bio_ontology).expand_families(stmts)
+
+
 @register_pipeline
 def reduce_activities(stmts_in, **kwargs):
     """Reduce the activity types in a list of statements
@@ -1862,14 +2214,31 @@ def reduce_activities(stmts_in, **kwargs):
     return stmts_out
 
 
+def _strip_agent_context(st):
+    new_st = deepcopy(st)
+    for agent in new_st.agent_list():
+        if agent is None:
+            continue
+        agent.mods = []
+        agent.mutations = []
+        agent.activity = None
+        agent.location = None
+        agent.bound_conditions = []
+    return new_st
+
+
 @register_pipeline
-def strip_agent_context(stmts_in, **kwargs):
+@register_stmt_map(lambda **kwargs: _strip_agent_context)
+def strip_agent_context(stmts_in, n_procs=1, **kwargs):
     """Strip any context on agents within each statement.
 
     Parameters
     ----------
     stmts_in : list[indra.statements.Statement]
         A list of statements whose agent context should be stripped.
+    n_procs : Optional[int]
+        If larger than 1, the statements are stripped in chunks by a pool of
+        this many processes. Default: 1
     save : Optional[str]
         The name of a pickle file to save the results (stmts_out) into.
 
@@ -1879,18 +2248,9 @@ def strip_agent_context(stmts_in, **kwargs):
         A list of stripped statements.
     """
     logger.info('Stripping agent context on %d statements...' % len(stmts_in))
-    stmts_out = []
-    for st in stmts_in:
-        new_st = deepcopy(st)
-        for agent in new_st.agent_list():
-            if agent is None:
-                continue
-            agent.mods = []
-            agent.mutations = []
-            agent.activity = None
-            agent.location = None
-            agent.bound_conditions = []
-        stmts_out.append(new_st)
+    stmts_out = apply_in_chunks(stmts_in,
+                                partial(_map_chunk, _strip_agent_context),
+                                n_procs)
     dump_pkl = kwargs.get('save')
     if dump_pkl:
         dump_statements(stmts_out, dump_pkl)
@@ -1898,7 +2258,7 @@ def strip_agent_context(stmts_in, **kwargs):
 
 
 @register_pipeline
-def standardize_names_groundings(stmts):
+def standardize_names_groundings(stmts, n_procs=1):
     """Standardize the names of Concepts with respect to an ontology.
 
     NOTE: this function is currently optimized for Influence Statements
@@ -1909,8 +2269,18 @@ def standardize_names_groundings(stmts):
     ----------
     stmts : list[indra.statements.Statement]
         A list of statements whose Concept names should be standardized.
+    n_procs : Optional[int]
+        If larger than 1, the statements are standardized in chunks by a
+        pool of this many processes, and copies of the statements are
+        returned instead of the statements being changed in place, unless
+        some statements have supports or supported_by links, in which case
+        they are standardized serially. Default: 1
     """
     print('Standardize names to groundings')
+    return apply_in_chunks(stmts, _standardize_names_groundings, n_procs)
+
+
+def _standardize_names_groundings(stmts):
     for stmt in stmts:
         for concept in stmt.agent_list():
             db_ns, db_id = concept.get_grounding()
@@ -1942,7 +2312,18 @@ def dump_stmt_strings(stmts, fname):
             fh.write(('%s\n' % st).encode('utf-8'))
 
 
+def _rename_db_ref_map(ns_from, ns_to, **kwargs):
+    def rename(st):
+        new_st = deepcopy(st)
+        for agent in new_st.agent_list():
+            if agent is not None and ns_from in agent.db_refs:
+                agent.db_refs[ns_to] = agent.db_refs.pop(ns_from)
+        return new_st
+    return rename
+
+
 @register_pipeline
+@register_stmt_map(_rename_db_ref_map)
 def rename_db_ref(stmts_in, ns_from, ns_to, **kwargs):
     """Rename an entry in the db_refs of each Agent.
 
@@ -1968,18 +2349,15 @@ def rename_db_ref(stmts_in, ns_from, ns_to, **kwargs):
     """
     logger.info('Remapping "%s" to "%s" in db_refs on %d statements...' %
                 (ns_from, ns_to, len(stmts_in)))
-    stmts_out = [deepcopy(st) for st in stmts_in]
-    for stmt in stmts_out:
-        for agent in stmt.agent_list():
-            if agent is not None and ns_from in agent.db_refs:
-                agent.db_refs[ns_to] = agent.db_refs.pop(ns_from)
+    rename = _rename_db_ref_map(ns_from, ns_to)
+    stmts_out = [rename(st) for st in stmts_in]
     dump_pkl = kwargs.get('save')
     if dump_pkl:
         dump_statements(stmts_out, dump_pkl)
     return stmts_out
 
 
-def align_statements(stmts1, stmts2, keyfun=None):
+def align_statements(stmts1, stmts2, keyfun=None, all_matches=False):
     """Return alignment of two lists of statements by key.
 
     Parameters
@@ -1992,7 +2370,12 @@ def align_statements(stmts1, stmts2, keyfun=None):
         A function that takes a Statement as an argument
         and returns a key to align by. If not given,
         the default key function is a tuble of the names
-        of the Agents in the Statement.
+        of the Agents in the Statement. The keys have to
+        be hashable.
+    all_matches : Optional[bool]
+        If True, each element of stmts1 is paired with every
+        element of stmts2 with the same key, rather than with
+        the first one only. Default: False
 
     Return
     ------
@@ -2011,22 +2394,32 @@ def align_statements(stmts1, stmts2, keyfun=None):
     matches = []
     keys1 = [keyfun(s) for s in stmts1]
     keys2 = [keyfun(s) for s in stmts2]
+    # Statements of the second list by key, in their original order
+    stmts2_by_key = defaultdict(list)
+    for stmt, key in zip(stmts2, keys2):
+        stmts2_by_key[key].append(stmt)
     for stmt, key in zip(stmts1, keys1):
-        try:
-            match_idx = keys2.index(key)
-            match_stmt = stmts2[match_idx]
-            matches.append((stmt, match_stmt))
-        except ValueError:
+        match_stmts = stmts2_by_key.get(key)
+        if not match_stmts:
             matches.append((stmt, None))
+        elif all_matches:
+            matches += [(stmt, match_stmt) for match_stmt in match_stmts]
+        else:
+            matches.append((stmt, match_stmts[0]))
+    keys1 = set(keys1)
     for stmt, key in zip(stmts2, keys2):
-        try:
-            match_idx = keys1.index(key)
-        except ValueError:
+        if key not in keys1:
             matches.append((None, stmt))
     return matches
 
 
+def _complexes_by_size_predicate(members_allowed=5):
+    return lambda stmt: not (isinstance(stmt, Complex) and
+                             len(stmt.members) > members_allowed)
+
+
 @register_pipeline
+@register_stmt_predicate(_complexes_by_size_predicate)
 def filter_complexes_by_size(stmts_in, members_allowed=5):
     """Filter out Complexes if the number of members exceeds specified allowed
     number.
@@ -2043,14 +2436,10 @@ def filter_complexes_by_size(stmts_in, members_allowed=5):
     stmts_out : list[indra.statements.Statement]
         A list of filtered Statements.
     """
-    stmts_out = []
     logger.info('Filtering out Complexes with more than %d members from %d '
                 'statements...' % (members_allowed, len(stmts_in)))
-    for stmt in stmts_in:
-        if isinstance(stmt, Complex) and len(stmt.members) > members_allowed:
-            continue
-        else:
-            stmts_out.append(stmt)
+    predicate = _complexes_by_size_predicate(members_allowed)
+    stmts_out = [stmt for stmt in stmts_in if predicate(stmt)]
     logger.info('%d statements after filter...' % len(stmts_out))
     return stmts_out
 
@@ -0,0 +1,149 @@
+"""Compare two corpora of Statements, e.g., two versions of a model.
+
+The Statements of the two corpora are matched by their hash in a single pass
+over each corpus, and the Statements which are only in the first corpus are
+reported as removed, those only in the second corpus as added, and those in
+both as changed if their number of evidences or their belief differ. If a
+corpus contains several Statements with the same hash, they are matched in
+order with those of the other corpus.
+
+The comparison can also be run on two pickle or JSON files of Statements as
+
+    python -m indra.tools.corpus_diff old.pkl new.pkl --output diff.json
+
+optionally with a --belief-tolerance.
+"""
+
+__all__ = ['CorpusDiff', 'diff_corpora']
+
+import json
+import logging
+import argparse
+from collections import defaultdict
+
+logger = logging.getLogger(__name__)
+
+
+class CorpusDiff(object):
+    """The differences between two corpora of Statements.
+
+    Attributes
+    ----------
+    added : list[indra.statements.Statement]
+        The Statements of the second corpus which aren't in the first one.
+    removed : list[indra.statements.Statement]
+        The Statements of the first corpus which aren't in the second one.
+    changed : list[tuple]
+        Pairs of Statements of the first and second corpus with the same
+        hash but a different number of evidences or belief.
+    num_unchanged : int
+        The number of Statements in both corpora which didn't change.
+    """
+    def __init__(self):
+        self.added = []
+        self.removed = []
+        self.changed = []
+        self.num_unchanged = 0
+
+    def to_json(self):
+        """Return the differences as a JSON-serializable dict."""
+        def stmt_entry(stmt):
+            return {'hash': stmt.get_hash(), 'statement': str(stmt),
+                    'num_evidence': len(stmt.evidence),
+                    'belief': stmt.belief}
+
+        return {
+            'num_unchanged': self.num_unchanged,
+            'added': [stmt_entry(stmt) for stmt in self.added],
+            'removed': [stmt_entry(stmt) for stmt in self.removed],
+            'changed': [{'hash': stmt1.get_hash(), 'statement': str(stmt2),
+                         'num_evidence': [len(stmt1.evidence),
+                                          len(stmt2.evidence)],
+                         'belief': [stmt1.belief, stmt2.belief]}
+                        for stmt1, stmt2 in self.changed]
+        }
+
+    def __str__(self):
+        return ('%d statements added, %d removed, %d changed and %d '
+                'unchanged' % (len(self.added), len(self.removed),
+                               len(self.changed), self.num_unchanged))
+
+
+def diff_corpora(stmts1, stmts2, belief_tolerance=0.0):
+    """Return the differences between two corpora of Statements.
+
+    Parameters
+    ----------
+    stmts1 : list[indra.statements.Statement]
+        The first (e.g., old) corpus.
+    stmts2 : list[indra.statements.Statement]
+        The second (e.g., new) corpus.
+    belief_tolerance : Optional[float]
+        Statements whose belief differs by at most this much between the two
+        corpora (and whose number of evidences is the same) are considered
+        unchanged. Default: 0.0
+
+    Returns
+    -------
+    CorpusDiff
+        The Statements added, removed and changed in the second corpus with
+        respect to the first one.
+    """
+    stmts1_by_hash = defaultdict(list)
+    for stmt in stmts1:
+        stmts1_by_hash[stmt.get_hash(refresh=True)].append(stmt)
+    diff = CorpusDiff()
+    num_matched = defaultdict(int)
+    for stmt2 in stmts2:
+        stmt_hash = stmt2.get_hash(refresh=True)
+        matches = stmts1_by_hash.get(stmt_hash, [])
+        if num_matched[stmt_hash] >= len(matches):
+            diff.added.append(stmt2)
+            continue
+        stmt1 = matches[num_matched[stmt_hash]]
+        num_matched[stmt_hash] += 1
+        if len(stmt1.evidence) != len(stmt2.evidence) or \
+                abs(stmt1.belief - stmt2.belief) > belief_tolerance:
+            diff.changed.append((stmt1, stmt2))
+        else:
+            diff.num_unchanged += 1
+    # The statements of the first corpus which weren't matched are the last
+    # ones of each hash
+    num_seen = defaultdict(int)
+    for stmt1 in stmts1:
+        stmt_hash = stmt1.get_hash()
+        num_seen[stmt_hash] += 1
+        if num_seen[stmt_hash] > num_matched[stmt_hash]:
+            diff.removed.append(stmt1)
+    logger.info('Compared %d and %d statements: %s'
+                % (len(stmts1), len(stmts2), diff))
+    return diff
+
+
+def _load_corpus(fname):
+    if fname.endswith('.json'):
+        from indra.statements import stmts_from_json_file
+        return stmts_from_json_file(fname)
+    from indra.tools.assemble_corpus import load_statements
+    return load_statements(fname)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Compare two corpora of INDRA Statements.')
+    parser.add_argument('corpus1', help='A pickle or JSON file of the '
+                                        'first (e.g., old) corpus.')
+    parser.add_argument('corpus2', help='A pickle or JSON file of the '
+                                        'second (e.g., new) corpus.')
+    parser.add_argument('--belief-tolerance', type=float, default=0.0)
+    parser.add_argument('--output', help='A JSON file to save the '
+                                         'differences into.')
+    args = parser.parse_args()
+
+    diff = diff_corpora(_load_corpus(args.corpus1),
+                        _load_corpus(args.corpus2),
+                        belief_tolerance=args.belief_tolerance)
+    print(diff)
+    if args.output:
+        with open(args.output, 'w') as fh:
+            json.dump(diff.to_json(), fh, indent=1)
@@ -0,0 +1,458 @@
+"""An index of a list of Statements for fast filtering and lookup.
+
+A :class:`StatementIndex` is built once over a corpus of Statements and maps
+agent names, agent groundings, Statement types, evidence sources, PMIDs,
+UUIDs and hashes to the positions of the Statements in the corpus. Queries
+return sets of positions which can be combined with the usual set operators
+and turned back into Statements, e.g.,
+
+>>> from indra.tools.statement_index import StatementIndex
+>>> index = StatementIndex(stmts)
+>>> positions = index.with_names(['BRAF']) & index.with_type(Phosphorylation)
+>>> positions -= index.with_source_apis(['sparser'])
+>>> braf_stmts = index.get_statements(positions)
+
+Several filters in :mod:`indra.tools.assemble_corpus` (e.g.,
+`filter_gene_list`, `filter_by_db_refs`, `filter_concept_names`,
+`filter_uuid_list` and `filter_by_curation`) take an index as their `index`
+argument, and use it instead of scanning all the Statements and their
+agents, as long as the Statements given to them are part of the indexed
+corpus.
+
+The index reflects the Statements at the time it was built, so it should
+be rebuilt if the Statements are changed in place.
+"""
+
+__all__ = ['StatementIndex']
+
+import logging
+from collections import defaultdict, Counter
+
+logger = logging.getLogger(__name__)
+
+
+class StatementIndex(object):
+    """An index of a list of Statements.
+
+    Parameters
+    ----------
+    stmts : list[indra.statements.Statement]
+        The Statements to index. The index refers to this list, which
+        shouldn't be changed afterwards.
+
+    Attributes
+    ----------
+    statements : list[indra.statements.Statement]
+        The indexed Statements.
+    """
+    def __init__(self, stmts):
+        self.statements = stmts
+        # Each agent occurrence adds the position of its Statement to the
+        # entries of its name and groundings, so that the entries can also
+        # be used to count matching agents.
+        self._names = defaultdict(list)
+        self._bound_names = defaultdict(list)
+        self._groundings = defaultdict(list)
+        self._namespaces = defaultdict(list)
+        self._num_agents = []
+        self._num_bound_agents = []
+        self._agentless = set()
+        self._types = defaultdict(set)
+        self._source_apis = defaultdict(set)
+        self._pmids = defaultdict(set)
+        self._uuids = {}
+        self._hashes = None
+        self._stmt_hashes = None
+        self._positions = {}
+        for pos, stmt in enumerate(stmts):
+            self._positions[id(stmt)] = pos
+            self._types[type(stmt)].add(pos)
+            self._uuids[stmt.uuid] = pos
+            agents = [ag for ag in stmt.agent_list() if ag is not None]
+            self._num_agents.append(len(agents))
+            if not agents:
+                self._agentless.add(pos)
+            num_bound_agents = len(agents)
+            for agent in agents:
+                self._names[agent.name].append(pos)
+                self._bound_names[agent.name].append(pos)
+                for ns, entry in agent.db_refs.items():
+                    if isinstance(entry, list):
+                        if not entry:
+                            continue
+                        entry = entry[0][0]
+                    try:
+                        self._groundings[(ns, entry)].append(pos)
+                    except TypeError:
+                        continue
+                    self._namespaces[ns].append(pos)
+                for bc in getattr(agent, 'bound_conditions', []):
+                    if bc.agent is not None:
+                        self._bound_names[bc.agent.name].append(pos)
+                        num_bound_agents += 1
+            self._num_bound_agents.append(num_bound_agents)
+            for ev in stmt.evidence:
+                self._source_apis[ev.source_api].add(pos)
+                if ev.pmid:
+                    self._pmids[ev.pmid].add(pos)
+        logger.info('Indexed %d statements with %d agent names and %d '
+                    'groundings' % (len(stmts), len(self._names),
+                                    len(self._groundings)))
+
+    def __len__(self):
+        return len(self.statements)
+
+    def all(self):
+        """Return the positions of all the Statements."""
+        return set(range(len(self.statements)))
+
+    def with_names(self, names, include_bound=False):
+        """Return the positions of Statements with an agent of given names.
+
+        Parameters
+        ----------
+        names : list[str]
+            Agent names.
+        include_bound : Optional[bool]
+            If True, the agents in the bound conditions of the Statements'
+            agents are also considered. Default: False
+
+        Returns
+        -------
+        set[int]
+            The positions of the Statements with at least one such agent.
+        """
+        index = self._bound_names if include_bound else self._names
+        return self._union(index, names)
+
+    def with_only_names(self, names, include_bound=False):
+        """Return the positions of Statements whose agents all have given
+        names.
+
+        Parameters
+        ----------
+        names : list[str]
+            Agent names.
+        include_bound : Optional[bool]
+            If True, the agents in the bound conditions of the Statements'
+            agents are also considered. Default: False
+
+        Returns
+        -------
+        set[int]
+            The positions of the Statements all of whose agents have one of
+            the names, including those without any agents.
+        """
+        if include_bound:
+            return self._only(self._bound_names, names,
+                              self._num_bound_agents)
+        return self._only(self._names, names, self._num_agents)
+
+    def with_groundings(self, namespace, ids):
+        """Return the positions of Statements with an agent grounded to
+        given IDs.
+
+        Parameters
+        ----------
+        namespace : str
+            The namespace of the groundings in the agents' db_refs.
+        ids : list[str]
+            The IDs in the namespace. For db_refs entries which are lists of
+            scored groundings, the top grounding is used.
+
+        Returns
+        -------
+        set[int]
+            The positions of the Statements with at least one such agent.
+        """
+        return self._union(self._groundings, [(namespace, db_id)
+                                              for db_id in ids])
+
+    def with_only_groundings(self, namespace, ids):
+        """Return the positions of Statements whose agents are all grounded
+        to given IDs.
+
+        Parameters
+        ----------
+        namespace : str
+            The namespace of the groundings in the agents' db_refs.
+        ids : list[str]
+            The IDs in the namespace.
+
+        Returns
+        -------
+        set[int]
+            The positions of the Statements all of whose agents are grounded
+            to one of the IDs, including those without any agents.
+        """
+        return self._only(self._groundings, [(namespace, db_id)
+                                             for db_id in ids],
+                          self._num_agents)
+
+    def with_other_groundings(self, namespace, ids):
+        """Return the positions of Statements with an agent grounded in a
+        namespace to an ID other than given ones.
+
+        Parameters
+        ----------
+        namespace : str
+            The namespace of the groundings in the agents' db_refs.
+        ids : list[str]
+            The IDs in the namespace.
+
+        Returns
+        -------
+        set[int]
+            The positions of the Statements with at least one agent grounded
+            in the namespace but not to one of the IDs.
+        """
+        matches = self._count(self._groundings, [(namespace, db_id)
+                                                 for db_id in ids])
+        grounded = Counter(self._namespaces.get(namespace, []))
+        return {pos for pos, count in grounded.items()
+                if count > matches[pos]}
+
+    def with_only_other_groundings(self, namespace, ids):
+        """Return the positions of Statements whose agents are all grounded
+        in a namespace to IDs other than given ones.
+
+        Parameters
+        ----------
+        namespace : str
+            The namespace of the groundings in the agents' db_refs.
+        ids : list[str]
+            The IDs in the namespace.
+
+        Returns
+        -------
+        set[int]
+            The positions of the Statements all of whose agents are grounded
+            in the namespace but not to one of the IDs, including those
+            without any agents.
+        """
+        matches = self._count(self._groundings, [(namespace, db_id)
+                                                 for db_id in ids])
+        grounded = Counter(self._namespaces.get(namespace, []))
+        positions = {pos for pos, count in grounded.items()
+                     if count == self._num_agents[pos] and not matches[pos]}
+        return positions | self._agentless
+
+    def with_type(self, stmt_type):
+        """Return the positions of Statements of a given type.
+
+        Parameters
+        ----------
+        stmt_type : type
+            A Statement class. Statements of its subclasses are also
+            included.
+
+        Returns
+        -------
+        set[int]
+            The positions of the Statements of the type.
+        """
+        positions = set()
+        for cls, cls_positions in self._types.items():
+            if issubclass(cls, stmt_type):
+                positions |= cls_positions
+        return positions
+
+    def with_source_apis(self, source_apis):
+        """Return the positions of Statements with evidence from given
+        sources.
+
+        Parameters
+        ----------
+        source_apis : list[str]
+            Source APIs, e.g., reach or biopax.
+
+        Returns
+        -------
+        set[int]
+            The positions of the Statements with at least one evidence from
+            one of the sources.
+        """
+        return self._union(self._source_apis, source_apis)
+
+    def with_pmids(self, pmids):
+        """Return the positions of Statements with evidence from given PMIDs.
+
+        Parameters
+        ----------
+        pmids : list[str]
+            PubMed IDs.
+
+        Returns
+        -------
+        set[int]
+            The positions of the Statements with at least one evidence from
+            one of the PMIDs.
+        """
+        return self._union(self._pmids, pmids)
+
+    def with_uuids(self, uuids):
+        """Return the positions of Statements with given UUIDs.
+
+        Parameters
+        ----------
+        uuids : list[str]
+            Statement UUIDs.
+
+        Returns
+        -------
+        set[int]
+            The positions of the Statements with the UUIDs.
+        """
+        return {self._uuids[uuid] for uuid in uuids if uuid in self._uuids}
+
+    def with_hashes(self, hashes):
+        """Return the positions of Statements with given hashes.
+
+        The hashes of the Statements are calculated the first time this
+        method is called.
+
+        Parameters
+        ----------
+        hashes : list[int]
+            Statement hashes (as given by Statement.get_hash()).
+
+        Returns
+        -------
+        set[int]
+            The positions of the Statements with the hashes.
+        """
+        return self._union(self._get_hash_index(), hashes)
+
+    def get_hash(self, pos):
+        """Return the hash of the Statement at a given position.
+
+        Parameters
+        ----------
+        pos : int
+            The position of the Statement.
+
+        Returns
+        -------
+        int
+            The hash of the Statement when the hashes were calculated.
+        """
+        self._get_hash_index()
+        return self._stmt_hashes[pos]
+
+    def get_positions(self, stmts):
+        """Return the positions of given Statements in the index.
+
+        Parameters
+        ----------
+        stmts : list[indra.statements.Statement]
+            Statements, which are identified by their identity rather than
+            by their content.
+
+        Returns
+        -------
+        list[int] or None
+            The positions of the Statements, or None if any of them is not
+            indexed.
+        """
+        if stmts is self.statements:
+            return list(range(len(self.statements)))
+        positions = [self._positions.get(id(stmt)) for stmt in stmts]
+        if None in positions:
+            return None
+        return positions
+
+    def get_statements(self, positions):
+        """Return the Statements at given positions, in their original order.
+
+        Parameters
+        ----------
+        positions : set[int]
+            The positions of the Statements, e.g., as returned by a query.
+
+        Returns
+        -------
+        list[indra.statements.Statement]
+            The Statements.
+        """
+        return [self.statements[pos] for pos in sorted(positions)]
+
+    def _get_hash_index(self):
+        if self._hashes is None:
+            self._stmt_hashes = [stmt.get_hash(refresh=True)
+                                 for stmt in self.statements]
+            self._hashes = defaultdict(set)
+            for pos, stmt_hash in enumerate(self._stmt_hashes):
+                self._hashes[stmt_hash].add(pos)
+        return self._hashes
+
+    @staticmethod
+    def _union(index, keys):
+        positions = set()
+        for key in set(keys):
+            if key in index:
+                positions.update(index[key])
+        return positions
+
+    @staticmethod
+    def _count(index, keys):
+        counts = Counter()
+        for key in set(keys):
+            if key in index:
+                counts.update(index[key])
+        return counts
+
+    def _only(self, index, keys, num_agents):
+        counts = self._count(index, keys)
+        positions = {pos for pos, count in counts.items()
+                     if count == num_agents[pos]}
+        return positions | self._agentless
+
+
+def get_indexed_positions(index, stmts):
+    """Return the positions of Statements in an index if they are all in it.
+
+    Parameters
+    ----------
+    index : StatementIndex or None
+        An index.
+    stmts : list[indra.statements.Statement]
+        Statements.
+
+    Returns
+    -------
+    list[int] or None
+        The positions of the Statements in the index, or None if no index is
+        given or not all the Statements are indexed.
+    """
+    if index is None:
+        return None
+    positions = index.get_positions(stmts)
+    if positions is None:
+        logger.info('Not all statements are indexed, not using the index.')
+    return positions
+
+
+def select_indexed(index, stmts, positions, matching):
+    """Return the Statements of a list whose positions match a query.
+
+    Parameters
+    ----------
+    index : StatementIndex
+        An index.
+    stmts : list[indra.statements.Statement]
+        Indexed Statements.
+    positions : list[int]
+        The positions of the Statements in the index (as returned by
+        `get_indexed_positions`).
+    matching : set[int]
+        The positions matching a query.
+
+    Returns
+    -------
+    list[indra.statements.Statement]
+        The Statements whose positions are matching, in the order of the
+        given list.
+    """
+    if stmts is index.statements:
+        return index.get_statements(matching)
+    return [stmt for stmt, pos in zip(stmts, positions) if pos in matching]
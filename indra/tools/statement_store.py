@@ -0,0 +1,329 @@
+"""A chunked, compressed store of Statements on disk.
+
+A statement store is a directory containing the Statements of a corpus split
+into chunks, each of which is a compressed pickle of a list of Statements,
+and an index file (index.json) listing the chunks in order along with their
+number of Statements. Compared to a single pickle of the whole corpus, a
+store
+
+- takes less space on disk,
+- can be loaded with several threads, each reading and decompressing
+  different chunks,
+- can be loaded partially, e.g., only its first chunks, or one chunk at a
+  time with :func:`iter_chunks` so that the whole corpus doesn't need to be
+  in memory at once,
+- can be appended to without rewriting the existing chunks.
+
+The supports and supported_by links between Statements are stored in each
+chunk as the UUIDs of the linked Statements, and the links are restored
+between the Statements loaded together. Links to Statements that are not
+loaded, e.g., in other chunks when loading only some of them, are
+:class:`indra.statements.Unresolved` Statements carrying the UUID.
+
+Chunks are compressed with gzip by default, or with lzma, or with zstd if
+the zstandard package is installed.
+
+Stores are written and read through
+:func:`indra.tools.assemble_corpus.dump_statements` and
+:func:`indra.tools.assemble_corpus.load_statements`, which use a store when
+the file name ends with .stmts (or a `chunk_size` is given) and a single
+pickle file otherwise, e.g.,
+
+>>> from indra.tools import assemble_corpus as ac
+>>> ac.dump_statements(stmts, 'corpus.stmts', chunk_size=10000)
+>>> ac.dump_statements(more_stmts, 'corpus.stmts', append=True)
+>>> stmts = ac.load_statements('corpus.stmts', max_workers=4)
+>>> first_stmts = ac.load_statements('corpus.stmts', chunks=[0])
+"""
+
+__all__ = ['STORE_SUFFIX', 'is_statement_store', 'get_store_index',
+           'dump_chunks', 'load_chunks', 'iter_chunks']
+
+import os
+import gzip
+import lzma
+import json
+import pickle
+import logging
+from copy import copy
+from concurrent.futures import ThreadPoolExecutor
+
+from indra.statements import Unresolved
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+
+STORE_SUFFIX = '.stmts'
+INDEX_FILE = 'index.json'
+# Stores of version 1 have Statements linked by supports and supported_by
+# pickled along with each Statement instead of their UUIDs.
+STORE_VERSION = 2
+_READABLE_VERSIONS = {1, 2}
+DEFAULT_CHUNK_SIZE = 10000
+
+# The file extension of the chunks for each compression
+_extensions = {'gzip': '.pkl.gz', 'lzma': '.pkl.xz', 'zstd': '.pkl.zst',
+               None: '.pkl'}
+
+
+def is_statement_store(fname):
+    """Return True if a path is an existing statement store.
+
+    Parameters
+    ----------
+    fname : str
+        A path.
+
+    Returns
+    -------
+    bool
+        True if the path is a directory with a statement store index.
+    """
+    return os.path.isfile(os.path.join(fname, INDEX_FILE))
+
+
+def get_store_index(fname):
+    """Return the index of a statement store.
+
+    Parameters
+    ----------
+    fname : str
+        The path of the statement store.
+
+    Returns
+    -------
+    dict
+        The index of the store, with the compression of its chunks under
+        `compression`, its total number of Statements under
+        `num_statements` and the list of its chunks under `chunks`, each
+        with its `file` name and `num_statements`.
+    """
+    with open(os.path.join(fname, INDEX_FILE), 'r') as fh:
+        index = json.load(fh)
+    if index.get('version') not in _READABLE_VERSIONS:
+        raise ValueError('Unsupported statement store version %s in %s'
+                         % (index.get('version'), fname))
+    return index
+
+
+def dump_chunks(stmts, fname, chunk_size=None, compression='gzip',
+                protocol=4, append=False):
+    """Write Statements into a statement store.
+
+    Parameters
+    ----------
+    stmts : list[indra.statements.Statement]
+        The Statements to write.
+    fname : str
+        The path of the statement store, which is created if it doesn't
+        exist.
+    chunk_size : Optional[int]
+        The number of Statements per chunk. Default: 10000
+    compression : Optional[str]
+        The compression of the chunks, one of gzip, lzma, zstd (which
+        requires the zstandard package) or None. When appending, the
+        compression of the existing store is used. Default: gzip
+    protocol : Optional[int]
+        The pickle protocol to use. Default: 4
+    append : Optional[bool]
+        If True, the Statements are added as new chunks at the end of an
+        existing store (if any). Otherwise the store is overwritten.
+        Default: False
+
+    Returns
+    -------
+    dict
+        The index of the store after writing.
+    """
+    chunk_size = chunk_size if chunk_size else DEFAULT_CHUNK_SIZE
+    if os.path.exists(fname) and not os.path.isdir(fname):
+        raise ValueError('%s exists and is not a statement store' % fname)
+    os.makedirs(fname, exist_ok=True)
+    old_index = get_store_index(fname) if is_statement_store(fname) else None
+    if append and old_index:
+        index = old_index
+        index['version'] = STORE_VERSION
+        compression = index['compression']
+    else:
+        index = {'version': STORE_VERSION, 'compression': compression,
+                 'num_statements': 0, 'chunks': []}
+    if compression not in _extensions:
+        raise ValueError('Unknown compression %s' % compression)
+    if compression == 'zstd' and zstandard is None:
+        raise ImportError('The zstandard package is required for zstd '
+                          'compression.')
+
+    # When overwriting, the new chunks are numbered after the old ones so
+    # that the old store stays readable until the new index is in place.
+    all_chunks = index['chunks'] + (old_index['chunks']
+                                    if old_index and not append else [])
+    chunk_num = max([_get_chunk_number(chunk['file'])
+                     for chunk in all_chunks], default=-1) + 1
+    for start in range(0, len(stmts), chunk_size):
+        chunk_stmts = stmts[start:start + chunk_size]
+        chunk_file = 'chunk_%05d%s' % (chunk_num, _extensions[compression])
+        data = _compress(pickle.dumps([_unlink_support(stmt)
+                                       for stmt in chunk_stmts],
+                                      protocol=protocol),
+                         compression)
+        with open(os.path.join(fname, chunk_file), 'wb') as fh:
+            fh.write(data)
+        index['chunks'].append({'file': chunk_file,
+                                'num_statements': len(chunk_stmts)})
+        index['num_statements'] += len(chunk_stmts)
+        chunk_num += 1
+    _write_index(fname, index)
+
+    if old_index and not append:
+        for chunk in old_index['chunks']:
+            os.remove(os.path.join(fname, chunk['file']))
+    logger.info('Wrote %d statements into %s, which now has %d statements '
+                'in %d chunks' % (len(stmts), fname, index['num_statements'],
+                                  len(index['chunks'])))
+    return index
+
+
+def load_chunks(fname, chunks=None, max_workers=1):
+    """Load the Statements of a statement store.
+
+    Parameters
+    ----------
+    fname : str
+        The path of the statement store.
+    chunks : Optional[list[int]]
+        The positions of the chunks to load in the store's index. If None,
+        all the chunks are loaded. Default: None
+    max_workers : Optional[int]
+        The number of threads reading and decompressing chunks in parallel.
+        Default: 1
+
+    Returns
+    -------
+    list[indra.statements.Statement]
+        The Statements of the chunks, in order.
+    """
+    index = get_store_index(fname)
+    chunk_files = _get_chunk_files(fname, index, chunks)
+    load = _get_chunk_loader(index['compression'])
+    if max_workers > 1 and len(chunk_files) > 1:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            chunk_stmts = list(executor.map(load, chunk_files))
+    else:
+        chunk_stmts = [load(chunk_file) for chunk_file in chunk_files]
+    stmts = []
+    for chunk in chunk_stmts:
+        stmts += chunk
+    _link_support(stmts)
+    return stmts
+
+
+def iter_chunks(fname, chunks=None):
+    """Iterate over the chunks of a statement store one at a time.
+
+    Parameters
+    ----------
+    fname : str
+        The path of the statement store.
+    chunks : Optional[list[int]]
+        The positions of the chunks to load in the store's index. If None,
+        all the chunks are loaded. Default: None
+
+    Yields
+    ------
+    list[indra.statements.Statement]
+        The Statements of each chunk, in which the supports and
+        supported_by links to Statements of other chunks are Unresolved.
+    """
+    index = get_store_index(fname)
+    load = _get_chunk_loader(index['compression'])
+    for chunk_file in _get_chunk_files(fname, index, chunks):
+        chunk_stmts = load(chunk_file)
+        _link_support(chunk_stmts)
+        yield chunk_stmts
+
+
+def _unlink_support(stmt):
+    # Return a shallow copy of a Statement whose supports and supported_by
+    # links are replaced by the UUIDs of the linked Statements, so that the
+    # linked Statements aren't pickled along with it.
+    if not stmt.supports and not stmt.supported_by:
+        return stmt
+    stmt = copy(stmt)
+    stmt.supports = [_get_link_uuid(st) for st in stmt.supports]
+    stmt.supported_by = [_get_link_uuid(st) for st in stmt.supported_by]
+    return stmt
+
+
+def _get_link_uuid(stmt):
+    # Unresolved Statements without a UUID are stored as they are
+    if isinstance(stmt, Unresolved) and not stmt.uuid:
+        return stmt
+    return stmt.uuid
+
+
+def _link_support(stmts):
+    # Replace the UUIDs in the supports and supported_by links of Statements
+    # by the Statements with these UUIDs, or by Unresolved Statements if
+    # they aren't among the given ones.
+    uuids = {stmt.uuid: stmt for stmt in stmts}
+    for stmt in stmts:
+        for links in (stmt.supports, stmt.supported_by):
+            for idx, link in enumerate(links):
+                if isinstance(link, str):
+                    links[idx] = uuids.get(link) or Unresolved(link)
+
+
+def _get_chunk_files(fname, index, chunks):
+    if chunks is None:
+        chunks = range(len(index['chunks']))
+    return [os.path.join(fname, index['chunks'][chunk]['file'])
+            for chunk in chunks]
+
+
+def _get_chunk_number(chunk_file):
+    return int(chunk_file.split('.')[0].split('_')[1])
+
+
+def _write_index(fname, index):
+    # The index is replaced atomically so that an interrupted write doesn't
+    # leave a corrupted store.
+    tmp_fname = os.path.join(fname, INDEX_FILE + '.tmp')
+    with open(tmp_fname, 'w') as fh:
+        json.dump(index, fh, indent=1)
+    os.replace(tmp_fname, os.path.join(fname, INDEX_FILE))
+
+
+def _compress(data, compression):
+    if compression == 'gzip':
+        return gzip.compress(data, compresslevel=6)
+    elif compression == 'lzma':
+        return lzma.compress(data)
+    elif compression == 'zstd':
+        return zstandard.ZstdCompressor().compress(data)
+    return data
+
+
+def _decompress(data, compression):
+    if compression == 'gzip':
+        return gzip.decompress(data)
+    elif compression == 'lzma':
+        return lzma.decompress(data)
+    elif compression == 'zstd':
+        if zstandard is None:
+            raise ImportError('The zstandard package is required to read '
+                              'zstd compressed chunks.')
+        return zstandard.ZstdDecompressor().decompress(data)
+    return data
+
+
+def _get_chunk_loader(compression):
+    def load(chunk_file):
+        with open(chunk_file, 'rb') as fh:
+            data = fh.read()
+        return pickle.loads(_decompress(data, compression))
+    return load
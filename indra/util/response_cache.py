@@ -0,0 +1,91 @@
+"""An on-disk cache of JSON responses from web services."""
+
+__all__ = ['ResponseCache']
+
+import os
+import json
+import time
+import hashlib
+import threading
+
+
+class ResponseCache(object):
+    """An on-disk cache of JSON responses from web services.
+
+    Each response is stored in its own JSON file whose name is derived from
+    a hash of the parameters of the request, so that the same query made
+    again, for instance when re-running an analysis, is answered locally.
+    It is used, e.g., for the responses of the INDRA DB REST API and of the
+    MeSH web service.
+
+    Parameters
+    ----------
+    cache_dir : str
+        The directory in which responses are stored. It is created if it
+        doesn't exist.
+    ttl : Optional[float]
+        The number of seconds after which a cached response expires and is
+        fetched again. If None, cached responses never expire. Default: None
+    """
+    def __init__(self, cache_dir, ttl=None):
+        self.cache_dir = os.path.expanduser(cache_dir)
+        self.ttl = ttl
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    @staticmethod
+    def get_key(*parts):
+        """Return the key for a request from its JSON-serializable parts."""
+        key_str = json.dumps(parts, sort_keys=True)
+        return hashlib.sha256(key_str.encode('utf-8')).hexdigest()
+
+    def _get_path(self, key):
+        return os.path.join(self.cache_dir, key + '.json')
+
+    def get(self, key):
+        """Return the cached response for a key or None if there isn't one.
+
+        Parameters
+        ----------
+        key : str
+            The key of the request, as returned by :meth:`get_key`.
+
+        Returns
+        -------
+        dict or None
+            The JSON of the cached response, or None if the response is not
+            in the cache or has expired.
+        """
+        path = self._get_path(key)
+        try:
+            if self.ttl is not None and \
+                    time.time() - os.path.getmtime(path) > self.ttl:
+                os.remove(path)
+                return None
+            with open(path, 'r') as fh:
+                return json.load(fh)
+        except (OSError, ValueError):
+            return None
+
+    def put(self, key, resp_json):
+        """Store the JSON of a response in the cache.
+
+        Parameters
+        ----------
+        key : str
+            The key of the request, as returned by :meth:`get_key`.
+        resp_json : dict
+            The JSON of the response.
+        """
+        path = self._get_path(key)
+        # Write to a temporary file first so that concurrent readers never
+        # see a partially written response.
+        tmp_path = '%s.%d.%d.tmp' % (path, os.getpid(), threading.get_ident())
+        with open(tmp_path, 'w') as fh:
+            json.dump(resp_json, fh)
+        os.replace(tmp_path, path)
+
+    def clear(self):
+        """Remove all responses from the cache."""
+        for fname in os.listdir(self.cache_dir):
+            if fname.endswith('.json'):
+                os.remove(os.path.join(self.cache_dir, fname))
@@ -0,0 +1,507 @@
+"""Read-only lookup tables shared by processes through memory-mapped files.
+
+Worker processes that look up information in large tables, e.g., the
+tables of the database clients, each build or unpickle their own copy of
+these tables, and even processes forked from a parent that already has
+them end up copying most of their pages once reference counts are
+updated. A :class:`SharedTable` instead stores a frozen table as a hash
+table in a file that every process memory-maps read-only, so that the
+table is held in memory once, in the operating system's page cache, no
+matter how many processes use it. A SharedTable is pickled as the path to
+its file, so it can be passed to worker processes cheaply, e.g., as an
+argument of a pool initializer.
+
+The dict tables that the database clients build from resource files, and
+the node and adjacency tables of the bio ontology, can be published in one
+go with :func:`share_resources` and installed in workers with
+:func:`install_shared_resources`::
+
+    with share_resources(ontology=True) as shared:
+        with multiprocessing.Pool(8, initializer=install_shared_resources,
+                                  initargs=(shared,)) as pool:
+            ...
+
+The other tables of the resources, e.g., lists or sets, are pickled into a
+single file next to the shared tables, from which workers load them when
+they first use them without building the shared tables again. Tables
+derived from other tables, e.g., the MeSH tree index, are built by each
+worker if it uses them. :func:`share_loaded_resources` shares only what is
+already loaded in the current process, and is used, e.g., by
+:func:`indra.tools.assemble_corpus.apply_in_chunks` to initialize its
+workers. By default, files are created in /dev/shm where it exists, so
+that they are never written to disk.
+"""
+
+__all__ = ['SharedTable', 'SharedResources', 'share_tables',
+           'share_resources', 'share_loaded_resources',
+           'install_shared_resources']
+
+import os
+import sys
+import mmap
+import atexit
+import uuid
+import zlib
+import pickle
+import struct
+import logging
+import tempfile
+import importlib
+from functools import partial
+from array import array
+from collections.abc import Mapping, ItemsView, ValuesView
+
+logger = logging.getLogger(__name__)
+
+_MAGIC = b'INDRATBL'
+# Magic, number of items, number of slots in the index
+_HEADER = struct.Struct('<8sQQ')
+# Length of the key and of the value of an entry
+_ENTRY = struct.Struct('<II')
+
+
+def get_default_directory():
+    """Return the folder in which shared table files are created."""
+    if os.path.isdir('/dev/shm'):
+        return '/dev/shm'
+    return tempfile.gettempdir()
+
+
+def _encode(obj):
+    # Strings, by far the most common keys and values, are stored as
+    # UTF-8, everything else is pickled.
+    if type(obj) is str:
+        return b's' + obj.encode('utf-8')
+    return b'p' + pickle.dumps(obj, protocol=4)
+
+
+def _decode(buf):
+    if buf[:1] == b's':
+        return buf[1:].decode('utf-8')
+    return pickle.loads(buf[1:])
+
+
+class SharedTable(Mapping):
+    """A read-only dict-like table stored in a memory-mapped file.
+
+    Use :meth:`create` to create a new table from a dict. The file is
+    mapped into memory the first time the table is accessed in each
+    process.
+
+    Parameters
+    ----------
+    path : str
+        The path to the file of the table.
+    """
+    def __init__(self, path):
+        self.path = path
+        self._mm = None
+        self._len = None
+        self._n_slots = None
+
+    @classmethod
+    def create(cls, table, path=None):
+        """Return a new shared table with the contents of a dict.
+
+        Parameters
+        ----------
+        table : dict
+            The table to share. Its keys and values have to be picklable.
+        path : Optional[str]
+            The path to the file to create. By default, a new file is
+            created in the folder returned by
+            :func:`get_default_directory`.
+
+        Returns
+        -------
+        SharedTable
+            The shared table.
+        """
+        if path is None:
+            path = os.path.join(get_default_directory(),
+                                'indra_table_%s' % uuid.uuid4().hex)
+        n_slots = 8
+        while n_slots < 2 * len(table):
+            n_slots *= 2
+        mask = n_slots - 1
+        slots = array('Q', bytes(8 * n_slots))
+        data_offset = _HEADER.size + 8 * n_slots
+        offset = data_offset
+        tmp_path = '%s.%d.tmp' % (path, os.getpid())
+        with open(tmp_path, 'wb') as fh:
+            fh.seek(data_offset)
+            for key, value in table.items():
+                key_bytes, value_bytes = _encode(key), _encode(value)
+                # Open addressing with linear probing
+                slot = zlib.crc32(key_bytes) & mask
+                while slots[slot]:
+                    slot = (slot + 1) & mask
+                slots[slot] = offset
+                fh.write(_ENTRY.pack(len(key_bytes), len(value_bytes)))
+                fh.write(key_bytes)
+                fh.write(value_bytes)
+                offset += _ENTRY.size + len(key_bytes) + len(value_bytes)
+            fh.seek(0)
+            fh.write(_HEADER.pack(_MAGIC, len(table), n_slots))
+            fh.write(slots.tobytes())
+        os.replace(tmp_path, path)
+        return cls(path)
+
+    def _get_mm(self):
+        if self._mm is None:
+            with open(self.path, 'rb') as fh:
+                mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, self._len, self._n_slots = _HEADER.unpack_from(mm, 0)
+            if magic != _MAGIC:
+                raise ValueError('%s is not a shared table file' % self.path)
+            self._mm = mm
+        return self._mm
+
+    def _get_entry(self, offset):
+        mm = self._mm
+        key_len, value_len = _ENTRY.unpack_from(mm, offset)
+        key_start = offset + _ENTRY.size
+        return key_start, key_start + key_len, key_start + key_len + value_len
+
+    def __getitem__(self, key):
+        mm = self._get_mm()
+        key_bytes = _encode(key)
+        mask = self._n_slots - 1
+        slot = zlib.crc32(key_bytes) & mask
+        while True:
+            offset, = struct.unpack_from('<Q', mm, _HEADER.size + 8 * slot)
+            if not offset:
+                raise KeyError(key)
+            key_start, key_end, value_end = self._get_entry(offset)
+            if mm[key_start:key_end] == key_bytes:
+                return _decode(mm[key_end:value_end])
+            slot = (slot + 1) & mask
+
+    def __contains__(self, key):
+        try:
+            self[key]
+        except KeyError:
+            return False
+        return True
+
+    def __len__(self):
+        self._get_mm()
+        return self._len
+
+    def _iter_entries(self):
+        # Entries are stored one after the other in the order of the
+        # original table, following the index.
+        self._get_mm()
+        offset = _HEADER.size + 8 * self._n_slots
+        for _ in range(self._len):
+            key_start, key_end, value_end = self._get_entry(offset)
+            yield key_start, key_end, value_end
+            offset = value_end
+
+    def __iter__(self):
+        for key_start, key_end, _ in self._iter_entries():
+            yield _decode(self._mm[key_start:key_end])
+
+    def _iter_items(self):
+        for key_start, key_end, value_end in self._iter_entries():
+            yield _decode(self._mm[key_start:key_end]), \
+                _decode(self._mm[key_end:value_end])
+
+    def items(self):
+        return _SharedItemsView(self)
+
+    def values(self):
+        return _SharedValuesView(self)
+
+    def copy(self):
+        """Return the contents of the table as a dict."""
+        return dict(self._iter_items())
+
+    def __repr__(self):
+        return '%s(%r)' % (self.__class__.__name__, self.path)
+
+    def __getstate__(self):
+        return {'path': self.path}
+
+    def __setstate__(self, state):
+        self.__init__(state['path'])
+
+    def close(self):
+        """Unmap the file of the table in this process."""
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+
+    def unlink(self):
+        """Remove the file of the table.
+
+        Processes that have already mapped the file can keep using the
+        table, but it can't be attached to anymore.
+        """
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+
+class _SharedItemsView(ItemsView):
+    def __iter__(self):
+        yield from self._mapping._iter_items()
+
+
+class _SharedValuesView(ValuesView):
+    def __iter__(self):
+        for _, value in self._mapping._iter_items():
+            yield value
+
+
+def share_tables(tables, directory=None):
+    """Return shared versions of a set of tables.
+
+    Parameters
+    ----------
+    tables : dict
+        A dict of tables keyed by name. Tables that are dicts (or other
+        mappings) are shared, other tables are returned as they are.
+    directory : Optional[str]
+        The folder in which the files of the tables are created. Default:
+        the folder returned by :func:`get_default_directory`.
+
+    Returns
+    -------
+    dict
+        A dict of the shared tables keyed by name.
+    """
+    directory = directory or get_default_directory()
+    shared = {}
+    for name, table in tables.items():
+        if isinstance(table, SharedTable) or not isinstance(table, Mapping):
+            shared[name] = table
+        else:
+            path = os.path.join(directory, 'indra_%s_%s'
+                                % (name, uuid.uuid4().hex))
+            shared[name] = SharedTable.create(table, path)
+    return shared
+
+
+def _load_pickled_tables(path):
+    with open(path, 'rb') as fh:
+        return pickle.load(fh)
+
+
+def _pickle_tables(tables, directory):
+    path = os.path.join(directory, 'indra_tables_%s.pkl' % uuid.uuid4().hex)
+    tmp_path = '%s.%d.tmp' % (path, os.getpid())
+    with open(tmp_path, 'wb') as fh:
+        pickle.dump(tables, fh, protocol=4)
+    os.replace(tmp_path, path)
+    return path
+
+
+class SharedResources(object):
+    """The shared tables of a set of resources, to be installed in workers.
+
+    Parameters
+    ----------
+    resources : list[tuple]
+        Tuples of the name of a module, the name of an object in the module
+        with a `set_tables` method (a LazyResource or an ontology), the
+        shared tables of that object keyed by name, and the path to the
+        file its other tables are pickled into, or None.
+    """
+    def __init__(self, resources):
+        self.resources = resources
+
+    def install(self):
+        """Make the resources in this process use the shared tables."""
+        for module_name, name, tables, rest_path in self.resources:
+            module = importlib.import_module(module_name)
+            if rest_path:
+                getattr(module, name).set_tables(
+                    tables, rest_loader=partial(_load_pickled_tables,
+                                                rest_path))
+            else:
+                getattr(module, name).set_tables(tables)
+
+    def unlink(self):
+        """Remove the files of the shared tables."""
+        for _, _, tables, rest_path in self.resources:
+            for table in tables.values():
+                if isinstance(table, SharedTable):
+                    table.unlink()
+            if rest_path:
+                try:
+                    os.remove(rest_path)
+                except FileNotFoundError:
+                    pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.unlink()
+
+
+def _share_resource(resource, directory):
+    from indra.ontology import IndraOntology
+    if isinstance(resource, IndraOntology):
+        return share_tables(resource.get_tables(), directory), None
+    tables = {name: getattr(resource, name) for name in resource.names}
+    shared = {name: table for name, table in tables.items()
+              if isinstance(table, Mapping)}
+    if not shared:
+        return None, None
+    rest = {name: table for name, table in tables.items()
+            if name not in shared}
+    rest_path = _pickle_tables(rest, directory) if rest else None
+    return share_tables(shared, directory), rest_path
+
+
+def _get_shareable_ontology():
+    from indra.ontology import IndraOntology
+    from indra.ontology.bio import bio_ontology
+    from indra.ontology.virtual import VirtualOntology
+    if isinstance(bio_ontology, IndraOntology) and \
+            not isinstance(bio_ontology, VirtualOntology):
+        return bio_ontology
+    return None
+
+
+def share_resources(modules=None, directory=None, ontology=False):
+    """Load the tables of database clients and share them.
+
+    Only the resources that are built from resource files are loaded, and
+    only their tables that are dicts (or other mappings) are shared. Their
+    other tables are pickled into a file that workers load them from, and
+    the resources derived from other tables (e.g., the MeSH tree index) are
+    built by each worker when it first uses them.
+
+    Parameters
+    ----------
+    modules : Optional[list[str]]
+        The names of the modules whose resources (see
+        :class:`indra.resources.LazyResource`) are shared. Default: the
+        database clients in
+        :data:`indra.resources.resource_cache.DEFAULT_MODULES`.
+    directory : Optional[str]
+        The folder in which the files of the tables are created. Default:
+        the folder returned by :func:`get_default_directory`.
+    ontology : Optional[bool]
+        If True, the bio ontology is initialized and its tables are shared
+        too, unless it is a remote ontology. Default: False
+
+    Returns
+    -------
+    SharedResources
+        The shared tables, which are removed when used as a context manager
+        and the context is exited, or when calling its `unlink` method.
+    """
+    from indra.resources import LazyResource
+    from indra.resources.resource_cache import DEFAULT_MODULES
+    directory = directory or get_default_directory()
+    resources = []
+    for module_name in (modules or DEFAULT_MODULES):
+        module = importlib.import_module(module_name)
+        for name, value in list(vars(module).items()):
+            if not isinstance(value, LazyResource) or not value.sources:
+                continue
+            try:
+                value.load()
+            except FileNotFoundError as e:
+                logger.warning('Could not share tables of %s: %s'
+                               % (module_name, e))
+                continue
+            tables, rest_path = _share_resource(value, directory)
+            if tables:
+                resources.append((module_name, name, tables, rest_path))
+    if ontology:
+        bio_ontology = _get_shareable_ontology()
+        if bio_ontology is not None:
+            tables, _ = _share_resource(bio_ontology, directory)
+            resources.append(('indra.ontology.bio', 'bio_ontology',
+                              tables, None))
+    return SharedResources(resources)
+
+
+# The resources shared by share_loaded_resources in this process, and the
+# names of the objects they were shared from
+_loaded_shared = {'names': None, 'shared': None}
+
+
+def _get_loaded_resources():
+    from indra.resources import LazyResource
+    from indra.resources.resource_cache import DEFAULT_MODULES
+    loaded = []
+    for module_name in DEFAULT_MODULES:
+        # Modules that were not imported have no loaded resources
+        module = sys.modules.get(module_name)
+        if module is None:
+            continue
+        for name, value in list(vars(module).items()):
+            if isinstance(value, LazyResource) and value.sources and \
+                    value.loaded:
+                loaded.append((module_name, name, value))
+    if 'indra.ontology.bio' in sys.modules:
+        bio_ontology = _get_shareable_ontology()
+        if bio_ontology is not None and bio_ontology._initialized:
+            loaded.append(('indra.ontology.bio', 'bio_ontology',
+                           bio_ontology))
+    return loaded
+
+
+def _unlink_loaded_shared():
+    if _loaded_shared['shared'] is not None:
+        _loaded_shared['shared'].unlink()
+        _loaded_shared['shared'] = None
+        _loaded_shared['names'] = None
+
+
+def share_loaded_resources(directory=None):
+    """Share the tables of the resources already loaded in this process.
+
+    Unlike :func:`share_resources`, nothing is loaded: the resources of the
+    database clients and the bio ontology are shared only if this process
+    already uses them. The shared tables are reused by later calls as long
+    as no other resource has been loaded in between, and are removed when
+    the process exits.
+
+    Parameters
+    ----------
+    directory : Optional[str]
+        The folder in which the files of the tables are created. Default:
+        the folder returned by :func:`get_default_directory`.
+
+    Returns
+    -------
+    SharedResources
+        The shared tables, to be installed in workers with
+        :func:`install_shared_resources`.
+    """
+    loaded = _get_loaded_resources()
+    names = [(module_name, name) for module_name, name, _ in loaded]
+    if _loaded_shared['names'] == names:
+        return _loaded_shared['shared']
+    directory = directory or get_default_directory()
+    resources = []
+    for module_name, name, value in loaded:
+        tables, rest_path = _share_resource(value, directory)
+        if tables:
+            resources.append((module_name, name, tables, rest_path))
+    if _loaded_shared['shared'] is None:
+        atexit.register(_unlink_loaded_shared)
+    else:
+        _loaded_shared['shared'].unlink()
+    _loaded_shared['names'] = names
+    _loaded_shared['shared'] = SharedResources(resources)
+    return _loaded_shared['shared']
+
+
+def install_shared_resources(shared_resources):
+    """Install shared resources in a process, e.g., as a pool initializer.
+
+    Parameters
+    ----------
+    shared_resources : SharedResources
+        The shared resources, as returned by :func:`share_resources`.
+    """
+    shared_resources.install()
@@ -3,16 +3,24 @@ import inspect
 import logging
 import json
 import base64
+import uuid
+import hashlib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+from collections import OrderedDict
 
 from docstring_parser import parse
-from flask import Flask, request
+from flask import Flask, Response, request
 from flask_restx import Api, Resource, fields, abort
 from flask_cors import CORS
 
 from indra import get_config
 from indra.sources import trips, reach, bel, biopax, eidos
 from indra.databases import hgnc_client
-from indra.statements import stmts_from_json, get_statement_by_name
+from indra.statements import stmts_from_json, get_statement_by_name, \
+    iter_stmts_json
 from indra.assemblers.pysb import PysbAssembler
 import indra.assemblers.pysb.assembler as pysb_assembler
 from indra.assemblers.cx import CxAssembler
@@ -27,6 +35,7 @@ from indra.sources.ndex_cx.api import process_ndex_network
 from indra.sources.reach.api import reach_nxml_url, reach_text_url
 from indra.ontology.bio import bio_ontology
 from indra.pipeline import AssemblyPipeline, pipeline_functions
+from indra.tools.statement_index import StatementIndex
 from indra.preassembler.custom_preassembly import *
 
 
@@ -66,6 +75,8 @@ stmts_model = api.model('Statements', {
         "sbo": "https://identifiers.org/SBO:0000526",
         "evidence": [{"text": "MEK binds ERK", "source_api": "trips"}]
         }])})
+preassembly_stmts_model = api.inherit('PreassemblyStatements', stmts_model, {
+    'async': fields.Boolean(default=False)})
 bio_text_model = api.model('BioText', {
     'text': fields.String(example='GRB2 binds SHC.')})
 jsonld_model = api.model('jsonld', {
@@ -74,7 +85,8 @@ genes_model = api.model('Genes', {
     'genes': fields.List(fields.String, example=['BRAF', 'MAP2K1'])})
 
 # Store the arguments by type
-int_args = ['members_allowed', 'protocol', 'poolsize', 'size_cutoff']
+int_args = ['members_allowed', 'protocol', 'poolsize', 'size_cutoff',
+            'n_procs', 'chunk_size']
 float_args = ['score_threshold', 'belief_cutoff']
 boolean_args = [
     'do_rename', 'use_adeft', 'do_methionine_offset', 'do_orthology_mapping',
@@ -82,7 +94,7 @@ boolean_args = [
     'normalize_equivalences', 'normalize_opposites', 'invert', 'remove_bound',
     'specific_only', 'allow_families', 'match_suffix', 'update_belief',
     'in_place', 'print_report_before', 'print_report_after',
-    'prior_hash_annots']
+    'prior_hash_annots', 'append']
 list_args = [
     'gene_list', 'name_list', 'values', 'source_apis', 'uuids', 'curations',
     'correct_tags', 'ignores', 'deletions']
@@ -101,6 +113,150 @@ def _return_stmts(stmts):
     return res
 
 
+# The indexed corpora and the preassembly jobs below are accessed from the
+# request threads, always with cache_lock held
+cache_lock = threading.Lock()
+
+# Corpora indexed with the /preassembly/index_statements resource, by ID,
+# so that they can be filtered repeatedly without being sent again
+indexed_corpora = OrderedDict()
+MAX_INDEXED_CORPORA = 10
+
+
+def _get_indexed_corpus(corpus_id):
+    with cache_lock:
+        if corpus_id not in indexed_corpora:
+            abort(404, 'No indexed corpus with ID %s.' % corpus_id)
+        indexed_corpora.move_to_end(corpus_id)
+        return indexed_corpora[corpus_id]
+
+
+def _add_indexed_corpus(corpus_id, corpus):
+    with cache_lock:
+        indexed_corpora[corpus_id] = corpus
+        while len(indexed_corpora) > MAX_INDEXED_CORPORA:
+            indexed_corpora.popitem(last=False)
+
+
+# Preassembly requests are run as jobs by a pool of workers. The jobs are
+# identified by a digest of the function or pipeline and its input, so that
+# the results of the most recent jobs are reused for identical requests.
+# Finished jobs are kept until they haven't been used for JOB_EXPIRY seconds
+# or, least recently used first, while there are more than
+# MAX_PREASSEMBLY_JOBS jobs or more than MAX_CACHED_STATEMENTS Statements in
+# their results.
+job_executor = ThreadPoolExecutor(max_workers=4)
+preassembly_jobs = OrderedDict()
+MAX_PREASSEMBLY_JOBS = 20
+MAX_CACHED_STATEMENTS = 500000
+JOB_EXPIRY = 3600
+# Functions with side effects, e.g., writing a file, are run again for each
+# request instead of reusing the result of an earlier job
+uncached_functions = {'dump_statements'}
+
+
+def _get_job_id(name, args_json):
+    digest = hashlib.sha256()
+    digest.update(name.encode('utf-8'))
+    digest.update(json.dumps(args_json, sort_keys=True).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def _is_cacheable(name, args_json):
+    """Return True if the result of a request can be reused."""
+    if _has_side_effects(name, args_json):
+        return False
+    return not any(_has_side_effects(step.get('function'),
+                                     step.get('kwargs') or {})
+                   for step in args_json.get('pipeline') or [])
+
+
+def _has_side_effects(name, kwargs):
+    # Functions save their results into a file if given a file name
+    return name in uncached_functions or bool(kwargs.get('save')) or \
+        bool(kwargs.get('save_unique'))
+
+
+def _get_num_stmts(job):
+    if not job.done() or job.exception() is not None:
+        return 0
+    res = job.result()
+    return len(res) if isinstance(res, list) else 0
+
+
+def _evict_jobs():
+    # Only finished jobs are removed, and never the most recently used one
+    now = time.time()
+    n_stmts = sum(_get_num_stmts(job) for job, _ in preassembly_jobs.values())
+    for job_id, (job, last_used) in list(preassembly_jobs.items())[:-1]:
+        if not job.done():
+            continue
+        if now - last_used > JOB_EXPIRY or \
+                len(preassembly_jobs) > MAX_PREASSEMBLY_JOBS or \
+                n_stmts > MAX_CACHED_STATEMENTS:
+            preassembly_jobs.pop(job_id)
+            n_stmts -= _get_num_stmts(job)
+
+
+def _submit_job(job_id, run, reuse=True):
+    with cache_lock:
+        job = preassembly_jobs.get(job_id, (None, None))[0]
+        # Failed jobs are run again
+        if not reuse or job is None or \
+                (job.done() and job.exception() is not None):
+            job = job_executor.submit(run)
+        preassembly_jobs[job_id] = (job, time.time())
+        preassembly_jobs.move_to_end(job_id)
+        _evict_jobs()
+    return job
+
+
+def _get_job(job_id):
+    """Return a job by ID, or abort with 404 if there is no such job."""
+    with cache_lock:
+        _evict_jobs()
+        if job_id not in preassembly_jobs:
+            abort(404, 'No preassembly job with ID %s.' % job_id)
+        job = preassembly_jobs[job_id][0]
+        preassembly_jobs[job_id] = (job, time.time())
+        preassembly_jobs.move_to_end(job_id)
+    return job
+
+
+def _get_job_status(job_id, job):
+    if not job.done():
+        return {'job_id': job_id, 'status': 'running'}
+    elif job.exception() is not None:
+        return {'job_id': job_id, 'status': 'failed',
+                'error': str(job.exception())}
+    return {'job_id': job_id, 'status': 'done'}
+
+
+def _run_preassembly_job(name, args_json, run):
+    """Run a preassembly request and return its result or its job status.
+
+    If the request has a true `async` entry, the job is submitted and its
+    status is returned right away, otherwise the result of the job is
+    returned when it is done. Requests with side effects (see
+    `uncached_functions`) don't reuse the result of an earlier job.
+    """
+    run_async = args_json.pop('async', False)
+    job_id = _get_job_id(name, args_json)
+    job = _submit_job(job_id, run, reuse=_is_cacheable(name, args_json))
+    if run_async:
+        return _get_job_status(job_id, job)
+    return _stream_stmts(job.result())
+
+
+def _stream_stmts(stmts):
+    """Return a response streaming the JSON of Statements as it's written."""
+    def generate():
+        yield '{"statements": '
+        yield from iter_stmts_json(stmts or [])
+        yield '}'
+    return Response(generate(), mimetype='application/json')
+
+
 def _stmts_from_proc(proc):
     if proc and proc.statements:
         stmts = stmts_to_json(proc.statements)
@@ -113,7 +269,7 @@ def _stmts_from_proc(proc):
 # Create Resources in Preassembly Namespace
 
 # Manually add preassembly resources not based on assembly corpus functions
-pipeline_model = api.inherit('Pipeline', stmts_model, {
+pipeline_model = api.inherit('Pipeline', preassembly_stmts_model, {
     'pipeline': fields.List(fields.Nested(dict_model), example=[
         {'function': 'filter_grounded_only'},
         {'function': 'run_preassembly', 'kwargs': {'return_toplevel': False}}
@@ -143,6 +299,11 @@ class RunPipeline(Resource):
             'kwargs' keys. For more documentation and examples, see
             https://indra.readthedocs.io/en/latest/modules/pipeline.html
 
+        async : Optional[bool]
+            If True, the pipeline is run as a job and the job's ID is
+            returned right away, to get the job's status and result from
+            the jobs resources. Default: False
+
         Returns
         -------
         statements : list[indra.statements.Statement.to_json()]
@@ -150,11 +311,112 @@ class RunPipeline(Resource):
             on the list of input Statements.
         """
         args = request.json
+
+        def run():
+            stmts = stmts_from_json(args.get('statements'))
+            pipeline_steps = args.get('pipeline')
+            ap = AssemblyPipeline(pipeline_steps)
+            return ap.run(stmts)
+        return _run_preassembly_job('pipeline', args, run)
+
+
+index_model = api.inherit('IndexStatements', stmts_model, {})
+corpus_id_model = api.model('CorpusId', {
+    'corpus_id': fields.String(example='5d0c7cfb6e4b4c0e9c8ae7a14e6d5f1b')})
+
+
+@preassembly_ns.expect(index_model)
+@preassembly_ns.route('/index_statements')
+class IndexStatements(Resource):
+    @api.doc(False)
+    def options(self):
+        return {}
+
+    def post(self):
+        """Index a list of Statements to filter them repeatedly.
+
+        The Statements are kept on the server along with a StatementIndex,
+        and the returned corpus ID can be given instead of the Statements to
+        the filter resources which take an index (filter_gene_list,
+        filter_by_db_refs, filter_concept_names, filter_uuid_list and
+        filter_by_curation). Only the most recently used corpora are kept.
+        Since filter_by_curation changes the Statements it keeps, it is run
+        on a copy of the corpus and doesn't use the index.
+
+        Parameters
+        ----------
+        statements : list[indra.statements.Statement.to_json()]
+            A list of INDRA Statements to index.
+
+        Returns
+        -------
+        corpus_id : str
+            The ID of the indexed corpus.
+        """
+        args = request.json
         stmts = stmts_from_json(args.get('statements'))
-        pipeline_steps = args.get('pipeline')
-        ap = AssemblyPipeline(pipeline_steps)
-        stmts_out = ap.run(stmts)
-        return _return_stmts(stmts_out)
+        corpus_id = uuid.uuid4().hex
+        _add_indexed_corpus(corpus_id, (stmts, StatementIndex(stmts)))
+        return {'corpus_id': corpus_id}
+
+
+@preassembly_ns.route('/jobs/<job_id>')
+class PreassemblyJobStatus(Resource):
+    @api.doc(False)
+    def options(self, job_id):
+        return {}
+
+    def get(self, job_id):
+        """Get the status of a preassembly job.
+
+        Preassembly jobs are submitted by adding "async": true to the
+        request of the pipeline resource or of any of the resources based on
+        assemble_corpus functions, which then return the job's ID instead of
+        the Statements. Identical requests share the same job, except for
+        requests with side effects such as dump_statements, which are run
+        again each time. Finished jobs are kept for a limited time.
+
+        Parameters
+        ----------
+        job_id : str
+            The ID of the job.
+
+        Returns
+        -------
+        status : str
+            The status of the job: running, done or failed (along with the
+            error under "error").
+        """
+        return _get_job_status(job_id, _get_job(job_id))
+
+
+@preassembly_ns.route('/jobs/<job_id>/result')
+class PreassemblyJobResult(Resource):
+    @api.doc(False)
+    def options(self, job_id):
+        return {}
+
+    def get(self, job_id):
+        """Get the Statements resulting from a preassembly job.
+
+        Parameters
+        ----------
+        job_id : str
+            The ID of the job.
+
+        Returns
+        -------
+        statements : list[indra.statements.Statement.to_json()]
+            The list of INDRA Statements resulting from the job, or the
+            status of the job if it isn't done yet.
+        """
+        job = _get_job(job_id)
+        status = _get_job_status(job_id, job)
+        if status['status'] == 'running':
+            return status, 202
+        elif status['status'] == 'failed':
+            return status, 500
+        return _stream_stmts(job.result())
 
 
 # Dynamically generate resources for assembly corpus functions
@@ -187,10 +449,33 @@ class PreassembleStatements(Resource):
         return {}
 
     def post(self):
-        args = self.process_args(request.json)
-        stmts = stmts_from_json(args.pop('statements'))
-        stmts_out = pipeline_functions[self.func_name](stmts, **args)
-        return _return_stmts(stmts_out)
+        args_json = request.json
+        func = pipeline_functions[self.func_name]
+        corpus = None
+        if args_json.get('corpus_id'):
+            if 'index' not in inspect.signature(func).parameters:
+                abort(400, '%s does not take an indexed corpus.'
+                      % self.func_name)
+            corpus = _get_indexed_corpus(args_json['corpus_id'])
+
+        def run():
+            args = self.process_args(args_json)
+            args.pop('corpus_id', None)
+            if corpus:
+                stmts, index = corpus
+                args.pop('statements', None)
+                # Functions that change the statements are run on copies so
+                # that the indexed corpus stays the same. The copies aren't
+                # in the index, so these functions don't use it.
+                if self.func_name == 'filter_by_curation' or \
+                        args.get('remove_bound'):
+                    stmts = deepcopy(stmts)
+                else:
+                    args['index'] = index
+            else:
+                stmts = stmts_from_json(args.pop('statements'))
+            return func(stmts, **args)
+        return _run_preassembly_job(self.func_name, args_json, run)
 
 
 def make_preassembly_model(func):
@@ -201,11 +486,13 @@ def make_preassembly_model(func):
     if ((len(args) == 1 and ('stmts_in' in args or 'stmts' in args)) or
             (len(args) == 2 and 'kwargs' in args and
                 ('stmts_in' in args or 'stmts' in args))):
-        return stmts_model
+        return preassembly_stmts_model
     # Inherit a model if there are other arguments
     model_fields = {}
     for arg in args:
-        if arg != 'stmts_in' and arg != 'stmts' and arg != 'kwargs':
+        if arg == 'index':
+            model_fields['corpus_id'] = fields.String(example=None)
+        elif arg != 'stmts_in' and arg != 'stmts' and arg != 'kwargs':
             default = None
             if args[arg].default is not inspect.Parameter.empty:
                 default = args[arg].default
@@ -232,7 +519,7 @@ def make_preassembly_model(func):
             else:
                 model_fields[arg] = fields.String(example=default)
     new_model = api.inherit(
-        ('%s_input' % func.__name__), stmts_model, model_fields)
+        ('%s_input' % func.__name__), preassembly_stmts_model, model_fields)
     return new_model
 
 
@@ -246,6 +533,13 @@ def update_docstring(func):
     for param in docstring.params:
         if param.arg_name in ['save', 'save_unique']:
             continue
+        elif param.arg_name == 'index':
+            param.arg_name = 'corpus_id'
+            param.type_name = 'Optional[str]'
+            param.description = (
+                'The ID of a corpus indexed with the index_statements '
+                'resource, which is filtered instead of the given '
+                'statements.')
         elif param.arg_name in ['stmts', 'stmts_in']:
             param.arg_name = 'statements'
             param.type_name = 'list[indra.statements.Statement.to_json()]'
@@ -274,6 +568,10 @@ def update_docstring(func):
                 '"wrong_relation", etc.) keys.')
         new_doc += (param.arg_name + ' : ' + param.type_name + '\n' +
                     param.description + '\n\n')
+    new_doc += ('async : Optional[bool]\nIf True, the function is run as a '
+                "job and the job's ID is returned right away, to get the "
+                "job's status and result from the jobs resources. "
+                'Default: False\n\n')
     new_doc += 'Returns\n----------\n'
     new_doc += 'statements : list[indra.statements.Statement.to_json()]\n'
     new_doc += 'A list of processed INDRA Statements'
@@ -1212,5 +1510,8 @@ if __name__ == '__main__':
     argparser = argparse.ArgumentParser('Run the INDRA REST API')
     argparser.add_argument('--host', default='0.0.0.0')
     argparser.add_argument('--port', default=8080, type=int)
+    argparser.add_argument('--workers', default=4, type=int,
+                           help='The number of preassembly job workers.')
     argparserargs = argparser.parse_args()
+    job_executor = ThreadPoolExecutor(max_workers=argparserargs.workers)
     app.run(host=argparserargs.host, port=argparserargs.port)